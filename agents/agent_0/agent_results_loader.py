@@ -22,6 +22,7 @@ from pathlib import Path
 import pandas as pd
 
 from lib.breadcrumb_system import BreadcrumbTrail
+from lib.response_cache import get_cache
 
 
 class AgentResultsLoader:
@@ -47,18 +48,23 @@ class AgentResultsLoader:
     }
     """
 
+    CACHE_SOURCE = "agent_results"
+
     def __init__(self, trail: BreadcrumbTrail, cache_dir: str = "cache/agent_results"):
         """
         Initialize agent results loader
 
         Args:
             trail: LED breadcrumb trail for debugging
-            cache_dir: Directory containing agent result JSON files
+            cache_dir: Drop-box directory where research agents write result JSON files
         """
         self.trail = trail
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
+        # Validated results are kept in the shared response cache (no expiry)
+        self.cache = get_cache()
+
         self.trail.light(620, {
             "action": "loader_init",
             "cache_dir": str(self.cache_dir)
@@ -68,6 +74,10 @@ class AgentResultsLoader:
         """
         Load agent research results for a keyword
 
+        A drop-box file newer than the cached copy is parsed, validated and
+        imported into the response cache; otherwise the cached copy is served
+        without re-reading the file.
+
         Args:
             keyword: The keyword to load results for
 
@@ -76,14 +86,33 @@ class AgentResultsLoader:
         """
         cache_file = self.cache_dir / f"{self._sanitize_filename(keyword)}.json"
 
-        self.trail.light(621, {
+        # Per-keyword LEDs: lazy payloads, skipped when BREADCRUMB_RATE_LIMIT suppresses them
+        self.trail.light(621, lambda: {
             "action": "cache_check",
             "keyword": keyword,
             "cache_file": str(cache_file)
         })
 
-        if not cache_file.exists():
-            self.trail.light(627, {
+        try:
+            file_mtime = cache_file.stat().st_mtime
+        except OSError:
+            file_mtime = None
+
+        entry = self.cache.get_entry(self.CACHE_SOURCE, keyword)
+
+        if entry and (file_mtime is None or entry['created_at'] >= file_mtime):
+            data = entry['value']
+            self.trail.light(622, lambda: {
+                "action": "results_loaded",
+                "keyword": keyword,
+                "demand_score": data.get('demand_score', 0),
+                "confidence": data.get('confidence', 0),
+                "from": "response_cache"
+            })
+            return data
+
+        if file_mtime is None:
+            self.trail.light(627, lambda: {
                 "action": "cache_miss",
                 "keyword": keyword
             })
@@ -98,7 +127,8 @@ class AgentResultsLoader:
                 "action": "results_loaded",
                 "keyword": keyword,
                 "demand_score": data.get('demand_score', 0),
-                "confidence": data.get('confidence', 0)
+                "confidence": data.get('confidence', 0),
+                "from": "drop_box_file"
             })
 
             # Validate structure
@@ -115,6 +145,9 @@ class AgentResultsLoader:
                 "keyword": keyword
             })
 
+            # Import into the response cache, dated by the file's mtime
+            self.cache.set(self.CACHE_SOURCE, keyword, data, created_at=file_mtime)
+
             return data
 
         except Exception as e:
@@ -125,6 +158,27 @@ class AgentResultsLoader:
             })
             return None
 
+    def save_results(self, keyword: str, data: Dict) -> bool:
+        """
+        Store agent research results directly in the response cache
+
+        Args:
+            keyword: The keyword the results are for
+            data: Results dict (same format as the drop-box files)
+
+        Returns:
+            True if stored, False if the structure is invalid or the write failed
+        """
+        if not self._validate_results(data):
+            self.trail.light(628, {
+                "action": "validation_error",
+                "keyword": keyword,
+                "message": "Invalid result structure"
+            })
+            return False
+
+        return self.cache.set(self.CACHE_SOURCE, keyword, data)
+
     def convert_to_trends_format(self, keyword: str, agent_results: Dict) -> pd.DataFrame:
         """
         Convert agent results to Google Trends-compatible DataFrame format
@@ -171,7 +225,9 @@ class AgentResultsLoader:
         cache_file = self.cache_dir / f"{self._sanitize_filename(keyword)}.json"
 
         if not cache_file.exists():
-            return None
+            # Results saved directly to the response cache have no drop-box file
+            entry = self.cache.get_entry(self.CACHE_SOURCE, keyword)
+            return entry['age_seconds'] / 3600.0 if entry else None
 
         age_seconds = time.time() - cache_file.stat().st_mtime
         return age_seconds / 3600.0
@@ -3,16 +3,20 @@ Agent 0 API Clients
 Handles integration with Google Trends, Reddit, and YouTube APIs
 """
 
+import contextvars
+import math
+import threading
 import time
 import random
-import json
-import os
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
 from typing import Dict, List, Optional
 from pytrends.request import TrendReq
 import praw
 
 from lib.breadcrumb_system import BreadcrumbTrail
+from lib.rate_limiter import get_limiter
+from lib.response_cache import get_cache
 from .config import Agent0Config as Config
 
 # YouTube imports (optional - only loaded if ENABLE_YOUTUBE=True)
@@ -26,7 +30,8 @@ except ImportError:
 class GoogleTrendsClient:
     """Google Trends API client using pytrends with retry logic and caching"""
 
-    CACHE_DIR = "cache"
+    CACHE_SOURCE = "google_trends"
+    CACHE_PARAMS = {"timeframe": "today 12-m"}
     CACHE_TTL_HOURS = 24
 
     def __init__(self, trail: BreadcrumbTrail, queue_manager=None):
@@ -34,15 +39,32 @@ class GoogleTrendsClient:
         self.queue_manager = queue_manager  # Optional queue manager for rate limit tracking
         # Initialize pytrends without retry params (handle retries ourselves)
         self.pytrends = TrendReq(hl='en-US', tz=360)
+        self._local = threading.local()  # One TrendReq per batch worker thread
+        self._local.pytrends = self.pytrends
+        self.rate_limiter = get_limiter(
+            "google_trends",
+            rate=1 / Config.GOOGLE_TRENDS_DELAY,
+            capacity=Config.GOOGLE_TRENDS_BURST
+        )
+
+        # Shared response cache (cache/response_cache.db)
+        self.cache = get_cache()
 
-        # Ensure cache directory exists
-        os.makedirs(self.CACHE_DIR, exist_ok=True)
+    @classmethod
+    def cache_params(cls) -> Dict:
+        """Cache parameters for the configured mode (anchor-relative scores are cached separately)"""
+        if cls._multiplexed():
+            return {
+                **cls.CACHE_PARAMS,
+                "anchor": Config.GOOGLE_TRENDS_ANCHOR,
+                "anchor_level": Config.GOOGLE_TRENDS_ANCHOR_LEVEL
+            }
+        return cls.CACHE_PARAMS
 
-    def _get_cache_path(self, keyword: str) -> str:
-        """Get cache file path for a keyword"""
-        # Sanitize keyword for filename
-        safe_keyword = keyword.replace(' ', '_').replace('/', '_')
-        return os.path.join(self.CACHE_DIR, f"trends_{safe_keyword}.json")
+    @classmethod
+    def is_cached(cls, keyword: str) -> bool:
+        """Check for fresh cached trend data without creating a client (no network)"""
+        return get_cache().contains(cls.CACHE_SOURCE, keyword, cls.cache_params())
 
     def _load_from_cache(self, keyword: str) -> Optional[Dict]:
         """
@@ -50,66 +72,59 @@ class GoogleTrendsClient:
 
         Returns None if cache miss or expired
         """
-        cache_path = self._get_cache_path(keyword)
+        entry = self.cache.get_entry(self.CACHE_SOURCE, keyword, self.cache_params(), include_expired=True)
 
-        if not os.path.exists(cache_path):
+        if entry is None:
+            # Cache miss (lights an LED so hit rates count misses too)
+            self.trail.light(Config.LED_GOOGLE_TRENDS_START + 1, {
+                "action": "cache_miss",
+                "keyword": keyword,
+                "source": self.CACHE_SOURCE
+            })
             return None
 
-        try:
-            with open(cache_path, 'r') as f:
-                cached = json.load(f)
-
-            # Check if cache is expired (24 hour TTL)
-            cached_time = datetime.fromisoformat(cached['cached_at'])
-            age = datetime.now() - cached_time
+        age_hours = round(entry['age_seconds'] / 3600, 1)
 
-            if age > timedelta(hours=self.CACHE_TTL_HOURS):
-                # Cache expired
-                self.trail.light(Config.LED_GOOGLE_TRENDS_START + 1, {
-                    "action": "cache_expired",
-                    "keyword": keyword,
-                    "age_hours": round(age.total_seconds() / 3600, 1)
-                })
-                return None
-
-            # Cache hit
+        if entry['expired']:
+            # Cache expired
             self.trail.light(Config.LED_GOOGLE_TRENDS_START + 1, {
-                "action": "cache_hit",
+                "action": "cache_expired",
                 "keyword": keyword,
-                "age_hours": round(age.total_seconds() / 3600, 1)
+                "source": self.CACHE_SOURCE,
+                "age_hours": age_hours
             })
+            return None
 
-            return cached['data']
+        # Cache hit
+        self.trail.light(Config.LED_GOOGLE_TRENDS_START + 1, {
+            "action": "cache_hit",
+            "keyword": keyword,
+            "source": self.CACHE_SOURCE,
+            "age_hours": age_hours
+        })
 
-        except Exception as e:
-            # Cache read error - ignore and fetch fresh
-            return None
+        return entry['value']
 
     def _save_to_cache(self, keyword: str, data: Dict):
         """Save trend data to cache"""
-        cache_path = self._get_cache_path(keyword)
-
-        try:
-            cached = {
-                'keyword': keyword,
-                'cached_at': datetime.now().isoformat(),
-                'data': data
-            }
-
-            with open(cache_path, 'w') as f:
-                json.dump(cached, f, indent=2)
+        saved = self.cache.set(
+            self.CACHE_SOURCE,
+            keyword,
+            data,
+            params=self.cache_params(),
+            ttl_seconds=self.CACHE_TTL_HOURS * 3600
+        )
 
+        if saved:
             self.trail.light(Config.LED_GOOGLE_TRENDS_START + 1, {
                 "action": "cache_saved",
                 "keyword": keyword
             })
-
-        except Exception as e:
+        else:
             # Cache write error - log but don't fail
             self.trail.light(Config.LED_GOOGLE_TRENDS_START + 1, {
                 "action": "cache_save_failed",
-                "keyword": keyword,
-                "error": str(e)[:100]
+                "keyword": keyword
             })
 
     def _retry_with_backoff(self, func, *args, max_retries=3, **kwargs):
@@ -148,25 +163,224 @@ class GoogleTrendsClient:
 
         raise Exception("Retry logic failed unexpectedly")
 
-    def get_batch_trend_data(self, keywords: List[str]) -> Dict[str, Dict]:
+    @staticmethod
+    def _is_rate_limit_error(error: Exception) -> bool:
+        error_str = str(error)
+        return '429' in error_str or 'Too Many Requests' in error_str or 'Max retries' in error_str
+
+    @staticmethod
+    def _summarize_interest(data, keyword: str) -> Dict:
+        """Average, peak and direction from an interest_over_time() frame"""
+        if data.empty or keyword not in data.columns:
+            return {
+                "average_interest": 0,
+                "peak_interest": 0,
+                "trend_direction": "no_data",
+                "data_points": 0
+            }
+
+        interest_values = data[keyword].values
+        average = float(interest_values.mean())
+        peak = float(interest_values.max())
+
+        # Determine trend direction (compare first half to second half)
+        mid = len(interest_values) // 2
+        first_half_avg = interest_values[:mid].mean()
+        second_half_avg = interest_values[mid:].mean()
+
+        if second_half_avg > first_half_avg * 1.1:
+            trend_direction = "rising"
+        elif second_half_avg < first_half_avg * 0.9:
+            trend_direction = "falling"
+        else:
+            trend_direction = "stable"
+
+        return {
+            "average_interest": round(average, 2),
+            "peak_interest": round(peak, 2),
+            "trend_direction": trend_direction,
+            "data_points": len(interest_values)
+        }
+
+    def _get_pytrends(self) -> TrendReq:
+        """This thread's pytrends session (TrendReq keeps per-request state, so workers don't share one)"""
+        pytrends = getattr(self._local, 'pytrends', None)
+        if pytrends is None:
+            pytrends = self._local.pytrends = TrendReq(hl='en-US', tz=360)
+        return pytrends
+
+    @staticmethod
+    def _multiplexed() -> bool:
+        return Config.GOOGLE_TRENDS_MODE == "multiplexed"
+
+    @classmethod
+    def requests_needed(cls, uncached: int) -> int:
+        """Google Trends requests needed for this many uncached keywords in the configured mode"""
+        if cls._multiplexed():
+            return math.ceil(uncached / (Config.GOOGLE_TRENDS_MAX_KEYWORDS - 1))
+        return uncached
+
+    def _plan_groups(self, keywords: List[str]) -> List[List[str]]:
+        """
+        Split keywords into request groups
+
+        Individual mode: one keyword per request. Multiplexed mode: up to
+        GOOGLE_TRENDS_MAX_KEYWORDS - 1 keywords per request, plus the anchor
+        (which rides along in the first group if it was asked for itself).
+        """
+        if not self._multiplexed():
+            return [[keyword] for keyword in keywords]
+
+        anchor = Config.GOOGLE_TRENDS_ANCHOR
+        size = Config.GOOGLE_TRENDS_MAX_KEYWORDS - 1
+        others = [keyword for keyword in keywords if keyword != anchor]
+        groups = [others[i:i + size] for i in range(0, len(others), size)]
+        if anchor in keywords:
+            if groups:
+                groups[0].append(anchor)
+            else:
+                groups.append([anchor])
+        return groups
+
+    def _rescale_to_anchor(self, data, anchor: str, group: List[str]):
+        """
+        Put a multiplexed response on the common anchor scale
+
+        Google normalizes each request to its own 0-100 peak. The anchor is in
+        every request, so multiplying by ANCHOR_LEVEL / mean(anchor) puts every
+        group on one scale where the anchor averages ANCHOR_LEVEL (a topic as
+        popular as the anchor scores ANCHOR_LEVEL). The anchor's mean uses all
+        data points, which keeps integer rounding error low.
+
+        Rescaled values are not clamped: a topic searched three times as much
+        as the anchor averages 150, and keeping that value preserves the order
+        of topics above the anchor. The trends score caps at 100, so such
+        topics are flagged with an LED (interest_above_scale) instead of
+        being clipped silently. Topics whose own peak in the response is below
+        GOOGLE_TRENDS_MIN_ANCHOR_PEAK are flagged too (topic_low_precision):
+        they are only a few integer steps tall, so their rescaled values are coarse.
+        """
+        if data.empty or anchor not in data.columns or float(data[anchor].mean()) == 0:
+            # FAIL LOUDLY - without the anchor the group cannot be compared to anything
+            raise ValueError(
+                f"Anchor '{anchor}' returned no interest alongside {group} - cannot rescale the group. "
+                f"Set AGENT_0_TRENDS_ANCHOR to a steadily searched term."
+            )
+
+        anchor_peak = float(data[anchor].max())
+        if anchor_peak < Config.GOOGLE_TRENDS_MIN_ANCHOR_PEAK:
+            # A topic dwarfs the anchor, so the anchor is only a few integer steps tall
+            self.trail.light(Config.LED_GOOGLE_TRENDS_START + 1, {
+                "action": "anchor_low_precision",
+                "anchor": anchor,
+                "anchor_peak": anchor_peak,
+                "keywords": group
+            })
+
+        topics = [keyword for keyword in group if keyword != anchor and keyword in data.columns]
+        coarse = {keyword: float(data[keyword].max()) for keyword in topics
+                  if float(data[keyword].max()) < Config.GOOGLE_TRENDS_MIN_ANCHOR_PEAK}
+        if coarse:
+            # The anchor dwarfs these topics - their rescaled values carry little precision
+            self.trail.light(Config.LED_GOOGLE_TRENDS_START + 1, {
+                "action": "topic_low_precision",
+                "anchor": anchor,
+                "topic_peaks": coarse
+            })
+
+        factor = Config.GOOGLE_TRENDS_ANCHOR_LEVEL / float(data[anchor].mean())
+        rescaled = data[[column for column in data.columns if column != 'isPartial']].astype(float) * factor
+
+        above = {keyword: round(float(rescaled[keyword].mean()), 2) for keyword in topics
+                 if float(rescaled[keyword].mean()) > 100}
+        if above:
+            # Unbounded on the anchor scale; the trends score saturates at 100 for these topics
+            self.trail.light(Config.LED_GOOGLE_TRENDS_START + 1, {
+                "action": "interest_above_scale",
+                "anchor": anchor,
+                "average_interest": above
+            })
+        return rescaled
+
+    def _fetch_group(self, group: List[str], stop: threading.Event) -> Dict[str, Dict]:
+        """
+        Query, parse and cache one request group (runs on a batch worker)
+
+        Results are written to the cache as soon as they are parsed, so keywords
+        fetched before a later failure are never lost.
         """
-        Query Google Trends for multiple keywords (individually to get absolute scores)
+        if stop.is_set():
+            raise ValueError(f"Skipped {group} - Google Trends rate limit exhausted earlier in this batch")
 
-        IMPORTANT: Queries each keyword individually to avoid relative scoring issue
-        When batching multiple keywords in one request, Google Trends returns
-        relative scores (normalized 0-100 against each other), causing clustering.
+        anchor = Config.GOOGLE_TRENDS_ANCHOR if self._multiplexed() else None
+        payload = group if anchor is None or anchor in group else group + [anchor]
 
-        Includes 24-hour local caching to avoid redundant API calls
+        def _query_group():
+            # Respect rate limits (shared Google Trends budget)
+            self.rate_limiter.acquire()
+            pytrends = self._get_pytrends()
+            pytrends.build_payload(payload, timeframe='today 12-m')
+            return pytrends.interest_over_time()
+
+        try:
+            data = self._retry_with_backoff(_query_group)
+        except Exception as e:
+            if self._is_rate_limit_error(e):
+                stop.set()  # Before this worker picks up another group
+            raise
+
+        # Log actual API call (one request, whatever the group size)
+        if self.queue_manager:
+            self.queue_manager.log_api_call(", ".join(group), cached=False)
+
+        if anchor is not None:
+            data = self._rescale_to_anchor(data, anchor, group)
+
+        results = {}
+        for keyword in group:
+            results[keyword] = self._summarize_interest(data, keyword)
+            if results[keyword]["data_points"] > 0:
+                # Checkpoint immediately
+                self._save_to_cache(keyword, results[keyword])
+
+        return results
+
+    def get_batch_trend_data(self, keywords: List[str]) -> Dict[str, Dict]:
+        """
+        Query Google Trends for multiple keywords on a comparable scale
+
+        Individual mode (default): each keyword gets its own request, because
+        Google normalizes every request 0-100 against the keywords in it and
+        batching them together causes clustering.
+
+        Multiplexed mode (AGENT_0_TRENDS_MODE=multiplexed): up to 4 keywords
+        share each request with a fixed anchor keyword, and every group is
+        rescaled so the anchor averages GOOGLE_TRENDS_ANCHOR_LEVEL. 50 topics
+        take 13 requests instead of 50; scores are relative to the anchor (and
+        can exceed 100), so they are cached separately from individual-mode scores.
+
+        Includes 24-hour caching to avoid redundant API calls. Request groups
+        are spread over Config.GOOGLE_TRENDS_WORKERS workers that all draw from
+        the shared rate limiter, so one request's backoff or parsing overlaps
+        the wait for the next slot. Each result is cached as soon as it is
+        fetched.
+
+        A failed request does not abort the batch: its keywords are returned
+        with trend_direction "error" and the error message. Once rate limit
+        retries are exhausted the groups not yet started are skipped (and
+        marked as errors) rather than queried into the block. If every
+        uncached keyword fails, a ValueError is raised.
 
         Args:
             keywords: List of topic keywords to query
 
         Returns:
-            Dict mapping keyword to trend data dict
+            Dict mapping keyword to trend data dict (in input order)
         """
         self.trail.light(Config.LED_GOOGLE_TRENDS_START, {
             "action": "batch_query_google_trends",
-            "total_keywords": len(keywords)
+            "total_keywords": len(keywords),
+            "mode": Config.GOOGLE_TRENDS_MODE
         })
 
         results = {}
@@ -180,7 +394,7 @@ class GoogleTrendsClient:
                 # Log cache hit
                 if self.queue_manager:
                     self.queue_manager.log_api_call(keyword, cached=True)
-            else:
+            elif keyword not in uncached_keywords:
                 uncached_keywords.append(keyword)
 
         if not uncached_keywords:
@@ -191,92 +405,81 @@ class GoogleTrendsClient:
             })
             return results
 
+        groups = self._plan_groups(uncached_keywords)
+        workers = max(1, min(Config.GOOGLE_TRENDS_WORKERS, len(groups)))
         self.trail.light(Config.LED_GOOGLE_TRENDS_START + 1, {
             "action": "cache_status",
             "cached": len(keywords) - len(uncached_keywords),
-            "uncached": len(uncached_keywords)
+            "uncached": len(uncached_keywords),
+            "requests": len(groups),
+            "workers": workers
         })
 
-        # Query each keyword INDIVIDUALLY to get absolute scores
-        for idx, keyword in enumerate(uncached_keywords, 1):
-            self.trail.light(Config.LED_GOOGLE_TRENDS_START + 1, {
-                "action": "querying_individual",
-                "keyword": keyword,
-                "progress": f"{idx}/{len(uncached_keywords)}"
-            })
-
-            try:
-                # Build payload for single keyword
-                def _query_single():
-                    self.pytrends.build_payload([keyword], timeframe='today 12-m')
-                    # Respect rate limits
-                    time.sleep(Config.GOOGLE_TRENDS_DELAY)
-                    return self.pytrends.interest_over_time()
-
-                # Execute with retry logic
-                data = self._retry_with_backoff(_query_single)
-
-                if data.empty or keyword not in data.columns:
-                    results[keyword] = {
-                        "average_interest": 0,
-                        "peak_interest": 0,
-                        "trend_direction": "no_data",
-                        "data_points": 0
-                    }
-                else:
-                    interest_values = data[keyword].values
-                    average = float(interest_values.mean())
-                    peak = float(interest_values.max())
-
-                    # Determine trend direction
-                    mid = len(interest_values) // 2
-                    first_half_avg = interest_values[:mid].mean()
-                    second_half_avg = interest_values[mid:].mean()
-
-                    if second_half_avg > first_half_avg * 1.1:
-                        trend_direction = "rising"
-                    elif second_half_avg < first_half_avg * 0.9:
-                        trend_direction = "falling"
-                    else:
-                        trend_direction = "stable"
-
-                    results[keyword] = {
-                        "average_interest": round(average, 2),
-                        "peak_interest": round(peak, 2),
-                        "trend_direction": trend_direction,
-                        "data_points": len(interest_values)
-                    }
-
-                    # Save to cache
-                    self._save_to_cache(keyword, results[keyword])
-
-                    # Log actual API call
-                    if self.queue_manager:
-                        self.queue_manager.log_api_call(keyword, cached=False)
-
-            except Exception as e:
-                self.trail.fail(Config.LED_GOOGLE_TRENDS_START + 2, e)
-                # FAIL LOUDLY - Don't hide API failures behind fake zero data
-                error_msg = str(e)
-                if '429' in error_msg or 'Too Many Requests' in error_msg:
-                    raise ValueError(
-                        f"Google Trends rate limit exceeded for '{keyword}'. "
-                        f"This means Google is blocking requests temporarily. "
-                        f"Wait 60 minutes and try again, or use cached data from previous runs. "
-                        f"Check cache/ directory for available cached keywords."
-                    ) from e
+        stop = threading.Event()
+        errors = {}
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="trends") as executor:
+            futures = {}
+            for idx, group in enumerate(groups, 1):
+                if self._multiplexed():
+                    self.trail.light(Config.LED_GOOGLE_TRENDS_START + 1, {
+                        "action": "querying_group",
+                        "keywords": group,
+                        "anchor": Config.GOOGLE_TRENDS_ANCHOR,
+                        "progress": f"{idx}/{len(groups)}"
+                    })
                 else:
-                    raise ValueError(
-                        f"Google Trends API failed for '{keyword}': {error_msg[:200]}"
-                    ) from e
+                    self.trail.light(Config.LED_GOOGLE_TRENDS_START + 1, {
+                        "action": "querying_individual",
+                        "keyword": group[0],
+                        "progress": f"{idx}/{len(groups)}"
+                    })
+                # Copy the context so worker LEDs nest under the caller's span
+                future = executor.submit(contextvars.copy_context().run, self._fetch_group, group, stop)
+                futures[future] = group
+
+            for future in as_completed(futures):
+                group = futures[future]
+                try:
+                    results.update(future.result())
+                except Exception as e:
+                    self.trail.fail(Config.LED_GOOGLE_TRENDS_START + 2, e)
+                    for keyword in group:
+                        errors[keyword] = e
+
+        for keyword, error in errors.items():
+            results[keyword] = {
+                "average_interest": 0,
+                "peak_interest": 0,
+                "trend_direction": "error",
+                "data_points": 0,
+                "error": str(error)[:200]
+            }
 
         self.trail.light(Config.LED_GOOGLE_TRENDS_START + 2, {
             "action": "batch_query_complete",
             "total_keywords": len(keywords),
-            "successful": sum(1 for r in results.values() if r['data_points'] > 0)
+            "successful": sum(1 for r in results.values() if r['data_points'] > 0),
+            "failed": len(errors),
+            "failed_keywords": list(errors)
         })
 
-        return results
+        if len(errors) == len(uncached_keywords):
+            # FAIL LOUDLY - Don't hide API failures behind fake zero data
+            keyword, error = next(iter(errors.items()))
+            if any(self._is_rate_limit_error(e) for e in errors.values()):
+                raise ValueError(
+                    f"Google Trends rate limit exceeded for all {len(errors)} uncached keywords. "
+                    f"This means Google is blocking requests temporarily. "
+                    f"Wait 60 minutes and try again, or use cached data from previous runs. "
+                    f"Check cache/response_cache.db for available cached keywords."
+                ) from error
+            raise ValueError(
+                f"Google Trends API failed for all {len(errors)} uncached keywords "
+                f"(first: '{keyword}'): {str(error)[:200]}"
+            ) from error
+
+        return {keyword: results[keyword] for keyword in keywords}
 
     def get_trend_data(self, keyword: str) -> Dict:
         """
@@ -296,49 +499,22 @@ class GoogleTrendsClient:
         try:
             # Build payload and query (wrapped in retry logic)
             def _query_trends():
-                self.pytrends.build_payload([keyword], timeframe='today 12-m')
-                # Respect rate limits
-                time.sleep(Config.GOOGLE_TRENDS_DELAY)
-                return self.pytrends.interest_over_time()
+                # Respect rate limits (shared Google Trends budget)
+                self.rate_limiter.acquire()
+                pytrends = self._get_pytrends()
+                pytrends.build_payload([keyword], timeframe='today 12-m')
+                return pytrends.interest_over_time()
 
             # Execute with retry logic
             data = self._retry_with_backoff(_query_trends)
 
-            if data.empty or keyword not in data.columns:
+            result = self._summarize_interest(data, keyword)
+            if result["data_points"] == 0:
                 self.trail.light(Config.LED_GOOGLE_TRENDS_START + 1, {
                     "action": "no_data",
                     "keyword": keyword
                 })
-                return {
-                    "average_interest": 0,
-                    "peak_interest": 0,
-                    "trend_direction": "no_data",
-                    "data_points": 0
-                }
-
-            # Calculate metrics
-            interest_values = data[keyword].values
-            average = float(interest_values.mean())
-            peak = float(interest_values.max())
-
-            # Determine trend direction (compare first half to second half)
-            mid = len(interest_values) // 2
-            first_half_avg = interest_values[:mid].mean()
-            second_half_avg = interest_values[mid:].mean()
-
-            if second_half_avg > first_half_avg * 1.1:
-                trend_direction = "rising"
-            elif second_half_avg < first_half_avg * 0.9:
-                trend_direction = "falling"
-            else:
-                trend_direction = "stable"
-
-            result = {
-                "average_interest": round(average, 2),
-                "peak_interest": round(peak, 2),
-                "trend_direction": trend_direction,
-                "data_points": len(interest_values)
-            }
+                return result
 
             self.trail.light(Config.LED_GOOGLE_TRENDS_START + 2, {
                 "action": "trends_success",
@@ -364,12 +540,29 @@ class RedditClient:
 
     def __init__(self, trail: BreadcrumbTrail):
         self.trail = trail
-        self.reddit = praw.Reddit(
-            client_id=Config.REDDIT_CLIENT_ID,
-            client_secret=Config.REDDIT_CLIENT_SECRET,
-            user_agent=Config.REDDIT_USER_AGENT
+        self.rate_limiter = get_limiter(
+            "reddit",
+            rate=1 / Config.REDDIT_DELAY,
+            capacity=Config.REDDIT_BURST
         )
 
+        # PRAW clients are not thread safe - one per research worker thread
+        self._local = threading.local()
+        self.reddit  # FAIL LOUDLY on bad settings in the constructing thread
+
+    @property
+    def reddit(self) -> praw.Reddit:
+        """PRAW client for the current thread"""
+        reddit = getattr(self._local, 'reddit', None)
+        if reddit is None:
+            reddit = praw.Reddit(
+                client_id=Config.REDDIT_CLIENT_ID,
+                client_secret=Config.REDDIT_CLIENT_SECRET,
+                user_agent=Config.REDDIT_USER_AGENT
+            )
+            self._local.reddit = reddit
+        return reddit
+
     def search_topic(self, keyword: str, fetch_purchase_intent: bool = True) -> Dict:
         """
         Search Reddit for keyword and analyze engagement
@@ -392,6 +585,9 @@ class RedditClient:
         })
 
         try:
+            # Respect rate limits
+            self.rate_limiter.acquire()
+
             # Search across all of Reddit
             posts = list(self.reddit.subreddit('all').search(
                 keyword,
@@ -399,9 +595,6 @@ class RedditClient:
                 sort='relevance'
             ))
 
-            # Respect rate limits
-            time.sleep(Config.RATE_LIMIT_DELAY)
-
             if not posts:
                 self.trail.light(Config.LED_REDDIT_START + 1, {
                     "action": "no_posts",
@@ -480,7 +673,23 @@ class YouTubeClient:
                 "Add it to .env file to use YouTube validation."
             )
 
-        self.youtube = build('youtube', 'v3', developerKey=Config.YOUTUBE_API_KEY)
+        # googleapiclient's HTTP transport is not thread safe - one service per thread
+        self._local = threading.local()
+        self.youtube  # FAIL LOUDLY on bad settings in the constructing thread
+        self.rate_limiter = get_limiter(
+            "youtube",
+            rate=1 / Config.RATE_LIMIT_DELAY,
+            capacity=Config.YOUTUBE_BURST
+        )
+
+    @property
+    def youtube(self):
+        """YouTube API service for the current thread"""
+        youtube = getattr(self._local, 'youtube', None)
+        if youtube is None:
+            youtube = build('youtube', 'v3', developerKey=Config.YOUTUBE_API_KEY)
+            self._local.youtube = youtube
+        return youtube
 
     def search_videos(self, keyword: str, fetch_purchase_intent: bool = True) -> Dict:
         """
@@ -512,6 +721,9 @@ class YouTubeClient:
                 "max_results": Config.MAX_YOUTUBE_VIDEOS
             })
 
+            # Respect rate limits
+            self.rate_limiter.acquire()
+
             # Search for videos
             search_response = self.youtube.search().list(
                 q=keyword,
@@ -521,9 +733,6 @@ class YouTubeClient:
                 order='relevance'
             ).execute()
 
-            # Respect rate limits
-            time.sleep(Config.RATE_LIMIT_DELAY)
-
             video_ids = [item['id']['videoId'] for item in search_response.get('items', [])]
 
             # LED 531: Search results received
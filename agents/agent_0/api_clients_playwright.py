@@ -12,13 +12,12 @@ LED Breadcrumb Range: 590-599 (Playwright client operations)
 """
 
 import asyncio
-import json
 import os
-from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 from pathlib import Path
 
 from lib.breadcrumb_system import BreadcrumbTrail
+from lib.response_cache import get_cache
 from .config import Agent0Config as Config
 from .playwright_scraper import PlaywrightScraper
 from .playwright_parser import PlaywrightCSVParser
@@ -41,7 +40,9 @@ class GoogleTrendsPlaywrightClient:
     LED Range: 590-599
     """
 
-    CACHE_DIR = "cache/playwright"
+    CACHE_DIR = "cache/playwright"  # Downloaded CSVs
+    CACHE_SOURCE = "google_trends_playwright"
+    CACHE_PARAMS = {"geo": "US", "timeframe": "today 12-m"}
     CACHE_TTL_HOURS = 24
 
     def __init__(self, trail: BreadcrumbTrail, queue_manager=None):
@@ -58,6 +59,9 @@ class GoogleTrendsPlaywrightClient:
         self.scraper = PlaywrightScraper(trail, cache_dir=self.CACHE_DIR)
         self.parser = PlaywrightCSVParser(trail)
 
+        # Shared response cache (cache/response_cache.db)
+        self.cache = get_cache()
+
         # Ensure cache directory exists
         os.makedirs(self.CACHE_DIR, exist_ok=True)
 
@@ -67,82 +71,65 @@ class GoogleTrendsPlaywrightClient:
             "cache_ttl_hours": self.CACHE_TTL_HOURS
         })
 
-    def _get_cache_path(self, keyword: str) -> str:
-        """Get cache file path for a keyword"""
-        safe_keyword = keyword.replace(' ', '_').replace('/', '_')
-        return os.path.join(self.CACHE_DIR, f"trends_{safe_keyword}.json")
-
     def _load_from_cache(self, keyword: str) -> Optional[Dict]:
         """
         Load cached trend data if available and not expired
 
         Returns None if cache miss or expired
         """
-        cache_path = self._get_cache_path(keyword)
-
-        if not os.path.exists(cache_path):
-            return None
+        entry = self.cache.get_entry(self.CACHE_SOURCE, keyword, self.CACHE_PARAMS, include_expired=True)
 
-        try:
-            with open(cache_path, 'r') as f:
-                cached = json.load(f)
-
-            # Check if cache is expired (24 hour TTL)
-            cached_time = datetime.fromisoformat(cached['cached_at'])
-            age = datetime.now() - cached_time
-
-            if age > timedelta(hours=self.CACHE_TTL_HOURS):
-                # Cache expired
-                self.trail.light(591, {
-                    "action": "cache_expired",
-                    "keyword": keyword,
-                    "age_hours": round(age.total_seconds() / 3600, 1)
-                })
-                return None
-
-            # Cache hit
+        if entry is None:
+            # Cache miss (lights an LED so hit rates count misses too)
             self.trail.light(591, {
-                "action": "cache_hit",
+                "action": "cache_miss",
                 "keyword": keyword,
-                "age_hours": round(age.total_seconds() / 3600, 1)
+                "source": self.CACHE_SOURCE
             })
+            return None
 
-            return cached['data']
+        age_hours = round(entry['age_seconds'] / 3600, 1)
 
-        except Exception as e:
-            # Cache read error - ignore and fetch fresh
+        if entry['expired']:
+            # Cache expired
             self.trail.light(591, {
-                "action": "cache_read_error",
+                "action": "cache_expired",
                 "keyword": keyword,
-                "error": str(e)[:100]
+                "source": self.CACHE_SOURCE,
+                "age_hours": age_hours
             })
             return None
 
-    def _save_to_cache(self, keyword: str, data: Dict):
-        """Save trend data to cache"""
-        cache_path = self._get_cache_path(keyword)
-
-        try:
-            cached = {
-                'keyword': keyword,
-                'cached_at': datetime.now().isoformat(),
-                'data': data
-            }
+        # Cache hit
+        self.trail.light(591, {
+            "action": "cache_hit",
+            "keyword": keyword,
+            "source": self.CACHE_SOURCE,
+            "age_hours": age_hours
+        })
 
-            with open(cache_path, 'w') as f:
-                json.dump(cached, f, indent=2)
+        return entry['value']
 
+    def _save_to_cache(self, keyword: str, data: Dict):
+        """Save trend data to cache"""
+        saved = self.cache.set(
+            self.CACHE_SOURCE,
+            keyword,
+            data,
+            params=self.CACHE_PARAMS,
+            ttl_seconds=self.CACHE_TTL_HOURS * 3600
+        )
+
+        if saved:
             self.trail.light(591, {
                 "action": "cache_saved",
                 "keyword": keyword
             })
-
-        except Exception as e:
+        else:
             # Cache write error - log but don't fail
             self.trail.light(591, {
                 "action": "cache_save_failed",
-                "keyword": keyword,
-                "error": str(e)[:100]
+                "keyword": keyword
             })
 
     def _convert_to_pytrends_format(self, parsed_data: Dict, keyword: str) -> Dict:
@@ -15,13 +15,13 @@ LED Breadcrumb Range: 600-609 (Web Search Client)
 - 609: Cleanup
 """
 
-import json
 import time
 from typing import List, Dict, Optional
-from pathlib import Path
 import pandas as pd
 
 from lib.breadcrumb_system import BreadcrumbTrail
+from lib.rate_limiter import get_limiter
+from lib.response_cache import get_cache
 from .websearch_analyzer import WebSearchAnalyzer
 
 
@@ -41,10 +41,12 @@ class GoogleTrendsWebSearchClient:
         data = client.get_batch_trend_data(['meditation', 'yoga'])
     """
 
+    SEARCH_DELAY = 2.0  # Seconds between searches (be respectful)
+    CACHE_SOURCE = "websearch"
+
     def __init__(
         self,
         trail: BreadcrumbTrail,
-        cache_dir: str = "cache/websearch",
         cache_ttl_hours: int = 24
     ):
         """
@@ -52,7 +54,6 @@ class GoogleTrendsWebSearchClient:
 
         Args:
             trail: LED breadcrumb trail for debugging
-            cache_dir: Directory for cached results
             cache_ttl_hours: Cache time-to-live in hours
 
         Note:
@@ -60,11 +61,11 @@ class GoogleTrendsWebSearchClient:
             Install with: pip install googlesearch-python
         """
         self.trail = trail
-        self.cache_dir = Path(cache_dir)
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.cache = get_cache()
         self.cache_ttl_seconds = cache_ttl_hours * 3600
 
         self.analyzer = WebSearchAnalyzer(trail)
+        self.rate_limiter = get_limiter("websearch", rate=1 / self.SEARCH_DELAY)
 
         # Try to import googlesearch
         try:
@@ -81,7 +82,7 @@ class GoogleTrendsWebSearchClient:
 
         self.trail.light(600, {
             "action": "websearch_client_init",
-            "cache_dir": str(self.cache_dir),
+            "cache_source": self.CACHE_SOURCE,
             "cache_ttl_hours": cache_ttl_hours,
             "search_available": self.search_available
         })
@@ -104,14 +105,21 @@ class GoogleTrendsWebSearchClient:
             try:
                 # Check cache first
                 cached_data = self._check_cache(keyword)
-                if cached_data:
+                if cached_data is not None:
                     self.trail.light(601, {
                         "action": "cache_hit",
-                        "keyword": keyword
+                        "keyword": keyword,
+                        "source": self.CACHE_SOURCE
                     })
                     results[keyword] = cached_data
                     continue
 
+                self.trail.light(601, {
+                    "action": "cache_miss",
+                    "keyword": keyword,
+                    "source": self.CACHE_SOURCE
+                })
+
                 # Execute web searches
                 search_results = self._search_keyword(keyword)
 
@@ -210,8 +218,7 @@ class GoogleTrendsWebSearchClient:
         try:
             # Use googlesearch library
             # Returns URLs only, we'll extract title/snippet from URL
-            import time
-            time.sleep(2)  # Rate limiting (be respectful)
+            self.rate_limiter.acquire()  # Rate limiting (be respectful)
 
             urls = list(self.search_func(query, num_results=max_results, lang="en"))
 
@@ -252,26 +259,14 @@ class GoogleTrendsWebSearchClient:
         Returns:
             Cached DataFrame if valid, None otherwise
         """
-        cache_file = self.cache_dir / f"{self._sanitize_filename(keyword)}.json"
-
-        if not cache_file.exists():
-            return None
+        cache_data = self.cache.get(self.CACHE_SOURCE, keyword)
 
-        # Check age
-        age = time.time() - cache_file.stat().st_mtime
-        if age > self.cache_ttl_seconds:
+        if cache_data is None:
             return None
 
-        # Load cached data
         try:
-            with open(cache_file, 'r') as f:
-                cache_data = json.load(f)
-
             # Reconstruct DataFrame
-            df = pd.DataFrame(cache_data['dataframe'])
-
-            return df
-
+            return pd.DataFrame(cache_data['dataframe'])
         except Exception:
             return None
 
@@ -284,8 +279,6 @@ class GoogleTrendsWebSearchClient:
             df: The DataFrame with trend data
             analysis: The analysis results
         """
-        cache_file = self.cache_dir / f"{self._sanitize_filename(keyword)}.json"
-
         cache_data = {
             'keyword': keyword,
             'timestamp': time.time(),
@@ -293,34 +286,20 @@ class GoogleTrendsWebSearchClient:
             'analysis': analysis
         }
 
-        try:
-            with open(cache_file, 'w') as f:
-                json.dump(cache_data, f, indent=2)
+        saved = self.cache.set(
+            self.CACHE_SOURCE,
+            keyword,
+            cache_data,
+            ttl_seconds=self.cache_ttl_seconds
+        )
 
+        if saved:
             self.trail.light(607, {
                 "action": "cache_saved",
-                "keyword": keyword,
-                "cache_file": str(cache_file)
+                "keyword": keyword
             })
-
-        except Exception as e:
+        else:
             self.trail.light(608, {
                 "action": "cache_save_error",
-                "keyword": keyword,
-                "error": str(e)
+                "keyword": keyword
             })
-
-    def _sanitize_filename(self, keyword: str) -> str:
-        """
-        Sanitize keyword for use as filename
-
-        Args:
-            keyword: The keyword
-
-        Returns:
-            Sanitized filename
-        """
-        # Replace spaces and special chars with underscores
-        sanitized = keyword.lower().replace(' ', '_')
-        sanitized = ''.join(c if c.isalnum() or c == '_' else '_' for c in sanitized)
-        return sanitized
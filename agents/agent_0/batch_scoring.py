@@ -0,0 +1,567 @@
+"""
+Agent 0 Batch Topic Scoring
+Vectorized TopicScorer for rescoring many topics at once
+
+Topics are packed into NumPy columns (interest, posts, engagement, Reddit
+timestamps as a flat ragged array with offsets) and every demand, competition,
+opportunity, richness, recency and zone score is computed with array ops.
+The per-topic dicts are identical to TopicScorer.calculate_composite_score,
+so cached topic entries can be rescored after a weight change without
+re-running the per-topic path. Both read their thresholds from scoring_rules.
+"""
+
+import operator
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from lib.breadcrumb_system import BreadcrumbTrail
+from .config import Agent0Config as Config
+from . import scoring_rules as rules
+
+
+# Trend direction codes (anything unrecognized scores like 'falling' for
+# competition and like 'stable' for demand, matching the per-topic path)
+RISING, STABLE, FALLING, OTHER = 0, 1, 2, 3
+DIRECTION_CODES = {'rising': RISING, 'stable': STABLE, 'falling': FALLING}
+
+SECONDS_PER_DAY = 24 * 60 * 60
+
+
+@dataclass
+class TopicColumns:
+    """
+    Columnar view of N topics' source data
+
+    Row i of every array belongs to topics[i]. Reddit timestamps for row i are
+    timestamps[offsets[i]:offsets[i + 1]].
+    """
+    topics: List[str]
+    has_trends: np.ndarray        # bool - trends_data present (truthy)
+    average_interest: np.ndarray  # float
+    direction: np.ndarray         # int8 trend direction code
+    directions: List[str]         # raw trend_direction strings
+    data_points: np.ndarray       # int64
+    total_posts: np.ndarray       # int64
+    avg_engagement: np.ndarray    # float
+    subreddit_count: np.ndarray   # int64
+    has_youtube: np.ndarray       # bool - youtube_data present (truthy)
+    total_videos: np.ndarray      # int64
+    avg_views: np.ndarray         # float
+    channel_count: np.ndarray     # int64
+    timestamps: np.ndarray        # float - flat Reddit timestamps
+    offsets: np.ndarray           # int64 - N + 1 ragged offsets
+
+    def __len__(self) -> int:
+        return len(self.topics)
+
+    @classmethod
+    def from_topics(cls, topic_entries: Sequence[Dict]) -> "TopicColumns":
+        """
+        Pack topic entries (as saved in topic-selection.json / all_topics)
+
+        Each entry needs 'topic' and 'reddit_data'; 'trends_data' and
+        'youtube_data' may be missing or None.
+        """
+        n = len(topic_entries)
+        has_trends = np.zeros(n, dtype=bool)
+        average_interest = np.zeros(n)
+        direction = np.full(n, STABLE, dtype=np.int8)
+        directions = []
+        data_points = np.zeros(n, dtype=np.int64)
+        total_posts = np.zeros(n, dtype=np.int64)
+        avg_engagement = np.zeros(n)
+        subreddit_count = np.zeros(n, dtype=np.int64)
+        has_youtube = np.zeros(n, dtype=bool)
+        total_videos = np.zeros(n, dtype=np.int64)
+        avg_views = np.zeros(n)
+        channel_count = np.zeros(n, dtype=np.int64)
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        timestamp_lists = []
+
+        for i, entry in enumerate(topic_entries):
+            trends_data = entry.get('trends_data')
+            reddit_data = entry.get('reddit_data')
+            youtube_data = entry.get('youtube_data')
+
+            # FAIL LOUDLY - the per-topic scorer requires Reddit data too
+            if reddit_data is None:
+                raise ValueError(f"Topic '{entry.get('topic')}' has no reddit_data - cannot score")
+
+            trend_direction = 'stable'
+            if trends_data:
+                has_trends[i] = True
+                average_interest[i] = trends_data.get('average_interest', 0)
+                trend_direction = trends_data.get('trend_direction', 'stable')
+                direction[i] = DIRECTION_CODES.get(trend_direction, OTHER)
+                data_points[i] = trends_data.get('data_points', 0)
+            directions.append(trend_direction)
+
+            total_posts[i] = reddit_data.get('total_posts', 0)
+            avg_engagement[i] = reddit_data.get('avg_engagement', 0)
+            subreddit_count[i] = len(reddit_data.get('top_subreddits', []))
+
+            if youtube_data:
+                has_youtube[i] = True
+                total_videos[i] = youtube_data.get('total_videos', 0)
+                avg_views[i] = youtube_data.get('avg_views', 0)
+                channel_count[i] = len(youtube_data.get('top_channels', []))
+
+            timestamps = reddit_data.get('timestamps', [])
+            timestamp_lists.append(timestamps)
+            offsets[i + 1] = offsets[i] + len(timestamps)
+
+        flat = np.fromiter(
+            (ts for timestamps in timestamp_lists for ts in timestamps),
+            dtype=float,
+            count=int(offsets[-1])
+        )
+
+        return cls(
+            topics=[entry.get('topic') for entry in topic_entries],
+            has_trends=has_trends,
+            average_interest=average_interest,
+            direction=direction,
+            directions=directions,
+            data_points=data_points,
+            total_posts=total_posts,
+            avg_engagement=avg_engagement,
+            subreddit_count=subreddit_count,
+            has_youtube=has_youtube,
+            total_videos=total_videos,
+            avg_views=avg_views,
+            channel_count=channel_count,
+            timestamps=flat,
+            offsets=offsets
+        )
+
+
+def _select(conditions: List[np.ndarray], choices: List, default) -> np.ndarray:
+    """np.select with float output (first matching condition wins)"""
+    return np.select(conditions, choices, default=default).astype(float)
+
+
+def _tiers(values: np.ndarray, tiers: rules.Tiers, default, op=operator.ge) -> np.ndarray:
+    """scoring_rules.tier for every row"""
+    if not tiers:
+        return np.broadcast_to(np.asarray(default, dtype=float), values.shape).copy()
+    return _select([op(values, threshold) for threshold, _ in tiers], [value for _, value in tiers], default)
+
+
+def _is_direction(cols: "TopicColumns", trend_direction: str) -> np.ndarray:
+    """Rows whose trend_direction is the given rising/stable/falling name"""
+    return cols.direction == DIRECTION_CODES[trend_direction]
+
+
+class BatchTopicScorer:
+    """
+    Vectorized equivalent of TopicScorer.calculate_composite_score
+
+    Float operations run in the same order as the per-topic code, so every
+    rounded value in the returned dicts matches it exactly.
+    """
+
+    def __init__(self, trail: BreadcrumbTrail):
+        self.trail = trail
+
+    # ------------------------------------------------------------------
+    # Demand
+    # ------------------------------------------------------------------
+
+    def normalize_trends_scores(self, cols: TopicColumns) -> np.ndarray:
+        """TopicScorer.normalize_trends_score for every row (0 without trends data)"""
+        score = cols.average_interest.copy()
+        for trend_direction, multiplier in rules.TRENDS_DIRECTION_MULTIPLIERS.items():
+            score = np.where(_is_direction(cols, trend_direction), score * multiplier, score)
+        low_data = cols.data_points < rules.TRENDS_LOW_DATA_POINTS
+        score = np.where(low_data, score * rules.TRENDS_LOW_DATA_MULTIPLIER, score)
+        score = np.where(
+            ~low_data & (cols.data_points >= rules.TRENDS_HIGH_DATA_POINTS),
+            score * rules.TRENDS_HIGH_DATA_MULTIPLIER,
+            score
+        )
+        score = np.minimum(score, 100.0)
+        return np.where(cols.has_trends, score, 0.0)
+
+    def normalize_reddit_scores(self, cols: TopicColumns) -> np.ndarray:
+        """TopicScorer.normalize_reddit_score for every row"""
+        posts = cols.total_posts
+        volume = _tiers(posts, rules.REDDIT_VOLUME_TIERS, posts * rules.REDDIT_VOLUME_PER_POST)
+        engagement = np.minimum(cols.avg_engagement / rules.REDDIT_ENGAGEMENT_DIVISOR, rules.REDDIT_ENGAGEMENT_CAP)
+        diversity = np.minimum(
+            cols.subreddit_count * rules.REDDIT_DIVERSITY_PER_SUBREDDIT, rules.REDDIT_DIVERSITY_CAP
+        )
+        total = np.minimum(volume + engagement + diversity, 100.0)
+        return np.where(posts == 0, 0.0, total)
+
+    def normalize_youtube_scores(self, cols: TopicColumns) -> np.ndarray:
+        """TopicScorer.normalize_youtube_score for every row (0 without YouTube data)"""
+        videos = cols.total_videos
+        views = cols.avg_views
+        volume = _tiers(videos, rules.YOUTUBE_VOLUME_TIERS, videos * rules.YOUTUBE_VOLUME_PER_VIDEO)
+        low_views = np.where(
+            views > 0,
+            np.minimum((views / 1000) * rules.YOUTUBE_VIEWS_PER_THOUSAND, rules.YOUTUBE_VIEWS_LOW_CAP),
+            0
+        )
+        views_score = _tiers(views, rules.YOUTUBE_VIEWS_TIERS, low_views)
+        diversity = np.minimum(
+            cols.channel_count * rules.YOUTUBE_DIVERSITY_PER_CHANNEL, rules.YOUTUBE_DIVERSITY_CAP
+        )
+        total = np.minimum(volume + views_score + diversity, 100.0)
+        return np.where(cols.has_youtube & (videos > 0), total, 0.0)
+
+    # ------------------------------------------------------------------
+    # Competition
+    # ------------------------------------------------------------------
+
+    def trends_competition(self, cols: TopicColumns) -> np.ndarray:
+        """CompetitionAnalyzer.analyze_trends_competition for every row"""
+        interest = cols.average_interest
+        stable = np.where(
+            interest > rules.TRENDS_STABLE_HIGH_INTEREST,
+            rules.TRENDS_COMPETITION_STABLE_HIGH,
+            rules.TRENDS_COMPETITION_STABLE_LOW
+        )
+        base = _select(
+            [cols.direction == RISING, cols.direction == STABLE],
+            [rules.TRENDS_COMPETITION_RISING, stable],
+            rules.TRENDS_COMPETITION_FALLING
+        )
+        base = np.where(interest > rules.TRENDS_SATURATION_INTEREST, base + rules.TRENDS_SATURATION_BONUS, base)
+        base = np.minimum(base, 100.0)
+        enough_data = cols.has_trends & (cols.data_points >= rules.TRENDS_COMPETITION_MIN_DATA_POINTS)
+        return np.where(enough_data, base, rules.NEUTRAL_COMPETITION)
+
+    def reddit_competition(self, cols: TopicColumns) -> np.ndarray:
+        """CompetitionAnalyzer.analyze_reddit_competition for every row"""
+        posts = cols.total_posts
+        engagement = cols.avg_engagement
+
+        per_post = engagement / np.maximum(posts, 1)
+        engagement_score = _tiers(
+            per_post,
+            rules.REDDIT_ENGAGEMENT_PER_POST_TIERS,
+            rules.REDDIT_ENGAGEMENT_PER_POST_DEFAULT,
+            operator.gt
+        )
+
+        count = cols.subreddit_count
+        concentration_score = np.where(
+            count == 0,
+            rules.REDDIT_CONCENTRATION_NO_DATA,
+            _tiers(count, rules.REDDIT_CONCENTRATION_TIERS, rules.REDDIT_CONCENTRATION_DEFAULT)
+        )
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            density = posts / (engagement / rules.REDDIT_DENSITY_NORMALIZER)
+        volume_score = _tiers(density, rules.REDDIT_DENSITY_TIERS, rules.REDDIT_DENSITY_DEFAULT, operator.gt)
+        volume_score = np.where((posts > 0) & (engagement > 0), volume_score, rules.REDDIT_DENSITY_NO_DATA)
+
+        engagement_weight, concentration_weight, volume_weight = rules.REDDIT_COMPETITION_WEIGHTS
+        base = (
+            engagement_score * engagement_weight +
+            concentration_score * concentration_weight +
+            volume_score * volume_weight
+        )
+        base = np.minimum(np.maximum(base, 0), 100.0)
+        return np.where(posts == 0, rules.NEUTRAL_COMPETITION, base)
+
+    # ------------------------------------------------------------------
+    # Richness and recency
+    # ------------------------------------------------------------------
+
+    def richness_scores(self, cols: TopicColumns) -> Dict[str, np.ndarray]:
+        """Per-source and overall data richness (TopicScorer.calculate_data_richness)"""
+        has_trends = cols.has_trends & (cols.data_points > 0)
+        has_reddit = cols.total_posts > 0
+
+        coverage_weight, interest_weight = rules.TRENDS_RICHNESS_WEIGHTS
+        trends = np.minimum(
+            (cols.data_points / rules.TRENDS_RICHNESS_FULL_POINTS) * coverage_weight +
+            (cols.average_interest / 100) * interest_weight,
+            100
+        )
+        volume_weight, engagement_weight = rules.REDDIT_RICHNESS_WEIGHTS
+        reddit = np.minimum(
+            (cols.total_posts / rules.REDDIT_RICHNESS_FULL_POSTS) * volume_weight +
+            (cols.avg_engagement / rules.REDDIT_RICHNESS_FULL_ENGAGEMENT) * engagement_weight,
+            100
+        )
+
+        overall = _select(
+            [has_trends & has_reddit, has_trends, has_reddit],
+            [(trends + reddit) / 2, trends, reddit],
+            0
+        )
+        return {
+            "trends": trends,
+            "reddit": reddit,
+            "has_trends": has_trends,
+            "has_reddit": has_reddit,
+            "overall": overall
+        }
+
+    def recency_scores(self, cols: TopicColumns, now: float) -> Dict[str, np.ndarray]:
+        """Reddit timestamp recency (TopicScorer.calculate_recency_score)"""
+        n = len(cols)
+        lengths = np.diff(cols.offsets)
+        rows = np.repeat(np.arange(n), lengths)
+
+        ages = now - cols.timestamps
+        recent_30 = np.bincount(rows[ages <= rules.RECENT_DAYS * SECONDS_PER_DAY], minlength=n)
+        recent_90 = np.bincount(rows[ages <= rules.ACTIVE_DAYS * SECONDS_PER_DAY], minlength=n)
+
+        # Age sums accumulate left to right like the per-topic loop; cumsum is
+        # sequential, so pad each row with zeros and take the last column
+        age_days = np.zeros((n, int(lengths.max()) if n else 0))
+        age_days[rows, np.arange(len(rows)) - cols.offsets[rows]] = ages / SECONDS_PER_DAY
+        total_age_days = np.cumsum(age_days, axis=1)[:, -1] if age_days.size else np.zeros(n)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            recent_90_pct = (recent_90 / lengths) * 100
+            avg_age_days = total_age_days / lengths
+        activity_weight, momentum_weight, freshness_weight = rules.RECENCY_WEIGHTS
+        activity = np.minimum(recent_90_pct, 100) * activity_weight
+
+        momentum = np.full(n, rules.MOMENTUM_DEFAULT * momentum_weight)
+        for trend_direction, score in rules.MOMENTUM_SCORES.items():
+            rows_with = cols.has_trends & _is_direction(cols, trend_direction)
+            momentum = np.where(rows_with, score * momentum_weight, momentum)
+        freshness = np.maximum(0, (1 - (avg_age_days / rules.FRESHNESS_DAYS)) * 100) * freshness_weight
+
+        return {
+            "recency_score": activity + momentum + freshness,
+            "recent_activity_pct": recent_90_pct,
+            "avg_content_age_days": avg_age_days,
+            "recent_30_days": recent_30,
+            "recent_90_days": recent_90,
+            "total_content": lengths
+        }
+
+    # ------------------------------------------------------------------
+    # Composite
+    # ------------------------------------------------------------------
+
+    def score_arrays(
+        self,
+        cols: TopicColumns,
+        now: Optional[float] = None,
+        weight_trends: Optional[float] = None,
+        weight_reddit: Optional[float] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Compute every score column without building per-topic dicts
+
+        weight_trends / weight_reddit override Config.WEIGHT_GOOGLE_TRENDS /
+        Config.WEIGHT_REDDIT for the 2-source blend (for weight sweeps).
+        """
+        if weight_trends is None:
+            weight_trends = Config.WEIGHT_GOOGLE_TRENDS
+        if weight_reddit is None:
+            weight_reddit = Config.WEIGHT_REDDIT
+        if now is None:
+            now = datetime.now().timestamp()
+
+        trends_score = self.normalize_trends_scores(cols)
+        reddit_score = self.normalize_reddit_scores(cols)
+        youtube_score = self.normalize_youtube_scores(cols)
+
+        sources_with_data = (
+            (cols.has_trends & (cols.data_points > 0)).astype(np.int64) +
+            (cols.total_posts > 0) +
+            (cols.has_youtube & (cols.total_videos > 0))
+        )
+
+        three_source = cols.has_youtube if Config.ENABLE_YOUTUBE else np.zeros(len(cols), dtype=bool)
+        reddit_only = np.ones(len(cols), dtype=bool) if Config.DRILLDOWN_MODE else ~cols.has_trends
+        three_trends, three_reddit, three_youtube = rules.THREE_SOURCE_WEIGHTS
+        composite = _select(
+            [three_source, reddit_only],
+            [
+                trends_score * three_trends + reddit_score * three_reddit + youtube_score * three_youtube,
+                reddit_score
+            ],
+            trends_score * weight_trends + reddit_score * weight_reddit
+        )
+
+        if Config.DRILLDOWN_MODE:
+            confidence = np.where(sources_with_data > 0, rules.DRILLDOWN_CONFIDENCE, 0)
+        elif Config.ENABLE_YOUTUBE:
+            confidence = np.array([rules.THREE_SOURCE_CONFIDENCE[count] for count in range(4)])[sources_with_data]
+        else:
+            # FAIL LOUDLY like the per-topic lookup when 3 sources show up in 2-source mode
+            if (sources_with_data > 2).any():
+                raise ValueError("3 sources with data while ENABLE_YOUTUBE is off - cannot assign confidence")
+            confidence = np.array([rules.TWO_SOURCE_CONFIDENCE[count] for count in range(3)])[sources_with_data]
+
+        trends_comp = self.trends_competition(cols)
+        reddit_comp = self.reddit_competition(cols)
+        overall = (trends_comp + reddit_comp) / 2.0
+        # Opportunity, complexity, zone and insights see the rounded competition
+        competition = np.array([round(value, 2) for value in overall.tolist()])
+        opportunity = composite * (1 - competition / 100)
+
+        audience = np.maximum(
+            (cols.average_interest * rules.TRENDS_AUDIENCE_PER_INTEREST).astype(np.int64) +
+            (cols.total_posts * cols.avg_engagement * rules.REDDIT_AUDIENCE_MULTIPLIER).astype(np.int64),
+            rules.MIN_AUDIENCE
+        )
+
+        return {
+            "trends_score": trends_score,
+            "reddit_score": reddit_score,
+            "youtube_score": youtube_score,
+            "composite": composite,
+            "sources_with_data": sources_with_data,
+            "confidence": confidence,
+            "trends_competition": trends_comp,
+            "reddit_competition": reddit_comp,
+            "overall_competition": overall,
+            "competition_score": competition,
+            "opportunity": opportunity,
+            "audience_size": audience,
+            "richness": self.richness_scores(cols),
+            "recency": self.recency_scores(cols, now)
+        }
+
+    def score(
+        self,
+        cols: TopicColumns,
+        now: Optional[float] = None,
+        weight_trends: Optional[float] = None,
+        weight_reddit: Optional[float] = None
+    ) -> List[Dict]:
+        """
+        Score every topic, returning the same dicts as calculate_composite_score
+
+        Lights one LED pair for the batch instead of the per-topic LEDs.
+        """
+        self.trail.light(Config.LED_SCORING_START + 2, {
+            "action": "batch_score",
+            "topics": len(cols)
+        })
+
+        arrays = self.score_arrays(cols, now, weight_trends, weight_reddit)
+        results = [self._topic_result(cols, arrays, i) for i in range(len(cols))]
+
+        self.trail.light(Config.LED_SCORING_START + 3, {
+            "action": "batch_score_complete",
+            "topics": len(results)
+        })
+
+        return results
+
+    def _topic_result(self, cols: TopicColumns, arrays: Dict, i: int) -> Dict:
+        """Assemble one topic's result dict from the score columns"""
+        composite = float(arrays["composite"][i])
+        overall = float(arrays["overall_competition"][i])
+        competition_score = float(arrays["competition_score"][i])
+        has_trends = bool(cols.has_trends[i])
+        has_youtube = bool(cols.has_youtube[i])
+
+        return {
+            "composite_score": round(composite, 2),
+            "trends_score": round(float(arrays["trends_score"][i]), 2),
+            "reddit_score": round(float(arrays["reddit_score"][i]), 2),
+            "youtube_score": round(float(arrays["youtube_score"][i]), 2) if has_youtube else None,
+            "confidence": int(arrays["confidence"][i]),
+            "sources_with_data": int(arrays["sources_with_data"][i]),
+            "competition": self._competition(arrays, i, overall),
+            "opportunity": self._opportunity(composite, competition_score, float(arrays["opportunity"][i])),
+            "insights": self._insights(cols, i, composite, competition_score),
+            "audience_size": int(arrays["audience_size"][i]),
+            "zone": rules.zone(composite, competition_score),
+            "richness": self._richness(cols, arrays["richness"], i),
+            "recency": self._recency(cols, arrays["recency"], i, has_trends)
+        }
+
+    @staticmethod
+    def _competition(arrays: Dict, i: int, overall: float) -> Dict:
+        level, emoji, description = rules.competition_level(overall)
+
+        return {
+            "trends_competition": round(float(arrays["trends_competition"][i]), 2),
+            "reddit_competition": round(float(arrays["reddit_competition"][i]), 2),
+            "overall_competition": round(overall, 2),
+            "competition_level": level,
+            "competition_emoji": emoji,
+            "competition_description": description
+        }
+
+    @staticmethod
+    def _opportunity(demand_score: float, competition_score: float, opportunity: float) -> Dict:
+        recommendation, emoji, description, risk = rules.opportunity_labels(opportunity)
+        complexity, complexity_desc = rules.complexity(demand_score, competition_score)
+
+        return {
+            "opportunity_score": round(opportunity, 2),
+            "recommendation": recommendation,
+            "recommendation_emoji": emoji,
+            "recommendation_description": description,
+            "risk_level": risk,
+            "complexity": complexity,
+            "complexity_description": complexity_desc,
+            "demand_score": demand_score,
+            "competition_score": competition_score
+        }
+
+    @staticmethod
+    def _insights(cols: TopicColumns, i: int, demand: float, comp: float) -> List[str]:
+        return rules.insights(
+            demand,
+            comp,
+            cols.directions[i] if cols.has_trends[i] else None,
+            int(cols.total_posts[i]),
+            float(cols.avg_engagement[i])
+        )
+
+    @staticmethod
+    def _richness(cols: TopicColumns, richness: Dict, i: int) -> Dict:
+        breakdown = {}
+        if richness["has_trends"][i]:
+            breakdown['trends'] = {
+                'richness': round(float(richness["trends"][i]), 1),
+                'data_points': int(cols.data_points[i]),
+                'average_interest': float(cols.average_interest[i])
+            }
+        if richness["has_reddit"][i]:
+            breakdown['reddit'] = {
+                'richness': round(float(richness["reddit"][i]), 1),
+                'total_posts': int(cols.total_posts[i]),
+                'avg_engagement': float(cols.avg_engagement[i])
+            }
+
+        overall = float(richness["overall"][i])
+        return {
+            'richness_score': round(overall, 2),
+            'richness_stars': rules.richness_stars(overall),
+            'sources_count': len(breakdown),
+            'breakdown': breakdown
+        }
+
+    @staticmethod
+    def _recency(cols: TopicColumns, recency: Dict, i: int, has_trends: bool) -> Dict:
+        total_content = int(recency["total_content"][i])
+        if total_content == 0:
+            return {
+                'recency_score': 0,
+                'recent_activity_pct': 0,
+                'trend_momentum': 'no_data',
+                'avg_content_age_days': 0,
+                'recent_30_days': 0,
+                'recent_90_days': 0,
+                'total_content': 0
+            }
+
+        return {
+            'recency_score': round(float(recency["recency_score"][i]), 2),
+            'recent_activity_pct': round(float(recency["recent_activity_pct"][i]), 1),
+            'trend_momentum': cols.directions[i] if has_trends else 'no_data',
+            'avg_content_age_days': round(float(recency["avg_content_age_days"][i]), 1),
+            'recent_30_days': int(recency["recent_30_days"][i]),
+            'recent_90_days': int(recency["recent_90_days"][i]),
+            'total_content': total_content
+        }
@@ -0,0 +1,176 @@
+"""
+Agent 0: Batch Topic Scoring Benchmark
+
+Compares the columnar BatchTopicScorer against the per-topic
+TopicScorer.calculate_composite_score on synthetic topics, and fails if the
+two produce different result dicts.
+
+Usage:
+    python agents/agent_0/benchmark_batch_scoring.py
+    python agents/agent_0/benchmark_batch_scoring.py --sizes 1000 10000 --seed 7
+    python agents/agent_0/benchmark_batch_scoring.py --skip-legacy --sizes 1000000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Dict, List
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from lib.breadcrumb_system import BreadcrumbTrail
+from agents.agent_0.batch_scoring import BatchTopicScorer, TopicColumns
+from agents.agent_0.scoring import TopicScorer
+
+
+DIRECTIONS = ['rising', 'stable', 'falling', 'no_data', 'error']
+DAY = 24 * 60 * 60
+
+
+def generate_topics(count: int, now: float, seed: int = 42) -> List[Dict]:
+    """
+    Deterministic synthetic topic entries shaped like Agent 0's all_topics
+
+    Mixes drill-down topics (no trends data), empty Reddit results, boundary
+    values on every threshold and the odd trend directions the clients emit.
+    """
+    rng = random.Random(seed)
+    topics = []
+
+    for i in range(count):
+        roll = rng.random()
+        if roll < 0.1:
+            trends_data = None
+        elif roll < 0.15:
+            trends_data = {}
+        else:
+            trends_data = {
+                "keyword": f"topic {i}",
+                "average_interest": rng.choice([0, 60, 80, round(rng.uniform(0, 100), 2)]),
+                "trend_direction": rng.choice(DIRECTIONS),
+                "data_points": rng.choice([0, 9, 10, 29, 30, 52, rng.randint(0, 260)])
+            }
+
+        posts = rng.choice([0, 5, 10, 30, 31, 50, 100, rng.randint(0, 250)])
+        timestamps = [
+            now - rng.choice([30 * DAY, 90 * DAY, rng.uniform(0, 800 * DAY)])
+            for _ in range(posts if rng.random() < 0.9 else 0)
+        ]
+        reddit_data = {
+            "keyword": f"topic {i}",
+            "total_posts": posts,
+            "avg_engagement": rng.choice([0, 1000, 2000, round(rng.uniform(0, 6000), 2)]) if posts else 0,
+            "top_subreddits": [f"sub{j}" for j in range(rng.randint(0, 7))],
+            "timestamps": timestamps
+        }
+
+        topics.append({
+            "topic": f"topic {i}",
+            "trends_data": trends_data,
+            "reddit_data": reddit_data,
+            "youtube_data": None
+        })
+
+    return topics
+
+
+def legacy_scores(scorer: TopicScorer, topics: List[Dict], now: float) -> List[Dict]:
+    """Per-topic path, one calculate_composite_score call per topic"""
+    return [
+        scorer.calculate_composite_score(
+            entry['trends_data'],
+            entry['reddit_data'],
+            entry['youtube_data'],
+            now=now
+        )
+        for entry in topics
+    ]
+
+
+def run_benchmark(sizes: List[int], seed: int, skip_legacy: bool) -> Dict:
+    trail = BreadcrumbTrail("Agent0_BatchScoringBenchmark")
+    scorer = TopicScorer(trail)
+    batch_scorer = BatchTopicScorer(trail)
+    now = time.time()
+    results = {}
+
+    for size in sizes:
+        topics = generate_topics(size, now, seed)
+
+        start = time.perf_counter()
+        columns = TopicColumns.from_topics(topics)
+        pack_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        batch_scorer.score_arrays(columns, now=now)
+        arrays_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        fast = batch_scorer.score(columns, now=now)
+        batch_seconds = time.perf_counter() - start
+
+        row = {
+            "topics": size,
+            "pack_seconds": round(pack_seconds, 3),
+            "arrays_seconds": round(arrays_seconds, 4),
+            "batch_seconds": round(batch_seconds, 3),
+            "batch_topics_per_sec": round(size / batch_seconds)
+        }
+
+        if not skip_legacy:
+            start = time.perf_counter()
+            slow = legacy_scores(scorer, topics, now)
+            slow_seconds = time.perf_counter() - start
+
+            for entry, expected, actual in zip(topics, slow, fast):
+                if expected != actual:
+                    raise ValueError(
+                        f"Batch scores differ from per-topic scores for '{entry['topic']}' "
+                        f"at {size} topics (seed {seed}):\n"
+                        f"  per-topic: {expected}\n"
+                        f"  batch:     {actual}"
+                    )
+
+            row["legacy_seconds"] = round(slow_seconds, 3)
+            row["legacy_topics_per_sec"] = round(size / slow_seconds)
+            row["speedup"] = round(slow_seconds / batch_seconds, 2)
+
+        results[size] = row
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the columnar batch topic scorer")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000],
+                        help='Topic counts to benchmark (default: 1000 10000)')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed for synthetic topics')
+    parser.add_argument('--skip-legacy', action='store_true',
+                        help='Only time the batch scorer (no parity check)')
+    args = parser.parse_args()
+
+    results = run_benchmark(args.sizes, args.seed, args.skip_legacy)
+
+    print(f"\n{'='*86}")
+    print("BATCH TOPIC SCORING BENCHMARK")
+    print(f"{'='*86}")
+    print(f"{'Topics':>10} {'Pack':>8} {'Arrays':>9} {'Dicts':>8} {'Topics/sec':>11} "
+          f"{'Per-topic':>10} {'Topics/sec':>11} {'Speedup':>8}")
+    for row in results.values():
+        print(
+            f"{row['topics']:>10,} {row['pack_seconds']:>7.2f}s {row['arrays_seconds']:>8.4f}s "
+            f"{row['batch_seconds']:>7.2f}s {row['batch_topics_per_sec']:>11,} "
+            + (
+                f"{row['legacy_seconds']:>9.2f}s {row['legacy_topics_per_sec']:>11,} {row['speedup']:>7}x"
+                if 'legacy_seconds' in row else f"{'-':>10} {'-':>11} {'-':>8}"
+            )
+        )
+    if not args.skip_legacy:
+        print("\n✅ Batch scores identical to per-topic TopicScorer")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+Agent 0: Purchase Intent Analyzer Benchmark
+
+Compares the single-pass scanner (PurchaseIntentAnalyzer.scan_batch) against
+the original per-category passes on synthetic Reddit posts, and fails if the
+two produce different results.
+
+Usage:
+    python agents/agent_0/benchmark_purchase_intent.py
+    python agents/agent_0/benchmark_purchase_intent.py --sizes 10000 100000 --seed 7
+    python agents/agent_0/benchmark_purchase_intent.py --skip-legacy --sizes 1000000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from types import SimpleNamespace
+from typing import Dict, List
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from lib.breadcrumb_system import BreadcrumbTrail
+from agents.agent_0.purchase_intent_analyzer import PurchaseIntentAnalyzer
+
+
+# Vocabulary mixes every signal category with filler and tricky near-misses
+# (substrings of keywords, multi-word phrases, odd casing, price formats)
+SIGNAL_WORDS = [
+    "buy", "Buying", "bought", "purchase", "purchased", "worth", "value", "worthwhile",
+    "recommend", "suggestion", "suggest", "best", "price", "cost", "expensive", "cheap",
+    "affordable", "budget", "pay", "paid", "paying", "subscription", "subscribe", "vs",
+    "versus", "compare", "comparison", "alternative", "should I", "which one",
+    "what's the best", "what is the best", "how much", "how do i", "how can you",
+    "which is better", "looking for", "need help", "need advice", "need recommendation",
+    "affiliate", "commission", "sponsored", "ad", "promo code", "discount code",
+    "referral", "link in bio", "adiscount code", "somehow do i", "bestseller",
+    "repay", "vsco", "$10", "$ 49.99", "$1,299/mo", "$5 / year", "$0", "$20000",
+    "$12.5", "$3/month", "SHOULD I", "ſhould i", "Kindle", "read", "had",
+]
+
+FILLER_WORDS = [
+    "the", "a", "my", "book", "novel", "series", "app", "kindle", "author", "love",
+    "story", "chapter", "for", "and", "it", "is", "this", "really", "good", "tips",
+]
+
+
+def generate_posts(count: int, seed: int = 42) -> List:
+    """Deterministic synthetic posts shaped like PRAW submissions"""
+    rng = random.Random(seed)
+
+    def sentence(length: int) -> str:
+        words = []
+        for _ in range(length):
+            pool = SIGNAL_WORDS if rng.random() < 0.15 else FILLER_WORDS
+            word = rng.choice(pool)
+            # Punctuation and glued tokens exercise word boundaries
+            roll = rng.random()
+            if roll < 0.05:
+                word += rng.choice(["?", ".", ",", "!", "'s"])
+            elif roll < 0.08:
+                word += rng.choice(SIGNAL_WORDS)
+            words.append(word)
+        return " ".join(words)
+
+    return [
+        SimpleNamespace(title=sentence(rng.randint(4, 14)), selftext=sentence(rng.randint(0, 120)))
+        for _ in range(count)
+    ]
+
+
+def legacy_analysis(analyzer: PurchaseIntentAnalyzer, posts: List) -> tuple:
+    """Original four passes over the posts"""
+    return (
+        analyzer._analyze_purchase_keywords(posts),
+        analyzer._analyze_price_mentions(posts),
+        analyzer._analyze_problem_frequency(posts),
+        analyzer._analyze_monetization_signals(posts)
+    )
+
+
+def single_pass_analysis(analyzer: PurchaseIntentAnalyzer, posts: List) -> tuple:
+    """Single-pass scan over the same posts"""
+    texts = [f"{post.title} {post.selftext}" for post in posts]
+    return analyzer._summarize_batch(analyzer.scan_batch(texts))
+
+
+def run_benchmark(sizes: List[int], seed: int, skip_legacy: bool) -> Dict:
+    trail = BreadcrumbTrail("Agent0_PurchaseIntentBenchmark")
+    analyzer = PurchaseIntentAnalyzer(trail)
+    results = {}
+
+    for size in sizes:
+        posts = generate_posts(size, seed)
+        total_chars = sum(len(post.title) + len(post.selftext) + 1 for post in posts)
+
+        start = time.perf_counter()
+        fast = single_pass_analysis(analyzer, posts)
+        fast_seconds = time.perf_counter() - start
+
+        row = {
+            "posts": size,
+            "megabytes": round(total_chars / 1e6, 1),
+            "single_pass_seconds": round(fast_seconds, 3),
+            "single_pass_posts_per_sec": round(size / fast_seconds)
+        }
+
+        if not skip_legacy:
+            start = time.perf_counter()
+            slow = legacy_analysis(analyzer, posts)
+            slow_seconds = time.perf_counter() - start
+
+            if slow != fast:
+                raise ValueError(
+                    f"Single-pass scan differs from legacy passes at {size} posts (seed {seed}):\n"
+                    f"  legacy:      {slow}\n"
+                    f"  single-pass: {fast}"
+                )
+
+            row["legacy_seconds"] = round(slow_seconds, 3)
+            row["legacy_posts_per_sec"] = round(size / slow_seconds)
+            row["speedup"] = round(slow_seconds / fast_seconds, 2)
+
+        results[size] = row
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the single-pass purchase intent scanner")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000],
+                        help='Post counts to benchmark (default: 10000 100000)')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed for synthetic posts')
+    parser.add_argument('--skip-legacy', action='store_true',
+                        help='Only time the single-pass scanner (no parity check)')
+    args = parser.parse_args()
+
+    results = run_benchmark(args.sizes, args.seed, args.skip_legacy)
+
+    print(f"\n{'='*78}")
+    print("PURCHASE INTENT ANALYZER BENCHMARK")
+    print(f"{'='*78}")
+    print(f"{'Posts':>10} {'MB':>6} {'Single-pass':>12} {'Posts/sec':>11} {'Legacy':>10} {'Posts/sec':>11} {'Speedup':>8}")
+    for row in results.values():
+        print(
+            f"{row['posts']:>10,} {row['megabytes']:>6} "
+            f"{row['single_pass_seconds']:>11.2f}s {row['single_pass_posts_per_sec']:>11,} "
+            + (
+                f"{row['legacy_seconds']:>9.2f}s {row['legacy_posts_per_sec']:>11,} {row['speedup']:>7}x"
+                if 'legacy_seconds' in row else f"{'-':>10} {'-':>11} {'-':>8}"
+            )
+        )
+    if not args.skip_legacy:
+        print("\n✅ Single-pass results identical to legacy passes")
+
+
+if __name__ == "__main__":
+    main()
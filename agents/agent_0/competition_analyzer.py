@@ -5,9 +5,11 @@ Analyzes market saturation and competitive landscape for topics
 Goal: Find high-demand, low-competition opportunities (the "sweet spot")
 """
 
+import operator
 from typing import Dict, List
 from lib.breadcrumb_system import BreadcrumbTrail
 from .config import Agent0Config as Config
+from . import scoring_rules as rules
 
 
 class CompetitionAnalyzer:
@@ -48,15 +50,15 @@ class CompetitionAnalyzer:
         """
         # Handle drill-down mode (no trends data)
         if not trends_data:
-            return 50.0  # Default moderate competition when no trends data
+            return rules.NEUTRAL_COMPETITION  # Default moderate competition when no trends data
 
         trend_direction = trends_data.get('trend_direction', 'stable')
         average_interest = trends_data.get('average_interest', 0)
         data_points = trends_data.get('data_points', 0)
 
-        if data_points < 10:
+        if data_points < rules.TRENDS_COMPETITION_MIN_DATA_POINTS:
             # Not enough data - assume moderate competition
-            return 50.0
+            return rules.NEUTRAL_COMPETITION
 
         # Calculate trend stability (variance indicator)
         # Rising trend = low competition (emerging market)
@@ -64,21 +66,21 @@ class CompetitionAnalyzer:
         # Falling = high competition (dying market)
 
         if trend_direction == 'rising':
-            base_competition = 20  # Low - emerging opportunity
+            base_competition = rules.TRENDS_COMPETITION_RISING  # Low - emerging opportunity
         elif trend_direction == 'stable':
             # Stable + high interest = saturated
             # Stable + low interest = niche
-            if average_interest > 60:
-                base_competition = 70  # High - mature/saturated
+            if average_interest > rules.TRENDS_STABLE_HIGH_INTEREST:
+                base_competition = rules.TRENDS_COMPETITION_STABLE_HIGH  # High - mature/saturated
             else:
-                base_competition = 40  # Moderate - niche market
+                base_competition = rules.TRENDS_COMPETITION_STABLE_LOW  # Moderate - niche market
         else:  # falling
-            base_competition = 80  # High - declining market
+            base_competition = rules.TRENDS_COMPETITION_FALLING  # High - declining market
 
         # Adjust for overall interest level
         # Very high sustained interest often means saturation
-        if average_interest > 80:
-            base_competition += 10
+        if average_interest > rules.TRENDS_SATURATION_INTEREST:
+            base_competition += rules.TRENDS_SATURATION_BONUS
 
         return min(base_competition, 100.0)
 
@@ -110,78 +112,55 @@ class CompetitionAnalyzer:
         top_subreddits = reddit_data.get('top_subreddits', [])
 
         if total_posts == 0:
-            return 50.0  # Unknown - assume moderate
+            return rules.NEUTRAL_COMPETITION  # Unknown - assume moderate
 
         # GRANULAR METRIC 1: Engagement Rate Per Post
         # This varies continuously even when total_posts is always ~50
         # High engagement/post = passionate community (could be low OR high competition)
-        # We interpret high engagement as problem-focused (low competition)
+        # We interpret high engagement as problem-focused (low competition):
+        # passionate pain points > active discussions > some solutions >
+        # maturing market; very low engagement = either niche or saturated
         engagement_per_post = avg_engagement / max(total_posts, 1)
-
-        if engagement_per_post > 200:
-            # Very high engagement per post = passionate pain points = low competition
-            engagement_score = 20
-        elif engagement_per_post > 100:
-            # High engagement per post = active discussions = moderate competition
-            engagement_score = 35
-        elif engagement_per_post > 50:
-            # Moderate engagement per post = some solutions = moderate-high competition
-            engagement_score = 55
-        elif engagement_per_post > 20:
-            # Low-moderate engagement = maturing market
-            engagement_score = 70
-        else:
-            # Low engagement per post = either niche or saturated
-            engagement_score = 60
+        engagement_score = rules.tier(
+            engagement_per_post,
+            rules.REDDIT_ENGAGEMENT_PER_POST_TIERS,
+            rules.REDDIT_ENGAGEMENT_PER_POST_DEFAULT,
+            operator.gt
+        )
 
         # GRANULAR METRIC 2: Subreddit Concentration Index
         # Spread across many subreddits = mainstream/competitive
-        # Concentrated in few = niche opportunity
+        # Concentrated in few = niche opportunity (1 subreddit = very niche)
         subreddit_count = len(top_subreddits)
         if subreddit_count == 0:
-            concentration_score = 50  # No data
-        elif subreddit_count >= 5:
-            # Spread across many communities = mainstream appeal = higher competition
-            concentration_score = 75
-        elif subreddit_count >= 3:
-            # Moderate spread = growing topic
-            concentration_score = 55
-        elif subreddit_count >= 2:
-            # Focused but not isolated = niche opportunity
-            concentration_score = 35
-        else:  # 1 subreddit
-            # Highly concentrated = very niche = low competition
-            concentration_score = 25
+            concentration_score = rules.REDDIT_CONCENTRATION_NO_DATA
+        else:
+            concentration_score = rules.tier(
+                subreddit_count, rules.REDDIT_CONCENTRATION_TIERS, rules.REDDIT_CONCENTRATION_DEFAULT
+            )
 
         # GRANULAR METRIC 3: Post Volume Density
         # Post count relative to engagement
         # Many posts + high engagement = active market (more competitive)
         # Many posts + low engagement = saturated (very competitive)
+        # Very low density = potential gap
         if total_posts > 0 and avg_engagement > 0:
-            density_ratio = total_posts / (avg_engagement / 100)  # Normalized
-            if density_ratio > 5:
-                # High density = saturated
-                volume_score = 85
-            elif density_ratio > 2:
-                # Moderate density = competitive
-                volume_score = 65
-            elif density_ratio > 0.5:
-                # Low density = healthy
-                volume_score = 45
-            else:
-                # Very low density = potential gap
-                volume_score = 30
+            density_ratio = total_posts / (avg_engagement / rules.REDDIT_DENSITY_NORMALIZER)  # Normalized
+            volume_score = rules.tier(
+                density_ratio, rules.REDDIT_DENSITY_TIERS, rules.REDDIT_DENSITY_DEFAULT, operator.gt
+            )
         else:
-            volume_score = 50
+            volume_score = rules.REDDIT_DENSITY_NO_DATA
 
         # Weighted composite
         # Engagement: 40% (primary signal)
         # Concentration: 35% (market spread)
         # Volume: 25% (saturation check)
+        engagement_weight, concentration_weight, volume_weight = rules.REDDIT_COMPETITION_WEIGHTS
         base_competition = (
-            engagement_score * 0.40 +
-            concentration_score * 0.35 +
-            volume_score * 0.25
+            engagement_score * engagement_weight +
+            concentration_score * concentration_weight +
+            volume_score * volume_weight
         )
 
         return min(max(base_competition, 0), 100.0)
@@ -212,22 +191,7 @@ class CompetitionAnalyzer:
         overall = (trends_comp + reddit_comp) / 2.0
 
         # Categorize competition level
-        if overall < 30:
-            level = 'low'
-            emoji = '🟢'
-            description = 'LOW - OPPORTUNITY!'
-        elif overall < 50:
-            level = 'moderate'
-            emoji = '🟡'
-            description = 'MODERATE'
-        elif overall < 70:
-            level = 'high'
-            emoji = '🟠'
-            description = 'HIGH'
-        else:
-            level = 'very_high'
-            emoji = '🔴'
-            description = 'VERY HIGH - SATURATED'
+        level, emoji, description = rules.competition_level(overall)
 
         result = {
             "trends_competition": round(trends_comp, 2),
@@ -269,40 +233,10 @@ class CompetitionAnalyzer:
         opportunity = demand_score * (1 - competition_score / 100)
 
         # Categorize opportunity
-        if opportunity >= 60:
-            recommendation = 'high_priority'
-            emoji = '🟢'
-            description = 'HIGH PRIORITY - Strong demand, low competition'
-            risk = 'LOW'
-        elif opportunity >= 45:
-            recommendation = 'viable'
-            emoji = '🟡'
-            description = 'VIABLE - Good opportunity with effort'
-            risk = 'MODERATE'
-        elif opportunity >= 30:
-            recommendation = 'risky'
-            emoji = '🔵'
-            description = 'RISKY - Need strong differentiation'
-            risk = 'HIGH'
-        else:
-            recommendation = 'avoid'
-            emoji = '🔴'
-            description = 'AVOID - Poor opportunity'
-            risk = 'VERY HIGH'
+        recommendation, emoji, description, risk = rules.opportunity_labels(opportunity)
 
         # Determine complexity level
-        if demand_score >= 70 and competition_score <= 30:
-            complexity = 'SIMPLE'
-            complexity_desc = 'First-time ebook creator friendly'
-        elif demand_score >= 50 and competition_score <= 50:
-            complexity = 'MODERATE'
-            complexity_desc = 'Standard ebook approach works'
-        elif demand_score >= 50:
-            complexity = 'COMPLEX'
-            complexity_desc = 'Need unique angle or superior quality'
-        else:
-            complexity = 'VERY COMPLEX'
-            complexity_desc = 'Market validation required'
+        complexity, complexity_desc = rules.complexity(demand_score, competition_score)
 
         result = {
             "opportunity_score": round(opportunity, 2),
@@ -342,17 +276,17 @@ class CompetitionAnalyzer:
         """
         # Google Trends: Average interest as search volume proxy (increased weight)
         trends_interest = trends_data.get('average_interest', 0) if trends_data else 0
-        trends_audience = int(trends_interest * 150000)  # Increased scale factor
+        trends_audience = int(trends_interest * rules.TRENDS_AUDIENCE_PER_INTEREST)  # Increased scale factor
 
         # Reddit: Engagement metric (posts × average score, doubled weight)
         reddit_posts = reddit_data.get('total_posts', 0)
         reddit_engagement = reddit_data.get('avg_engagement', 0)
-        reddit_audience = int(reddit_posts * reddit_engagement * 2)  # Doubled weight
+        reddit_audience = int(reddit_posts * reddit_engagement * rules.REDDIT_AUDIENCE_MULTIPLIER)  # Doubled weight
 
         # Total addressable audience (sum of both channels)
         total_audience = trends_audience + reddit_audience
 
-        return max(total_audience, 1000)  # Minimum 1K for visibility
+        return max(total_audience, rules.MIN_AUDIENCE)  # Minimum 1K for visibility
 
     def get_competitive_insights(
         self,
@@ -365,46 +299,13 @@ class CompetitionAnalyzer:
 
         Returns list of insight strings for dashboard
         """
-        insights = []
-
-        # Demand insights
-        demand = opportunity['demand_score']
-        if demand >= 80:
-            insights.append("✅ Strong validated demand")
-        elif demand >= 60:
-            insights.append("✅ Good demand signals")
-        elif demand >= 40:
-            insights.append("⚠️ Moderate demand - validate carefully")
-        else:
-            insights.append("🔴 Weak demand signals")
-
-        # Competition insights
-        comp = opportunity['competition_score']
-        if comp <= 30:
-            insights.append("✅ Low competition - market gap opportunity")
-        elif comp <= 50:
-            insights.append("🟡 Moderate competition - differentiation needed")
-        elif comp <= 70:
-            insights.append("⚠️ High competition - strong positioning required")
-        else:
-            insights.append("🔴 Very competitive - avoid or find unique angle")
-
-        # Trend insights (skip if no trends data in drill-down mode)
-        if trends_data:
-            trend_dir = trends_data.get('trend_direction', 'stable')
-            if trend_dir == 'rising':
-                insights.append("✅ Rising trend - early mover advantage")
-            elif trend_dir == 'falling':
-                insights.append("🔴 Declining trend - market may be dying")
-
-        # Reddit insights - purchase intent signals
-        reddit_posts = reddit_data.get('total_posts', 0)
-        reddit_engagement = reddit_data.get('avg_engagement', 0)
-        if reddit_posts > 30 and reddit_engagement > 1000:
-            insights.append("✅ Active community with strong engagement")
-
-        # High engagement = willingness to pay attention (proxy for purchase intent)
-        if reddit_engagement > 2000:
-            insights.append("✅ High engagement suggests purchase intent")
-
-        return insights
+        # Trend insights are skipped without trends data (drill-down mode)
+        trend_direction = trends_data.get('trend_direction', 'stable') if trends_data else None
+
+        return rules.insights(
+            opportunity['demand_score'],
+            opportunity['competition_score'],
+            trend_direction,
+            reddit_data.get('total_posts', 0),
+            reddit_data.get('avg_engagement', 0)
+        )
@@ -6,6 +6,8 @@ Loads settings from environment variables with sensible defaults
 import os
 from dotenv import load_dotenv
 
+from lib.rate_limiter import REDDIT_BURST as SHARED_REDDIT_BURST, REDDIT_DELAY as SHARED_REDDIT_DELAY
+
 # Load environment variables
 load_dotenv()
 
@@ -28,6 +30,26 @@ class Agent0Config:
     # Rate Limiting
     RATE_LIMIT_DELAY = float(os.getenv('AGENT_0_RATE_LIMIT_DELAY', '2.5'))
     GOOGLE_TRENDS_DELAY = 12.0  # Increased to 12s to avoid 429 rate limits (was 5.0)
+    REDDIT_DELAY = SHARED_REDDIT_DELAY  # Delay between Reddit API calls (shared "reddit" budget)
+
+    # Token-bucket burst sizes (lib/rate_limiter.py) - sustained rate is 1 / delay above
+    REDDIT_BURST = SHARED_REDDIT_BURST
+    YOUTUBE_BURST = int(os.getenv('AGENT_0_YOUTUBE_BURST', '3'))
+    GOOGLE_TRENDS_BURST = 1  # Google Trends 429s on any burst
+    GOOGLE_TRENDS_WORKERS = int(os.getenv('AGENT_0_TRENDS_WORKERS', '2'))  # Batch requests in flight (still paced by the bucket)
+
+    # Google Trends batch mode: "individual" (one request per keyword) or "multiplexed"
+    # (4 keywords + a shared anchor per request, rescaled so the anchor averages ANCHOR_LEVEL;
+    # topics more popular than the anchor can average above 100)
+    GOOGLE_TRENDS_MODE = os.getenv('AGENT_0_TRENDS_MODE', 'individual').lower()
+    GOOGLE_TRENDS_ANCHOR = os.getenv('AGENT_0_TRENDS_ANCHOR', 'books')
+    GOOGLE_TRENDS_ANCHOR_LEVEL = 50.0
+    GOOGLE_TRENDS_MAX_KEYWORDS = 5  # pytrends build_payload limit (anchor included)
+    GOOGLE_TRENDS_MIN_ANCHOR_PEAK = 10  # Below this the anchor (or a topic) is too coarse to rescale precisely (LED warning)
+
+    # Concurrency (topics researched in parallel; 1 = sequential)
+    # Workers draw from the shared per-source rate limiters, so they only overlap network waits
+    MAX_WORKERS = int(os.getenv('AGENT_0_MAX_WORKERS', '1'))
 
     # Query Limits
     MAX_TOPICS = int(os.getenv('AGENT_0_MAX_TOPICS', '10'))
@@ -46,8 +68,15 @@ class Agent0Config:
     OUTPUT_JSON = os.path.join(OUTPUT_DIR, "topic-selection.json")
     OUTPUT_HTML = os.path.join(OUTPUT_DIR, "agent0-dashboard.html")
 
+    # Split-view dashboard data: node summaries go to <html>_data/index.js, full
+    # node data to chunk files loaded on demand (CHUNK_SIZE nodes per file)
+    DASHBOARD_CHUNK_SIZE = int(os.getenv('AGENT_0_DASHBOARD_CHUNK_SIZE', '50'))
+    DASHBOARD_STRIP_SUMMARY = os.getenv('AGENT_0_DASHBOARD_STRIP_SUMMARY', '0').lower() in ('1', 'true', 'yes')  # Chart fields only
+    DASHBOARD_EXPAND_MAX_NODES = 200  # Larger trees start collapsed
+
     # LED Ranges
     LED_INIT = 500
+    LED_SPAN = 509  # Stage timing spans (start/end with wall and CPU seconds)
     LED_GOOGLE_TRENDS_START = 510
     LED_REDDIT_START = 520
     LED_YOUTUBE_START = 530  # YouTube API operations (530-539)
@@ -71,6 +100,11 @@ class Agent0Config:
         if cls.ENABLE_YOUTUBE and not cls.YOUTUBE_API_KEY:
             missing.append('YOUTUBE_API_KEY (required when --enable-youtube is used)')
 
+        if cls.GOOGLE_TRENDS_MODE not in ('individual', 'multiplexed'):
+            raise ValueError(
+                f"AGENT_0_TRENDS_MODE must be 'individual' or 'multiplexed', got '{cls.GOOGLE_TRENDS_MODE}'"
+            )
+
         if missing:
             raise ValueError(
                 f"Missing required environment variables: {', '.join(missing)}\n"
@@ -6,6 +6,7 @@ Creates HTML dashboard and JSON output for topic selection
 import json
 import os
 import webbrowser
+from collections import deque
 from datetime import datetime
 from typing import Dict, List
 from pathlib import Path
@@ -173,7 +174,7 @@ class DashboardGenerator:
         for idx, topic_data in enumerate(ranked_topics, 1):
             topic = topic_data['topic']
             scores = topic_data['scores']
-            trends = topic_data.get('trends_data', {})
+            trends = topic_data.get('trends_data') or {}
             reddit = topic_data.get('reddit_data', {})
 
             # Confidence badge
@@ -291,7 +292,9 @@ class DashboardGenerator:
                         "rank": idx + 1,
                         "topic": t['topic'],
                         "score": t['scores']['composite_score'],
-                        "confidence": t['scores']['confidence']
+                        "confidence": t['scores']['confidence'],
+                        # Google Trends failed: scored Reddit-only
+                        **({"trends_error": t['trends_error']} if t.get('trends_error') else {})
                     }
                     for idx, t in enumerate(ranked_topics)
                 ],
@@ -312,15 +315,22 @@ class DashboardGenerator:
 
         return output_path
 
-    def generate_split_view_html(self, ranked_topics: List[Dict], tree_data: Dict, output_path: str, queue_manager=None) -> str:
+    def generate_split_view_html(self, ranked_topics: List[Dict], tree_data: Dict, output_path: str, queue_manager=None,
+                                 strip_summary: bool = None) -> str:
         """
         Generate split-view HTML dashboard with tree navigation and chart
 
+        Tree data is not inlined: node summaries (what the chart draws) and the
+        full per-node data go to a sidecar directory next to the HTML, and the
+        page loads detail chunks only when a node is expanded or opened.
+
         Args:
             ranked_topics: List of topic data dicts (sorted by score)
-            tree_data: Tree structure from drill_trail.json
+            tree_data: Tree structure from DrillDownTrail.get_tree_for_dashboard()
             output_path: Path to save HTML file
             queue_manager: Optional queue manager for quota visualization
+            strip_summary: Keep only chart fields in the summary index
+                (default: Config.DASHBOARD_STRIP_SUMMARY)
 
         Returns:
             Path to generated HTML file
@@ -337,14 +347,20 @@ class DashboardGenerator:
         if tree_data is None:
             tree_data = {"root_nodes": [], "metadata": {}}
 
-        # Extract ALL topics from tree for initial chart display
-        all_tree_topics = self._extract_all_topics_from_tree(tree_data.get('root_nodes', []))
+        # Use tree nodes if available, otherwise show ranked_topics as roots
+        root_nodes = tree_data.get('root_nodes') or [
+            {"id": f"topic-{idx}", "topic": topic['topic'], "level": 0, "data": topic, "children": []}
+            for idx, topic in enumerate(ranked_topics)
+        ]
 
-        # Use tree topics if available, otherwise use ranked_topics
-        topics_for_chart = all_tree_topics if all_tree_topics else ranked_topics
+        # Write summary index + detail chunks next to the HTML
+        if strip_summary is None:
+            strip_summary = Config.DASHBOARD_STRIP_SUMMARY
+        data_files = self._write_split_view_data(root_nodes, output_path, strip_summary)
 
-        # Build tree HTML
-        tree_html = self._build_tree_html(tree_data.get('root_nodes', []))
+        # Build tree HTML (big trees start collapsed)
+        expanded = data_files['node_count'] <= Config.DASHBOARD_EXPAND_MAX_NODES
+        tree_html = self._build_tree_html(root_nodes, expanded=expanded)
 
         # Calculate quota usage
         quota_html = self._build_quota_html(queue_manager)
@@ -360,6 +376,7 @@ class DashboardGenerator:
     <script src="https://cdn.jsdelivr.net/npm/chartjs-plugin-annotation@3.0.1"></script>
     <script src="https://cdn.jsdelivr.net/npm/hammerjs@2.0.8"></script>
     <script src="https://cdn.jsdelivr.net/npm/chartjs-plugin-zoom@2.0.1"></script>
+    <script src="{data_files['index_src']}"></script>
     <style>
         * {{ margin: 0; padding: 0; box-sizing: border-box; }}
         body {{
@@ -652,13 +669,42 @@ class DashboardGenerator:
     </div>
 
     <script>
-        // Data
-        const allTopics = {json.dumps(topics_for_chart)};
-        const treeData = {json.dumps(tree_data)};
+        // Data: node summaries from the sidecar index, full node data loaded per chunk
+        const dashboardIndex = window.agent0DashboardIndex || {{ nodes: {{}}, data_dir: '', version: '' }};
+        const nodeIndex = dashboardIndex.nodes;
+        const nodeDetails = {{}};
+        const chunkLoads = {{}};
 
         let currentChart = null;
         let selectedTopics = new Set();
 
+        // Chunk files call this when their script runs
+        window.agent0DashboardChunk = function(chunkId, details) {{
+            Object.assign(nodeDetails, details);
+        }};
+
+        function loadChunk(chunkId) {{
+            if (!chunkLoads[chunkId]) {{
+                chunkLoads[chunkId] = new Promise((resolve, reject) => {{
+                    const script = document.createElement('script');
+                    const name = String(chunkId).padStart(4, '0');
+                    script.src = `${{dashboardIndex.data_dir}}/chunk_${{name}}.js?v=${{dashboardIndex.version}}`;
+                    script.onload = resolve;
+                    script.onerror = () => {{
+                        delete chunkLoads[chunkId];
+                        reject(new Error(`Could not load ${{script.src}}`));
+                    }};
+                    document.head.appendChild(script);
+                }});
+            }}
+            return chunkLoads[chunkId];
+        }}
+
+        function loadDetails(nodeIds) {{
+            const chunks = new Set(nodeIds.filter(id => nodeIndex[id]).map(id => nodeIndex[id].chunk));
+            return Promise.all([...chunks].map(loadChunk));
+        }}
+
         // Plugin to draw richness number inside bubbles
         const centerTextPlugin = {{
             id: 'centerText',
@@ -738,20 +784,10 @@ class DashboardGenerator:
 
         // Initialize
         window.addEventListener('load', () => {{
-            collectAllNodeIds(treeData.root_nodes);
+            Object.keys(nodeIndex).forEach(id => selectedTopics.add(id));
             updateChartFromSelection();
         }});
 
-        function collectAllNodeIds(nodes) {{
-            if (!nodes) return;
-            for (const node of nodes) {{
-                selectedTopics.add(node.id);
-                if (node.children) {{
-                    collectAllNodeIds(node.children);
-                }}
-            }}
-        }}
-
         function toggleTopicSelection(nodeId) {{
             const checkbox = document.getElementById(`check-${{nodeId}}`);
             const isChecked = checkbox.checked;
@@ -764,7 +800,7 @@ class DashboardGenerator:
             }}
 
             // Find node and cascade to children
-            const node = findNodeById(treeData.root_nodes, nodeId);
+            const node = nodeIndex[nodeId];
             if (node && node.children) {{
                 cascadeCheckboxes(node.children, isChecked);
             }}
@@ -772,20 +808,20 @@ class DashboardGenerator:
             updateChartFromSelection();
         }}
 
-        function cascadeCheckboxes(nodes, checked) {{
-            if (!nodes) return;
-            for (const node of nodes) {{
-                const childCheckbox = document.getElementById(`check-${{node.id}}`);
+        function cascadeCheckboxes(nodeIds, checked) {{
+            if (!nodeIds) return;
+            for (const id of nodeIds) {{
+                const childCheckbox = document.getElementById(`check-${{id}}`);
                 if (childCheckbox) {{
                     childCheckbox.checked = checked;
                     if (checked) {{
-                        selectedTopics.add(node.id);
+                        selectedTopics.add(id);
                     }} else {{
-                        selectedTopics.delete(node.id);
+                        selectedTopics.delete(id);
                     }}
                 }}
-                if (node.children) {{
-                    cascadeCheckboxes(node.children, checked);
+                if (nodeIndex[id] && nodeIndex[id].children) {{
+                    cascadeCheckboxes(nodeIndex[id].children, checked);
                 }}
             }}
         }}
@@ -793,9 +829,9 @@ class DashboardGenerator:
         function updateChartFromSelection() {{
             const topicsToShow = [];
             for (const nodeId of selectedTopics) {{
-                const node = findNodeById(treeData.root_nodes, nodeId);
-                if (node && node.data) {{
-                    topicsToShow.push(node.data);
+                const node = nodeIndex[nodeId];
+                if (node && node.summary) {{
+                    topicsToShow.push(node.summary);
                 }}
             }}
             // Show only checked topics (empty array = no bubbles if nothing checked)
@@ -803,7 +839,7 @@ class DashboardGenerator:
         }}
 
         function selectNode(nodeId) {{
-            const node = findNodeById(treeData.root_nodes, nodeId);
+            const node = nodeIndex[nodeId];
             if (!node) return;
 
             document.querySelectorAll('.node-item').forEach(el => el.classList.remove('selected'));
@@ -812,24 +848,12 @@ class DashboardGenerator:
 
             let topicsToShow = [];
             if (node.children && node.children.length > 0) {{
-                topicsToShow = node.children.map(child => child.data);
+                topicsToShow = node.children.map(id => nodeIndex[id].summary);
             }} else {{
-                topicsToShow = [node.data];
+                topicsToShow = [node.summary];
             }}
 
-            updateChart(topicsToShow);
-        }}
-
-        function findNodeById(nodes, id) {{
-            if (!nodes) return null;
-            for (const node of nodes) {{
-                if (node.id === id) return node;
-                if (node.children) {{
-                    const found = findNodeById(node.children, id);
-                    if (found) return found;
-                }}
-            }}
-            return null;
+            updateChart(topicsToShow.filter(Boolean));
         }}
 
         function toggleChildren(nodeId) {{
@@ -840,6 +864,10 @@ class DashboardGenerator:
                 if (toggleBtn) {{
                     toggleBtn.textContent = isExpanded ? '▼' : '▶';
                 }}
+                if (isExpanded) {{
+                    // Prefetch details for the topics just revealed
+                    loadDetails(nodeIndex[nodeId].children).catch(err => console.error(err));
+                }}
             }}
         }}
 
@@ -984,10 +1012,13 @@ class DashboardGenerator:
         }}
 
         function showTopicSummary(nodeId) {{
-            const node = findNodeById(treeData.root_nodes, nodeId);
-            if (!node || !node.data) return;
+            if (!nodeIndex[nodeId]) return;
 
-            showInfo(node.data);
+            loadDetails([nodeId])
+                .then(() => {{
+                    if (nodeDetails[nodeId]) showInfo(nodeDetails[nodeId]);
+                }})
+                .catch(err => console.error(err));
         }}
 
         function updateChart(topics) {{
@@ -1053,7 +1084,7 @@ class DashboardGenerator:
                     onClick: (event, elements) => {{
                         if (elements.length > 0) {{
                             const datasetIndex = elements[0].datasetIndex;
-                            showInfo(topics[datasetIndex]);
+                            showTopicSummary(topics[datasetIndex].id);
                         }}
                     }},
                     plugins: {{
@@ -1294,8 +1325,134 @@ class DashboardGenerator:
 
         return html
 
-    def _build_tree_html(self, nodes: List[Dict], level: int = 0) -> str:
-        """Build HTML for tree nodes recursively"""
+    def _write_split_view_data(self, root_nodes: List[Dict], output_path: str, strip_summary: bool) -> Dict:
+        """
+        Write the split-view data files next to the HTML
+
+        <name>_data/index.js holds one summary per node (topic, tree links and
+        the scores the chart draws); chunk_NNNN.js files hold the full node
+        data, DASHBOARD_CHUNK_SIZE nodes each. Chunks are filled breadth-first
+        so siblings - what expanding a node reveals - share a chunk. Both are
+        JS files loaded with <script> tags, since fetch() is blocked on file://.
+
+        Returns:
+            Dict with node_count, index_src (relative URL for the HTML),
+            data_dir, chunks and byte sizes
+        """
+        chunk_size = Config.DASHBOARD_CHUNK_SIZE
+        if chunk_size < 1:
+            raise ValueError(f"DASHBOARD_CHUNK_SIZE must be at least 1, got {chunk_size}")
+
+        html_path = Path(output_path)
+        data_dir = html_path.parent / f"{html_path.stem}_data"
+        data_dir.mkdir(parents=True, exist_ok=True)
+        for stale in data_dir.glob('chunk_*.js'):
+            stale.unlink()
+
+        # Chunk assignment, breadth-first
+        chunk_of = {}
+        chunks: List[Dict] = []
+        queue = deque(root_nodes)
+        while queue:
+            node = queue.popleft()
+            if not chunks or len(chunks[-1]) >= chunk_size:
+                chunks.append({})
+            chunks[-1][node['id']] = node.get('data') or {}
+            chunk_of[node['id']] = len(chunks) - 1
+            queue.extend(node.get('children') or [])
+
+        # Summary index, depth-first (tree order)
+        nodes = {}
+        stack = [(node, None) for node in reversed(root_nodes)]
+        while stack:
+            node, parent_id = stack.pop()
+            children = node.get('children') or []
+            nodes[node['id']] = {
+                "id": node['id'],
+                "topic": node['topic'],
+                "level": node.get('level', 0),
+                "parent": parent_id,
+                "children": [child['id'] for child in children],
+                "chunk": chunk_of[node['id']],
+                "summary": self._summarize_topic(node, strip_summary)
+            }
+            stack.extend((child, node['id']) for child in reversed(children))
+
+        version = datetime.now().strftime("%Y%m%d%H%M%S")
+        index = {
+            "version": version,
+            "data_dir": data_dir.name,
+            "node_count": len(nodes),
+            "chunk_count": len(chunks),
+            "root_ids": [node['id'] for node in root_nodes],
+            "nodes": nodes
+        }
+
+        index_path = data_dir / 'index.js'
+        index_path.write_text(
+            f"window.agent0DashboardIndex = {json.dumps(index, separators=(',', ':'))};\n",
+            encoding='utf-8'
+        )
+
+        chunk_bytes = 0
+        for chunk_id, details in enumerate(chunks):
+            chunk_path = data_dir / f"chunk_{chunk_id:04d}.js"
+            chunk_path.write_text(
+                f"window.agent0DashboardChunk({chunk_id}, {json.dumps(details, separators=(',', ':'))});\n",
+                encoding='utf-8'
+            )
+            chunk_bytes += chunk_path.stat().st_size
+
+        result = {
+            "node_count": len(nodes),
+            "chunks": len(chunks),
+            "data_dir": str(data_dir),
+            "index_src": f"{data_dir.name}/index.js?v={version}",
+            "index_bytes": index_path.stat().st_size,
+            "chunk_bytes": chunk_bytes
+        }
+
+        self.trail.light(Config.LED_DASHBOARD_START + 3, {
+            "action": "split_view_data_written",
+            "strip_summary": strip_summary,
+            **result
+        })
+
+        return result
+
+    def _summarize_topic(self, node: Dict, strip: bool) -> Dict:
+        """Chart-side summary of a node: topic plus scores (strip = chart fields only)"""
+        topic_data = node.get('data') or {}
+        scores = topic_data.get('scores') or {}
+        if strip:
+            competition = scores.get('competition') or {}
+            opportunity = scores.get('opportunity') or {}
+            richness = scores.get('richness') or {}
+            scores = {
+                "composite_score": scores.get('composite_score'),
+                "confidence": scores.get('confidence'),
+                "audience_size": scores.get('audience_size'),
+                "zone": scores.get('zone'),
+                "competition": {"overall_competition": competition.get('overall_competition')},
+                "opportunity": {
+                    key: opportunity.get(key)
+                    for key in ('opportunity_score', 'recommendation', 'competition_score')
+                },
+                "richness": {
+                    key: richness.get(key)
+                    for key in ('richness_stars', 'richness_score', 'breakdown')
+                },
+                "recency": scores.get('recency') or {}
+            }
+
+        return {
+            "id": node['id'],
+            "topic": topic_data.get('topic') or node['topic'],
+            "scores": scores
+        }
+
+    def _build_tree_html(self, nodes: List[Dict], level: int = 0, expanded: bool = True) -> str:
+        """Build HTML for tree nodes recursively (expanded=False starts collapsed)"""
         if not nodes:
             return "<p>No topics yet. Run research to populate the tree.</p>"
 
@@ -1315,7 +1472,7 @@ class DashboardGenerator:
 
             # Has children?
             has_children = node.get('children') and len(node.get('children', [])) > 0
-            toggle_html = f'<span class="toggle-btn" id="toggle-{node["id"]}" onclick="event.stopPropagation(); toggleChildren(\'{node["id"]}\')">{"▼" if has_children else "  "}</span>' if has_children else ''
+            toggle_html = f'<span class="toggle-btn" id="toggle-{node["id"]}" onclick="event.stopPropagation(); toggleChildren(\'{node["id"]}\')">{"▼" if expanded else "▶"}</span>' if has_children else ''
 
             # Build node HTML with checkbox
             # Paper icon shows popup, other elements select node
@@ -1334,9 +1491,9 @@ class DashboardGenerator:
 
             # Add children
             if has_children:
-                children_html = self._build_tree_html(node['children'], level + 1)
+                children_html = self._build_tree_html(node['children'], level + 1, expanded)
                 node_html += f'''
-                <div class="tree-children expanded" id="children-{node["id"]}">
+                <div class="tree-children{" expanded" if expanded else ""}" id="children-{node["id"]}">
                     {children_html}
                 </div>
                 '''
@@ -1346,16 +1503,6 @@ class DashboardGenerator:
 
         return '\n'.join(html_parts)
 
-    def _extract_all_topics_from_tree(self, nodes: List[Dict]) -> List[Dict]:
-        """Extract all topic data from tree nodes recursively"""
-        topics = []
-        for node in nodes:
-            if node.get('data'):
-                topics.append(node['data'])
-            if node.get('children'):
-                topics.extend(self._extract_all_topics_from_tree(node['children']))
-        return topics
-
     def open_dashboard(self, html_path: str) -> None:
         """Open HTML dashboard in default browser"""
         try:
@@ -5,6 +5,8 @@ Manages navigation history and parent-child relationships for multi-level resear
 
 import json
 import os
+import sqlite3
+import threading
 from datetime import datetime
 from typing import Dict, List, Optional
 from pathlib import Path
@@ -21,128 +23,246 @@ class DrillDownTrail:
     enabling navigation back through research history and visualization
     of the complete research tree.
 
+    Nodes live in a SQLite store (cache/drill_trail.db, WAL mode), one row per
+    node with its parent id, indexed by lower-cased topic and by parent:
+    - Topic lookups and sibling checks are index seeks (nothing is loaded up front)
+    - Breadcrumb paths follow parent ids, O(depth)
+    - A research session appends only its new rows in one transaction
+    - The node count is kept in a meta row, updated with every append
+    The full tree is only assembled for the dashboard. The legacy
+    cache/drill_trail.json is imported once (retried until it succeeds) and
+    kept as *.migrated.
+
     LED Range: 570-589
     """
 
-    def __init__(self, trail: BreadcrumbTrail):
+    TRAIL_DB = "cache/drill_trail.db"
+    TRAIL_FILE = "cache/drill_trail.json"  # Legacy format, migrated on first use
+    VERSION = "2.0"
+
+    def __init__(self, trail: BreadcrumbTrail, db_path: str = None):
         self.trail = trail
-        self.cache_dir = Path("cache")
-        self.trail_file = self.cache_dir / "drill_trail.json"
-        self.tree_data = None
+        self.db_path = Path(db_path or self.TRAIL_DB)
+        self.cache_dir = self.db_path.parent
+        self.trail_file = self.cache_dir / Path(self.TRAIL_FILE).name
 
         # Ensure cache directory exists
-        self.cache_dir.mkdir(exist_ok=True)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = None
 
-        # Load existing trail
+        # Open (and if needed create or migrate) the trail store
         self._load_trail()
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open (once) the shared connection to the trail store"""
+        if self._conn is None:
+            self._conn = sqlite3.connect(str(self.db_path), timeout=10, check_same_thread=False)
+            self._conn.row_factory = sqlite3.Row
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        return self._conn
+
     def _load_trail(self):
-        """Load existing drill-down trail from disk"""
+        """Create the schema and import the legacy JSON trail"""
         self.trail.light(Config.LED_DRILL_DOWN_START + 1, {
             "action": "load_trail",
-            "trail_file": str(self.trail_file)
+            "trail_file": str(self.db_path)
         })
 
-        if self.trail_file.exists():
-            try:
-                with open(self.trail_file, 'r', encoding='utf-8') as f:
-                    self.tree_data = json.load(f)
-
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    conn.execute("""
+                        CREATE TABLE IF NOT EXISTS nodes (
+                            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                            id TEXT NOT NULL UNIQUE,
+                            parent_id TEXT,
+                            topic TEXT NOT NULL,
+                            topic_key TEXT NOT NULL,
+                            level INTEGER NOT NULL,
+                            score REAL,
+                            researched_at TEXT,
+                            output_file TEXT,
+                            data TEXT
+                        )
+                    """)
+                    conn.execute("CREATE INDEX IF NOT EXISTS idx_nodes_topic ON nodes(topic_key, seq)")
+                    conn.execute("CREATE INDEX IF NOT EXISTS idx_nodes_parent ON nodes(parent_id, seq)")
+                    conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+                    now = datetime.now().isoformat()
+                    created = conn.execute(
+                        "INSERT OR IGNORE INTO meta (key, value) VALUES ('created', ?), ('last_updated', ?), ('node_count', '0')",
+                        (now, now)
+                    ).rowcount > 0
+
+            if created:
                 self.trail.light(Config.LED_DRILL_DOWN_START + 2, {
-                    "action": "trail_loaded",
-                    "nodes_count": self._count_nodes(self.tree_data) if self.tree_data else 0
+                    "action": "new_trail_created"
                 })
-            except Exception as e:
-                self.trail.fail(Config.LED_DRILL_DOWN_START + 2, e)
-                print(f"[!] Warning: Could not load trail file: {e}")
-                self.tree_data = None
-        else:
-            # Create new empty trail
-            self.tree_data = {
-                "version": "1.0",
-                "created": datetime.now().isoformat(),
-                "last_updated": datetime.now().isoformat(),
-                "root_nodes": []
-            }
+
+            self._migrate_legacy_trail()
+
             self.trail.light(Config.LED_DRILL_DOWN_START + 2, {
-                "action": "new_trail_created"
+                "action": "trail_loaded",
+                "nodes_count": self._count_nodes()
             })
+        except Exception as e:
+            self.trail.fail(Config.LED_DRILL_DOWN_START + 2, e)
+            raise
 
-    def _count_nodes(self, tree_data: Dict) -> int:
-        """Recursively count all nodes in tree"""
-        if not tree_data or "root_nodes" not in tree_data:
-            return 0
-
-        def count_children(node):
-            count = 1
-            for child in node.get("children", []):
-                count += count_children(child)
-            return count
+    def _migrate_legacy_trail(self):
+        """
+        Import cache/drill_trail.json into the store
 
-        total = 0
-        for root in tree_data["root_nodes"]:
-            total += count_children(root)
-        return total
+        The file is renamed to *.migrated before it is read, so only one
+        process picks it up, and kept for reference. The import sets a
+        'migrated' meta row in the same transaction as the nodes; until that
+        row exists, every start retries from *.migrated, so a failed import
+        never loses the history (re-imports skip nodes already stored).
+        """
+        migrated_file = self.trail_file.with_name(self.trail_file.name + ".migrated")
 
-    def _save_trail(self):
-        """Save trail to disk"""
-        self.trail.light(Config.LED_DRILL_DOWN_START + 11, {
-            "action": "save_trail",
-            "trail_file": str(self.trail_file)
-        })
+        if self.trail_file.exists():
+            try:
+                os.replace(self.trail_file, migrated_file)
+            except OSError:
+                return  # Another process is migrating
+        elif not migrated_file.exists() or self._meta("migrated") is not None:
+            return
 
         try:
-            self.tree_data["last_updated"] = datetime.now().isoformat()
+            with open(migrated_file, 'r', encoding='utf-8') as f:
+                tree_data = json.load(f)
+
+            rows = []
+
+            def collect(node: Dict, parent_id: Optional[str]):
+                rows.append(self._node_row(node, parent_id, node.get("data")))
+                for child in node.get("children", []):
+                    collect(child, node["id"])
+
+            for root in (tree_data or {}).get("root_nodes", []):
+                collect(root, None)
+
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    inserted = self._insert_rows(conn, rows)
+                    if tree_data and tree_data.get("created"):
+                        conn.execute("UPDATE meta SET value = ? WHERE key = 'created'", (tree_data["created"],))
+                    conn.execute(
+                        "INSERT OR REPLACE INTO meta (key, value) VALUES ('migrated', ?)",
+                        (datetime.now().isoformat(),)
+                    )
 
-            with open(self.trail_file, 'w', encoding='utf-8') as f:
-                json.dump(self.tree_data, f, indent=2, ensure_ascii=False)
-
-            self.trail.light(Config.LED_DRILL_DOWN_START + 12, {
-                "action": "trail_saved",
-                "nodes_count": self._count_nodes(self.tree_data)
+            self.trail.light(Config.LED_DRILL_DOWN_START + 2, {
+                "action": "trail_migrated",
+                "nodes_count": inserted,
+                "from": str(migrated_file)
             })
         except Exception as e:
-            self.trail.fail(Config.LED_DRILL_DOWN_START + 12, e)
-            raise
+            self.trail.fail(Config.LED_DRILL_DOWN_START + 2, e)
+            print(f"[!] Warning: Could not migrate trail file {migrated_file}: {e}")
+            print(f"[*] The import will be retried on the next start")
+
+    def _meta(self, key: str) -> Optional[str]:
+        """Value of a meta row (None if unset)"""
+        with self._lock:
+            row = self._connect().execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else None
+
+    @staticmethod
+    def _node_row(node: Dict, parent_id: Optional[str], data: Optional[Dict]) -> tuple:
+        return (
+            node["id"],
+            parent_id,
+            node["topic"],
+            node["topic"].lower(),
+            node.get("level", 0),
+            node.get("score"),
+            node.get("researched_at"),
+            node.get("output_file"),
+            DrillDownTrail._dump(data)
+        )
+
+    @staticmethod
+    def _dump(data: Optional[Dict]) -> Optional[str]:
+        """Compact JSON for a node's data column"""
+        if data is None:
+            return None
+        return json.dumps(data, ensure_ascii=False, separators=(',', ':'), default=str)
+
+    @staticmethod
+    def _insert_rows(conn: sqlite3.Connection, rows: List[tuple]) -> int:
+        """Append node rows and bump the stored node count (caller holds the transaction)"""
+        inserted = 0
+        for row in rows:
+            inserted += conn.execute(
+                "INSERT OR IGNORE INTO nodes (id, parent_id, topic, topic_key, level, score, researched_at, output_file, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                row
+            ).rowcount
+        conn.execute(
+            "UPDATE meta SET value = CAST(value AS INTEGER) + ? WHERE key = 'node_count'",
+            (inserted,)
+        )
+        conn.execute("UPDATE meta SET value = ? WHERE key = 'last_updated'", (datetime.now().isoformat(),))
+        return inserted
+
+    def _count_nodes(self) -> int:
+        """Maintained node count (no tree walk)"""
+        with self._lock:
+            row = self._connect().execute("SELECT value FROM meta WHERE key = 'node_count'").fetchone()
+        return int(row["value"]) if row else 0
+
+    @staticmethod
+    def _node_dict(row: sqlite3.Row) -> Dict:
+        return {
+            "id": row["id"],
+            "parent_id": row["parent_id"],
+            "topic": row["topic"],
+            "score": row["score"],
+            "level": row["level"],
+            "researched_at": row["researched_at"],
+            "output_file": row["output_file"]
+        }
 
     def find_parent_topic(self, topic: str) -> Optional[Dict]:
         """
         Find if a topic exists in the trail (potential parent for drill-down)
 
         Args:
-            topic: Topic name to search for
+            topic: Topic name to search for (case-insensitive)
 
         Returns:
-            Node dict if found, None otherwise
+            Node dict (id, parent_id, topic, score, level, researched_at,
+            output_file) of the earliest node with that topic, None otherwise
         """
         self.trail.light(Config.LED_DRILL_DOWN_START + 3, {
             "action": "find_parent",
             "topic": topic
         })
 
-        def search_node(node, target):
-            if node["topic"].lower() == target.lower():
-                return node
-            for child in node.get("children", []):
-                result = search_node(child, target)
-                if result:
-                    return result
-            return None
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT id, parent_id, topic, score, level, researched_at, output_file "
+                "FROM nodes WHERE topic_key = ? ORDER BY seq LIMIT 1",
+                (topic.lower(),)
+            ).fetchone()
 
-        if not self.tree_data or not self.tree_data.get("root_nodes"):
+        if row is None:
             return None
 
-        for root in self.tree_data["root_nodes"]:
-            result = search_node(root, topic)
-            if result:
-                self.trail.light(Config.LED_DRILL_DOWN_START + 4, {
-                    "action": "parent_found",
-                    "topic": topic,
-                    "level": result["level"]
-                })
-                return result
-
-        return None
+        node = self._node_dict(row)
+        self.trail.light(Config.LED_DRILL_DOWN_START + 4, {
+            "action": "parent_found",
+            "topic": topic,
+            "level": node["level"]
+        })
+        return node
 
     def get_breadcrumb_path(self, topic: str) -> List[str]:
         """
@@ -159,32 +279,32 @@ class DrillDownTrail:
             "topic": topic
         })
 
-        def find_path(node, target, current_path):
-            current_path = current_path + [node["topic"]]
-
-            if node["topic"].lower() == target.lower():
-                return current_path
-
-            for child in node.get("children", []):
-                result = find_path(child, target, current_path)
-                if result:
-                    return result
-
-            return None
-
-        if not self.tree_data or not self.tree_data.get("root_nodes"):
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT topic, parent_id FROM nodes WHERE topic_key = ? ORDER BY seq LIMIT 1",
+                (topic.lower(),)
+            ).fetchone()
+
+            path = []
+            while row is not None:
+                path.append(row["topic"])
+                if row["parent_id"] is None:
+                    break
+                row = conn.execute(
+                    "SELECT topic, parent_id FROM nodes WHERE id = ?",
+                    (row["parent_id"],)
+                ).fetchone()
+
+        if not path:
             return []
 
-        for root in self.tree_data["root_nodes"]:
-            path = find_path(root, topic, [])
-            if path:
-                self.trail.light(Config.LED_DRILL_DOWN_START + 6, {
-                    "action": "path_found",
-                    "path": " → ".join(path)
-                })
-                return path
-
-        return []
+        path.reverse()
+        self.trail.light(Config.LED_DRILL_DOWN_START + 6, {
+            "action": "path_found",
+            "path": " → ".join(path)
+        })
+        return path
 
     def add_research_session(self, parent_topic: Optional[str], topics: List[Dict], output_file: str):
         """
@@ -203,91 +323,100 @@ class DrillDownTrail:
 
         session_time = datetime.now().isoformat()
 
-        # Create nodes for all topics
-        new_nodes = []
-        for topic_data in topics:
-            # Deep copy topic_data and remove non-JSON-serializable objects
-            import copy
-            clean_data = copy.deepcopy(topic_data)
-
-            # Remove Reddit Submission objects (stored in trends_data and reddit_data)
-            # Also handle None values for drill-down mode
-            if 'trends_data' in clean_data and clean_data['trends_data'] is not None:
-                if 'posts' in clean_data['trends_data']:
-                    del clean_data['trends_data']['posts']
-            if 'reddit_data' in clean_data and clean_data['reddit_data'] is not None:
-                if 'posts' in clean_data['reddit_data']:
-                    del clean_data['reddit_data']['posts']
-
-            node = {
-                "id": f"{topic_data['topic'].replace(' ', '_')}_{session_time}",
-                "topic": topic_data['topic'],
-                "score": topic_data['scores']['composite_score'],
-                "level": 0,  # Will be updated based on parent
-                "researched_at": session_time,
-                "output_file": output_file,
-                "data": clean_data,
-                "children": []
-            }
-            new_nodes.append(node)
-
-        if parent_topic:
-            # Find parent and add as children
-            parent_node = self.find_parent_topic(parent_topic)
-            if parent_node:
-                # Update level based on parent
-                parent_level = parent_node["level"]
-
-                # Deduplicate: only add children that don't already exist
-                existing_child_topics = {child["topic"] for child in parent_node["children"]}
-                added_count = 0
-                for node in new_nodes:
-                    if node["topic"] not in existing_child_topics:
-                        node["level"] = parent_level + 1
-                        parent_node["children"].append(node)
-                        added_count += 1
-
-                self.trail.light(Config.LED_DRILL_DOWN_START + 8, {
-                    "action": "children_added_to_parent",
-                    "parent": parent_topic,
-                    "children_count": added_count
-                })
-            else:
-                # Parent not found, add as root nodes
-                print(f"[!] Warning: Parent topic '{parent_topic}' not found in trail")
-                print(f"[*] Adding topics as root nodes instead")
-                self.tree_data["root_nodes"].extend(new_nodes)
-
-                self.trail.light(Config.LED_DRILL_DOWN_START + 8, {
-                    "action": "parent_not_found_added_as_roots",
-                    "parent": parent_topic,
-                    "topics_count": len(new_nodes)
-                })
-        else:
-            # Add as root nodes (with deduplication)
-            existing_root_topics = {root["topic"] for root in self.tree_data["root_nodes"]}
-            added_count = 0
-            for node in new_nodes:
-                if node["topic"] not in existing_root_topics:
-                    self.tree_data["root_nodes"].append(node)
-                    added_count += 1
-                else:
-                    # Update existing root node data instead of creating duplicate
-                    for existing in self.tree_data["root_nodes"]:
-                        if existing["topic"] == node["topic"]:
-                            existing["data"] = node["data"]
-                            existing["score"] = node["score"]
-                            existing["researched_at"] = node["researched_at"]
-                            break
+        parent_node = self.find_parent_topic(parent_topic) if parent_topic else None
+        if parent_topic and parent_node is None:
+            # Parent not found, add as root nodes
+            print(f"[!] Warning: Parent topic '{parent_topic}' not found in trail")
+            print(f"[*] Adding topics as root nodes instead")
 
+        parent_id = parent_node["id"] if parent_node else None
+        level = parent_node["level"] + 1 if parent_node else 0
+
+        self.trail.light(Config.LED_DRILL_DOWN_START + 11, {
+            "action": "save_trail",
+            "trail_file": str(self.db_path)
+        })
+
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    if parent_id is None:
+                        sibling_rows = conn.execute("SELECT topic FROM nodes WHERE parent_id IS NULL").fetchall()
+                    else:
+                        sibling_rows = conn.execute("SELECT topic FROM nodes WHERE parent_id = ?", (parent_id,)).fetchall()
+                    existing_topics = {row["topic"] for row in sibling_rows}
+
+                    new_rows = []
+                    updated_count = 0
+                    for topic_data in topics:
+                        topic = topic_data['topic']
+                        data = self._clean_topic_data(topic_data)
+                        score = topic_data['scores']['composite_score']
+
+                        if topic not in existing_topics:
+                            existing_topics.add(topic)
+                            node = {
+                                "id": f"{topic.replace(' ', '_')}_{session_time}",
+                                "topic": topic,
+                                "score": score,
+                                "level": level,
+                                "researched_at": session_time,
+                                "output_file": output_file
+                            }
+                            new_rows.append(self._node_row(node, parent_id, data))
+                        elif parent_node is None:
+                            # Update existing root node data instead of creating duplicate
+                            conn.execute(
+                                "UPDATE nodes SET data = ?, score = ?, researched_at = ? "
+                                "WHERE seq = (SELECT seq FROM nodes WHERE parent_id IS NULL AND topic = ? ORDER BY seq LIMIT 1)",
+                                (self._dump(data), score, session_time, topic)
+                            )
+                            updated_count += 1
+
+                    added_count = self._insert_rows(conn, new_rows)
+
+            self.trail.light(Config.LED_DRILL_DOWN_START + 12, {
+                "action": "trail_saved",
+                "nodes_count": self._count_nodes()
+            })
+        except Exception as e:
+            self.trail.fail(Config.LED_DRILL_DOWN_START + 12, e)
+            raise
+
+        if parent_node:
+            self.trail.light(Config.LED_DRILL_DOWN_START + 8, {
+                "action": "children_added_to_parent",
+                "parent": parent_topic,
+                "children_count": added_count
+            })
+        elif parent_topic:
+            self.trail.light(Config.LED_DRILL_DOWN_START + 8, {
+                "action": "parent_not_found_added_as_roots",
+                "parent": parent_topic,
+                "topics_count": added_count
+            })
+        else:
             self.trail.light(Config.LED_DRILL_DOWN_START + 8, {
                 "action": "root_nodes_added",
                 "topics_count": added_count,
-                "updated_count": len(new_nodes) - added_count
+                "updated_count": updated_count
             })
 
-        # Save updated trail
-        self._save_trail()
+    @staticmethod
+    def _clean_topic_data(topic_data: Dict) -> Dict:
+        """
+        Topic data without Reddit Submission objects (JSON-serializable)
+
+        Only the source dicts holding 'posts' are copied; the rest is
+        serialized as-is, so no deep copy is needed.
+        """
+        clean_data = dict(topic_data)
+        for key in ('trends_data', 'reddit_data'):
+            source = clean_data.get(key)
+            if source is not None and 'posts' in source:
+                clean_data[key] = {k: v for k, v in source.items() if k != 'posts'}
+        return clean_data
 
     def get_tree_for_dashboard(self) -> Dict:
         """
@@ -298,14 +427,36 @@ class DrillDownTrail:
         """
         self.trail.light(Config.LED_DRILL_DOWN_START + 9, {
             "action": "get_tree_for_dashboard",
-            "nodes_count": self._count_nodes(self.tree_data)
+            "nodes_count": self._count_nodes()
         })
 
-        return self.tree_data if self.tree_data else {
-            "version": "1.0",
-            "created": datetime.now().isoformat(),
-            "last_updated": datetime.now().isoformat(),
-            "root_nodes": []
+        with self._lock:
+            conn = self._connect()
+            meta = {row["key"]: row["value"] for row in conn.execute("SELECT key, value FROM meta")}
+            rows = conn.execute("SELECT * FROM nodes ORDER BY seq").fetchall()
+
+        # Parents are always inserted before their children, so one pass in
+        # insertion order builds every children list in its original order
+        nodes = {}
+        root_nodes = []
+        for row in rows:
+            node = self._node_dict(row)
+            del node["parent_id"]
+            node["data"] = json.loads(row["data"]) if row["data"] is not None else None
+            node["children"] = []
+            nodes[row["id"]] = node
+
+            parent = nodes.get(row["parent_id"]) if row["parent_id"] is not None else None
+            if parent is not None:
+                parent["children"].append(node)
+            else:
+                root_nodes.append(node)
+
+        return {
+            "version": self.VERSION,
+            "created": meta.get("created"),
+            "last_updated": meta.get("last_updated"),
+            "root_nodes": root_nodes
         }
 
     def clear_trail(self):
@@ -314,11 +465,9 @@ class DrillDownTrail:
             "action": "clear_trail"
         })
 
-        self.tree_data = {
-            "version": "1.0",
-            "created": datetime.now().isoformat(),
-            "last_updated": datetime.now().isoformat(),
-            "root_nodes": []
-        }
-
-        self._save_trail()
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM nodes")
+                conn.execute("UPDATE meta SET value = '0' WHERE key = 'node_count'")
+                conn.execute("UPDATE meta SET value = ? WHERE key = 'last_updated'", (datetime.now().isoformat(),))
@@ -16,25 +16,192 @@ Output: outputs/topic-selection.json, outputs/agent0-dashboard.html
 import sys
 import os
 import time
-from typing import List
+import threading
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 
 # Add project root to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 from lib.breadcrumb_system import BreadcrumbTrail
+from lib.metrics import enable_metrics_from_env
 from agents.agent_0.config import Agent0Config as Config
 from agents.agent_0.api_clients import GoogleTrendsClient, RedditClient, YouTubeClient
 from agents.agent_0.api_clients_playwright import GoogleTrendsPlaywrightClient
 from agents.agent_0.api_clients_websearch import GoogleTrendsWebSearchClient
 from agents.agent_0.agent_results_loader import AgentResultsLoader
 from agents.agent_0.scoring import TopicScorer
+from agents.agent_0.ranking import StreamingRanker, format_leaderboard
 from agents.agent_0.dashboard import DashboardGenerator
 from agents.agent_0.queue_manager import QueueManager
 from agents.agent_0.drill_down_loader import DrillDownTrail
 from agents.agent_0.purchase_intent_analyzer import PurchaseIntentAnalyzer
 
 
-def main(topics: List[str], method: str = "pytrends", parent_topic: str = None, use_split_view: bool = False):
+def research_topic(topic: str, idx: int, total_topics: int, trail: BreadcrumbTrail,
+                   agent_results: Dict, trends_batch_results: Dict,
+                   reddit_client: RedditClient, youtube_client: Optional[YouTubeClient],
+                   purchase_intent_analyzer: PurchaseIntentAnalyzer, scorer: TopicScorer,
+                   log=print) -> Dict:
+    """
+    Research a single topic: trends lookup, Reddit, optional YouTube, purchase intent, scoring
+
+    Args:
+        topic: Topic string to research
+        idx: 1-based position of the topic in the batch (progress output only)
+        total_topics: Number of topics in the batch
+        trail: LED breadcrumb trail
+        agent_results: AI agent research results keyed by topic
+        trends_batch_results: Batched Google Trends results keyed by topic
+        log: Callable receiving each progress line (print, or a buffer when running concurrently)
+
+    Returns:
+        Topic entry dict (topic, scores, trends_data, reddit_data, youtube_data, purchase_intent)
+    """
+    log(f"\n{'='*60}")
+    log(f"Researching topic {idx}/{total_topics}: {topic}")
+    log(f"{'='*60}")
+
+    trail.light(Config.LED_INIT + 3, {
+        "action": "researching_topic",
+        "topic": topic,
+        "index": idx
+    })
+
+    # Get trend data (skip if DRILLDOWN_MODE)
+    step = 1
+    total_steps = 2 + (1 if Config.ENABLE_YOUTUBE else 0) + (0 if Config.DRILLDOWN_MODE else 1)
+
+    trends_data = None
+    trends_error = None
+    if not Config.DRILLDOWN_MODE:
+        if topic in agent_results:
+            log(f"  [{step}/{total_steps}] Using AI agent research data (demand: {agent_results[topic]['demand_score']}, confidence: {agent_results[topic]['confidence']}%)...")
+            # Convert agent results to trends format
+            trends_data = {
+                "average_interest": agent_results[topic]['demand_score'],
+                "peak_interest": agent_results[topic]['demand_score'],
+                "trend_direction": "stable",
+                "data_points": agent_results[topic]['signals']['mention_count'],
+                "source": "agent"
+            }
+        else:
+            log(f"  [{step}/{total_steps}] Using batched Google Trends data...")
+            trends_data = trends_batch_results.get(topic, {
+                "average_interest": 0,
+                "peak_interest": 0,
+                "trend_direction": "no_data",
+                "data_points": 0,
+                "source": "google_trends"
+            })
+            if trends_data.get('trend_direction') == 'error':
+                # Failed query: score Reddit-only instead of as zero interest
+                trends_error = trends_data.get('error', 'unknown error')
+                trends_data = None
+                log(f"  [!] Google Trends failed ({trends_error}) - scoring without trends")
+        step += 1
+    else:
+        log(f"  [DRILL-DOWN MODE] Skipping Google Trends (saves quota)")
+
+    # Query Reddit (with purchase intent data)
+    log(f"  [{step}/{total_steps}] Querying Reddit...")
+    with trail.span(Config.LED_SPAN, "reddit", {"topic": topic}):
+        reddit_data = reddit_client.search_topic(topic, fetch_purchase_intent=True)
+    step += 1
+
+    # Query YouTube if enabled
+    youtube_data = None
+    if Config.ENABLE_YOUTUBE and youtube_client:
+        log(f"  [{step}/{total_steps}] Querying YouTube...")
+        with trail.span(Config.LED_SPAN, "youtube", {"topic": topic}):
+            youtube_data = youtube_client.search_videos(topic, fetch_purchase_intent=False)
+        step += 1
+
+    # Analyze purchase intent from Reddit posts
+    log(f"  [{step}/{total_steps}] Analyzing purchase intent...")
+    purchase_intent_data = {}
+    if reddit_data.get('posts'):
+        with trail.span(Config.LED_SPAN, "purchase_intent", {"topic": topic}):
+            purchase_intent_data = purchase_intent_analyzer.analyze_purchase_intent(
+                topic,
+                reddit_data['posts']
+            )
+
+        # Log purchase intent findings
+        if purchase_intent_data['purchase_signals']:
+            log(f"  [OK] Purchase Intent: {purchase_intent_data['purchase_intent_score']:.1f}/100")
+            log(f"  [OK] Willingness to Pay: {purchase_intent_data['willingness_to_pay_score']:.1f}/100")
+            for signal in purchase_intent_data['purchase_signals'][:3]:  # Show top 3
+                # Remove emoji for Windows console compatibility
+                safe_signal = signal.encode('ascii', 'ignore').decode('ascii')
+                log(f"       {safe_signal}")
+
+    # Calculate scores
+    log("  [*] Calculating composite score...")
+    with trail.span(Config.LED_SPAN, "scoring", {"topic": topic}):
+        scores = scorer.calculate_composite_score(
+            trends_data,
+            reddit_data,
+            youtube_data  # Pass YouTube data (None if not enabled)
+        )
+
+    # Store results (include description if available from agent results)
+    topic_entry = {
+        "topic": topic,
+        "scores": scores,
+        "trends_data": trends_data,
+        "reddit_data": reddit_data,
+        "youtube_data": youtube_data,  # Include YouTube data
+        "purchase_intent": purchase_intent_data  # NEW: purchase intent analysis
+    }
+    if trends_error:
+        topic_entry['trends_error'] = trends_error
+
+    # Add description from agent results if available
+    if topic in agent_results and 'description' in agent_results[topic]:
+        topic_entry['description'] = agent_results[topic]['description']
+
+    log(f"  [OK] Composite Score: {scores['composite_score']:.2f} (Confidence: {scores['confidence']}%)")
+
+    return topic_entry
+
+
+def _research_concurrently(topics: List[str], workers: int, research) -> List[Dict]:
+    """
+    Research topics on a bounded thread pool
+
+    Each topic's progress lines are buffered and printed as one block when the
+    topic finishes, so output never interleaves. Results are returned in input
+    order, which keeps ranking identical to a sequential run. Workers run in a
+    copy of the caller's context, so their timing spans nest under its span.
+    """
+    print_lock = threading.Lock()
+
+    def run(idx: int, topic: str) -> Dict:
+        lines = []
+        try:
+            return research(idx, topic, lines.append)
+        finally:
+            with print_lock:
+                print('\n'.join(lines), flush=True)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(contextvars.copy_context().run, run, idx, topic)
+            for idx, topic in enumerate(topics, 1)
+        ]
+        try:
+            return [future.result() for future in futures]
+        except Exception:
+            # FAIL LOUDLY - stop queued topics, surface the first failure
+            for future in futures:
+                future.cancel()
+            raise
+
+
+def main(topics: List[str], method: str = "pytrends", parent_topic: str = None, use_split_view: bool = False,
+         max_workers: int = None):
     """
     Main execution function for Agent 0
 
@@ -43,12 +210,14 @@ def main(topics: List[str], method: str = "pytrends", parent_topic: str = None,
         method: Data collection method ("pytrends", "playwright", or "websearch")
         parent_topic: Optional parent topic for drill-down mode (None for root level)
         use_split_view: Use split-view dashboard with tree navigation
+        max_workers: Topics researched in parallel (default: Config.MAX_WORKERS, 1 = sequential)
 
     Returns:
         Path to output JSON file
     """
     # Initialize LED breadcrumb trail
     trail = BreadcrumbTrail("Agent0_TopicResearch")
+    enable_metrics_from_env()  # METRICS_PORT / METRICS_TEXTFILE
 
     trail.light(Config.LED_INIT, {
         "action": "agent_0_started",
@@ -148,15 +317,16 @@ def main(topics: List[str], method: str = "pytrends", parent_topic: str = None,
     agent_results = {}
     topics_needing_trends = []
 
-    for topic in topics:
-        agent_data = agent_loader.load_results(topic)
-        if agent_data:
-            age_hours = agent_loader.get_result_age_hours(topic)
-            print(f"  [OK] Found agent results for '{topic}' (age: {age_hours:.1f}h)")
-            agent_results[topic] = agent_data
-        else:
-            print(f"  [ ] No agent results for '{topic}' - will use {method} method")
-            topics_needing_trends.append(topic)
+    with trail.span(Config.LED_SPAN, "agent_results"):
+        for topic in topics:
+            agent_data = agent_loader.load_results(topic)
+            if agent_data:
+                age_hours = agent_loader.get_result_age_hours(topic)
+                print(f"  [OK] Found agent results for '{topic}' (age: {age_hours:.1f}h)")
+                agent_results[topic] = agent_data
+            else:
+                print(f"  [ ] No agent results for '{topic}' - will use {method} method")
+                topics_needing_trends.append(topic)
 
     # Query Google Trends only for topics without agent results
     trends_batch_results = {}
@@ -164,115 +334,56 @@ def main(topics: List[str], method: str = "pytrends", parent_topic: str = None,
         print(f"\n{'='*60}")
         print(f"Querying Google Trends (batched - {len(topics_needing_trends)} topics)...")
         print(f"{'='*60}")
-        trends_batch_results = trends_client.get_batch_trend_data(topics_needing_trends)
+        with trail.span(Config.LED_SPAN, "google_trends", {"topics": len(topics_needing_trends)}):
+            trends_batch_results = trends_client.get_batch_trend_data(topics_needing_trends)
+        failed_trends = [topic for topic, data in trends_batch_results.items() if data.get('trend_direction') == 'error']
+        if failed_trends:
+            print(f"  [!] Google Trends failed for {len(failed_trends)}/{len(topics_needing_trends)} topics "
+                  f"(scored without trends, retried next run): {', '.join(failed_trends)}")
     else:
         print(f"\n[*] All topics have agent results - skipping Google Trends")
 
-    # Research each topic
-    topic_data = []
-
-    for idx, topic in enumerate(topics, 1):
-        print(f"\n{'='*60}")
-        print(f"Researching topic {idx}/{len(topics)}: {topic}")
-        print(f"{'='*60}")
-
-        trail.light(Config.LED_INIT + 3, {
-            "action": "researching_topic",
-            "topic": topic,
-            "index": idx
-        })
-
-        # Get trend data (skip if DRILLDOWN_MODE)
-        step = 1
-        total_steps = 2 + (1 if Config.ENABLE_YOUTUBE else 0) + (0 if Config.DRILLDOWN_MODE else 1)
-
-        trends_data = None
-        if not Config.DRILLDOWN_MODE:
-            if topic in agent_results:
-                print(f"  [{step}/{total_steps}] Using AI agent research data (demand: {agent_results[topic]['demand_score']}, confidence: {agent_results[topic]['confidence']}%)...")
-                # Convert agent results to trends format
-                trends_data = {
-                    "average_interest": agent_results[topic]['demand_score'],
-                    "peak_interest": agent_results[topic]['demand_score'],
-                    "trend_direction": "stable",
-                    "data_points": agent_results[topic]['signals']['mention_count'],
-                    "source": "agent"
-                }
-            else:
-                print(f"  [{step}/{total_steps}] Using batched Google Trends data...")
-                trends_data = trends_batch_results.get(topic, {
-                    "average_interest": 0,
-                    "peak_interest": 0,
-                    "trend_direction": "no_data",
-                    "data_points": 0,
-                    "source": "google_trends"
-                })
-            step += 1
-        else:
-            print(f"  [DRILL-DOWN MODE] Skipping Google Trends (saves quota)")
-
-        # Query Reddit (with purchase intent data)
-        print(f"  [{step}/{total_steps}] Querying Reddit...")
-        reddit_data = reddit_client.search_topic(topic, fetch_purchase_intent=True)
-        step += 1
-
-        # Query YouTube if enabled
-        youtube_data = None
-        if Config.ENABLE_YOUTUBE and youtube_client:
-            print(f"  [{step}/{total_steps}] Querying YouTube...")
-            youtube_data = youtube_client.search_videos(topic, fetch_purchase_intent=False)
-            step += 1
-
-        # Analyze purchase intent from Reddit posts
-        print(f"  [{step}/{total_steps}] Analyzing purchase intent...")
-        purchase_intent_data = {}
-        if reddit_data.get('posts'):
-            purchase_intent_data = purchase_intent_analyzer.analyze_purchase_intent(
-                topic,
-                reddit_data['posts']
-            )
-
-            # Log purchase intent findings
-            if purchase_intent_data['purchase_signals']:
-                print(f"  [OK] Purchase Intent: {purchase_intent_data['purchase_intent_score']:.1f}/100")
-                print(f"  [OK] Willingness to Pay: {purchase_intent_data['willingness_to_pay_score']:.1f}/100")
-                for signal in purchase_intent_data['purchase_signals'][:3]:  # Show top 3
-                    # Remove emoji for Windows console compatibility
-                    safe_signal = signal.encode('ascii', 'ignore').decode('ascii')
-                    print(f"       {safe_signal}")
-
-        # Calculate scores
-        print("  [*] Calculating composite score...")
-        scores = scorer.calculate_composite_score(
-            trends_data,
-            reddit_data,
-            youtube_data  # Pass YouTube data (None if not enabled)
+    # Rank topics as they finish (index keeps ties in input order)
+    ranker = StreamingRanker(trail, expected=len(topics))
+
+    # Research each topic (fan out across workers when MAX_WORKERS > 1)
+    def research(idx: int, topic: str, log) -> Dict:
+        topic_entry = research_topic(
+            topic, idx, len(topics), trail,
+            agent_results=agent_results,
+            trends_batch_results=trends_batch_results,
+            reddit_client=reddit_client,
+            youtube_client=youtube_client,
+            purchase_intent_analyzer=purchase_intent_analyzer,
+            scorer=scorer,
+            log=log
         )
+        if ranker.add(topic_entry, index=idx):
+            log(f"  [*] Leaderboard: {format_leaderboard(ranker.leaderboard())}")
+        return topic_entry
+
+    workers = max(1, min(max_workers or Config.MAX_WORKERS, len(topics)))
+    trail.light(Config.LED_INIT + 4, {
+        "action": "research_mode_selected",
+        "mode": "concurrent" if workers > 1 else "sequential",
+        "workers": workers
+    })
 
-        # Store results (include description if available from agent results)
-        topic_entry = {
-            "topic": topic,
-            "scores": scores,
-            "trends_data": trends_data,
-            "reddit_data": reddit_data,
-            "youtube_data": youtube_data,  # Include YouTube data
-            "purchase_intent": purchase_intent_data  # NEW: purchase intent analysis
-        }
-
-        # Add description from agent results if available
-        if topic in agent_results and 'description' in agent_results[topic]:
-            topic_entry['description'] = agent_results[topic]['description']
-
-        topic_data.append(topic_entry)
-
-        print(f"  [OK] Composite Score: {scores['composite_score']:.2f} (Confidence: {scores['confidence']}%)")
+    with trail.span(Config.LED_SPAN, "research_topics", {"topics": len(topics), "workers": workers}):
+        if workers > 1:
+            print(f"\n[*] Researching {len(topics)} topics with {workers} workers")
+            _research_concurrently(topics, workers, research)
+        else:
+            for idx, topic in enumerate(topics, 1):
+                research(idx, topic, print)
 
     # Rank topics
     print(f"\n{'='*60}")
     print("Ranking topics...")
     print(f"{'='*60}")
 
-    ranked_topics = scorer.rank_topics(topic_data)
+    with trail.span(Config.LED_SPAN, "ranking"):
+        ranked_topics = ranker.finish()
 
     # Display results
     print("\nTop Topics:")
@@ -287,31 +398,32 @@ def main(topics: List[str], method: str = "pytrends", parent_topic: str = None,
     # Create output directory
     os.makedirs(Config.OUTPUT_DIR, exist_ok=True)
 
-    # Initialize drill-down trail
-    drill_trail = DrillDownTrail(trail)
+    with trail.span(Config.LED_SPAN, "outputs"):
+        # Initialize drill-down trail
+        drill_trail = DrillDownTrail(trail)
 
-    # Add this research session to trail
-    drill_trail.add_research_session(parent_topic, ranked_topics, Config.OUTPUT_JSON)
+        # Add this research session to trail
+        drill_trail.add_research_session(parent_topic, ranked_topics, Config.OUTPUT_JSON)
 
-    # Get tree data for dashboard
-    tree_data = drill_trail.get_tree_for_dashboard()
+        # Get tree data for dashboard
+        tree_data = drill_trail.get_tree_for_dashboard()
 
-    # Generate appropriate dashboard based on mode
-    if use_split_view or tree_data.get("root_nodes"):
-        # Use split-view if explicitly requested OR if we have drill-down history
-        trail.light(Config.LED_DRILL_DOWN_START + 13, {
-            "action": "generating_split_view_dashboard"
-        })
-        html_path = dashboard_gen.generate_split_view_html(ranked_topics, tree_data, Config.OUTPUT_HTML, queue_manager=queue_manager)
-        print(f"  [OK] Split-View Dashboard: {html_path}")
-    else:
-        # Use standard dashboard for first-time research
-        html_path = dashboard_gen.generate_html(ranked_topics, Config.OUTPUT_HTML, queue_manager=queue_manager)
-        print(f"  [OK] HTML Dashboard: {html_path}")
+        # Generate appropriate dashboard based on mode
+        if use_split_view or tree_data.get("root_nodes"):
+            # Use split-view if explicitly requested OR if we have drill-down history
+            trail.light(Config.LED_DRILL_DOWN_START + 13, {
+                "action": "generating_split_view_dashboard"
+            })
+            html_path = dashboard_gen.generate_split_view_html(ranked_topics, tree_data, Config.OUTPUT_HTML, queue_manager=queue_manager)
+            print(f"  [OK] Split-View Dashboard: {html_path}")
+        else:
+            # Use standard dashboard for first-time research
+            html_path = dashboard_gen.generate_html(ranked_topics, Config.OUTPUT_HTML, queue_manager=queue_manager)
+            print(f"  [OK] HTML Dashboard: {html_path}")
 
-    # Generate JSON output
-    json_path = dashboard_gen.generate_json_output(ranked_topics, Config.OUTPUT_JSON)
-    print(f"  [OK] JSON Output: {json_path}")
+        # Generate JSON output
+        json_path = dashboard_gen.generate_json_output(ranked_topics, Config.OUTPUT_JSON)
+        print(f"  [OK] JSON Output: {json_path}")
 
     # Open dashboard in browser
     print("\n  [*] Opening dashboard in browser...")
@@ -342,6 +454,8 @@ def main(topics: List[str], method: str = "pytrends", parent_topic: str = None,
     print(f"  Actual API calls: {api_stats['actual_api_calls']}")
     print(f"  Cache hits: {api_stats['cache_hits']} ({api_stats['cache_hit_rate']}%)")
     print(f"  Rate limit status: {api_stats['actual_api_calls']}/{queue_manager.MAX_CALLS_PER_HOUR} calls")
+    print(f"\n[*] Stage Timing:")
+    BreadcrumbTrail.print_span_breakdown()
     print(f"{'='*60}\n")
 
     return json_path
@@ -360,6 +474,7 @@ if __name__ == "__main__":
         print("\nMode Flags:")
         print("  --drill-down-mode  - Reddit-only (fast exploration, 60% confidence, saves quotas)")
         print("  --enable-youtube   - Enable YouTube API (final validation, 100% confidence, uses quota)")
+        print("  --workers <N>      - Research N topics in parallel (default: AGENT_0_MAX_WORKERS or 1)")
         print("\nExamples:")
         print('  # Drill-down exploration (Reddit-only, unlimited)')
         print('  python agents/agent_0/main.py --drill-down-mode "romance novels"')
@@ -389,6 +504,17 @@ if __name__ == "__main__":
         sys.argv.pop(idx)  # Remove --method
         sys.argv.pop(idx)  # Remove method value
 
+    # Check for workers flag (concurrent per-topic research)
+    max_workers = None
+    if "--workers" in sys.argv:
+        idx = sys.argv.index("--workers")
+        if idx + 1 >= len(sys.argv) or not sys.argv[idx + 1].isdigit() or int(sys.argv[idx + 1]) < 1:
+            print("[!] Error: --workers requires a positive integer (e.g. --workers 4)")
+            sys.exit(1)
+        max_workers = int(sys.argv[idx + 1])
+        sys.argv.pop(idx)  # Remove --workers
+        sys.argv.pop(idx)  # Remove workers value
+
     # Check for drill-down mode flag (Reddit-only, fast exploration)
     if "--drill-down-mode" in sys.argv:
         Config.DRILLDOWN_MODE = True
@@ -528,7 +654,8 @@ IMPORTANT: Make each subtopic specific enough to be searchable and distinct from
         topics = topics[:Config.MAX_TOPICS]
 
     # Run Agent 0
-    output_path = main(topics, method=method, parent_topic=parent_topic, use_split_view=use_split_view)
+    output_path = main(topics, method=method, parent_topic=parent_topic, use_split_view=use_split_view,
+                       max_workers=max_workers)
 
     if output_path:
         print(f"\n[OK] Agent 0 completed successfully!")
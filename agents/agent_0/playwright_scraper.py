@@ -4,7 +4,7 @@ Core browser automation for scraping Google Trends data
 
 LED Breadcrumb Range: 570-579 (Playwright operations)
 - 570: Scraper initialization
-- 571: Browser launch
+- 571: Browser pool checkout / context creation
 - 572: Page navigation
 - 573: Cookie consent handling
 - 574: Widget detection
@@ -12,18 +12,19 @@ LED Breadcrumb Range: 570-579 (Playwright operations)
 - 576: CSV save operations
 - 577: Rate limit detection
 - 578: Error handling
-- 579: Cleanup operations
+- 579: Page release / browser pool close
 """
 
 import asyncio
 import os
-import time
 import random
 from typing import List, Dict, Optional
 from pathlib import Path
-from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Download
+from playwright.async_api import Page
 
 from lib.breadcrumb_system import BreadcrumbTrail
+from lib.browser_pool import AsyncBrowserPool
+from lib.rate_limiter import get_limiter
 from .config import Agent0Config as Config
 
 
@@ -38,6 +39,7 @@ class PlaywrightScraper:
     - Exponential backoff on rate limits
     - LED breadcrumb instrumentation
     - CSV download handling
+    - Pooled browser: one launch per batch, a fresh context after a 429
     """
 
     # User agents (Chrome 134-135, 2025)
@@ -76,7 +78,16 @@ class PlaywrightScraper:
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
-        self.last_request_time = 0
+        self.rate_limiter = get_limiter(
+            "google_trends_playwright",
+            rate=1 / self.MIN_DELAY_BETWEEN_REQUESTS
+        )
+
+        # Long-lived browser shared by every keyword (lib/browser_pool.py)
+        self.pool = AsyncBrowserPool(
+            max_contexts=1,  # Keywords are scraped one at a time
+            context_options=self._new_context_options
+        )
 
         self.trail.light(570, {
             "action": "playwright_scraper_init",
@@ -91,18 +102,34 @@ class PlaywrightScraper:
         """Get random viewport size"""
         return random.choice(self.VIEWPORTS)
 
-    def _wait_for_rate_limit(self):
-        """Enforce minimum delay between requests"""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.MIN_DELAY_BETWEEN_REQUESTS:
-            wait_time = self.MIN_DELAY_BETWEEN_REQUESTS - elapsed
+    def _new_context_options(self) -> Dict:
+        """Anti-detection settings for each new pooled context (new identity per context)"""
+        user_agent = self._get_random_user_agent()
+        viewport = self._get_random_viewport()
+
+        self.trail.light(571, {
+            "action": "browser_context_create",
+            "user_agent": user_agent[:50] + "...",
+            "viewport": viewport
+        })
+
+        return {
+            "viewport": viewport,
+            "user_agent": user_agent,
+            "accept_downloads": True,
+            "locale": 'en-US',
+            "timezone_id": 'America/New_York'
+        }
+
+    async def _wait_for_rate_limit(self):
+        """Enforce minimum delay between requests (shared budget, sleeps on the event loop)"""
+        wait_time = self.rate_limiter.reserve()
+        if wait_time > 0:
             self.trail.light(577, {
                 "action": "rate_limit_wait",
                 "wait_seconds": round(wait_time, 2)
             })
-            time.sleep(wait_time)
-
-        self.last_request_time = time.time()
+            await asyncio.sleep(wait_time)
 
     async def scrape_keyword(
         self,
@@ -132,45 +159,16 @@ class PlaywrightScraper:
         })
 
         # Enforce rate limiting
-        self._wait_for_rate_limit()
+        await self._wait_for_rate_limit()
 
         try:
-            async with async_playwright() as p:
-                # Launch browser
-                self.trail.light(571, {
-                    "action": "browser_launch",
-                    "headless": True
-                })
-
-                browser = await p.chromium.launch(
-                    headless=True,
-                    args=[
-                        '--disable-blink-features=AutomationControlled',
-                        '--disable-dev-shm-usage',
-                        '--no-sandbox'
-                    ]
-                )
-
-                # Create context with anti-detection
-                user_agent = self._get_random_user_agent()
-                viewport = self._get_random_viewport()
-
-                self.trail.light(571, {
-                    "action": "browser_context_create",
-                    "user_agent": user_agent[:50] + "...",
-                    "viewport": viewport
-                })
-
-                context = await browser.new_context(
-                    viewport=viewport,
-                    user_agent=user_agent,
-                    accept_downloads=True,
-                    locale='en-US',
-                    timezone_id='America/New_York'
-                )
-
-                page = await context.new_page()
+            # Borrow a page from the long-lived browser (launched on first use)
+            self.trail.light(571, {
+                "action": "browser_pool_checkout",
+                **self.pool.get_stats()
+            })
 
+            async with self.pool.page("google_trends") as page:
                 try:
                     # Build URL
                     base_url = "https://trends.google.com/trends/explore"
@@ -193,140 +191,154 @@ class PlaywrightScraper:
                             "status": 429
                         })
 
-                        if retry_count < self.MAX_RETRIES:
-                            # Exponential backoff
-                            backoff = self.BASE_BACKOFF * (2 ** retry_count) + random.uniform(0, 1)
-                            self.trail.light(577, {
-                                "action": "rate_limit_backoff",
-                                "backoff_seconds": round(backoff, 2),
-                                "retry": retry_count + 1
-                            })
-
-                            await asyncio.sleep(backoff)
-                            await context.close()
-                            await browser.close()
-
-                            # Retry with exponential backoff
-                            return await self.scrape_keyword(keyword, geo, timeframe, retry_count + 1)
-                        else:
-                            self.trail.fail(577, Exception(f"Max retries ({self.MAX_RETRIES}) exceeded for rate limit"))
-                            return None
-
-                    # Handle cookie consent
-                    self.trail.light(573, {
-                        "action": "check_cookie_consent"
-                    })
+                        # Retry (after returning the page) with a fresh context: new cookies and user agent
+                        self.pool.retire(page)
+                        rate_limited = True
+                    else:
+                        rate_limited = False
+                        downloaded_files = await self._download_widgets(page, keyword)
 
-                    try:
-                        cookie_button = page.locator("button[mode='primary']").first
-                        if await cookie_button.is_visible(timeout=3000):
-                            await cookie_button.click()
-                            await asyncio.sleep(random.uniform(0.5, 1.0))
-
-                            self.trail.light(573, {
-                                "action": "cookie_consent_accepted"
-                            })
-                    except Exception as e:
-                        self.trail.light(573, {
-                            "action": "cookie_consent_not_found",
-                            "note": "May have been previously accepted"
-                        })
+                except Exception as e:
+                    self.trail.fail(578, e)
+                    raise
 
-                    # Wait for page content to load
-                    self.trail.light(572, {
-                        "action": "wait_for_networkidle"
+                finally:
+                    self.trail.light(579, {
+                        "action": "release_browser_page"
                     })
 
-                    await page.wait_for_load_state("networkidle", timeout=60000)
+        except Exception as e:
+            self.trail.fail(578, e)
+            return None
 
-                    # Add random delay (mimic human)
-                    human_delay = random.uniform(1.0, 2.0)
-                    await asyncio.sleep(human_delay)
+        if not rate_limited:
+            return downloaded_files
 
-                    # Wait for export buttons
-                    self.trail.light(574, {
-                        "action": "wait_for_export_buttons"
-                    })
+        if retry_count < self.MAX_RETRIES:
+            # Exponential backoff
+            backoff = self.BASE_BACKOFF * (2 ** retry_count) + random.uniform(0, 1)
+            self.trail.light(577, {
+                "action": "rate_limit_backoff",
+                "backoff_seconds": round(backoff, 2),
+                "retry": retry_count + 1
+            })
 
-                    await page.wait_for_selector(".widget-actions-item.export", state="visible", timeout=20000)
+            await asyncio.sleep(backoff)
 
-                    # Get all export buttons
-                    export_buttons = await page.locator(".widget-actions-item.export").all()
+            # Retry with exponential backoff
+            return await self.scrape_keyword(keyword, geo, timeframe, retry_count + 1)
 
-                    self.trail.light(574, {
-                        "action": "export_buttons_found",
-                        "count": len(export_buttons)
-                    })
+        self.trail.fail(577, Exception(f"Max retries ({self.MAX_RETRIES}) exceeded for rate limit"))
+        return None
 
-                    # Prepare download directory
-                    keyword_dir = self.cache_dir / keyword.replace(' ', '_').replace('/', '_')
-                    keyword_dir.mkdir(parents=True, exist_ok=True)
-
-                    downloaded_files = []
-
-                    # Download each CSV
-                    for i, button in enumerate(export_buttons):
-                        try:
-                            self.trail.light(575, {
-                                "action": "download_csv_start",
-                                "widget_index": i,
-                                "total_widgets": len(export_buttons)
-                            })
-
-                            # Random delay before click
-                            await asyncio.sleep(random.uniform(0.5, 1.5))
-
-                            # Setup download expectation BEFORE clicking
-                            async with page.expect_download(timeout=15000) as download_info:
-                                await button.click()
-
-                            download = await download_info.value
-
-                            # Save with descriptive name
-                            file_name = f"{keyword.replace(' ', '_')}_widget_{i}_{download.suggested_filename}"
-                            file_path = keyword_dir / file_name
-
-                            await download.save_as(str(file_path))
-                            downloaded_files.append(str(file_path))
-
-                            self.trail.light(576, {
-                                "action": "csv_saved",
-                                "widget_index": i,
-                                "file_name": file_name,
-                                "file_path": str(file_path)
-                            })
-
-                        except Exception as e:
-                            self.trail.light(578, {
-                                "action": "download_error",
-                                "widget_index": i,
-                                "error": str(e)[:200]
-                            })
-
-                    self.trail.light(575, {
-                        "action": "scrape_keyword_complete",
-                        "keyword": keyword,
-                        "files_downloaded": len(downloaded_files)
-                    })
+    async def _download_widgets(self, page: Page, keyword: str) -> List[str]:
+        """Accept cookies, wait for the explore page and download every widget's CSV"""
+        # Handle cookie consent
+        self.trail.light(573, {
+            "action": "check_cookie_consent"
+        })
 
-                    return downloaded_files
+        try:
+            cookie_button = page.locator("button[mode='primary']").first
+            if await cookie_button.is_visible(timeout=3000):
+                await cookie_button.click()
+                await asyncio.sleep(random.uniform(0.5, 1.0))
 
-                except Exception as e:
-                    self.trail.fail(578, e)
-                    raise
+                self.trail.light(573, {
+                    "action": "cookie_consent_accepted"
+                })
+        except Exception as e:
+            self.trail.light(573, {
+                "action": "cookie_consent_not_found",
+                "note": "May have been previously accepted"
+            })
 
-                finally:
-                    # Cleanup
-                    self.trail.light(579, {
-                        "action": "cleanup_browser_context"
-                    })
+        # Wait for page content to load
+        self.trail.light(572, {
+            "action": "wait_for_networkidle"
+        })
 
-                    await context.close()
-                    await browser.close()
+        await page.wait_for_load_state("networkidle", timeout=60000)
 
-        except Exception as e:
-            self.trail.fail(578, e)
-            return None
+        # Add random delay (mimic human)
+        human_delay = random.uniform(1.0, 2.0)
+        await asyncio.sleep(human_delay)
+
+        # Wait for export buttons
+        self.trail.light(574, {
+            "action": "wait_for_export_buttons"
+        })
+
+        await page.wait_for_selector(".widget-actions-item.export", state="visible", timeout=20000)
+
+        # Get all export buttons
+        export_buttons = await page.locator(".widget-actions-item.export").all()
+
+        self.trail.light(574, {
+            "action": "export_buttons_found",
+            "count": len(export_buttons)
+        })
+
+        # Prepare download directory
+        keyword_dir = self.cache_dir / keyword.replace(' ', '_').replace('/', '_')
+        keyword_dir.mkdir(parents=True, exist_ok=True)
+
+        downloaded_files = []
+
+        # Download each CSV
+        for i, button in enumerate(export_buttons):
+            try:
+                self.trail.light(575, {
+                    "action": "download_csv_start",
+                    "widget_index": i,
+                    "total_widgets": len(export_buttons)
+                })
+
+                # Random delay before click
+                await asyncio.sleep(random.uniform(0.5, 1.5))
+
+                # Setup download expectation BEFORE clicking
+                async with page.expect_download(timeout=15000) as download_info:
+                    await button.click()
+
+                download = await download_info.value
+
+                # Save with descriptive name
+                file_name = f"{keyword.replace(' ', '_')}_widget_{i}_{download.suggested_filename}"
+                file_path = keyword_dir / file_name
+
+                await download.save_as(str(file_path))
+                downloaded_files.append(str(file_path))
+
+                self.trail.light(576, {
+                    "action": "csv_saved",
+                    "widget_index": i,
+                    "file_name": file_name,
+                    "file_path": str(file_path)
+                })
+
+            except Exception as e:
+                self.trail.light(578, {
+                    "action": "download_error",
+                    "widget_index": i,
+                    "error": str(e)[:200]
+                })
+
+        self.trail.light(575, {
+            "action": "scrape_keyword_complete",
+            "keyword": keyword,
+            "files_downloaded": len(downloaded_files)
+        })
+
+        return downloaded_files
+
+    async def close(self):
+        """Close the pooled browser (call before the event loop closes)"""
+        self.trail.light(579, {
+            "action": "browser_pool_closed",
+            **self.pool.get_stats()
+        })
+        await self.pool.close()
 
     async def scrape_batch(
         self,
@@ -354,15 +366,19 @@ class PlaywrightScraper:
 
         results = {}
 
-        for i, keyword in enumerate(keywords, 1):
-            self.trail.light(570, {
-                "action": "scrape_batch_progress",
-                "keyword": keyword,
-                "progress": f"{i}/{len(keywords)}"
-            })
+        try:
+            for i, keyword in enumerate(keywords, 1):
+                self.trail.light(570, {
+                    "action": "scrape_batch_progress",
+                    "keyword": keyword,
+                    "progress": f"{i}/{len(keywords)}"
+                })
 
-            files = await self.scrape_keyword(keyword, geo, timeframe)
-            results[keyword] = files if files else []
+                files = await self.scrape_keyword(keyword, geo, timeframe)
+                results[keyword] = files if files else []
+        finally:
+            # One browser per batch - its event loop is closed by the caller afterwards
+            await self.close()
 
         self.trail.light(570, {
             "action": "scrape_batch_complete",
@@ -52,6 +52,24 @@ class PurchaseIntentAnalyzer:
         'discount code', 'referral', 'link in bio'
     ]
 
+    # Question patterns (same problem asked repeatedly = unmet need)
+    QUESTION_PATTERNS = [
+        r'how (?:do|can) (?:i|you)',
+        r'what(?:\'s| is) the best',
+        r'should i',
+        r'which (?:one|is better)',
+        r'looking for',
+        r'need (?:help|advice|recommendation)'
+    ]
+
+    # Lowercase non-ASCII letters that IGNORECASE matches to ASCII keyword
+    # letters (dotless i, long s) - folded before the case-sensitive keyword scan
+    CASE_FOLDS = str.maketrans({'\u0131': 'i', '\u017f': 's'})
+    CASE_FOLD_CHARS = ('\u0131', '\u017f')
+
+    # Compiled single-pass scanner (built on first use, see _get_scanner)
+    _scanner = None
+
     def __init__(self, trail: BreadcrumbTrail):
         self.trail = trail
 
@@ -74,26 +92,36 @@ class PurchaseIntentAnalyzer:
             - willingness_to_pay_score: 0-100 based on price discussions
             - purchase_signals: List of specific signals found
         """
+        texts = [f"{post.title} {post.selftext}" for post in posts]
+        return self.analyze_texts(keyword, texts)
+
+    def analyze_texts(self, keyword: str, texts: List[str]) -> Dict:
+        """
+        Analyze raw texts (post titles + bodies, comments) for purchase intent
+
+        Same result as analyze_purchase_intent(), for callers that already have
+        plain strings - e.g. every comment in a thread rather than 50 titles.
+
+        Args:
+            keyword: The search topic
+            texts: One string per post/comment
+
+        Returns:
+            Same dict as analyze_purchase_intent()
+        """
         self.trail.light(self.LED_KEYWORD_ANALYSIS, {
             "action": "analyze_purchase_intent",
             "keyword": keyword,
-            "total_posts": len(posts)
+            "total_posts": len(texts)
         })
 
-        if not posts:
+        if not texts:
             return self._empty_result()
 
-        # Analyze purchase keywords
-        keyword_matches = self._analyze_purchase_keywords(posts)
-
-        # Analyze price mentions
-        price_data = self._analyze_price_mentions(posts)
-
-        # Analyze problem frequency
-        problem_data = self._analyze_problem_frequency(posts)
-
-        # Analyze monetization signals
-        monetization_data = self._analyze_monetization_signals(posts)
+        # One scan per text for keywords, prices, questions and monetization
+        columns = self.scan_batch(texts)
+        keyword_matches, price_data, problem_data, monetization_data = \
+            self._summarize_batch(columns)
 
         # Calculate composite purchase intent score
         intent_score = self._calculate_purchase_intent_score(
@@ -101,14 +129,14 @@ class PurchaseIntentAnalyzer:
             price_data,
             problem_data,
             monetization_data,
-            len(posts)
+            len(texts)
         )
 
         # Calculate willingness to pay score
         willingness_score = self._calculate_willingness_to_pay(
             price_data,
             keyword_matches,
-            len(posts)
+            len(texts)
         )
 
         # Generate specific purchase signals list
@@ -131,7 +159,7 @@ class PurchaseIntentAnalyzer:
             "monetization_signals": monetization_data['count'],
             "monetization_types": monetization_data['types'],
             "purchase_signals": signals,
-            "total_analyzed": len(posts)
+            "total_analyzed": len(texts)
         }
 
         self.trail.light(self.LED_INTENT_SCORE_COMPLETE, {
@@ -144,6 +172,202 @@ class PurchaseIntentAnalyzer:
 
         return result
 
+    @classmethod
+    def _get_scanner(cls) -> Dict:
+        """
+        Compile the single-pass scanner (once per class)
+
+        One regex emits every count per text - price mentions and each purchase
+        keyword category, as named groups - so the text is walked once instead of
+        once per category. Keyword categories are whole words from disjoint
+        lists, so at most one matches at a position. Multi-word phrases ("what's
+        the best") contain other categories' words, so their span is rescanned
+        with the phrase scanner to reproduce the independent per-category counts.
+
+        The keyword patterns are lowercased and matched case-sensitively: the
+        text is already lowercase, and IGNORECASE doubles the scan time. The
+        only lowercase non-ASCII letters IGNORECASE equates with ASCII ones are
+        folded first (see CASE_FOLDS).
+
+        Question phrasing and monetization are yes/no per text, so they stay
+        early-exit checks (one combined search, one ordered substring probe).
+        Folding them into the counting regex made every scan slower, because
+        sre then tries the lookaheads at every position.
+        """
+        if cls._scanner is None:
+            patterns = {}
+            for category, pattern in cls.PURCHASE_KEYWORDS.items():
+                if re.search(r'\\[A-Z]', pattern):
+                    raise ValueError(
+                        f"PURCHASE_KEYWORDS['{category}'] uses an uppercase escape; "
+                        f"the single-pass scanner lowercases keyword patterns"
+                    )
+                patterns[category] = pattern.lower()
+
+            # Hoist a shared \b...\b out of the categories so sre can factor it
+            boundary = all(p.startswith(r'\b') and p.endswith(r'\b') for p in patterns.values())
+
+            def keyword_alternation(categories):
+                groups = "|".join(
+                    f"(?P<kw_{category}>{patterns[category][2:-2] if boundary else patterns[category]})"
+                    for category in categories
+                )
+                return rf"\b(?:{groups})\b" if boundary else groups
+
+            # Categories with multi-word phrases can contain other categories' words
+            phrase_categories = [c for c, p in patterns.items() if ' ' in p]
+            word_categories = [c for c in patterns if c not in phrase_categories]
+            questions = "|".join(f"(?:{p})" for p in cls.QUESTION_PATTERNS)
+
+            cls._scanner = {
+                "scanner": re.compile(
+                    f"(?P<price>{cls.PRICE_PATTERN})|{keyword_alternation(patterns)}"
+                ),
+                "phrase_scanner": re.compile(keyword_alternation(word_categories)),
+                "phrase_groups": {f"kw_{c}" for c in phrase_categories},
+                "questions": re.compile(questions),
+            }
+
+        return cls._scanner
+
+    def scan_batch(self, texts: List[str]) -> Dict:
+        """
+        Single-pass scan of a batch of texts into per-text columns
+
+        Each text is lowercased once and scanned once by the combined regex
+        (see _get_scanner).
+
+        Returns dict of columns (one entry per text):
+        - keyword_counts: {category: [count per text]}
+        - prices: [[realistic prices found in text]]
+        - has_question: [bool]
+        - monetization_type: [first MONETIZATION_KEYWORDS entry present, or None]
+        """
+        compiled = self._get_scanner()
+        scanner = compiled['scanner']
+        phrase_scanner = compiled['phrase_scanner']
+        phrase_groups = compiled['phrase_groups']
+        questions = compiled['questions']
+        price_group = scanner.groupindex['price'] + 1  # The amount capture inside PRICE_PATTERN
+        categories = list(self.PURCHASE_KEYWORDS.keys())
+
+        keyword_columns = {category: [] for category in categories}
+        price_column = []
+        question_column = []
+        monetization_column = []
+
+        for raw_text in texts:
+            text = raw_text.lower()
+            counts = dict.fromkeys(categories, 0)
+            prices = []
+
+            # Keywords match IGNORECASE-equivalent letters; questions stay case-sensitive
+            scan_text = text
+            if any(char in text for char in self.CASE_FOLD_CHARS):
+                scan_text = text.translate(self.CASE_FOLDS)
+
+            for match in scanner.finditer(scan_text):
+                group = match.lastgroup
+
+                if group == 'price':
+                    # Remove commas and filter out unrealistic prices (0-10000 range)
+                    price = float(match.group(price_group).replace(',', ''))
+                    if 0 < price <= 10000:
+                        prices.append(price)
+                else:
+                    counts[group[3:]] += 1
+                    if group in phrase_groups:
+                        for inner in phrase_scanner.finditer(scan_text, match.start(), match.end()):
+                            counts[inner.lastgroup[3:]] += 1
+
+            has_question = questions.search(text) is not None
+
+            monetization_type = None
+            for keyword in self.MONETIZATION_KEYWORDS:
+                if keyword in text:
+                    monetization_type = keyword
+                    break  # Count once per post
+
+            for category in categories:
+                keyword_columns[category].append(counts[category])
+            price_column.append(prices)
+            question_column.append(has_question)
+            monetization_column.append(monetization_type)
+
+        return {
+            "keyword_counts": keyword_columns,
+            "prices": price_column,
+            "has_question": question_column,
+            "monetization_type": monetization_column
+        }
+
+    def _summarize_batch(self, columns: Dict):
+        """
+        Reduce scan_batch() columns to the per-analysis dicts
+
+        Returns (keyword_matches, price_data, problem_data, monetization_data),
+        identical to the _analyze_* passes.
+        """
+        keyword_counts = {
+            category: sum(column) for category, column in columns['keyword_counts'].items()
+        }
+
+        # Per-topic LEDs: lazy payloads, skipped when BREADCRUMB_RATE_LIMIT suppresses them
+        self.trail.light(self.LED_KEYWORD_ANALYSIS + 1, lambda: {
+            "action": "keyword_analysis_complete",
+            **keyword_counts
+        })
+
+        prices = [price for post_prices in columns['prices'] for price in post_prices]
+
+        if prices:
+            price_range = (min(prices), max(prices))
+            avg_price = sum(prices) / len(prices)
+        else:
+            price_range = None
+            avg_price = 0
+
+        self.trail.light(self.LED_PRICE_ANALYSIS + 1, lambda: {
+            "action": "price_analysis_complete",
+            "prices_found": len(prices),
+            "price_range": price_range,
+            "avg_price": round(avg_price, 2) if avg_price else 0
+        })
+
+        question_posts = sum(columns['has_question'])
+        total_posts = len(columns['has_question'])
+        frequency = (question_posts / total_posts * 100) if total_posts > 0 else 0
+
+        self.trail.light(self.LED_PROBLEM_ANALYSIS + 1, lambda: {
+            "action": "problem_analysis_complete",
+            "question_posts": question_posts,
+            "total_posts": total_posts,
+            "frequency_pct": round(frequency, 1)
+        })
+
+        monetization_count = 0
+        types_found = set()
+        for found in columns['monetization_type']:
+            if found is not None:
+                monetization_count += 1
+                types_found.add(found)
+
+        self.trail.light(self.LED_MONETIZATION_ANALYSIS + 1, lambda: {
+            "action": "monetization_analysis_complete",
+            "signals_found": monetization_count,
+            "types_count": len(types_found)
+        })
+
+        return (
+            keyword_counts,
+            {"prices": prices, "range": price_range, "avg_price": avg_price},
+            {"frequency": frequency, "repeated_count": question_posts},
+            {"count": monetization_count, "types": list(types_found)}
+        )
+
+    # Per-category passes - superseded by scan_batch(), kept as the reference
+    # implementation for parity checks and benchmark_purchase_intent.py
+
     def _analyze_purchase_keywords(self, posts: List) -> Dict[str, int]:
         """
         Count purchase-related keywords in titles and selftext
@@ -165,7 +389,7 @@ class PurchaseIntentAnalyzer:
                 matches = re.findall(pattern, text, re.IGNORECASE)
                 keyword_counts[category] += len(matches)
 
-        self.trail.light(self.LED_KEYWORD_ANALYSIS + 1, {
+        self.trail.light(self.LED_KEYWORD_ANALYSIS + 1, lambda: {
             "action": "keyword_analysis_complete",
             **keyword_counts
         })
@@ -205,7 +429,7 @@ class PurchaseIntentAnalyzer:
             price_range = None
             avg_price = 0
 
-        self.trail.light(self.LED_PRICE_ANALYSIS + 1, {
+        self.trail.light(self.LED_PRICE_ANALYSIS + 1, lambda: {
             "action": "price_analysis_complete",
             "prices_found": len(prices),
             "price_range": price_range,
@@ -232,20 +456,10 @@ class PurchaseIntentAnalyzer:
             "action": "analyzing_problem_frequency"
         })
 
-        # Look for question patterns
-        question_patterns = [
-            r'how (?:do|can) (?:i|you)',
-            r'what(?:\'s| is) the best',
-            r'should i',
-            r'which (?:one|is better)',
-            r'looking for',
-            r'need (?:help|advice|recommendation)'
-        ]
-
         question_posts = 0
         for post in posts:
             text = f"{post.title} {post.selftext}".lower()
-            for pattern in question_patterns:
+            for pattern in self.QUESTION_PATTERNS:
                 if re.search(pattern, text):
                     question_posts += 1
                     break
@@ -254,7 +468,7 @@ class PurchaseIntentAnalyzer:
         total_posts = len(posts)
         frequency = (question_posts / total_posts * 100) if total_posts > 0 else 0
 
-        self.trail.light(self.LED_PROBLEM_ANALYSIS + 1, {
+        self.trail.light(self.LED_PROBLEM_ANALYSIS + 1, lambda: {
             "action": "problem_analysis_complete",
             "question_posts": question_posts,
             "total_posts": total_posts,
@@ -292,7 +506,7 @@ class PurchaseIntentAnalyzer:
                     types_found.add(keyword)
                     break  # Count once per post
 
-        self.trail.light(self.LED_MONETIZATION_ANALYSIS + 1, {
+        self.trail.light(self.LED_MONETIZATION_ANALYSIS + 1, lambda: {
             "action": "monetization_analysis_complete",
             "signals_found": monetization_count,
             "types_count": len(types_found)
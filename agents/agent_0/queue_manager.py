@@ -5,12 +5,15 @@ Smart batch processing and rate limit tracking for Google Trends queries
 
 import json
 import os
+import sqlite3
+import threading
 import time
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 from pathlib import Path
 
 from lib.breadcrumb_system import BreadcrumbTrail
+from lib.metrics import get_metrics
 from .config import Agent0Config as Config
 
 
@@ -24,42 +27,140 @@ class QueueManager:
     - Schedule queries to respect rate limits
     - Provide next safe query time
     - Export call history for dashboard visualization
+
+    Call history is an append-only SQLite table (WAL mode) indexed by timestamp:
+    logging is a single INSERT, windowed counts are index range scans, and several
+    agent processes can log concurrently. The legacy JSON history is imported once.
     """
 
-    API_HISTORY_FILE = "cache/api_call_history.json"
+    API_HISTORY_DB = "cache/api_call_history.db"
+    API_HISTORY_FILE = "cache/api_call_history.json"  # Legacy format, migrated on first use
+    HISTORY_RETENTION_DAYS = 7  # Older records are pruned on startup
     MAX_CALLS_PER_HOUR = 15  # Conservative limit for Google Trends
     MIN_DELAY_SECONDS = 12   # Minimum delay between requests
 
-    def __init__(self, trail: BreadcrumbTrail):
+    def __init__(self, trail: BreadcrumbTrail, db_path: str = None):
         self.trail = trail
-        self.history_file = Path(self.API_HISTORY_FILE)
-        self.history_file.parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = Path(db_path or self.API_HISTORY_DB)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.legacy_file = self.db_path.parent / Path(self.API_HISTORY_FILE).name
 
-    def _load_history(self) -> List[Dict]:
-        """Load API call history from JSON file"""
-        if not self.history_file.exists():
-            return []
+        self._lock = threading.Lock()
+        self._conn = None
+
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open (once) the shared connection to the call log"""
+        if self._conn is None:
+            self._conn = sqlite3.connect(str(self.db_path), timeout=10, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        return self._conn
+
+    def _init_db(self):
+        """Create schema, import legacy JSON history, prune expired records"""
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    conn.execute("""
+                        CREATE TABLE IF NOT EXISTS api_calls (
+                            id INTEGER PRIMARY KEY AUTOINCREMENT,
+                            timestamp REAL NOT NULL,
+                            keyword TEXT,
+                            cached INTEGER NOT NULL DEFAULT 0,
+                            source TEXT,
+                            datetime TEXT
+                        )
+                    """)
+                    conn.execute("CREATE INDEX IF NOT EXISTS idx_api_calls_timestamp ON api_calls(timestamp)")
+                    conn.execute(
+                        "DELETE FROM api_calls WHERE timestamp < ?",
+                        ((time.time() - self.HISTORY_RETENTION_DAYS * 86400) * 1000,)
+                    )
+
+            self._migrate_legacy_history()
+
+        except Exception as e:
+            # Silently fail - not critical
+            pass
+
+    def _migrate_legacy_history(self):
+        """
+        Import cache/api_call_history.json into the call log
+
+        The file is renamed before it is read, so only one process imports it.
+        It is kept as *.migrated for reference.
+        """
+        if not self.legacy_file.exists():
+            return
 
+        migrated_file = self.legacy_file.with_name(self.legacy_file.name + ".migrated")
         try:
-            with open(self.history_file, 'r') as f:
+            os.replace(self.legacy_file, migrated_file)
+        except OSError:
+            return  # Another process is migrating
+
+        try:
+            with open(migrated_file, 'r') as f:
                 history = json.load(f)
 
-            # Filter to last hour only
-            one_hour_ago = time.time() - 3600
-            return [call for call in history if call['timestamp'] > one_hour_ago]
+            rows = [
+                (
+                    float(call['timestamp']),
+                    call.get('keyword'),
+                    1 if call.get('cached', False) else 0,
+                    call.get('source', 'google_trends'),
+                    call.get('datetime')
+                )
+                for call in history
+                if 'timestamp' in call
+            ]
+
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    conn.executemany(
+                        "INSERT INTO api_calls (timestamp, keyword, cached, source, datetime) VALUES (?, ?, ?, ?, ?)",
+                        rows
+                    )
+
+            self.trail.light(Config.LED_INIT + 5, {
+                "action": "api_history_migrated",
+                "records": len(rows),
+                "from": str(migrated_file)
+            })
 
         except Exception as e:
-            # Silently fail - not critical
-            return []
+            self.trail.fail(Config.LED_INIT + 5, e)
+
+    def _load_history(self, window_seconds: int = 3600) -> List[Dict]:
+        """Load API call records from the last window_seconds (default: last hour)"""
+        cutoff_ms = (time.time() - window_seconds) * 1000  # Timestamps are stored in milliseconds
 
-    def _save_history(self, history: List[Dict]):
-        """Save API call history to JSON file"""
         try:
-            with open(self.history_file, 'w') as f:
-                json.dump(history, f, indent=2)
+            with self._lock:
+                rows = self._connect().execute(
+                    "SELECT timestamp, keyword, cached, source, datetime FROM api_calls "
+                    "WHERE timestamp > ? ORDER BY timestamp",
+                    (cutoff_ms,)
+                ).fetchall()
+
+            return [
+                {
+                    'timestamp': timestamp,
+                    'keyword': keyword,
+                    'cached': bool(cached),
+                    'source': source,
+                    'datetime': dt
+                }
+                for timestamp, keyword, cached, source, dt in rows
+            ]
+
         except Exception as e:
             # Silently fail - not critical
-            pass
+            return []
 
     def log_api_call(self, keyword: str, cached: bool = False, source: str = "google_trends"):
         """
@@ -70,22 +171,35 @@ class QueueManager:
             cached: Whether this was a cache hit (no actual API call)
             source: API source (google_trends, reddit, youtube)
         """
-        history = self._load_history()
+        metrics = get_metrics()
+        if metrics is not None:
+            metrics.record_api_call(source, cached)
 
-        call_record = {
-            'timestamp': time.time() * 1000,  # JavaScript timestamp (milliseconds)
-            'keyword': keyword,
-            'cached': cached,
-            'source': source,
-            'datetime': datetime.now().isoformat()
-        }
-
-        history.append(call_record)
-        self._save_history(history)
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    conn.execute(
+                        "INSERT INTO api_calls (timestamp, keyword, cached, source, datetime) VALUES (?, ?, ?, ?, ?)",
+                        (
+                            time.time() * 1000,  # JavaScript timestamp (milliseconds)
+                            keyword,
+                            1 if cached else 0,
+                            source,
+                            datetime.now().isoformat()
+                        )
+                    )
+        except Exception as e:
+            # Silently fail - not critical
+            pass
 
-    def get_calls_last_hour(self) -> Dict:
+    def get_api_usage_stats(self, window_seconds: int = 3600, source: Optional[str] = None) -> Dict:
         """
-        Get API call statistics for the last hour
+        Get API call statistics for a time window
+
+        Args:
+            window_seconds: Window size (default: last hour)
+            source: Only count calls from this source (None = all sources)
 
         Returns dict with:
         - total_calls: Total queries (including cache hits)
@@ -93,10 +207,21 @@ class QueueManager:
         - cache_hits: Number of cache hits
         - cache_hit_rate: Percentage of cache hits
         """
-        history = self._load_history()
+        cutoff_ms = (time.time() - window_seconds) * 1000
+
+        query = "SELECT COUNT(*), COALESCE(SUM(cached), 0) FROM api_calls WHERE timestamp > ?"
+        params = [cutoff_ms]
+        if source:
+            query += " AND source = ?"
+            params.append(source)
+
+        try:
+            with self._lock:
+                total_calls, cache_hits = self._connect().execute(query, params).fetchone()
+        except Exception as e:
+            # Silently fail - not critical
+            total_calls, cache_hits = 0, 0
 
-        total_calls = len(history)
-        cache_hits = len([call for call in history if call.get('cached', False)])
         actual_api_calls = total_calls - cache_hits
         cache_hit_rate = (cache_hits / total_calls * 100) if total_calls > 0 else 0
 
@@ -107,6 +232,18 @@ class QueueManager:
             'cache_hit_rate': round(cache_hit_rate, 1)
         }
 
+    def get_calls_last_hour(self) -> Dict:
+        """
+        Get API call statistics for the last hour
+
+        Returns dict with:
+        - total_calls: Total queries (including cache hits)
+        - actual_api_calls: Real API calls (excluding cache)
+        - cache_hits: Number of cache hits
+        - cache_hit_rate: Percentage of cache hits
+        """
+        return self.get_api_usage_stats(window_seconds=3600)
+
     def get_next_safe_query_time(self) -> float:
         """
         Calculate seconds until next safe query
@@ -114,13 +251,19 @@ class QueueManager:
         Returns:
             Seconds to wait (0 if safe to query now)
         """
-        history = self._load_history()
+        try:
+            with self._lock:
+                last_call_ms = self._connect().execute(
+                    "SELECT MAX(timestamp) FROM api_calls"
+                ).fetchone()[0]
+        except Exception as e:
+            return 0
 
-        if not history:
+        if last_call_ms is None:
             return 0
 
         # Get timestamp of most recent call
-        last_call_time = max(call['timestamp'] for call in history) / 1000  # Convert to seconds
+        last_call_time = last_call_ms / 1000  # Convert to seconds
         time_since_last = time.time() - last_call_time
 
         return max(0, self.MIN_DELAY_SECONDS - time_since_last)
@@ -138,26 +281,25 @@ class QueueManager:
             Dict with:
             - total_topics: Number of topics
             - cached_topics: Number already cached
-            - new_queries: Number requiring API calls
+            - new_queries: Number of API requests needed
             - estimated_seconds: Total time estimate
             - estimated_minutes: Total time in minutes (rounded)
         """
+        from .api_clients import GoogleTrendsClient
         total_topics = len(topics)
 
         # Determine how many are cached
         if cache_status:
             cached_topics = sum(1 for is_cached in cache_status.values() if is_cached)
         else:
-            # Check actual cache files
-            from .api_clients import GoogleTrendsClient
-            dummy_trail = BreadcrumbTrail("QueueManager_CacheCheck")
-            client = GoogleTrendsClient(dummy_trail)
-            cached_topics = sum(1 for topic in topics if client._load_from_cache(topic) is not None)
+            # Check the shared response cache (index lookup, no client or network needed)
+            cached_topics = sum(1 for topic in topics if GoogleTrendsClient.is_cached(topic))
 
-        new_queries = total_topics - cached_topics
+        # Requests, not topics (multiplexed mode packs 4 topics per request)
+        new_queries = GoogleTrendsClient.requests_needed(total_topics - cached_topics)
 
         # Estimate time:
-        # - Cached queries: ~0.1 seconds each (file read)
+        # - Cached queries: ~0.1 seconds each (cache lookup)
         # - New queries: ~14 seconds each (12s delay + 2s API call)
         estimated_seconds = (cached_topics * 0.1) + (new_queries * 14)
         estimated_minutes = round(estimated_seconds / 60, 1)
@@ -0,0 +1,186 @@
+"""
+Agent 0 Streaming Topic Ranking
+Ranks topics as they finish instead of sorting everything at the end
+
+Topics are kept in a heap keyed by (opportunity_score, confidence). With a
+bound (top_k) only the best K topics are kept, so ranking tens of thousands
+of drill-down candidates costs O(N log K) time and O(K) memory. A second,
+smaller heap tracks the leaderboard (the top few topics) so callers can show
+it every time it changes.
+
+Ties are broken by each topic's index (its position in the input), so the
+final ranking matches a stable sort of the input no matter which order
+parallel workers finish in. Rankers filled by separate workers can be
+merged into one.
+"""
+
+import heapq
+import itertools
+import threading
+from typing import Dict, List, Optional
+
+from lib.breadcrumb_system import BreadcrumbTrail
+from .config import Agent0Config as Config
+
+
+def ranking_key(topic_entry: Dict) -> tuple:
+    """Ranking key: opportunity score, then confidence (higher ranks first)"""
+    scores = topic_entry['scores']
+    return (scores['opportunity']['opportunity_score'], scores['confidence'])
+
+
+class StreamingRanker:
+    """
+    Bounded top-K ranking with streaming insertion
+
+    add() is thread-safe and returns True when the topic entered the
+    leaderboard. finish() returns the ranking (best first) and lights the
+    ranking_complete LED.
+    """
+
+    def __init__(
+        self,
+        trail: BreadcrumbTrail,
+        top_k: Optional[int] = None,
+        leaderboard_size: int = 5,
+        expected: Optional[int] = None
+    ):
+        """
+        Args:
+            trail: LED breadcrumb trail
+            top_k: Topics to keep (None = keep all, full ranking)
+            leaderboard_size: Topics in the live leaderboard
+            expected: Total topics expected (for the LED only)
+        """
+        if top_k is not None and top_k < 1:
+            raise ValueError(f"top_k must be at least 1, got {top_k}")
+        if leaderboard_size < 1:
+            raise ValueError(f"leaderboard_size must be at least 1, got {leaderboard_size}")
+
+        self.trail = trail
+        self.top_k = top_k
+        self.leaderboard_size = leaderboard_size if top_k is None else min(leaderboard_size, top_k)
+
+        # Min-heaps of (opportunity, confidence, -index, -seq, entry): the root
+        # is the worst kept topic, so a better one replaces it in O(log K)
+        self._heap: List[tuple] = []
+        self._board: List[tuple] = []
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+        self.seen = 0
+
+        self.trail.light(Config.LED_SCORING_START + 7, {
+            "action": "rank_topics",
+            "total_topics": expected,
+            "top_k": top_k
+        })
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def add(self, topic_entry: Dict, index: Optional[int] = None) -> bool:
+        """
+        Insert a scored topic entry (dict with 'topic' and 'scores')
+
+        Args:
+            topic_entry: Scored topic entry
+            index: Position in the input, used to break ties like a stable
+                sort (defaults to insertion order)
+
+        Returns:
+            True if the leaderboard changed
+        """
+        with self._lock:
+            return self._push(topic_entry, index)
+
+    def extend(self, topic_entries: List[Dict]) -> "StreamingRanker":
+        """Insert entries in order (index = position in the list)"""
+        with self._lock:
+            for index, topic_entry in enumerate(topic_entries):
+                self._push(topic_entry, index)
+        return self
+
+    def merge(self, other: "StreamingRanker") -> "StreamingRanker":
+        """
+        Fold another ranker's kept topics into this one
+
+        Workers should pass the same global indices to add() so ties resolve
+        the same way a single ranker would.
+        """
+        with other._lock:
+            items = list(other._heap)
+            seen = other.seen
+
+        with self._lock:
+            for opportunity, confidence, neg_index, _, entry in items:
+                self._push_key(opportunity, confidence, neg_index, entry)
+            self.seen += seen - len(items)
+
+        return self
+
+    def leaderboard(self) -> List[Dict]:
+        """Current top topics (best first)"""
+        with self._lock:
+            return [item[-1] for item in sorted(self._board, reverse=True)]
+
+    def ranked(self) -> List[Dict]:
+        """Kept topics, best first (all topics when top_k is None)"""
+        with self._lock:
+            return [item[-1] for item in sorted(self._heap, reverse=True)]
+
+    def finish(self) -> List[Dict]:
+        """Final ranking (lights the ranking_complete LED)"""
+        ranked = self.ranked()
+
+        self.trail.light(Config.LED_SCORING_START + 8, {
+            "action": "ranking_complete",
+            "total_topics": self.seen,
+            "kept_topics": len(ranked),
+            "top_topic": ranked[0]['topic'] if ranked else None,
+            "top_opportunity": ranked[0]['scores']['opportunity']['opportunity_score'] if ranked else 0,
+            "top_demand": ranked[0]['scores']['composite_score'] if ranked else 0,
+            "top_competition": ranked[0]['scores']['competition']['overall_competition'] if ranked else 0
+        })
+
+        return ranked
+
+    def _push(self, topic_entry: Dict, index: Optional[int]) -> bool:
+        seq = next(self._seq)
+        opportunity, confidence = ranking_key(topic_entry)
+        return self._push_key(opportunity, confidence, -(seq if index is None else index), topic_entry, seq)
+
+    def _push_key(self, opportunity, confidence, neg_index: int, entry: Dict, seq: Optional[int] = None) -> bool:
+        if seq is None:
+            seq = next(self._seq)
+        item = (opportunity, confidence, neg_index, -seq, entry)
+        self.seen += 1
+
+        if self.top_k is None or len(self._heap) < self.top_k:
+            heapq.heappush(self._heap, item)
+        elif item[:4] > self._heap[0][:4]:
+            heapq.heapreplace(self._heap, item)
+        else:
+            return False
+
+        if len(self._board) < self.leaderboard_size:
+            heapq.heappush(self._board, item)
+        elif item[:4] > self._board[0][:4]:
+            heapq.heapreplace(self._board, item)
+        else:
+            return False
+
+        self.trail.light(Config.LED_SCORING_START + 7, {
+            "action": "leaderboard_updated",
+            "topic": entry['topic'],
+            "opportunity": opportunity,
+            "leader": max(self._board)[-1]['topic']
+        })
+        return True
+
+
+def format_leaderboard(leaderboard: List[Dict]) -> str:
+    """One-line leaderboard for progress output"""
+    return " | ".join(
+        f"{rank}. {entry['topic']} ({entry['scores']['opportunity']['opportunity_score']:.1f})"
+        for rank, entry in enumerate(leaderboard, 1)
+    )
@@ -0,0 +1,347 @@
+"""
+Agent 0: Offline Re-Scoring
+
+Recomputes scores and rankings for every researched topic from the raw
+signals already on disk - no network I/O. Trends data, Reddit aggregates and
+post timestamps come from the drill-down trail (cache/drill_trail.db); with
+--trends-cache, trends data is taken from the response cache (pytrends, then
+Playwright entries, expired ones included) wherever it has an entry.
+
+Inputs are parsed and packed into columns once (BatchTopicScorer), then scored
+under each weight configuration, so sweeping a grid costs milliseconds per
+configuration. Thresholds come from scoring_rules, which the per-topic scorer
+reads too; --rule overrides one for this run (repeat a NAME to sweep it).
+
+Usage:
+    python agents/agent_0/rescore.py
+    python agents/agent_0/rescore.py --weights 0.7:0.3
+    python agents/agent_0/rescore.py --weights 0.5:0.5 0.6:0.4 0.7:0.3 --top 5
+    python agents/agent_0/rescore.py --sweep 0 1 0.1 --output outputs/rescore.json
+    python agents/agent_0/rescore.py --parent "meditation" --trends-cache
+    python agents/agent_0/rescore.py --rule ZONE_HIGH_DEMAND=40 --rule ZONE_HIGH_DEMAND=60
+    python agents/agent_0/rescore.py --rule 'REDDIT_VOLUME_TIERS=[[80, 70], [40, 50], [10, 30]]'
+"""
+
+import argparse
+import itertools
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from lib.breadcrumb_system import BreadcrumbTrail
+from lib.response_cache import get_cache
+from agents.agent_0.batch_scoring import BatchTopicScorer, TopicColumns
+from agents.agent_0.config import Agent0Config as Config
+from agents.agent_0.drill_down_loader import DrillDownTrail
+from agents.agent_0 import scoring_rules
+
+
+DEFAULT_TRAIL_FILE = DrillDownTrail.TRAIL_DB
+
+
+def load_trail_topics(
+    trail: BreadcrumbTrail,
+    trail_file: str = DEFAULT_TRAIL_FILE,
+    parent: Optional[str] = None
+) -> Tuple[List[Dict], int]:
+    """
+    Collect topic entries from every node of the drill-down trail
+
+    Args:
+        trail: LED breadcrumb trail
+        trail_file: Path to the drill-down trail store (drill_trail.db)
+        parent: Only the direct children of this topic (case-insensitive)
+
+    Returns:
+        (entries, skipped) - entries carry 'topic', 'path', the raw source data
+        and the stored 'scores'; skipped counts nodes without Reddit data
+    """
+    path = Path(trail_file)
+    legacy_file = path.parent / Path(DrillDownTrail.TRAIL_FILE).name
+    if not path.exists() and not legacy_file.exists():
+        raise ValueError(f"Drill-down trail not found: {trail_file} - run agents/agent_0/main.py first")
+
+    tree_data = DrillDownTrail(trail, db_path=trail_file).get_tree_for_dashboard()
+
+    entries = []
+    skipped = 0
+    found_parent = parent is None
+
+    def visit(node: Dict, ancestors: List[str], in_scope: bool):
+        nonlocal skipped, found_parent
+        node_path = ancestors + [node['topic']]
+
+        if in_scope:
+            data = node.get('data') or {}
+            if data.get('reddit_data') is None:
+                skipped += 1
+            else:
+                entries.append({
+                    "topic": node['topic'],
+                    "path": node_path,
+                    "trends_data": data.get('trends_data'),
+                    "reddit_data": data['reddit_data'],
+                    "youtube_data": data.get('youtube_data'),
+                    "scores": data.get('scores')
+                })
+
+        is_parent = parent is not None and node['topic'].lower() == parent.lower()
+        found_parent = found_parent or is_parent
+        for child in node.get('children', []):
+            visit(child, node_path, parent is None or is_parent)
+
+    for root in tree_data.get('root_nodes', []):
+        visit(root, [], parent is None)
+
+    if not found_parent:
+        raise ValueError(f"Parent topic '{parent}' not found in {trail_file}")
+
+    return entries, skipped
+
+
+def apply_trends_cache(entries: List[Dict]) -> int:
+    """
+    Replace trends data with response cache entries where one exists
+
+    Looks up the pytrends entry first, then the Playwright one. Expired entries
+    are used too - offline re-scoring wants the last known signal, not a fresh
+    one. Returns the number of topics updated.
+    """
+    # Imported here so the default path needs neither pytrends nor Playwright
+    from agents.agent_0.api_clients import GoogleTrendsClient
+    from agents.agent_0.api_clients_playwright import GoogleTrendsPlaywrightClient
+
+    sources = [
+        (GoogleTrendsClient.CACHE_SOURCE, GoogleTrendsClient.cache_params()),
+        (GoogleTrendsPlaywrightClient.CACHE_SOURCE, GoogleTrendsPlaywrightClient.CACHE_PARAMS),
+    ]
+    cache = get_cache()
+    updated = 0
+
+    for entry in entries:
+        for source, params in sources:
+            cached = cache.get_entry(source, entry['topic'], params, include_expired=True)
+            if cached is not None:
+                entry['trends_data'] = cached['value']
+                updated += 1
+                break
+
+    return updated
+
+
+def parse_weights(pairs: List[str]) -> List[Tuple[float, float]]:
+    """Parse 'TRENDS:REDDIT' weight pairs, e.g. ['0.6:0.4']"""
+    grid = []
+    for pair in pairs:
+        try:
+            weight_trends, weight_reddit = (float(part) for part in pair.split(':'))
+        except ValueError:
+            raise ValueError(f"Invalid weight pair '{pair}' - expected TRENDS:REDDIT, e.g. 0.6:0.4")
+        grid.append((weight_trends, weight_reddit))
+    return grid
+
+
+def sweep_weights(start: float, stop: float, step: float) -> List[Tuple[float, float]]:
+    """Trends weights from start to stop (inclusive), Reddit weight = 1 - trends weight"""
+    if step <= 0:
+        raise ValueError(f"Sweep step must be positive, got {step}")
+
+    count = int(round((stop - start) / step)) + 1
+    return [
+        (round(start + i * step, 6), round(1 - (start + i * step), 6))
+        for i in range(max(count, 0))
+    ]
+
+
+def parse_rules(items: List[str]) -> List[Dict]:
+    """
+    Parse 'NAME=VALUE' scoring rule overrides into override sets
+
+    VALUE is JSON (tiers as nested lists). A NAME given several times is swept:
+    the result is the cross product of every name's values, e.g.
+    ['A=1', 'A=2', 'B=3'] -> [{'A': 1, 'B': 3}, {'A': 2, 'B': 3}].
+    No items -> [{}] (the rules as they are).
+    """
+    values: Dict[str, List] = {}
+    for item in items:
+        name, separator, raw = item.partition('=')
+        name = name.strip()
+        if not separator or name not in scoring_rules.names():
+            raise ValueError(
+                f"Invalid rule override '{item}' - expected NAME=VALUE with NAME from "
+                f"agents/agent_0/scoring_rules.py, e.g. ZONE_HIGH_DEMAND=60"
+            )
+        try:
+            values.setdefault(name, []).append(json.loads(raw))
+        except json.JSONDecodeError:
+            raise ValueError(f"Invalid value for rule {name}: {raw!r} is not JSON")
+
+    names = list(values)
+    return [dict(zip(names, combination)) for combination in itertools.product(*values.values())]
+
+
+def rank(entries: List[Dict], scores: List[Dict]) -> List[int]:
+    """Indices ordered like TopicScorer.rank_topics (opportunity, then confidence)"""
+    return sorted(
+        range(len(entries)),
+        key=lambda i: (
+            scores[i]['opportunity']['opportunity_score'],
+            scores[i]['confidence']
+        ),
+        reverse=True
+    )
+
+
+def rescore(
+    entries: List[Dict],
+    grid: List[Tuple[float, float]],
+    trail: BreadcrumbTrail,
+    now: Optional[float] = None,
+    rule_sets: Optional[List[Dict]] = None
+) -> List[Dict]:
+    """
+    Score the entries under every (trends, reddit) weight pair
+
+    rule_sets: scoring_rules overrides (see parse_rules); every weight pair is
+    scored under each set. Default: the rules as they are.
+
+    Entries are packed once and reused across the grid. Returns one dict per
+    configuration with its ranking (full score dicts, best first).
+    """
+    if not entries:
+        raise ValueError("No topics with Reddit data to re-score")
+    if now is None:
+        now = datetime.now().timestamp()
+    if not rule_sets:
+        rule_sets = [{}]
+    configs = [(rules, weights) for rules in rule_sets for weights in grid]
+
+    start = time.perf_counter()
+    columns = TopicColumns.from_topics(entries)
+    scorer = BatchTopicScorer(trail)
+
+    trail.light(Config.LED_SCORING_START + 9, {
+        "action": "rescore_inputs_loaded",
+        "topics": len(entries),
+        "configs": len(configs),
+        "pack_ms": round((time.perf_counter() - start) * 1000, 2)
+    })
+
+    # Ranks under the stored scores (None for nodes saved without scores)
+    stored = [entry.get('scores') for entry in entries]
+    baseline = {}
+    if all(stored):
+        baseline = {i: position for position, i in enumerate(rank(entries, stored), 1)}
+
+    results = []
+    for rules, (weight_trends, weight_reddit) in configs:
+        with scoring_rules.override(rules):
+            scores = scorer.score(columns, now=now, weight_trends=weight_trends, weight_reddit=weight_reddit)
+        ranking = []
+        for position, i in enumerate(rank(entries, scores), 1):
+            ranking.append({
+                "rank": position,
+                "previous_rank": baseline.get(i),
+                "topic": entries[i]['topic'],
+                "path": entries[i]['path'],
+                "scores": scores[i]
+            })
+        results.append({
+            "weight_google_trends": weight_trends,
+            "weight_reddit": weight_reddit,
+            "rules": rules,
+            "ranking": ranking
+        })
+
+    trail.light(Config.LED_SCORING_START + 9, {
+        "action": "rescore_complete",
+        "topics": len(entries),
+        "configs": len(configs),
+        "total_ms": round((time.perf_counter() - start) * 1000, 2)
+    })
+
+    return results
+
+
+def print_results(results: List[Dict], top: int):
+    for result in results:
+        print(f"\n{'='*78}")
+        print(f"WEIGHTS  Google Trends {result['weight_google_trends']:.2f}  /  Reddit {result['weight_reddit']:.2f}")
+        for name, value in result['rules'].items():
+            print(f"RULE     {name} = {json.dumps(value, ensure_ascii=False)}")
+        print(f"{'='*78}")
+        print(f"{'Rank':>4} {'Was':>4}  {'Topic':<32} {'Opportunity':>11} {'Demand':>7} {'Comp':>6}  Zone")
+        for row in result['ranking'][:top]:
+            scores = row['scores']
+            previous = row['previous_rank'] if row['previous_rank'] is not None else '-'
+            print(
+                f"{row['rank']:>4} {previous:>4}  {row['topic'][:32]:<32} "
+                f"{scores['opportunity']['opportunity_score']:>11.2f} "
+                f"{scores['composite_score']:>7.2f} "
+                f"{scores['competition']['overall_competition']:>6.2f}  {scores['zone']}"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-score researched topics offline under new weights")
+    parser.add_argument('--trail', default=DEFAULT_TRAIL_FILE, help=f'Drill-down trail (default: {DEFAULT_TRAIL_FILE})')
+    parser.add_argument('--parent', help='Only re-score the direct children of this topic')
+    parser.add_argument('--weights', nargs='+', metavar='TRENDS:REDDIT',
+                        help='Weight pairs to score under (default: current config)')
+    parser.add_argument('--sweep', nargs=3, type=float, metavar=('START', 'STOP', 'STEP'),
+                        help='Sweep the Google Trends weight (Reddit = 1 - trends)')
+    parser.add_argument('--rule', action='append', default=[], metavar='NAME=VALUE',
+                        help='Override a scoring_rules threshold (JSON value); repeat a NAME to sweep it')
+    parser.add_argument('--trends-cache', action='store_true',
+                        help='Prefer trends data from the response cache over the trail copy')
+    parser.add_argument('--top', type=int, default=10, help='Topics to print per configuration (default: 10)')
+    parser.add_argument('--output', help='Write every configuration\'s full ranking to this JSON file')
+    args = parser.parse_args()
+
+    grid = []
+    if args.weights:
+        grid += parse_weights(args.weights)
+    if args.sweep:
+        grid += sweep_weights(*args.sweep)
+    if not grid:
+        grid = [(Config.WEIGHT_GOOGLE_TRENDS, Config.WEIGHT_REDDIT)]
+    rule_sets = parse_rules(args.rule)
+
+    trail = BreadcrumbTrail("Agent0_Rescore")
+    entries, skipped = load_trail_topics(trail, args.trail, args.parent)
+    print(f"[OK] Loaded {len(entries)} topics from {args.trail}"
+          + (f" ({skipped} without Reddit data skipped)" if skipped else ""))
+
+    if args.trends_cache:
+        updated = apply_trends_cache(entries)
+        print(f"[OK] Trends data from response cache for {updated}/{len(entries)} topics")
+
+    start = time.perf_counter()
+    results = rescore(entries, grid, trail, rule_sets=rule_sets)
+    elapsed = time.perf_counter() - start
+
+    print_results(results, args.top)
+    print(f"\n[OK] Scored {len(entries)} topics under {len(results)} configuration(s) in {elapsed * 1000:.1f} ms")
+
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({
+                "generated": datetime.now().isoformat(),
+                "trail_file": args.trail,
+                "parent": args.parent,
+                "topics": len(entries),
+                "configs": results
+            }, f, indent=2, ensure_ascii=False)
+        print(f"[OK] Rankings written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,7 +8,9 @@ from typing import Dict, List
 from datetime import datetime
 from lib.breadcrumb_system import BreadcrumbTrail
 from .config import Agent0Config as Config
+from . import scoring_rules as rules
 from .competition_analyzer import CompetitionAnalyzer
+from .ranking import StreamingRanker
 
 
 class TopicScorer:
@@ -21,7 +23,8 @@ class TopicScorer:
     def calculate_recency_score(
         self,
         trends_data: Dict,
-        reddit_data: Dict
+        reddit_data: Dict,
+        now: float = None
     ) -> Dict:
         """
         Calculate recency/urgency score based on content freshness
@@ -36,10 +39,13 @@ class TopicScorer:
         - recent_activity_pct: % of content in last 90 days
         - trend_momentum: Rising/stable/falling
         - avg_content_age_days: Average age of content
+
+        now: Reference timestamp (defaults to the current time)
         """
-        now = datetime.now().timestamp()
-        days_30 = 30 * 24 * 60 * 60
-        days_90 = 90 * 24 * 60 * 60
+        if now is None:
+            now = datetime.now().timestamp()
+        days_30 = rules.RECENT_DAYS * 24 * 60 * 60
+        days_90 = rules.ACTIVE_DAYS * 24 * 60 * 60
 
         recent_30_count = 0
         recent_90_count = 0
@@ -71,28 +77,27 @@ class TopicScorer:
                 'total_content': 0
             }
 
+        activity_weight, momentum_weight, freshness_weight = rules.RECENCY_WEIGHTS
+
         # 1. Recent activity (60%): Percentage of content in last 90 days
         recent_90_pct = (recent_90_count / total_content) * 100
-        recent_activity_score = min(recent_90_pct, 100) * 0.60
+        recent_activity_score = min(recent_90_pct, 100) * activity_weight
 
         # 2. Trend momentum (30%): From Google Trends (skip if no trends data)
         if trends_data:
+            # Rising bonus, falling penalty, stable or no_data neutral
             trend_direction = trends_data.get('trend_direction', 'stable')
-            if trend_direction == 'rising':
-                trend_momentum_score = 100 * 0.30
-            elif trend_direction == 'falling':
-                trend_momentum_score = 30 * 0.30  # Penalty for falling
-            else:  # stable or no_data
-                trend_momentum_score = 60 * 0.30
+            momentum = rules.MOMENTUM_SCORES.get(trend_direction, rules.MOMENTUM_DEFAULT)
         else:
             # Drill-down mode: No trends data, use neutral score
             trend_direction = 'no_data'
-            trend_momentum_score = 60 * 0.30
+            momentum = rules.MOMENTUM_DEFAULT
+        trend_momentum_score = momentum * momentum_weight
 
         # 3. Content freshness (10%): Inverse of average age
         avg_age_days = total_age_days / total_content
         # Convert to freshness score: 0 days = 100, 365 days = 0
-        freshness_score = max(0, (1 - (avg_age_days / 365)) * 100) * 0.10
+        freshness_score = max(0, (1 - (avg_age_days / rules.FRESHNESS_DAYS)) * 100) * freshness_weight
 
         # Combined recency score
         recency_score = recent_activity_score + trend_momentum_score + freshness_score
@@ -130,9 +135,10 @@ class TopicScorer:
 
             if trends_points > 0:
                 # More data points (52 weeks = full year) + higher interest = richer
+                coverage_weight, interest_weight = rules.TRENDS_RICHNESS_WEIGHTS
                 trends_richness = min(
-                    (trends_points / 52) * 50 +  # Data point coverage
-                    (trends_interest / 100) * 50,  # Interest level
+                    (trends_points / rules.TRENDS_RICHNESS_FULL_POINTS) * coverage_weight +  # Data point coverage
+                    (trends_interest / 100) * interest_weight,  # Interest level
                     100
                 )
                 scores.append(trends_richness)
@@ -148,9 +154,10 @@ class TopicScorer:
 
         if reddit_posts > 0:
             # More posts + higher engagement = richer
+            volume_weight, engagement_weight = rules.REDDIT_RICHNESS_WEIGHTS
             reddit_richness = min(
-                (reddit_posts / 100) * 30 +  # Post volume (100 posts = good sample)
-                (reddit_engagement / 5000) * 70,  # Engagement quality
+                (reddit_posts / rules.REDDIT_RICHNESS_FULL_POSTS) * volume_weight +  # Post volume (100 posts = good sample)
+                (reddit_engagement / rules.REDDIT_RICHNESS_FULL_ENGAGEMENT) * engagement_weight,  # Engagement quality
                 100
             )
             scores.append(reddit_richness)
@@ -164,16 +171,7 @@ class TopicScorer:
         overall_richness = sum(scores) / len(scores) if scores else 0
 
         # Convert to star rating (1-5)
-        if overall_richness >= 90:
-            stars = 5
-        elif overall_richness >= 70:
-            stars = 4
-        elif overall_richness >= 50:
-            stars = 3
-        elif overall_richness >= 30:
-            stars = 2
-        else:
-            stars = 1
+        stars = rules.richness_stars(overall_richness)
 
         return {
             'richness_score': round(overall_richness, 2),
@@ -198,18 +196,15 @@ class TopicScorer:
         # Base score from average interest
         score = avg_interest
 
-        # Bonus for rising trends (+20%)
-        if trend_direction == 'rising':
-            score *= 1.2
-        # Penalty for falling trends (-20%)
-        elif trend_direction == 'falling':
-            score *= 0.8
+        # Bonus for rising trends (+20%), penalty for falling trends (-20%)
+        if trend_direction in rules.TRENDS_DIRECTION_MULTIPLIERS:
+            score *= rules.TRENDS_DIRECTION_MULTIPLIERS[trend_direction]
 
         # Quality adjustment based on data points
-        if data_points < 10:
-            score *= 0.7  # Low confidence
-        elif data_points >= 30:
-            score *= 1.1  # High confidence
+        if data_points < rules.TRENDS_LOW_DATA_POINTS:
+            score *= rules.TRENDS_LOW_DATA_MULTIPLIER  # Low confidence
+        elif data_points >= rules.TRENDS_HIGH_DATA_POINTS:
+            score *= rules.TRENDS_HIGH_DATA_MULTIPLIER  # High confidence
 
         # Cap at 100
         return min(score, 100.0)
@@ -232,21 +227,16 @@ class TopicScorer:
 
         # Post volume score (logarithmic scale)
         # 10 posts = 30, 50 posts = 50, 100+ posts = 70
-        if total_posts >= 100:
-            volume_score = 70
-        elif total_posts >= 50:
-            volume_score = 50
-        elif total_posts >= 10:
-            volume_score = 30
-        else:
-            volume_score = total_posts * 3
+        volume_score = rules.tier(
+            total_posts, rules.REDDIT_VOLUME_TIERS, total_posts * rules.REDDIT_VOLUME_PER_POST
+        )
 
         # Engagement score (linear scale, capped)
         # Average score >100 = very high engagement
-        engagement_score = min(avg_engagement / 2, 50)
+        engagement_score = min(avg_engagement / rules.REDDIT_ENGAGEMENT_DIVISOR, rules.REDDIT_ENGAGEMENT_CAP)
 
         # Diversity bonus (more subreddits = broader appeal)
-        diversity_bonus = min(len(top_subreddits) * 3, 15)
+        diversity_bonus = min(len(top_subreddits) * rules.REDDIT_DIVERSITY_PER_SUBREDDIT, rules.REDDIT_DIVERSITY_CAP)
 
         total = volume_score + engagement_score + diversity_bonus
         return min(total, 100.0)
@@ -272,30 +262,20 @@ class TopicScorer:
 
         # Video volume score (logarithmic scale)
         # 5 videos = 20, 10 videos = 35, 20+ videos = 60
-        if total_videos >= 20:
-            volume_score = 60
-        elif total_videos >= 10:
-            volume_score = 35
-        elif total_videos >= 5:
-            volume_score = 20
-        else:
-            volume_score = total_videos * 4
+        volume_score = rules.tier(
+            total_videos, rules.YOUTUBE_VOLUME_TIERS, total_videos * rules.YOUTUBE_VOLUME_PER_VIDEO
+        )
 
         # View count score (logarithmic scale, capped)
         # 10k avg views = 20, 100k = 40, 1M+ = 60
-        if avg_views >= 1000000:
-            views_score = 60
-        elif avg_views >= 100000:
-            views_score = 40
-        elif avg_views >= 10000:
-            views_score = 20
-        elif avg_views > 0:
-            views_score = min((avg_views / 1000) * 2, 20)
+        if avg_views > 0:
+            low_views_score = min((avg_views / 1000) * rules.YOUTUBE_VIEWS_PER_THOUSAND, rules.YOUTUBE_VIEWS_LOW_CAP)
         else:
-            views_score = 0
+            low_views_score = 0
+        views_score = rules.tier(avg_views, rules.YOUTUBE_VIEWS_TIERS, low_views_score)
 
         # Channel diversity bonus (more creators = broader interest)
-        diversity_bonus = min(len(top_channels) * 4, 20)
+        diversity_bonus = min(len(top_channels) * rules.YOUTUBE_DIVERSITY_PER_CHANNEL, rules.YOUTUBE_DIVERSITY_CAP)
 
         total = volume_score + views_score + diversity_bonus
         return min(total, 100.0)
@@ -304,7 +284,8 @@ class TopicScorer:
         self,
         trends_data: Dict,
         reddit_data: Dict,
-        youtube_data: Dict = None
+        youtube_data: Dict = None,
+        now: float = None
     ) -> Dict:
         """
         Calculate weighted composite demand score with competition analysis
@@ -323,6 +304,10 @@ class TopicScorer:
         - competition: dict with competition metrics
         - opportunity: dict with opportunity score and recommendation
         - insights: list of competitive insights
+
+        now: Reference timestamp for recency (defaults to the current time).
+        BatchTopicScorer (batch_scoring.py) returns the same dicts for many
+        topics at once.
         """
         self.trail.light(Config.LED_SCORING_START, {
             "action": "calculate_scores"
@@ -342,10 +327,8 @@ class TopicScorer:
 
         # Adjust weights dynamically based on available sources
         if Config.ENABLE_YOUTUBE and youtube_data:
-            # 3-source mode: 33/33/33 split
-            weight_trends = 0.33
-            weight_reddit = 0.33
-            weight_youtube = 0.34  # Slight extra to sum to 1.0
+            # 3-source mode: 33/33/33 split (YouTube slightly more to sum to 1.0)
+            weight_trends, weight_reddit, weight_youtube = rules.THREE_SOURCE_WEIGHTS
             composite = (
                 trends_score * weight_trends +
                 reddit_score * weight_reddit +
@@ -364,13 +347,13 @@ class TopicScorer:
         # Calculate confidence based on mode and data availability
         if Config.DRILLDOWN_MODE:
             # Drill-down mode: 60% confidence (acceptable for exploration)
-            confidence = 60 if sources_with_data > 0 else 0
+            confidence = rules.DRILLDOWN_CONFIDENCE if sources_with_data > 0 else 0
         elif Config.ENABLE_YOUTUBE:
             # 3-source mode: Confidence based on source count
-            confidence = {3: 100, 2: 75, 1: 50, 0: 0}[sources_with_data]
+            confidence = rules.THREE_SOURCE_CONFIDENCE[sources_with_data]
         else:
             # 2-source mode: Confidence based on source count
-            confidence = {2: 100, 1: 60, 0: 0}[sources_with_data]
+            confidence = rules.TWO_SOURCE_CONFIDENCE[sources_with_data]
 
         # Analyze COMPETITION
         competition = self.competition_analyzer.calculate_overall_competition(
@@ -406,7 +389,8 @@ class TopicScorer:
         # Calculate recency/urgency (NEW)
         recency = self.calculate_recency_score(
             trends_data,
-            reddit_data
+            reddit_data,
+            now
         )
 
         # Classify zone based on demand and competition
@@ -462,46 +446,15 @@ class TopicScorer:
 
         Returns: Zone identifier string
         """
-        high_demand = demand_score >= 50
-        low_competition = competition_score < 50
-
-        if high_demand and low_competition:
-            return 'gold_mine'
-        elif high_demand and not low_competition:
-            return 'viable'
-        elif not high_demand and low_competition:
-            return 'risky_niche'
-        else:
-            return 'avoid'
+        return rules.zone(demand_score, competition_score)
 
-    def rank_topics(self, topic_data: List[Dict]) -> List[Dict]:
+    def rank_topics(self, topic_data: List[Dict], top_k: int = None) -> List[Dict]:
         """
         Rank topics by opportunity score (demand vs competition)
 
         Input: List of dicts with 'topic' and 'scores' keys
-        Output: Sorted list (highest opportunity first)
+        Output: Sorted list (highest opportunity first), only the best top_k
+        if given (bounded heap - see ranking.StreamingRanker)
         """
-        self.trail.light(Config.LED_SCORING_START + 7, {
-            "action": "rank_topics",
-            "total_topics": len(topic_data)
-        })
-
-        # Sort by opportunity score (primary), then confidence (secondary)
-        ranked = sorted(
-            topic_data,
-            key=lambda x: (
-                x['scores']['opportunity']['opportunity_score'],
-                x['scores']['confidence']
-            ),
-            reverse=True
-        )
-
-        self.trail.light(Config.LED_SCORING_START + 8, {
-            "action": "ranking_complete",
-            "top_topic": ranked[0]['topic'] if ranked else None,
-            "top_opportunity": ranked[0]['scores']['opportunity']['opportunity_score'] if ranked else 0,
-            "top_demand": ranked[0]['scores']['composite_score'] if ranked else 0,
-            "top_competition": ranked[0]['scores']['competition']['overall_competition'] if ranked else 0
-        })
-
-        return ranked
+        ranker = StreamingRanker(self.trail, top_k=top_k, expected=len(topic_data))
+        return ranker.extend(topic_data).finish()
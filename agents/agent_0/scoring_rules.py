@@ -0,0 +1,238 @@
+"""
+Agent 0 Scoring Rules
+Thresholds, weights and labels shared by every topic scorer
+
+TopicScorer / CompetitionAnalyzer (per topic) and BatchTopicScorer (NumPy
+columns) both read these values at call time as module attributes
+(scoring_rules.NAME), so a change here - or a temporary override() -
+applies to all of them at once.
+
+Tiers are (threshold, value) pairs checked in order; the first threshold the
+input reaches (with the tier's comparison) wins, otherwise the default.
+"""
+
+import operator
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Sequence, Tuple
+
+Tiers = Sequence[Tuple[float, Any]]
+
+NEUTRAL_COMPETITION = 50.0  # No usable data - assume moderate competition
+
+# ----------------------------------------------------------------------
+# Demand (TopicScorer.normalize_*_score)
+# ----------------------------------------------------------------------
+
+TRENDS_DIRECTION_MULTIPLIERS = {'rising': 1.2, 'falling': 0.8}  # Others unchanged
+TRENDS_LOW_DATA_POINTS = 10       # Fewer points = low confidence
+TRENDS_LOW_DATA_MULTIPLIER = 0.7
+TRENDS_HIGH_DATA_POINTS = 30      # At least this many = high confidence
+TRENDS_HIGH_DATA_MULTIPLIER = 1.1
+
+REDDIT_VOLUME_TIERS = ((100, 70), (50, 50), (10, 30))  # total_posts >=
+REDDIT_VOLUME_PER_POST = 3                              # Below the last tier
+REDDIT_ENGAGEMENT_DIVISOR = 2
+REDDIT_ENGAGEMENT_CAP = 50
+REDDIT_DIVERSITY_PER_SUBREDDIT = 3
+REDDIT_DIVERSITY_CAP = 15
+
+YOUTUBE_VOLUME_TIERS = ((20, 60), (10, 35), (5, 20))  # total_videos >=
+YOUTUBE_VOLUME_PER_VIDEO = 4
+YOUTUBE_VIEWS_TIERS = ((1000000, 60), (100000, 40), (10000, 20))  # avg_views >=
+YOUTUBE_VIEWS_PER_THOUSAND = 2    # Below the last tier (> 0 views)
+YOUTUBE_VIEWS_LOW_CAP = 20
+YOUTUBE_DIVERSITY_PER_CHANNEL = 4
+YOUTUBE_DIVERSITY_CAP = 20
+
+# 3-source blend (Trends / Reddit / YouTube); the 2-source blend is
+# Config.WEIGHT_GOOGLE_TRENDS / Config.WEIGHT_REDDIT
+THREE_SOURCE_WEIGHTS = (0.33, 0.33, 0.34)
+
+# Confidence by number of sources with data
+DRILLDOWN_CONFIDENCE = 60
+THREE_SOURCE_CONFIDENCE = {3: 100, 2: 75, 1: 50, 0: 0}
+TWO_SOURCE_CONFIDENCE = {2: 100, 1: 60, 0: 0}
+
+# ----------------------------------------------------------------------
+# Competition (CompetitionAnalyzer)
+# ----------------------------------------------------------------------
+
+TRENDS_COMPETITION_MIN_DATA_POINTS = 10
+TRENDS_COMPETITION_RISING = 20          # Emerging market
+TRENDS_COMPETITION_STABLE_HIGH = 70     # Stable + high interest = saturated
+TRENDS_COMPETITION_STABLE_LOW = 40      # Stable + low interest = niche
+TRENDS_COMPETITION_FALLING = 80         # Declining market (any other direction)
+TRENDS_STABLE_HIGH_INTEREST = 60        # average_interest >
+TRENDS_SATURATION_INTEREST = 80         # average_interest > adds the bonus
+TRENDS_SATURATION_BONUS = 10
+
+REDDIT_ENGAGEMENT_PER_POST_TIERS = ((200, 20), (100, 35), (50, 55), (20, 70))  # >
+REDDIT_ENGAGEMENT_PER_POST_DEFAULT = 60
+REDDIT_CONCENTRATION_NO_DATA = 50
+REDDIT_CONCENTRATION_TIERS = ((5, 75), (3, 55), (2, 35))  # subreddit count >=
+REDDIT_CONCENTRATION_DEFAULT = 25                         # 1 subreddit
+REDDIT_DENSITY_NORMALIZER = 100                           # posts / (engagement / N)
+REDDIT_DENSITY_TIERS = ((5, 85), (2, 65), (0.5, 45))      # >
+REDDIT_DENSITY_DEFAULT = 30
+REDDIT_DENSITY_NO_DATA = 50                               # No posts or no engagement
+REDDIT_COMPETITION_WEIGHTS = (0.40, 0.35, 0.25)  # Engagement / concentration / volume
+
+COMPETITION_LEVEL_TIERS = (  # overall_competition <
+    (30, ('low', '🟢', 'LOW - OPPORTUNITY!')),
+    (50, ('moderate', '🟡', 'MODERATE')),
+    (70, ('high', '🟠', 'HIGH')),
+)
+COMPETITION_LEVEL_DEFAULT = ('very_high', '🔴', 'VERY HIGH - SATURATED')
+
+OPPORTUNITY_TIERS = (  # opportunity_score >= : (recommendation, emoji, description, risk)
+    (60, ('high_priority', '🟢', 'HIGH PRIORITY - Strong demand, low competition', 'LOW')),
+    (45, ('viable', '🟡', 'VIABLE - Good opportunity with effort', 'MODERATE')),
+    (30, ('risky', '🔵', 'RISKY - Need strong differentiation', 'HIGH')),
+)
+OPPORTUNITY_DEFAULT = ('avoid', '🔴', 'AVOID - Poor opportunity', 'VERY HIGH')
+
+COMPLEXITY_RULES = (  # (min demand, max competition or None, label, description)
+    (70, 30, 'SIMPLE', 'First-time ebook creator friendly'),
+    (50, 50, 'MODERATE', 'Standard ebook approach works'),
+    (50, None, 'COMPLEX', 'Need unique angle or superior quality'),
+)
+COMPLEXITY_DEFAULT = ('VERY COMPLEX', 'Market validation required')
+
+TRENDS_AUDIENCE_PER_INTEREST = 150000  # Search volume proxy
+REDDIT_AUDIENCE_MULTIPLIER = 2         # posts x avg engagement x N
+MIN_AUDIENCE = 1000                    # Minimum 1K for visibility
+
+DEMAND_INSIGHT_TIERS = (  # demand >=
+    (80, "✅ Strong validated demand"),
+    (60, "✅ Good demand signals"),
+    (40, "⚠️ Moderate demand - validate carefully"),
+)
+DEMAND_INSIGHT_DEFAULT = "🔴 Weak demand signals"
+COMPETITION_INSIGHT_TIERS = (  # competition <=
+    (30, "✅ Low competition - market gap opportunity"),
+    (50, "🟡 Moderate competition - differentiation needed"),
+    (70, "⚠️ High competition - strong positioning required"),
+)
+COMPETITION_INSIGHT_DEFAULT = "🔴 Very competitive - avoid or find unique angle"
+TREND_INSIGHTS = {
+    'rising': "✅ Rising trend - early mover advantage",
+    'falling': "🔴 Declining trend - market may be dying",
+}
+ACTIVE_COMMUNITY_POSTS = 30          # total_posts >
+ACTIVE_COMMUNITY_ENGAGEMENT = 1000   # and avg_engagement >
+PURCHASE_INTENT_ENGAGEMENT = 2000    # avg_engagement >
+
+# ----------------------------------------------------------------------
+# Richness, recency and zones (TopicScorer)
+# ----------------------------------------------------------------------
+
+TRENDS_RICHNESS_FULL_POINTS = 52     # A full year of weekly points
+TRENDS_RICHNESS_WEIGHTS = (50, 50)   # Coverage / interest
+REDDIT_RICHNESS_FULL_POSTS = 100
+REDDIT_RICHNESS_FULL_ENGAGEMENT = 5000
+REDDIT_RICHNESS_WEIGHTS = (30, 70)   # Volume / engagement
+RICHNESS_STAR_TIERS = ((90, 5), (70, 4), (50, 3), (30, 2))  # >=
+RICHNESS_STAR_DEFAULT = 1
+
+RECENT_DAYS = 30
+ACTIVE_DAYS = 90
+FRESHNESS_DAYS = 365                  # Content this old has no freshness left
+RECENCY_WEIGHTS = (0.60, 0.30, 0.10)  # Activity / momentum / freshness
+MOMENTUM_SCORES = {'rising': 100, 'falling': 30}
+MOMENTUM_DEFAULT = 60                 # Stable, unknown or no trends data
+
+ZONE_HIGH_DEMAND = 50       # demand >=
+ZONE_LOW_COMPETITION = 50   # competition <
+
+
+def tier(value, tiers: Tiers, default, op: Callable = operator.ge):
+    """Value of the first tier whose threshold passes op(value, threshold)"""
+    for threshold, result in tiers:
+        if op(value, threshold):
+            return result
+    return default
+
+
+def competition_level(overall: float) -> Tuple[str, str, str]:
+    """(level, emoji, description) for an overall competition score"""
+    return tier(overall, COMPETITION_LEVEL_TIERS, COMPETITION_LEVEL_DEFAULT, operator.lt)
+
+
+def opportunity_labels(opportunity: float) -> Tuple[str, str, str, str]:
+    """(recommendation, emoji, description, risk) for an opportunity score"""
+    return tier(opportunity, OPPORTUNITY_TIERS, OPPORTUNITY_DEFAULT)
+
+
+def complexity(demand_score: float, competition_score: float) -> Tuple[str, str]:
+    """(complexity, description) for a demand / competition pair"""
+    for min_demand, max_competition, label, description in COMPLEXITY_RULES:
+        if demand_score >= min_demand and (max_competition is None or competition_score <= max_competition):
+            return label, description
+    return COMPLEXITY_DEFAULT
+
+
+def insights(demand: float, competition: float, trend_direction,
+             reddit_posts: int, reddit_engagement: float) -> List[str]:
+    """Competitive insight strings (trend_direction None = no trends data)"""
+    result = [
+        tier(demand, DEMAND_INSIGHT_TIERS, DEMAND_INSIGHT_DEFAULT),
+        tier(competition, COMPETITION_INSIGHT_TIERS, COMPETITION_INSIGHT_DEFAULT, operator.le),
+    ]
+    if trend_direction in TREND_INSIGHTS:
+        result.append(TREND_INSIGHTS[trend_direction])
+    if reddit_posts > ACTIVE_COMMUNITY_POSTS and reddit_engagement > ACTIVE_COMMUNITY_ENGAGEMENT:
+        result.append("✅ Active community with strong engagement")
+    # High engagement = willingness to pay attention (proxy for purchase intent)
+    if reddit_engagement > PURCHASE_INTENT_ENGAGEMENT:
+        result.append("✅ High engagement suggests purchase intent")
+    return result
+
+
+def zone(demand_score: float, competition_score: float) -> str:
+    """Quadrant zone: gold_mine, viable, risky_niche or avoid"""
+    high_demand = demand_score >= ZONE_HIGH_DEMAND
+    low_competition = competition_score < ZONE_LOW_COMPETITION
+
+    if high_demand and low_competition:
+        return 'gold_mine'
+    elif high_demand:
+        return 'viable'
+    elif low_competition:
+        return 'risky_niche'
+    return 'avoid'
+
+
+def richness_stars(overall_richness: float) -> int:
+    """1-5 star rating for an overall richness score"""
+    return tier(overall_richness, RICHNESS_STAR_TIERS, RICHNESS_STAR_DEFAULT)
+
+
+def names() -> List[str]:
+    """Every tunable rule (module-level UPPER_CASE constants)"""
+    return [name for name in globals() if name.isupper() and not name.startswith('_')]
+
+
+@contextmanager
+def override(values: Dict[str, Any]) -> Iterator[None]:
+    """
+    Temporarily replace rules by name (restored on exit) - rescore.py --rule
+
+    Lists are converted to tuples so JSON values work for tiers.
+
+    Raises:
+        ValueError: If a name is not a scoring rule
+    """
+    module = globals()
+    unknown = [name for name in values if name not in names()]
+    if unknown:
+        raise ValueError(f"Unknown scoring rule(s): {', '.join(unknown)} - see agents/agent_0/scoring_rules.py")
+
+    def freeze(value):
+        return tuple(freeze(item) for item in value) if isinstance(value, list) else value
+
+    saved = {name: module[name] for name in values}
+    try:
+        module.update({name: freeze(value) for name, value in values.items()})
+        yield
+    finally:
+        module.update(saved)
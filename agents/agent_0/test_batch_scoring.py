@@ -0,0 +1,140 @@
+"""
+Agent 0 Batch Scoring Parity Test
+Scores synthetic topics through TopicScorer and BatchTopicScorer at a pinned
+time and checks the result dicts are identical in every scoring mode
+
+Run with: python agents/agent_0/test_batch_scoring.py
+"""
+
+import sys
+import os
+import random
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from lib.breadcrumb_system import BreadcrumbTrail
+from agents.agent_0.batch_scoring import BatchTopicScorer, TopicColumns
+from agents.agent_0.benchmark_batch_scoring import generate_topics, legacy_scores
+from agents.agent_0.config import Agent0Config as Config
+from agents.agent_0.scoring import TopicScorer
+from agents.agent_0 import scoring_rules
+
+NOW = 1760000000.0  # Pinned so recency does not depend on the clock
+SEEDS = (7, 42)
+TOPICS = 500
+
+
+def add_youtube(topics: list, seed: int) -> list:
+    """Attach YouTube data (boundary values included) to most topics"""
+    rng = random.Random(seed)
+    for entry in topics:
+        if rng.random() < 0.7:
+            entry['youtube_data'] = {
+                "total_videos": rng.choice([0, 4, 5, 10, 20, rng.randint(0, 40)]),
+                "avg_views": rng.choice([0, 9999, 10000, 100000, 1000000, round(rng.uniform(0, 2000000), 2)]),
+                "top_channels": [f"channel{j}" for j in range(rng.randint(0, 8))]
+            }
+    return topics
+
+
+def assert_parity(topics: list, label: str):
+    """Per-topic and batch scorers return identical dicts for every topic"""
+    trail = BreadcrumbTrail("Agent0_BatchScoringTest")
+    expected = legacy_scores(TopicScorer(trail), topics, NOW)
+    actual = BatchTopicScorer(trail).score(TopicColumns.from_topics(topics), now=NOW)
+
+    assert len(expected) == len(actual)
+    for entry, slow, fast in zip(topics, expected, actual):
+        assert slow == fast, f"{label}: '{entry['topic']}' differs\n  per-topic: {slow}\n  batch:     {fast}"
+
+
+def set_modes(enable_youtube: bool, drilldown: bool):
+    """Set the scoring mode flags, returning the previous values"""
+    previous = (Config.ENABLE_YOUTUBE, Config.DRILLDOWN_MODE)
+    Config.ENABLE_YOUTUBE, Config.DRILLDOWN_MODE = enable_youtube, drilldown
+    return previous
+
+
+def test_two_source_parity():
+    """Default Trends + Reddit blend"""
+    print("Testing 2-source parity...")
+    previous = set_modes(False, False)
+    try:
+        for seed in SEEDS:
+            assert_parity(generate_topics(TOPICS, NOW, seed), f"2-source seed {seed}")
+    finally:
+        Config.ENABLE_YOUTUBE, Config.DRILLDOWN_MODE = previous
+    print(f"✅ {TOPICS} topics x {len(SEEDS)} seeds identical")
+
+
+def test_three_source_parity():
+    """Trends + Reddit + YouTube blend"""
+    print("\nTesting 3-source parity...")
+    previous = set_modes(True, False)
+    try:
+        for seed in SEEDS:
+            assert_parity(add_youtube(generate_topics(TOPICS, NOW, seed), seed), f"3-source seed {seed}")
+    finally:
+        Config.ENABLE_YOUTUBE, Config.DRILLDOWN_MODE = previous
+    print(f"✅ {TOPICS} topics x {len(SEEDS)} seeds identical")
+
+
+def test_drilldown_parity():
+    """Reddit-only drill-down mode"""
+    print("\nTesting drill-down parity...")
+    previous = set_modes(False, True)
+    try:
+        for seed in SEEDS:
+            assert_parity(generate_topics(TOPICS, NOW, seed), f"drill-down seed {seed}")
+    finally:
+        Config.ENABLE_YOUTUBE, Config.DRILLDOWN_MODE = previous
+    print(f"✅ {TOPICS} topics x {len(SEEDS)} seeds identical")
+
+
+def test_overridden_rules_parity():
+    """Both scorers follow a scoring_rules override (and it is restored)"""
+    print("\nTesting parity with overridden scoring rules...")
+    topics = generate_topics(TOPICS, NOW, SEEDS[0])
+    trail = BreadcrumbTrail("Agent0_BatchScoringTest")
+    baseline = legacy_scores(TopicScorer(trail), topics, NOW)
+
+    overrides = {
+        "REDDIT_VOLUME_TIERS": [[40, 90], [5, 10]],
+        "TRENDS_LOW_DATA_POINTS": 40,
+        "COMPETITION_LEVEL_TIERS": [[45, ["low", "🟢", "LOW"]]],
+        "MOMENTUM_SCORES": {"rising": 90, "stable": 10},
+    }
+    with scoring_rules.override(overrides):
+        assert_parity(topics, "overridden rules")
+        assert legacy_scores(TopicScorer(trail), topics, NOW) != baseline, "override had no effect"
+
+    assert legacy_scores(TopicScorer(trail), topics, NOW) == baseline, "override was not restored"
+    print("✅ Overrides apply to both scorers and are restored on exit")
+
+
+def main():
+    """Run all batch scoring tests"""
+    print("=" * 80)
+    print("AGENT 0 BATCH SCORING PARITY TESTS")
+    print("=" * 80)
+
+    results = []
+    for test in (test_two_source_parity, test_three_source_parity,
+                 test_drilldown_parity, test_overridden_rules_parity):
+        try:
+            test()
+            results.append(True)
+        except AssertionError as e:
+            print(f"❌ {test.__name__}: {e}")
+            results.append(False)
+
+    print("\n" + "=" * 80)
+    print("TEST SUMMARY")
+    print("=" * 80)
+    print(f"Tests passed: {sum(results)}/{len(results)}")
+    return 0 if all(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+"""
+Agent 0 Per-Topic LED Test
+Checks the lazy payloads on the results loader (621/622/627) and the purchase
+intent per-category LEDs record the same data, and are skipped under
+BREADCRUMB_RATE_LIMIT
+
+Run with: python agents/agent_0/test_hot_leds.py
+"""
+
+import sys
+import os
+import tempfile
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from lib import breadcrumb_system
+from lib.breadcrumb_system import BreadcrumbTrail
+from lib.response_cache import ResponseCache
+from agents.agent_0.agent_results_loader import AgentResultsLoader
+from agents.agent_0.purchase_intent_analyzer import PurchaseIntentAnalyzer
+
+RESULTS = {"keyword": "meditation", "demand_score": 87, "confidence": 92}
+
+
+def make_loader(trail: BreadcrumbTrail, directory: str) -> AgentResultsLoader:
+    loader = AgentResultsLoader.__new__(AgentResultsLoader)  # Temp cache instead of the shared one
+    loader.trail = trail
+    loader.cache_dir = Path(directory)
+    loader.cache = ResponseCache(str(Path(directory) / "response_cache.db"))
+    return loader
+
+
+def payloads(trail: BreadcrumbTrail, led_id: int) -> list:
+    return [b.data for b in trail.sequence if b.id == led_id]
+
+
+def set_rate_limit(limit: int, window: float):
+    """Set the breadcrumb rate limit, returning the previous settings"""
+    previous = (breadcrumb_system.RATE_LIMIT, breadcrumb_system.RATE_WINDOW_SECONDS)
+    breadcrumb_system.RATE_LIMIT, breadcrumb_system.RATE_WINDOW_SECONDS = limit, window
+    return previous
+
+
+def test_loader_payloads():
+    """Lazy payloads record the same dicts as before"""
+    print("Testing results loader LEDs...")
+    trail = BreadcrumbTrail("Agent0_HotLedTest")
+    with tempfile.TemporaryDirectory() as directory:
+        loader = make_loader(trail, directory)
+        loader.cache.set(AgentResultsLoader.CACHE_SOURCE, "meditation", RESULTS)
+
+        assert loader.load_results("meditation") == RESULTS
+        assert loader.load_results("sourdough") is None
+        loader.cache._conn.close()
+
+    assert [data["keyword"] for data in payloads(trail, 621)] == ["meditation", "sourdough"]
+    assert payloads(trail, 621)[1]["cache_file"].endswith("sourdough.json")
+    assert payloads(trail, 622) == [{
+        "action": "results_loaded", "keyword": "meditation",
+        "demand_score": 87, "confidence": 92, "from": "response_cache"
+    }]
+    assert payloads(trail, 627) == [{"action": "cache_miss", "keyword": "sourdough"}]
+    print("✅ 621/622/627 payloads unchanged")
+
+
+def test_loader_rate_limited():
+    """Under a rate limit the suppressed lights are counted, not recorded"""
+    print("\nTesting results loader LEDs under BREADCRUMB_RATE_LIMIT...")
+    trail = BreadcrumbTrail("Agent0_HotLedTest")
+    previous = set_rate_limit(2, 3600)
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            loader = make_loader(trail, directory)
+            for i in range(10):
+                assert loader.load_results(f"missing {i}") is None
+            loader.cache._conn.close()
+    finally:
+        breadcrumb_system.RATE_LIMIT, breadcrumb_system.RATE_WINDOW_SECONDS = previous
+
+    assert [data["keyword"] for data in payloads(trail, 627)] == ["missing 0", "missing 1"]
+    assert len(payloads(trail, 621)) == 2
+    assert trail.led_count == 20, "suppressed lights still count"
+    print("✅ 2 of 10 lights recorded per LED, all 20 counted")
+
+
+def test_analyzer_payloads():
+    """Per-category LEDs carry the batch counts"""
+    print("\nTesting purchase intent per-category LEDs...")
+    trail = BreadcrumbTrail("Agent0_HotLedTest")
+    analyzer = PurchaseIntentAnalyzer(trail)
+    texts = [
+        "Where can I buy a good meditation cushion? Budget is $40",
+        "Just bought the premium app for $59.99, worth it",
+        "How do I start meditating?",
+    ]
+    result = analyzer.analyze_texts("meditation", texts)
+
+    recorded = {
+        b.data["action"]: b.data for b in trail.sequence
+        if b.data and b.data.get("action", "").endswith("_analysis_complete")
+    }
+    keyword_counts = dict(recorded["keyword_analysis_complete"])
+    del keyword_counts["action"]
+    assert keyword_counts == result["keyword_matches"]
+    assert recorded["price_analysis_complete"]["prices_found"] == len(result["price_mentions"]) == 2
+    assert recorded["problem_analysis_complete"]["total_posts"] == 3
+    assert recorded["monetization_analysis_complete"]["signals_found"] == result["monetization_signals"]
+    print("✅ Keyword, price, problem and monetization LEDs match the result")
+
+
+def main():
+    """Run all per-topic LED tests"""
+    print("=" * 80)
+    print("AGENT 0 PER-TOPIC LED TESTS")
+    print("=" * 80)
+
+    results = []
+    for test in (test_loader_payloads, test_loader_rate_limited, test_analyzer_payloads):
+        try:
+            test()
+            results.append(True)
+        except AssertionError as e:
+            print(f"❌ {test.__name__}: {e}")
+            results.append(False)
+
+    print("\n" + "=" * 80)
+    print("TEST SUMMARY")
+    print("=" * 80)
+    print(f"Tests passed: {sum(results)}/{len(results)}")
+    return 0 if all(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,147 @@
+"""
+Agent 0 Offline Re-Scoring Test
+Loads topics from a throwaway drill-down trail and checks the weight and rule
+grids rescore.py builds
+
+Run with: python agents/agent_0/test_rescore.py
+"""
+
+import sys
+import os
+import tempfile
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from lib.breadcrumb_system import BreadcrumbTrail
+from agents.agent_0.drill_down_loader import DrillDownTrail
+from agents.agent_0.rescore import load_trail_topics, parse_rules, rescore, sweep_weights
+
+NOW = 1760000000.0
+
+
+def topic(name: str, posts: int = 20, reddit: bool = True) -> dict:
+    """Minimal researched topic as main.py saves it"""
+    return {
+        "topic": name,
+        "trends_data": {"average_interest": 50, "trend_direction": "stable", "data_points": 52},
+        "reddit_data": {
+            "total_posts": posts,
+            "avg_engagement": 300,
+            "top_subreddits": ["productivity"],
+            "timestamps": [NOW - 86400 * day for day in range(posts)]
+        } if reddit else None,
+        "scores": {"composite_score": 50.0}
+    }
+
+
+def build_trail(directory: str) -> str:
+    """Roots 'Productivity' and 'Meditation', with children under each"""
+    db_path = os.path.join(directory, "drill_trail.db")
+    trail = DrillDownTrail(BreadcrumbTrail("Agent0_RescoreTest"), db_path=db_path)
+    trail.add_research_session(None, [topic("Productivity"), topic("Meditation")], "roots.json")
+    trail.add_research_session(
+        "Productivity",
+        [topic("Time blocking", 40), topic("Deep work", 5), topic("Pomodoro", reddit=False)],
+        "productivity.json"
+    )
+    trail.add_research_session("Meditation", [topic("Breathwork")], "meditation.json")
+    return db_path
+
+
+def test_load_trail_topics_parent():
+    """--parent keeps only that topic's direct children (case-insensitive)"""
+    print("Testing load_trail_topics with --parent...")
+    trail = BreadcrumbTrail("Agent0_RescoreTest")
+    with tempfile.TemporaryDirectory() as directory:
+        db_path = build_trail(directory)
+
+        entries, skipped = load_trail_topics(trail, db_path, parent="productivity")
+        assert [entry['topic'] for entry in entries] == ["Time blocking", "Deep work"]
+        assert entries[0]['path'] == ["Productivity", "Time blocking"]
+        assert skipped == 1, "Pomodoro has no Reddit data"
+
+        entries, skipped = load_trail_topics(trail, db_path)
+        assert len(entries) == 5 and skipped == 1
+
+        try:
+            load_trail_topics(trail, db_path, parent="Sleep")
+            assert False, "unknown parent should raise"
+        except ValueError as e:
+            assert "Sleep" in str(e)
+    print("✅ Direct children only, Reddit-less nodes skipped, unknown parent raises")
+
+
+def test_sweep_weights():
+    """Inclusive sweep with Reddit weight = 1 - trends weight"""
+    print("\nTesting sweep_weights...")
+    assert sweep_weights(0, 1, 0.25) == [(0, 1), (0.25, 0.75), (0.5, 0.5), (0.75, 0.25), (1, 0)]
+
+    grid = sweep_weights(0, 1, 0.1)
+    assert len(grid) == 11
+    assert grid[3] == (0.3, 0.7), "float steps are rounded"
+    assert all(round(trends + reddit, 6) == 1 for trends, reddit in grid)
+
+    assert sweep_weights(0.6, 0.4, 0.1) == []
+    for step in (0, -0.1):
+        try:
+            sweep_weights(0, 1, step)
+            assert False, f"step {step} should raise"
+        except ValueError:
+            pass
+    print("✅ Inclusive grid, rounded weights, non-positive step raises")
+
+
+def test_rule_grid():
+    """--rule values cross, and rescore reports each set it scored under"""
+    print("\nTesting --rule grids...")
+    rule_sets = parse_rules(["ZONE_HIGH_DEMAND=40", "ZONE_HIGH_DEMAND=70", "REDDIT_VOLUME_TIERS=[[30, 70]]"])
+    assert rule_sets == [
+        {"ZONE_HIGH_DEMAND": 40, "REDDIT_VOLUME_TIERS": [[30, 70]]},
+        {"ZONE_HIGH_DEMAND": 70, "REDDIT_VOLUME_TIERS": [[30, 70]]},
+    ]
+    assert parse_rules([]) == [{}]
+    for bad in ("NOT_A_RULE=1", "ZONE_HIGH_DEMAND", "ZONE_HIGH_DEMAND=abc"):
+        try:
+            parse_rules([bad])
+            assert False, f"'{bad}' should raise"
+        except ValueError:
+            pass
+
+    trail = BreadcrumbTrail("Agent0_RescoreTest")
+    entries = [dict(topic("Time blocking", 40), path=["Time blocking"], scores=None)]
+    rule_sets = parse_rules(["ZONE_HIGH_DEMAND=40", "ZONE_HIGH_DEMAND=70"])
+    results = rescore(entries, [(0.5, 0.5), (0.7, 0.3)], trail, now=NOW, rule_sets=rule_sets)
+    assert [(r['rules']['ZONE_HIGH_DEMAND'], r['weight_google_trends']) for r in results] == [
+        (40, 0.5), (40, 0.7), (70, 0.5), (70, 0.7)
+    ]
+    # Demand 69 with competition 47: gold mine at 40, low demand at 70
+    assert results[0]['ranking'][0]['scores']['zone'] == 'gold_mine'
+    assert results[2]['ranking'][0]['scores']['zone'] == 'risky_niche'
+    print("✅ Rule sets cross with weights and change the scores")
+
+
+def main():
+    """Run all re-scoring tests"""
+    print("=" * 80)
+    print("AGENT 0 OFFLINE RE-SCORING TESTS")
+    print("=" * 80)
+
+    results = []
+    for test in (test_load_trail_topics_parent, test_sweep_weights, test_rule_grid):
+        try:
+            test()
+            results.append(True)
+        except AssertionError as e:
+            print(f"❌ {test.__name__}: {e}")
+            results.append(False)
+
+    print("\n" + "=" * 80)
+    print("TEST SUMMARY")
+    print("=" * 80)
+    print(f"Tests passed: {sum(results)}/{len(results)}")
+    return 0 if all(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+"""
+Agent 0 Multiplexed Trends Rescaling Test
+Rescales synthetic interest_over_time() frames to the anchor scale and checks
+values above 100 are kept (and flagged) and coarse topics are flagged
+
+Run with: python agents/agent_0/test_trends_anchor.py
+"""
+
+import sys
+import os
+
+import pandas as pd
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from lib.breadcrumb_system import BreadcrumbTrail
+from agents.agent_0.api_clients import GoogleTrendsClient
+
+ANCHOR = "books"
+WEEKS = 52
+
+
+def make_client() -> GoogleTrendsClient:
+    client = GoogleTrendsClient.__new__(GoogleTrendsClient)  # No TrendReq (network) - only rescaling is used
+    client.trail = BreadcrumbTrail("Agent0_TrendsAnchorTest")
+    return client
+
+
+def frame(**columns) -> pd.DataFrame:
+    """Weekly frame with constant interest per keyword (plus pytrends' isPartial column)"""
+    data = pd.DataFrame({keyword: [value] * WEEKS for keyword, value in columns.items()})
+    data["isPartial"] = False
+    return data
+
+
+def lit(client: GoogleTrendsClient, action: str) -> list:
+    return [b.data for b in client.trail.sequence if b.data and b.data.get("action") == action]
+
+
+def test_above_scale_kept_and_flagged():
+    """A topic 3x the anchor averages 150 on the anchor scale, with an LED"""
+    print("Testing interest above 100...")
+    client = make_client()
+    data = frame(**{"sourdough": 60, "knitting": 20, ANCHOR: 20})
+
+    rescaled = client._rescale_to_anchor(data, ANCHOR, ["sourdough", "knitting"])
+    assert "isPartial" not in rescaled.columns
+    summary = GoogleTrendsClient._summarize_interest(rescaled, "sourdough")
+    assert summary["average_interest"] == 150.0 and summary["peak_interest"] == 150.0, summary
+    assert GoogleTrendsClient._summarize_interest(rescaled, ANCHOR)["average_interest"] == 50.0
+
+    assert lit(client, "interest_above_scale") == [
+        {"action": "interest_above_scale", "anchor": ANCHOR, "average_interest": {"sourdough": 150.0}}
+    ]
+    assert lit(client, "topic_low_precision") == []
+    print("✅ Not clamped, ranking kept, interest_above_scale lit")
+
+
+def test_coarse_topic_flagged():
+    """A topic peaking below GOOGLE_TRENDS_MIN_ANCHOR_PEAK gets a low-precision LED"""
+    print("\nTesting coarse topics...")
+    client = make_client()
+    data = frame(**{"quilting": 4, "knitting": 30, ANCHOR: 100})
+
+    client._rescale_to_anchor(data, ANCHOR, ["quilting", "knitting"])
+    assert lit(client, "topic_low_precision") == [
+        {"action": "topic_low_precision", "anchor": ANCHOR, "topic_peaks": {"quilting": 4.0}}
+    ]
+    assert lit(client, "anchor_low_precision") == [] and lit(client, "interest_above_scale") == []
+    print("✅ topic_low_precision lit for the coarse topic only")
+
+
+def test_missing_anchor_raises():
+    """Without the anchor the group cannot be rescaled (FAIL LOUDLY)"""
+    print("\nTesting missing anchor...")
+    client = make_client()
+    for data in (frame(knitting=30), frame(**{"knitting": 30, ANCHOR: 0})):
+        try:
+            client._rescale_to_anchor(data, ANCHOR, ["knitting"])
+            assert False, "missing anchor interest should raise"
+        except ValueError as e:
+            assert ANCHOR in str(e)
+    print("✅ Missing or all-zero anchor raises")
+
+
+def main():
+    """Run all trends rescaling tests"""
+    print("=" * 80)
+    print("AGENT 0 MULTIPLEXED TRENDS RESCALING TESTS")
+    print("=" * 80)
+
+    results = []
+    for test in (test_above_scale_kept_and_flagged, test_coarse_topic_flagged, test_missing_anchor_raises):
+        try:
+            test()
+            results.append(True)
+        except AssertionError as e:
+            print(f"❌ {test.__name__}: {e}")
+            results.append(False)
+
+    print("\n" + "=" * 80)
+    print("TEST SUMMARY")
+    print("=" * 80)
+    print(f"Tests passed: {sum(results)}/{len(results)}")
+    return 0 if all(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,13 +7,13 @@ CRITICAL RULES:
 - Require data: No .get(key, 0) - raise KeyError if fields missing
 """
 
-import time
 from typing import List, Dict, Any
 from datetime import datetime
 
 from amazon_paapi import AmazonApi
 
 from lib.breadcrumb_system import BreadcrumbTrail
+from lib.rate_limiter import get_limiter
 from agents.agent_1.config import Agent1Config as Config
 
 
@@ -39,6 +39,13 @@ class AmazonProductAPI:
             country='US'  # United States marketplace
         )
 
+        # Shared PA API budget (1 request/second hard limit)
+        self.rate_limiter = get_limiter(
+            "amazon_paapi",
+            rate=1 / Config.AMAZON_DELAY,
+            capacity=Config.AMAZON_BURST
+        )
+
     def search_products(
         self,
         query: str,
@@ -64,8 +71,8 @@ class AmazonProductAPI:
         })
 
         # Rate limit protection: Amazon PA API allows 1 request/second
-        # Add delay to ensure we never hit throttling
-        time.sleep(Config.AMAZON_DELAY)
+        # Waits only when the previous request was less than AMAZON_DELAY ago
+        self.rate_limiter.acquire()
 
         try:
             # Amazon PA API limits to 10 results per search
@@ -9,21 +9,29 @@ CRITICAL RULES:
 """
 
 import praw
-import time
 import json
-from typing import List, Dict, Any, Optional
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Iterable, Optional
 from datetime import datetime, timedelta
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
 
 from lib.breadcrumb_system import BreadcrumbTrail
+from lib.rate_limiter import get_limiter
+from lib.response_cache import get_cache
 from agents.agent_1.config import Agent1Config as Config
 
 
 class RedditClient:
     """Reddit API client using PRAW for discussion search"""
 
+    # User histories are shared by every overlap run (cache/response_cache.db)
+    USER_ACTIVITY_CACHE_SOURCE = "reddit_user_activity"
+    USER_HISTORY_LIMIT = 20  # Newest submissions and comments read per user
+
     def __init__(self, trail: BreadcrumbTrail):
         self.trail = trail
 
@@ -40,6 +48,17 @@ class RedditClient:
         )
         self.reddit.read_only = True
 
+        # Shared Reddit budget - acquire once per API request, not per result
+        self.rate_limiter = get_limiter(
+            "reddit",
+            rate=1 / Config.REDDIT_DELAY,
+            capacity=Config.REDDIT_BURST
+        )
+
+        # PRAW clients are not thread safe - user-history workers get their own
+        self._local = threading.local()
+        self.cache = get_cache()
+
     def search_product_discussions(
         self,
         query: str,
@@ -78,7 +97,8 @@ class RedditClient:
             else:
                 search_target = self.reddit.subreddit("all")
 
-            # Execute search
+            # Execute search (one listing request returns up to 100 results)
+            self.rate_limiter.acquire()
             results = search_target.search(
                 search_query,
                 sort="relevance",
@@ -99,8 +119,6 @@ class RedditClient:
                     "platform": "reddit"
                 })
 
-                time.sleep(Config.REDDIT_DELAY)
-
             if not discussions:
                 raise ValueError(
                     f"Reddit search returned no results for query: '{query}'\n"
@@ -148,8 +166,10 @@ class RedditClient:
 
             # Get active users from recent posts
             active_users = set()
+            self.rate_limiter.acquire()
             for submission in subreddit.hot(limit=50):
                 active_users.add(submission.author.name if submission.author else None)
+                self.rate_limiter.acquire()  # Comment tree fetch
                 submission.comments.replace_more(limit=0)
                 for comment in submission.comments.list()[:10]:
                     active_users.add(comment.author.name if comment.author else None)
@@ -157,7 +177,6 @@ class RedditClient:
                         break
                 if len(active_users) >= max_users:
                     break
-                time.sleep(Config.REDDIT_DELAY)
 
             # Remove None values
             active_users.discard(None)
@@ -168,27 +187,15 @@ class RedditClient:
                     f"Need at least 10 active users for meaningful overlap analysis"
                 )
 
-            # Count subreddit activity across users (sample first 100 users to avoid rate limits)
-            overlap_counts = {}
-            sampled_users = list(active_users)[:100]
-
-            for username in sampled_users:
-                try:
-                    user = self.reddit.redditor(username)
-                    for submission in user.submissions.new(limit=20):
-                        sub = str(submission.subreddit)
-                        if sub != base_subreddit:
-                            overlap_counts[sub] = overlap_counts.get(sub, 0) + 1
+            # Count subreddit activity across users (sample to bound API calls)
+            sampled_users = list(active_users)[:Config.OVERLAP_USER_SAMPLE]
+            activity = self.get_user_activity(sampled_users)
 
-                    for comment in user.comments.new(limit=20):
-                        sub = str(comment.subreddit)
-                        if sub != base_subreddit:
-                            overlap_counts[sub] = overlap_counts.get(sub, 0) + 1
-
-                    time.sleep(Config.REDDIT_DELAY)
-                except Exception:
-                    # Skip users with private/deleted accounts
-                    continue
+            overlap_counts = Counter()
+            for subreddits in activity.values():
+                if subreddits is None:
+                    continue  # Private/deleted account
+                overlap_counts.update(sub for sub in subreddits if sub != base_subreddit)
 
             if not overlap_counts:
                 raise ValueError(
@@ -200,7 +207,7 @@ class RedditClient:
             total_activity = sum(overlap_counts.values())
             overlaps = []
 
-            for subreddit_name, count in sorted(overlap_counts.items(), key=lambda x: x[1], reverse=True):
+            for subreddit_name, count in overlap_counts.most_common():
                 multiplier = (count / len(sampled_users)) * 10  # Normalize to reasonable range
                 if multiplier >= Config.MIN_OVERLAP_MULTIPLIER:
                     overlaps.append({
@@ -230,6 +237,77 @@ class RedditClient:
             self.trail.fail(Config.LED_ERROR_START + 1, e)
             raise ValueError(f"Subreddit overlap analysis failed: {str(e)}")
 
+    def get_user_activity(self, usernames: Iterable[str]) -> Dict[str, Optional[List[str]]]:
+        """
+        Subreddits each user recently posted or commented in
+
+        Histories come from the shared response cache when fresh; the rest are
+        fetched concurrently (REDDIT_USER_WORKERS threads) under the shared
+        "reddit" rate budget and cached for USER_ACTIVITY_CACHE_HOURS.
+
+        Args:
+            usernames: Reddit usernames
+
+        Returns:
+            Dict of username -> subreddit names (one per submission/comment,
+            newest first), or None for private/deleted accounts
+        """
+        params = {"limit": self.USER_HISTORY_LIMIT}
+        activity = {}
+        to_fetch = []
+
+        for username in dict.fromkeys(usernames):
+            cached = self.cache.get(self.USER_ACTIVITY_CACHE_SOURCE, username, params)
+            if cached is not None:
+                activity[username] = cached
+            else:
+                to_fetch.append(username)
+
+        if to_fetch:
+            with ThreadPoolExecutor(max_workers=Config.REDDIT_USER_WORKERS) as executor:
+                for username, subreddits in zip(to_fetch, executor.map(self._fetch_user_activity, to_fetch)):
+                    activity[username] = subreddits
+                    if subreddits is not None:
+                        self.cache.set(
+                            self.USER_ACTIVITY_CACHE_SOURCE, username, subreddits, params,
+                            ttl_seconds=Config.USER_ACTIVITY_CACHE_HOURS * 3600
+                        )
+
+        self.trail.light(Config.LED_OVERLAP_START + 2, {
+            "action": "user_activity_loaded",
+            "users": len(activity),
+            "cache_hits": len(activity) - len(to_fetch),
+            "fetched": len(to_fetch),
+            "unavailable": sum(1 for subreddits in activity.values() if subreddits is None)
+        })
+
+        return activity
+
+    def _fetch_user_activity(self, username: str) -> Optional[List[str]]:
+        """One user's recent subreddits (None if the account is private/deleted)"""
+        try:
+            self.rate_limiter.acquire(min(2, Config.REDDIT_BURST))  # Submissions + comments listings
+            user = self._thread_reddit().redditor(username)
+            subreddits = [str(submission.subreddit) for submission in user.submissions.new(limit=self.USER_HISTORY_LIMIT)]
+            subreddits.extend(str(comment.subreddit) for comment in user.comments.new(limit=self.USER_HISTORY_LIMIT))
+            return subreddits
+        except Exception:
+            # Skip users with private/deleted accounts
+            return None
+
+    def _thread_reddit(self) -> praw.Reddit:
+        """PRAW client for the current worker thread"""
+        reddit = getattr(self._local, 'reddit', None)
+        if reddit is None:
+            reddit = praw.Reddit(
+                client_id=Config.REDDIT_CLIENT_ID,
+                client_secret=Config.REDDIT_CLIENT_SECRET,
+                user_agent=Config.REDDIT_USER_AGENT,
+            )
+            reddit.read_only = True
+            self._local.reddit = reddit
+        return reddit
+
     def _interpret_overlap(self, subreddit: str) -> str:
         """Generate interpretation for overlapping subreddit (simple heuristic)"""
         # This would ideally use an AI agent, but keeping simple for now
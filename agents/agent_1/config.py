@@ -6,6 +6,8 @@ Loads settings from environment variables with sensible defaults
 import os
 from dotenv import load_dotenv
 
+from lib.rate_limiter import REDDIT_BURST as SHARED_REDDIT_BURST, REDDIT_DELAY as SHARED_REDDIT_DELAY
+
 # Load environment variables
 load_dotenv()
 
@@ -28,10 +30,14 @@ class Agent1Config:
 
     # Rate Limiting
     RATE_LIMIT_DELAY = float(os.getenv('AGENT_1_RATE_LIMIT_DELAY', '2.0'))
-    REDDIT_DELAY = 2.0  # Delay between Reddit API calls
+    REDDIT_DELAY = SHARED_REDDIT_DELAY  # Delay between Reddit API calls (shared "reddit" budget)
     YOUTUBE_DELAY = 1.0  # Delay between YouTube API calls
     AMAZON_DELAY = 2.0  # Delay before Amazon API calls (1 req/sec limit)
 
+    # Token-bucket burst sizes (lib/rate_limiter.py) - sustained rate is 1 / delay above
+    REDDIT_BURST = SHARED_REDDIT_BURST
+    AMAZON_BURST = 1  # PA API throttles any burst above 1 req/sec
+
     # Query Limits
     MAX_COMPARABLES = int(os.getenv('AGENT_1_MAX_COMPARABLES', '10'))
     MAX_REDDIT_DISCUSSIONS = int(os.getenv('AGENT_1_MAX_REDDIT_DISCUSSIONS', '20'))
@@ -49,6 +55,10 @@ class Agent1Config:
     MAX_USERS_OVERLAP = int(os.getenv('AGENT_1_MAX_USERS_OVERLAP', '500'))
     MIN_OVERLAP_MULTIPLIER = float(os.getenv('AGENT_1_MIN_OVERLAP_MULTIPLIER', '2.0'))
     TOP_OVERLAPS = int(os.getenv('AGENT_1_TOP_OVERLAPS', '10'))
+    MAX_OVERLAP_BASES = int(os.getenv('AGENT_1_MAX_OVERLAP_BASES', '5'))  # Base subreddits analyzed per run
+    OVERLAP_USER_SAMPLE = int(os.getenv('AGENT_1_OVERLAP_USER_SAMPLE', '100'))  # User histories fetched per base
+    REDDIT_USER_WORKERS = int(os.getenv('AGENT_1_REDDIT_USER_WORKERS', '4'))  # Concurrent user-history fetches
+    USER_ACTIVITY_CACHE_HOURS = float(os.getenv('AGENT_1_USER_ACTIVITY_CACHE_HOURS', '168'))  # Cached user histories (1 week)
 
     # Scoring Weights for Comparables Ranking
     WEIGHT_SALES_SIGNAL = 0.30  # Amazon BSR, YouTube views
@@ -56,15 +66,16 @@ class Agent1Config:
     WEIGHT_RECENCY = 0.20  # Publication/upload date
     WEIGHT_SEMANTIC = 0.20  # Similarity to user input
 
-    # Cache Settings
+    # Cache Settings (search results live in the shared response cache: CACHE_DIR/response_cache.db)
     CACHE_DIR = "cache"
-    CACHE_DURATION_DAYS = 30  # Reuse comparables cache for 30 days
+    CACHE_DURATION_DAYS = int(os.getenv('AGENT_1_CACHE_DURATION_DAYS', '30'))  # Reuse search results for 30 days
 
     # Output Paths
     OUTPUT_DIR = "outputs"
 
     # LED Ranges (1500-1599)
     LED_INIT = 1500
+    LED_SPAN = 1509  # Stage timing spans (start/end with wall and CPU seconds)
     LED_AMAZON_START = 1510
     LED_REDDIT_START = 1520
     LED_YOUTUBE_START = 1530
@@ -94,6 +105,12 @@ class Agent1Config:
         if not cls.AMAZON_ASSOCIATE_TAG:
             missing.append('AMAZON_ASSOCIATE_TAG')
 
+        # Overlap fan-out must be usable (FAIL LOUDLY on bad env values)
+        if cls.MAX_OVERLAP_BASES < 1:
+            raise ValueError(f"AGENT_1_MAX_OVERLAP_BASES must be at least 1 (got {cls.MAX_OVERLAP_BASES})")
+        if cls.REDDIT_USER_WORKERS < 1:
+            raise ValueError(f"AGENT_1_REDDIT_USER_WORKERS must be at least 1 (got {cls.REDDIT_USER_WORKERS})")
+
         # YouTube is optional (can skip if not available)
         # No validation check - fails loudly when used if missing
 
@@ -11,6 +11,7 @@ from datetime import datetime
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 from lib.breadcrumb_system import BreadcrumbTrail
+from lib.metrics import enable_metrics_from_env
 from agents.agent_1.config import Agent1Config as Config
 from agents.agent_1.search import MultiSourceSearch, SubredditDetector
 from agents.agent_1.comparables import ComparablesRanker
@@ -23,6 +24,7 @@ def main(product_description: str, product_category: str = "general",
          auto_approve: bool = False):
     """Main execution for Agent 1 - Product Researcher"""
     trail = BreadcrumbTrail("Agent1_ProductResearch")
+    enable_metrics_from_env()  # METRICS_PORT / METRICS_TEXTFILE
 
     trail.light(Config.LED_INIT, {"action": "agent_1_started", "product": product_description})
 
@@ -41,12 +43,13 @@ def main(product_description: str, product_category: str = "general",
         # Step 1: Multi-source search
         print("[1/5] Searching multiple sources for comparable products...")
         search = MultiSourceSearch(trail)
-        search_results = search.search_all_sources(
-            product_description=product_description,
-            product_category=product_category,
-            enable_youtube=enable_youtube,
-            enable_goodreads=enable_goodreads
-        )
+        with trail.span(Config.LED_SPAN, "search"):
+            search_results = search.search_all_sources(
+                product_description=product_description,
+                product_category=product_category,
+                enable_youtube=enable_youtube,
+                enable_goodreads=enable_goodreads
+            )
         print(f"  Amazon: {len(search_results['amazon'])} products")
         print(f"  Reddit: {len(search_results['reddit'])} discussions")
         print(f"  YouTube: {len(search_results['youtube'])} videos")
@@ -56,8 +59,9 @@ def main(product_description: str, product_category: str = "general",
         # Step 2: Rank comparables
         print("[2/5] Ranking comparable products by relevance...")
         ranker = ComparablesRanker(trail)
-        comparables = ranker.rank_comparables(search_results, product_description)
-        discussions = ranker.aggregate_discussion_sources(search_results)
+        with trail.span(Config.LED_SPAN, "ranking"):
+            comparables = ranker.rank_comparables(search_results, product_description)
+            discussions = ranker.aggregate_discussion_sources(search_results)
         print(f"  Selected: {len(comparables)} top comparables")
         print(f"  Aggregated: {len(discussions)} discussion sources")
         print()
@@ -66,11 +70,13 @@ def main(product_description: str, product_category: str = "general",
         print("[3/5] Analyzing subreddit overlaps...")
         base_subreddits = SubredditDetector.detect_subreddits(product_description, product_category)
         overlap_analyzer = SubredditOverlapAnalyzer(trail)
-        overlaps = overlap_analyzer.analyze_overlaps(base_subreddits, comparables, discussions)
+        with trail.span(Config.LED_SPAN, "subreddit_overlap", {"bases": len(base_subreddits)}):
+            overlaps = overlap_analyzer.analyze_overlaps(base_subreddits, comparables, discussions)
         print(f"  Found: {len(overlaps)} communities\n")
 
         print("[4/5] Generating segment insights...")
-        segment_insights = SegmentInsightsGenerator.generate_insights(overlaps)
+        with trail.span(Config.LED_SPAN, "segment_insights"):
+            segment_insights = SegmentInsightsGenerator.generate_insights(overlaps)
         print(f"  Segments: {segment_insights['total_segments']} | High-opp: {segment_insights['high_opportunity_segments']}\n")
 
         # Step 5: Checkpoint & save
@@ -89,13 +95,17 @@ def main(product_description: str, product_category: str = "general",
         output_path = os.path.join(os.path.dirname(__file__), Config.OUTPUT_DIR, f"{timestamp}-agent1-output.json")
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
-        checkpoint.save_checkpoint_data(output_path, product_description, product_category,
-                                       comparables, discussions, overlaps, segment_insights)
+        with trail.span(Config.LED_SPAN, "save_output"):
+            checkpoint.save_checkpoint_data(output_path, product_description, product_category,
+                                           comparables, discussions, overlaps, segment_insights)
 
         trail.light(Config.LED_OUTPUT_START + 1, {"action": "agent_1_complete", "output": output_path})
 
         print(f"\n{'='*80}\nAGENT 1 COMPLETE\n{'='*80}")
-        print(f"Output: {output_path}\nReady for Agent 2\n")
+        print(f"Output: {output_path}\nReady for Agent 2")
+        print(f"\n[*] Stage Timing:")
+        BreadcrumbTrail.print_span_breakdown()
+        print()
         return output_path
 
     except Exception as e:
@@ -11,12 +11,18 @@ import time
 import re
 from typing import List, Dict, Any, Optional
 from datetime import datetime
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout, Page
+from playwright.sync_api import TimeoutError as PlaywrightTimeout, Page
 
 from lib.breadcrumb_system import BreadcrumbTrail
+from lib.browser_pool import get_browser_pool
 from agents.agent_1.config import Agent1Config as Config
 
 
+# Contexts come from the shared browser pool (lib/browser_pool.py): one long-lived
+# browser, cookies kept per site between queries
+CONTEXT_OPTIONS = {"user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/120.0.0.0"}
+
+
 class AmazonScraper:
     """Playwright-based Amazon scraper for product search"""
 
@@ -47,68 +53,66 @@ class AmazonScraper:
             "max_results": max_results
         })
 
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page(user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/120.0.0.0")
-
-            try:
-                # Navigate to Amazon search
-                search_url = f"https://www.amazon.com/s?k={query.replace(' ', '+')}"
-                page.goto(search_url, timeout=30000)
-
-                # Wait for results to load
-                page.wait_for_selector('[data-component-type="s-search-result"]', timeout=10000)
-
-                # Extract product cards
-                products = []
-                result_cards = page.query_selector_all('[data-component-type="s-search-result"]')
-
-                for card in result_cards[:max_results]:
-                    try:
-                        product = self._extract_product_from_card(card)
-                        if product:
-                            products.append(product)
-                    except Exception as e:
-                        # Skip individual products that fail to parse
-                        continue
-
-                browser.close()
-
-                if not products:
-                    raise ValueError(
-                        f"Amazon scraping returned no products for query: '{query}'\n"
-                        f"URL: {search_url}\n"
-                        f"Possible anti-bot detection or rate limiting"
-                    )
-
-                # Filter by minimum review threshold
-                filtered_products = [p for p in products if p['review_count'] >= Config.MIN_REVIEWS_AMAZON]
-
-                if not filtered_products:
-                    raise ValueError(
-                        f"No Amazon products found with >={Config.MIN_REVIEWS_AMAZON} reviews\n"
-                        f"Query: '{query}', Products found: {len(products)}"
-                    )
-
-                self.trail.light(Config.LED_AMAZON_START + 1, {
-                    "action": "amazon_scrape_complete",
-                    "products_found": len(filtered_products)
-                })
-
-                return filtered_products
-
-            except PlaywrightTimeout as e:
-                browser.close()
-                self.trail.fail(Config.LED_ERROR_START + 3, e)
+        search_url = f"https://www.amazon.com/s?k={query.replace(' ', '+')}"
+
+        def _scrape(page: Page) -> List[Dict[str, Any]]:
+            # Navigate to Amazon search
+            page.goto(search_url, timeout=30000)
+
+            # Wait for results to load
+            page.wait_for_selector('[data-component-type="s-search-result"]', timeout=10000)
+
+            # Extract product cards
+            products = []
+            result_cards = page.query_selector_all('[data-component-type="s-search-result"]')
+
+            for card in result_cards[:max_results]:
+                try:
+                    product = self._extract_product_from_card(card)
+                    if product:
+                        products.append(product)
+                except Exception as e:
+                    # Skip individual products that fail to parse
+                    continue
+
+            return products
+
+        try:
+            products = get_browser_pool().run(_scrape, profile="amazon", context_options=CONTEXT_OPTIONS)
+
+            if not products:
                 raise ValueError(
-                    f"Amazon scraping timed out for query: '{query}'\n"
+                    f"Amazon scraping returned no products for query: '{query}'\n"
                     f"URL: {search_url}\n"
-                    f"Error: {str(e)}"
+                    f"Possible anti-bot detection or rate limiting"
+                )
+
+            # Filter by minimum review threshold
+            filtered_products = [p for p in products if p['review_count'] >= Config.MIN_REVIEWS_AMAZON]
+
+            if not filtered_products:
+                raise ValueError(
+                    f"No Amazon products found with >={Config.MIN_REVIEWS_AMAZON} reviews\n"
+                    f"Query: '{query}', Products found: {len(products)}"
                 )
-            except Exception as e:
-                browser.close()
-                self.trail.fail(Config.LED_ERROR_START + 3, e)
-                raise ValueError(f"Amazon scraping failed: {str(e)}")
+
+            self.trail.light(Config.LED_AMAZON_START + 1, {
+                "action": "amazon_scrape_complete",
+                "products_found": len(filtered_products)
+            })
+
+            return filtered_products
+
+        except PlaywrightTimeout as e:
+            self.trail.fail(Config.LED_ERROR_START + 3, e)
+            raise ValueError(
+                f"Amazon scraping timed out for query: '{query}'\n"
+                f"URL: {search_url}\n"
+                f"Error: {str(e)}"
+            )
+        except Exception as e:
+            self.trail.fail(Config.LED_ERROR_START + 3, e)
+            raise ValueError(f"Amazon scraping failed: {str(e)}")
 
     def _extract_product_from_card(self, card) -> Optional[Dict[str, Any]]:
         """Extract product data from a single Amazon result card"""
@@ -193,58 +197,56 @@ class GoodreadsScraper:
             "max_results": max_results
         })
 
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page(user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/120.0.0.0")
-
-            try:
-                # Navigate to Goodreads search
-                search_url = f"https://www.goodreads.com/search?q={query.replace(' ', '+')}"
-                page.goto(search_url, timeout=30000)
-
-                # Wait for results
-                page.wait_for_selector('.bookTitle', timeout=10000)
-
-                # Extract book data
-                books = []
-                book_rows = page.query_selector_all('tr[itemtype="http://schema.org/Book"]')
-
-                for row in book_rows[:max_results]:
-                    try:
-                        book = self._extract_book_from_row(row)
-                        if book:
-                            books.append(book)
-                    except Exception:
-                        continue
-
-                browser.close()
-
-                if not books:
-                    raise ValueError(
-                        f"Goodreads scraping returned no books for query: '{query}'\n"
-                        f"URL: {search_url}\n"
-                        f"Possible anti-bot detection"
-                    )
-
-                self.trail.light(Config.LED_GOODREADS_START + 1, {
-                    "action": "goodreads_scrape_complete",
-                    "books_found": len(books)
-                })
-
-                return books
-
-            except PlaywrightTimeout as e:
-                browser.close()
-                self.trail.fail(Config.LED_ERROR_START + 4, e)
+        search_url = f"https://www.goodreads.com/search?q={query.replace(' ', '+')}"
+
+        def _scrape(page: Page) -> List[Dict[str, Any]]:
+            # Navigate to Goodreads search
+            page.goto(search_url, timeout=30000)
+
+            # Wait for results
+            page.wait_for_selector('.bookTitle', timeout=10000)
+
+            # Extract book data
+            books = []
+            book_rows = page.query_selector_all('tr[itemtype="http://schema.org/Book"]')
+
+            for row in book_rows[:max_results]:
+                try:
+                    book = self._extract_book_from_row(row)
+                    if book:
+                        books.append(book)
+                except Exception:
+                    continue
+
+            return books
+
+        try:
+            books = get_browser_pool().run(_scrape, profile="goodreads", context_options=CONTEXT_OPTIONS)
+
+            if not books:
                 raise ValueError(
-                    f"Goodreads scraping timed out for query: '{query}'\n"
+                    f"Goodreads scraping returned no books for query: '{query}'\n"
                     f"URL: {search_url}\n"
-                    f"Error: {str(e)}"
+                    f"Possible anti-bot detection"
                 )
-            except Exception as e:
-                browser.close()
-                self.trail.fail(Config.LED_ERROR_START + 4, e)
-                raise ValueError(f"Goodreads scraping failed: {str(e)}")
+
+            self.trail.light(Config.LED_GOODREADS_START + 1, {
+                "action": "goodreads_scrape_complete",
+                "books_found": len(books)
+            })
+
+            return books
+
+        except PlaywrightTimeout as e:
+            self.trail.fail(Config.LED_ERROR_START + 4, e)
+            raise ValueError(
+                f"Goodreads scraping timed out for query: '{query}'\n"
+                f"URL: {search_url}\n"
+                f"Error: {str(e)}"
+            )
+        except Exception as e:
+            self.trail.fail(Config.LED_ERROR_START + 4, e)
+            raise ValueError(f"Goodreads scraping failed: {str(e)}")
 
     def _extract_book_from_row(self, row) -> Optional[Dict[str, Any]]:
         """Extract book data from a single Goodreads result row"""
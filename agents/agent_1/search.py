@@ -12,6 +12,7 @@ from typing import List, Dict, Any, Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from lib.breadcrumb_system import BreadcrumbTrail
+from lib.response_cache import get_cache
 from agents.agent_1.config import Agent1Config as Config
 from agents.agent_1.api_clients import RedditClient, YouTubeClient
 from agents.agent_1.amazon_api import AmazonProductAPI
@@ -30,6 +31,33 @@ class MultiSourceSearch:
         self.youtube_client = None
         self.goodreads_scraper = None
 
+        # Search results are reused for CACHE_DURATION_DAYS (cache/response_cache.db)
+        self.cache = get_cache()
+
+    def _cached_search(self, source: str, query: str, max_results: int, search_func) -> List[Dict[str, Any]]:
+        """Return cached results for (source, query, max_results), or run search_func and cache them"""
+        params = {"max_results": max_results}
+        cached = self.cache.get(f"agent1_{source}", query, params)
+
+        if cached:
+            self.trail.light(Config.LED_INIT + 3, {
+                "action": "search_cache_hit",
+                "source": source,
+                "query": query,
+                "results": len(cached)
+            })
+            return cached
+
+        results = search_func()
+        self.cache.set(
+            f"agent1_{source}",
+            query,
+            results,
+            params=params,
+            ttl_seconds=Config.CACHE_DURATION_DAYS * 86400
+        )
+        return results
+
     def search_all_sources(
         self,
         product_description: str,
@@ -184,7 +212,10 @@ class MultiSourceSearch:
     def _safe_search_amazon(self, query: str) -> List[Dict[str, Any]]:
         """Wrapper for Amazon API search with error handling"""
         try:
-            return self.amazon_api.search_products(query, Config.MAX_AMAZON_RESULTS)
+            return self._cached_search(
+                'amazon', query, Config.MAX_AMAZON_RESULTS,
+                lambda: self.amazon_api.search_products(query, Config.MAX_AMAZON_RESULTS)
+            )
         except Exception as e:
             # Re-raise to propagate to executor
             raise ValueError(f"Amazon API search failed: {str(e)}")
@@ -192,10 +223,13 @@ class MultiSourceSearch:
     def _safe_search_reddit(self, query: str) -> List[Dict[str, Any]]:
         """Wrapper for Reddit search with error handling"""
         try:
-            return self.reddit_client.search_product_discussions(
-                query,
-                subreddits=None,  # Search all subreddits
-                limit=Config.MAX_REDDIT_DISCUSSIONS
+            return self._cached_search(
+                'reddit', query, Config.MAX_REDDIT_DISCUSSIONS,
+                lambda: self.reddit_client.search_product_discussions(
+                    query,
+                    subreddits=None,  # Search all subreddits
+                    limit=Config.MAX_REDDIT_DISCUSSIONS
+                )
             )
         except Exception as e:
             raise ValueError(f"Reddit search failed: {str(e)}")
@@ -205,7 +239,10 @@ class MultiSourceSearch:
         try:
             if not self.youtube_client:
                 self.youtube_client = YouTubeClient(self.trail)
-            return self.youtube_client.search_product_reviews(query, Config.MAX_YOUTUBE_VIDEOS)
+            return self._cached_search(
+                'youtube', query, Config.MAX_YOUTUBE_VIDEOS,
+                lambda: self.youtube_client.search_product_reviews(query, Config.MAX_YOUTUBE_VIDEOS)
+            )
         except Exception as e:
             raise ValueError(f"YouTube search failed: {str(e)}")
 
@@ -214,7 +251,10 @@ class MultiSourceSearch:
         try:
             if not self.goodreads_scraper:
                 self.goodreads_scraper = GoodreadsScraper(self.trail)
-            return self.goodreads_scraper.search_books(query, Config.MAX_GOODREADS_RESULTS)
+            return self._cached_search(
+                'goodreads', query, Config.MAX_GOODREADS_RESULTS,
+                lambda: self.goodreads_scraper.search_books(query, Config.MAX_GOODREADS_RESULTS)
+            )
         except Exception as e:
             raise ValueError(f"Goodreads search failed: {str(e)}")
 
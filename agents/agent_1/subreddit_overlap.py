@@ -36,8 +36,12 @@ class SubredditOverlapAnalyzer:
             comparables: Comparable products from search
             discussions: Reddit discussions from search
 
+        Every base subreddit (up to MAX_OVERLAP_BASES) is analyzed; bases that
+        fail are skipped as long as at least one produces overlaps.
+
         Returns:
-            List of overlapping subreddits with multipliers and interpretations
+            List of overlapping subreddits with multipliers and interpretations,
+            each tagged with the base_subreddit it was found from
 
         Raises:
             ValueError: If insufficient overlaps found
@@ -51,8 +55,8 @@ class SubredditOverlapAnalyzer:
         # Extract subreddits from discussions
         discussion_subreddits = self._extract_discussion_subreddits(discussions)
 
-        # Combine with base subreddits
-        all_base_subreddits = list(set(base_subreddits + discussion_subreddits))
+        # Combine with base subreddits (keep order: explicit bases first)
+        all_base_subreddits = list(dict.fromkeys(base_subreddits + discussion_subreddits))
 
         if not all_base_subreddits:
             raise ValueError(
@@ -60,28 +64,53 @@ class SubredditOverlapAnalyzer:
                 "Need at least 1 base subreddit or Reddit discussions"
             )
 
-        # Perform overlap analysis for first base subreddit (most relevant)
-        primary_subreddit = all_base_subreddits[0]
+        analyzed_subreddits = all_base_subreddits[:Config.MAX_OVERLAP_BASES]
 
         try:
-            overlaps = self.reddit_client.get_subreddit_overlap(
-                base_subreddit=primary_subreddit,
-                max_users=Config.MAX_USERS_OVERLAP
-            )
-
-            if not overlaps:
+            # User histories are cached, so users active in several bases are fetched once
+            best_overlaps = {}
+            failures = {}
+
+            for base_subreddit in analyzed_subreddits:
+                try:
+                    overlaps = self.reddit_client.get_subreddit_overlap(
+                        base_subreddit=base_subreddit,
+                        max_users=Config.MAX_USERS_OVERLAP
+                    )
+                except ValueError as e:
+                    # One quiet subreddit shouldn't sink the others
+                    failures[base_subreddit] = str(e)
+                    self.trail.light(Config.LED_OVERLAP_START + 3, {
+                        "warning": "base_subreddit_skipped",
+                        "base_subreddit": base_subreddit,
+                        "error": str(e)
+                    })
+                    continue
+
+                # A segment reached from several bases keeps its strongest overlap
+                for overlap in overlaps:
+                    best = best_overlaps.get(overlap['subreddit'])
+                    if best is None or overlap['multiplier'] > best['multiplier']:
+                        best_overlaps[overlap['subreddit']] = {**overlap, "base_subreddit": f"r/{base_subreddit}"}
+
+            if not best_overlaps:
                 raise ValueError(
-                    f"No overlaps found for r/{primary_subreddit}\n"
-                    f"Try a different base subreddit"
+                    f"No overlaps found for {', '.join('r/' + sub for sub in analyzed_subreddits)}\n"
+                    + "".join(f"  r/{sub}: {error}\n" for sub, error in failures.items())
+                    + "Try a different base subreddit"
                 )
 
+            overlaps = sorted(best_overlaps.values(), key=lambda o: o['multiplier'], reverse=True)
+
             # Enrich overlaps with segment insights
-            enriched_overlaps = self._enrich_overlaps(overlaps, comparables)
+            enriched_overlaps = self._enrich_overlaps(overlaps[:Config.TOP_OVERLAPS], comparables)
 
             self.trail.light(Config.LED_OVERLAP_START + 1, {
                 "action": "overlap_analysis_complete",
                 "overlaps_found": len(enriched_overlaps),
-                "primary_subreddit": primary_subreddit
+                "primary_subreddit": analyzed_subreddits[0],
+                "base_subreddits": analyzed_subreddits,
+                "bases_failed": len(failures)
             })
 
             return enriched_overlaps
@@ -4,9 +4,9 @@ Demographics Aggregator - Cluster and aggregate demographic profiles
 LED Range: 2560-2569
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable
 from collections import Counter
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 
 
 @dataclass
@@ -23,6 +23,125 @@ class DemographicCluster:
     life_stage: str
 
 
+@dataclass
+class ProfileTally:
+    """
+    Mergeable counts for a group of demographic profiles
+
+    Holds only Counters, so shards extracted in other processes can be combined
+    without shipping the profiles themselves. Merge shards in input order:
+    Counters keep first-seen key order, which decides most_common() ties, so an
+    in-order merge gives exactly the result of counting the profiles in one go.
+    """
+    count: int = 0
+    age_ranges: Counter = field(default_factory=Counter)
+    genders: Counter = field(default_factory=Counter)
+    occupations: Counter = field(default_factory=Counter)
+    life_stages: Counter = field(default_factory=Counter)
+    pain_points: Counter = field(default_factory=Counter)
+    interests: Counter = field(default_factory=Counter)
+
+    @classmethod
+    def from_profiles(cls, profiles: List[Any]) -> 'ProfileTally':
+        tally = cls()
+        for profile in profiles:
+            tally.add(profile)
+        return tally
+
+    def add(self, profile: Any) -> None:
+        """Count one profile (DemographicProfile or its dict form)"""
+        if not isinstance(profile, dict):
+            profile = vars(profile)
+
+        self.count += 1
+        self.age_ranges[profile['age_range']] += 1
+        self.genders[profile['gender']] += 1
+        self.occupations[profile['occupation']] += 1
+        self.life_stages[profile['life_stage']] += 1
+        self.pain_points.update(profile['pain_points'])
+        self.interests.update(profile['interests'])
+
+    def merge(self, other: 'ProfileTally') -> 'ProfileTally':
+        """Add another tally's counts into this one (in place)"""
+        self.count += other.count
+        self.age_ranges.update(other.age_ranges)
+        self.genders.update(other.genders)
+        self.occupations.update(other.occupations)
+        self.life_stages.update(other.life_stages)
+        self.pain_points.update(other.pain_points)
+        self.interests.update(other.interests)
+        return self
+
+
+def cluster_key(profile: Any) -> str:
+    """Cluster key for a profile: occupation + age combination"""
+    if not isinstance(profile, dict):
+        profile = vars(profile)
+    return f"{profile['occupation']}_{profile['age_range']}"
+
+
+@dataclass
+class IncrementalDemographics:
+    """
+    Incremental, mergeable demographics state for a stream of profiles
+
+    Profiles are counted once, as they arrive, into the overall tally, their
+    source's tally and their cluster's tally; nothing keeps the profiles. Every
+    dimension has a small fixed set of labels, so exact Counters stay as
+    compact as an approximate sketch would. States built in parallel (e.g. one
+    per worker shard) combine with merge(), in input order for exact ties.
+
+    Usage:
+        state = IncrementalDemographics()
+        for profile in extractor.extract_profiles(reviews):
+            state.add(profile, source="reddit")
+        output = aggregator.snapshot(state)  # any time, state keeps growing
+    """
+    overall: ProfileTally = field(default_factory=ProfileTally)
+    sources: Dict[str, ProfileTally] = field(default_factory=dict)
+    clusters: Dict[str, ProfileTally] = field(default_factory=dict)
+
+    @property
+    def profile_count(self) -> int:
+        return self.overall.count
+
+    def add(self, profile: Any, source: str = None) -> None:
+        """Count one profile (DemographicProfile or its dict form)"""
+        if not isinstance(profile, dict):
+            profile = vars(profile)
+
+        self.overall.add(profile)
+
+        if source is not None:
+            if source not in self.sources:
+                self.sources[source] = ProfileTally()
+            self.sources[source].add(profile)
+
+        key = cluster_key(profile)
+        if key not in self.clusters:
+            self.clusters[key] = ProfileTally()
+        self.clusters[key].add(profile)
+
+    def add_many(self, profiles: Iterable[Any], source: str = None) -> 'IncrementalDemographics':
+        """Count a chunk of profiles"""
+        for profile in profiles:
+            self.add(profile, source)
+        return self
+
+    def merge(self, other: 'IncrementalDemographics') -> 'IncrementalDemographics':
+        """Add another state's counts into this one (in place)"""
+        self.overall.merge(other.overall)
+        for name, tally in other.sources.items():
+            if name not in self.sources:
+                self.sources[name] = ProfileTally()
+            self.sources[name].merge(tally)
+        for key, tally in other.clusters.items():
+            if key not in self.clusters:
+                self.clusters[key] = ProfileTally()
+            self.clusters[key].merge(tally)
+        return self
+
+
 class DemographicsAggregator:
     """Aggregate and cluster demographic profiles"""
 
@@ -51,13 +170,27 @@ class DemographicsAggregator:
         if not profiles:
             raise ValueError("Cannot aggregate empty profile list")
 
+        return self.aggregate_tally(ProfileTally.from_profiles(profiles))
+
+    def aggregate_tally(self, tally: ProfileTally) -> Dict[str, Any]:
+        """
+        Aggregate a ProfileTally into overall demographics
+
+        Same output as aggregate_profiles() for the profiles that were tallied.
+
+        Raises:
+            ValueError: If the tally is empty or has no age/occupation data
+        """
+        if tally.count == 0:
+            raise ValueError("Cannot aggregate empty profile list")
+
         self.trail.light(2560, {
             "action": "aggregating_demographics",
-            "total_profiles": len(profiles)
+            "total_profiles": tally.count
         })
 
         # Calculate age distribution
-        age_counts = Counter([p['age_range'] for p in profiles if p['age_range'] != 'unknown'])
+        age_counts = Counter({age: count for age, count in tally.age_ranges.items() if age != 'unknown'})
         total_age = sum(age_counts.values())
 
         if total_age == 0:
@@ -69,7 +202,7 @@ class DemographicsAggregator:
         }
 
         # Calculate gender distribution
-        gender_counts = Counter([p['gender'] for p in profiles])
+        gender_counts = tally.genders
         total_gender = sum(gender_counts.values())
         gender_distribution = {
             gender: round(count / total_gender * 100, 1)
@@ -77,9 +210,9 @@ class DemographicsAggregator:
         }
 
         # Calculate occupation frequencies
-        occupation_counts = Counter([
-            p['occupation'] for p in profiles if p['occupation'] != 'unknown'
-        ])
+        occupation_counts = Counter({
+            occ: count for occ, count in tally.occupations.items() if occ != 'unknown'
+        })
         total_occupations = sum(occupation_counts.values())
 
         if total_occupations == 0:
@@ -95,31 +228,21 @@ class DemographicsAggregator:
         ]
 
         # Calculate pain point frequencies
-        pain_point_counts = Counter()
-        for profile in profiles:
-            for pain in profile['pain_points']:
-                pain_point_counts[pain] += 1
-
         top_pain_points = [
             {
                 "pain": pain,
                 "mentions": count,
-                "percentage": round(count / len(profiles) * 100, 1)
+                "percentage": round(count / tally.count * 100, 1)
             }
-            for pain, count in pain_point_counts.most_common(10)
+            for pain, count in tally.pain_points.most_common(10)
         ]
 
         # Calculate interest frequencies
-        interest_counts = Counter()
-        for profile in profiles:
-            for interest in profile['interests']:
-                interest_counts[interest] += 1
-
-        top_interests = [interest for interest, _ in interest_counts.most_common(10)]
+        top_interests = [interest for interest, _ in tally.interests.most_common(10)]
 
         # Determine most common age range and life stage
         most_common_age = age_counts.most_common(1)[0][0] if age_counts else "unknown"
-        life_stage_counts = Counter([p['life_stage'] for p in profiles])
+        life_stage_counts = tally.life_stages
         most_common_life_stage = life_stage_counts.most_common(1)[0][0] if life_stage_counts else "unknown"
 
         aggregated = {
@@ -159,30 +282,41 @@ class DemographicsAggregator:
         if not profiles:
             raise ValueError("Cannot cluster empty profile list")
 
-        self.trail.light(2562, {
-            "action": "clustering_profiles",
-            "num_profiles": len(profiles),
-            "target_clusters": num_clusters
-        })
-
         # Simple clustering by occupation + age combination
-        clusters_dict = {}
-
+        cluster_tallies = {}
         for profile in profiles:
-            # Create cluster key from occupation and age
-            occupation = profile['occupation']
-            age = profile['age_range']
-            cluster_key = f"{occupation}_{age}"
+            key = cluster_key(profile)
+            if key not in cluster_tallies:
+                cluster_tallies[key] = ProfileTally()
+            cluster_tallies[key].add(profile)
+
+        return self.cluster_tallies(cluster_tallies, num_clusters)
+
+    def cluster_tallies(self, cluster_tallies: Dict[str, ProfileTally],
+                        num_clusters: int = 4) -> List[DemographicCluster]:
+        """
+        Build the top clusters from per-cluster tallies (keyed by cluster_key)
 
-            if cluster_key not in clusters_dict:
-                clusters_dict[cluster_key] = []
+        Same output as cluster_profiles() for the profiles that were tallied,
+        as long as keys were inserted in first-seen order.
 
-            clusters_dict[cluster_key].append(profile)
+        Raises:
+            ValueError: If there are no tallies or no clusters could be created
+        """
+        num_profiles = sum(tally.count for tally in cluster_tallies.values())
+        if num_profiles == 0:
+            raise ValueError("Cannot cluster empty profile list")
+
+        self.trail.light(2562, {
+            "action": "clustering_profiles",
+            "num_profiles": num_profiles,
+            "target_clusters": num_clusters
+        })
 
         # Convert to DemographicCluster objects
         clusters = []
-        for cluster_id, cluster_profiles in clusters_dict.items():
-            cluster = self._create_cluster(cluster_id, cluster_profiles)
+        for cluster_id, tally in cluster_tallies.items():
+            cluster = self._cluster_from_tally(cluster_id, tally)
             clusters.append(cluster)
 
         # Sort by size (largest first)
@@ -204,61 +338,54 @@ class DemographicsAggregator:
 
     def _create_cluster(self, cluster_id: str, cluster_profiles: List[Dict[str, Any]]) -> DemographicCluster:
         """Create DemographicCluster from list of profiles"""
+        return self._cluster_from_tally(cluster_id, ProfileTally.from_profiles(cluster_profiles))
+
+    def _cluster_from_tally(self, cluster_id: str, tally: ProfileTally) -> DemographicCluster:
+        """Create DemographicCluster from a cluster's tally"""
 
         # Aggregate cluster demographics
-        age_counts = Counter([p['age_range'] for p in cluster_profiles if p['age_range'] != 'unknown'])
+        age_counts = Counter({age: count for age, count in tally.age_ranges.items() if age != 'unknown'})
         total_age = sum(age_counts.values())
         age_distribution = {
             age: round(count / total_age * 100, 1)
             for age, count in age_counts.items()
         } if total_age > 0 else {}
 
-        gender_counts = Counter([p['gender'] for p in cluster_profiles])
+        gender_counts = tally.genders
         total_gender = sum(gender_counts.values())
         gender_distribution = {
             gender: round(count / total_gender * 100, 1)
             for gender, count in gender_counts.items()
         }
 
-        occupation_counts = Counter([p['occupation'] for p in cluster_profiles])
         top_occupations = [
             {
                 "occupation": occ,
-                "frequency": round(count / len(cluster_profiles) * 100, 1),
+                "frequency": round(count / tally.count * 100, 1),
                 "count": count
             }
-            for occ, count in occupation_counts.most_common(5)
+            for occ, count in tally.occupations.most_common(5)
         ]
 
-        pain_point_counts = Counter()
-        for profile in cluster_profiles:
-            for pain in profile['pain_points']:
-                pain_point_counts[pain] += 1
-
         top_pain_points = [
             {
                 "pain": pain,
                 "mentions": count,
-                "percentage": round(count / len(cluster_profiles) * 100, 1)
+                "percentage": round(count / tally.count * 100, 1)
             }
-            for pain, count in pain_point_counts.most_common(5)
+            for pain, count in tally.pain_points.most_common(5)
         ]
 
-        interest_counts = Counter()
-        for profile in cluster_profiles:
-            for interest in profile['interests']:
-                interest_counts[interest] += 1
-
-        top_interests = [interest for interest, _ in interest_counts.most_common(5)]
+        top_interests = [interest for interest, _ in tally.interests.most_common(5)]
 
         # Determine dominant characteristics
         most_common_age = age_counts.most_common(1)[0][0] if age_counts else "unknown"
-        life_stage_counts = Counter([p['life_stage'] for p in cluster_profiles])
+        life_stage_counts = tally.life_stages
         most_common_life_stage = life_stage_counts.most_common(1)[0][0] if life_stage_counts else "unknown"
 
         return DemographicCluster(
             cluster_id=cluster_id,
-            size=len(cluster_profiles),
+            size=tally.count,
             age_range=most_common_age,
             age_distribution=age_distribution,
             gender_distribution=gender_distribution,
@@ -268,6 +395,48 @@ class DemographicsAggregator:
             life_stage=most_common_life_stage
         )
 
+    def snapshot(self, state: IncrementalDemographics, num_clusters: int = 4) -> Dict[str, Any]:
+        """
+        Current output for an IncrementalDemographics state
+
+        Can be called at any point in a stream; the state is not modified.
+        Parts that cannot be aggregated yet (e.g. no profile with an age so
+        far) are reported under "errors" instead of raising.
+
+        Returns:
+            Dict with total_profiles, sources ({name: {sample_size, ...}}),
+            overall (aggregate_profiles() output or None), clusters (list of
+            cluster dicts) and errors ({part: message})
+        """
+        sources = {}
+        errors = {}
+
+        for name, tally in state.sources.items():
+            try:
+                sources[name] = {"sample_size": tally.count, **self.aggregate_tally(tally)}
+            except ValueError as e:
+                errors[f"source:{name}"] = str(e)
+
+        try:
+            overall = self.aggregate_tally(state.overall)
+        except ValueError as e:
+            overall = None
+            errors["overall"] = str(e)
+
+        try:
+            clusters = self.clusters_to_dict(self.cluster_tallies(state.clusters, num_clusters))
+        except ValueError as e:
+            clusters = []
+            errors["clusters"] = str(e)
+
+        return {
+            "total_profiles": state.profile_count,
+            "sources": sources,
+            "overall": overall,
+            "clusters": clusters,
+            "errors": errors
+        }
+
     def clusters_to_dict(self, clusters: List[DemographicCluster]) -> List[Dict[str, Any]]:
         """Convert clusters to dictionary format for JSON serialization"""
         return [asdict(cluster) for cluster in clusters]
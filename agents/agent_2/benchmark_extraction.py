@@ -0,0 +1,164 @@
+"""
+Agent 2: Demographics Extraction Benchmark
+
+Times DemographicsExtractor.extract_from_batch on synthetic reviews built from
+the Agent 2 test fixture, and checks every profile against the original
+per-dimension extractors (_extract_age, _extract_gender, ...).
+
+Usage:
+    python agents/agent_2/benchmark_extraction.py
+    python agents/agent_2/benchmark_extraction.py --sizes 100000 250000 --seed 7
+    python agents/agent_2/benchmark_extraction.py --skip-legacy --sizes 1000000
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import time
+from typing import Dict, List
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from lib.breadcrumb_system import BreadcrumbTrail
+from agents.agent_2.demographics_extractor import DemographicsExtractor, DemographicProfile
+
+
+FIXTURE_PATH = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), '../..', 'tests', 'fixtures', 'agent2_test_data.json'
+))
+
+# Phrases that hit (or nearly hit) taxonomy patterns, including overlaps,
+# mid-word matches and the non-ASCII letters IGNORECASE folds
+EXTRA_PHRASES = [
+    "I'm a guy", "as a woman", "she/her", "he/him", "I'm 24", "age 41", "turned 70",
+    "started my business", "college student", "retirement", "escalate", "work-life balance",
+    "worklife balance", "self improvement", "delegation", "avoiding", "growth", "next level",
+    "automation", "recurring revenue", "parent", "mid-career", "gen z", "gen x", "boomer",
+    "sımple", "ſtartup", "DEVELOPER", "Team Lead", "freelancer", "professor",
+    "manager manager", "student studying at university",
+]
+
+
+def generate_reviews(count: int, seed: int = 42) -> List[Dict]:
+    """Deterministic synthetic reviews remixed from the Agent 2 fixture"""
+    with open(FIXTURE_PATH, 'r', encoding='utf-8') as f:
+        fixture = json.load(f)
+
+    sentences = [
+        sentence.strip()
+        for reviews in fixture.values()
+        for review in reviews
+        for sentence in re.split(r'(?<=[.!?])\s+', review['text'])
+        if sentence.strip()
+    ]
+
+    rng = random.Random(seed)
+    reviews = []
+    for i in range(count):
+        parts = [rng.choice(sentences) for _ in range(rng.randint(1, 6))]
+        if rng.random() < 0.5:
+            parts.insert(rng.randint(0, len(parts)), rng.choice(EXTRA_PHRASES) + ".")
+        reviews.append({"id": f"bench_{i}", "text": " ".join(parts)})
+
+    return reviews
+
+
+def legacy_profile(extractor: DemographicsExtractor, review: Dict) -> DemographicProfile:
+    """Profile built with the original per-dimension extractors"""
+    text = review['text'].lower()
+    age_range, age_conf = extractor._extract_age(text)
+    gender, gender_conf = extractor._extract_gender(text)
+    occupation, occ_conf = extractor._extract_occupation(text)
+
+    return DemographicProfile(
+        review_id=review['id'],
+        age_range=age_range,
+        age_confidence=age_conf,
+        gender=gender,
+        gender_confidence=gender_conf,
+        occupation=occupation,
+        occupation_confidence=occ_conf,
+        life_stage=extractor._infer_life_stage(age_range, occupation, text),
+        pain_points=extractor._extract_pain_points(text),
+        interests=extractor._extract_interests(text),
+        source_text=review['text'][:200]
+    )
+
+
+def run_benchmark(sizes: List[int], seed: int, skip_legacy: bool) -> Dict:
+    trail = BreadcrumbTrail("Agent2_ExtractionBenchmark")
+    extractor = DemographicsExtractor(trail)
+    results = {}
+
+    for size in sizes:
+        reviews = generate_reviews(size, seed)
+
+        start = time.perf_counter()
+        profiles = extractor.extract_from_batch(reviews)
+        fast_seconds = time.perf_counter() - start
+
+        row = {
+            "reviews": size,
+            "seconds": round(fast_seconds, 3),
+            "reviews_per_sec": round(size / fast_seconds)
+        }
+
+        if not skip_legacy:
+            start = time.perf_counter()
+            reference = [legacy_profile(extractor, review) for review in reviews]
+            slow_seconds = time.perf_counter() - start
+
+            mismatches = [
+                (ref, new) for ref, new in zip(reference, profiles) if ref != new
+            ]
+            if mismatches or len(reference) != len(profiles):
+                ref, new = mismatches[0] if mismatches else (len(reference), len(profiles))
+                raise ValueError(
+                    f"Compiled extraction differs from legacy extractors at {size} reviews "
+                    f"(seed {seed}, {len(mismatches)} mismatches):\n"
+                    f"  legacy:   {ref}\n"
+                    f"  compiled: {new}"
+                )
+
+            row["legacy_seconds"] = round(slow_seconds, 3)
+            row["legacy_reviews_per_sec"] = round(size / slow_seconds)
+            row["speedup"] = round(slow_seconds / fast_seconds, 2)
+
+        results[size] = row
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark compiled demographics extraction")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000],
+                        help='Review counts to benchmark (default: 10000 100000)')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed for synthetic reviews')
+    parser.add_argument('--skip-legacy', action='store_true',
+                        help='Only time the compiled extractor (no parity check)')
+    args = parser.parse_args()
+
+    results = run_benchmark(args.sizes, args.seed, args.skip_legacy)
+
+    print(f"\n{'='*70}")
+    print("DEMOGRAPHICS EXTRACTION BENCHMARK")
+    print(f"{'='*70}")
+    print(f"{'Reviews':>10} {'Compiled':>10} {'Reviews/sec':>12} {'Legacy':>10} {'Reviews/sec':>12} {'Speedup':>8}")
+    for row in results.values():
+        print(
+            f"{row['reviews']:>10,} {row['seconds']:>9.2f}s {row['reviews_per_sec']:>12,} "
+            + (
+                f"{row['legacy_seconds']:>9.2f}s {row['legacy_reviews_per_sec']:>12,} {row['speedup']:>7}x"
+                if 'legacy_seconds' in row else f"{'-':>10} {'-':>12} {'-':>8}"
+            )
+        )
+    if not args.skip_legacy:
+        print("\n[OK] Compiled extraction identical to legacy extractors")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,352 @@
+"""
+Reddit Comment Harvester - Concurrent comment scraping for Agent 2
+
+Fetches the comment threads Agent 1 found on a small thread pool instead of
+one submission at a time. Every API request (the submission itself and each
+"load more comments" expansion) draws from the shared "reddit" rate budget
+(lib/rate_limiter.py), so more workers overlap network latency without
+exceeding Reddit's limits.
+
+Comments are yielded per thread in input order as each thread finishes, so
+callers can hand them to the extractor while later threads are still loading.
+
+Replay mode (offline testing):
+    A replay fixture stores each submission's comments and "more comments"
+    expansions. Set AGENT_2_REDDIT_REPLAY=<fixture.json> to harvest from it
+    instead of the API, or AGENT_2_REDDIT_RECORD=<fixture.json> to record one
+    from a live run. See tests/fixtures/reddit_replay.json.
+
+LED Range: 2514-2516 (within scraping range 2510-2539)
+"""
+
+import heapq
+import itertools
+import json
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import praw
+
+from lib.rate_limiter import get_limiter
+
+
+MIN_COMMENT_LENGTH = 20  # Shorter comments carry no demographic signal
+
+
+def submission_id_from_url(url: str) -> Optional[str]:
+    """Extract the submission ID from a Reddit thread URL (None if not a thread URL)"""
+    if '/comments/' not in url:
+        return None
+    return url.split('/comments/')[1].split('/')[0] or None
+
+
+class RedditCommentHarvester:
+    """Harvest Reddit thread comments concurrently under a shared rate budget"""
+
+    # LED breadcrumb assignments (scraping range 2510-2539)
+    LED_HARVEST_START = 2514
+    LED_THREAD_FAILED = 2515
+    LED_HARVEST_COMPLETE = 2516
+
+    def __init__(self, trail, config, replay_path: Optional[str] = None,
+                 record_path: Optional[str] = None):
+        """
+        Initialize comment harvester
+
+        Args:
+            trail: BreadcrumbTrail for LED tracking
+            config: Agent2Config for limits and credentials
+            replay_path: Harvest from this replay fixture instead of the API
+            record_path: Write a replay fixture of everything fetched to this path
+
+        Raises:
+            FileNotFoundError: If replay_path doesn't exist
+            ValueError: If the replay fixture is invalid
+        """
+        self.trail = trail
+        self.config = config
+        self.workers = config.REDDIT_HARVEST_WORKERS
+        self.comment_budget = config.MAX_REDDIT_COMMENTS_PER_THREAD
+        self.more_limit = config.REDDIT_MORE_COMMENTS_LIMIT
+        self.record_path = record_path
+
+        self.replay = ReplayReddit.load(replay_path) if replay_path else None
+        self.rate_limiter = None if self.replay else get_limiter(
+            "reddit",
+            rate=1 / config.REDDIT_DELAY,
+            capacity=config.REDDIT_BURST
+        )
+
+        # PRAW clients are not thread safe - one per worker thread
+        self._local = threading.local()
+        self._recorded: Dict[str, Dict] = {}
+        self._recorded_lock = threading.Lock()
+
+    def harvest(self, discussions: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Yield usable comments from Reddit discussions
+
+        Threads are fetched concurrently; their comments are yielded in input
+        order as soon as each thread (and all threads before it) is done. A
+        thread that fails to load is skipped with a warning LED.
+
+        Args:
+            discussions: Agent 1 discussion dicts with a 'url' field
+
+        Yields:
+            Dicts with text, thread, score (no 'id' - the caller numbers them)
+        """
+        targets = []
+        for discussion in discussions[:self.config.MAX_REDDIT_DISCUSSIONS]:
+            url = discussion.get('url', '')
+            submission_id = submission_id_from_url(url)
+            if submission_id:
+                targets.append((url, submission_id))
+
+        if not targets:
+            return
+
+        # FAIL LOUDLY on bad credentials before any thread starts
+        self.connect()
+
+        self.trail.light(self.LED_HARVEST_START, {
+            "action": "harvesting_reddit_comments",
+            "threads": len(targets),
+            "workers": min(self.workers, len(targets)),
+            "comment_budget": self.comment_budget,
+            "more_limit": self.more_limit,
+            "replay": self.replay is not None
+        })
+
+        start_time = time.time()
+        comment_count = 0
+        failed = 0
+
+        for url, comments in self._map_threads(targets):
+            if comments is None:
+                failed += 1
+                continue
+            for comment in comments:
+                comment_count += 1
+                yield {"text": comment.body, "source": "reddit", "thread": url, "score": comment.score}
+
+        self.trail.light(self.LED_HARVEST_COMPLETE, {
+            "action": "reddit_harvest_complete",
+            "threads": len(targets),
+            "threads_failed": failed,
+            "comments": comment_count,
+            "seconds": round(time.time() - start_time, 2)
+        })
+
+        if self.record_path:
+            self._write_recording()
+
+    def _map_threads(self, targets: List[Tuple[str, str]]) -> Iterator[Tuple[str, Optional[List]]]:
+        """Yield (url, comments) in input order, at most two threads per worker in flight"""
+        if self.workers == 1 or len(targets) == 1:
+            for url, submission_id in targets:
+                yield url, self._harvest_thread(url, submission_id)
+            return
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            pending = deque()
+            try:
+                for url, submission_id in targets:
+                    pending.append((url, executor.submit(self._harvest_thread, url, submission_id)))
+                    if len(pending) >= self.workers * 2:
+                        url_done, future = pending.popleft()
+                        yield url_done, future.result()
+
+                while pending:
+                    url_done, future = pending.popleft()
+                    yield url_done, future.result()
+
+            finally:
+                for _, future in pending:
+                    future.cancel()
+
+    def _harvest_thread(self, url: str, submission_id: str) -> Optional[List]:
+        """Fetch one thread's comments, expanding "more comments" within budget (None on failure)"""
+        try:
+            return self._fetch_comments(submission_id)
+        except Exception as e:
+            # Skip this discussion if scraping fails (don't fail entire pipeline)
+            self.trail.light(self.LED_THREAD_FAILED, {
+                "warning": "reddit_scrape_failed",
+                "url": url,
+                "error": str(e)
+            })
+            return None
+
+    def _fetch_comments(self, submission_id: str) -> List:
+        """
+        Collect up to comment_budget usable comments from one submission
+
+        The submission's first page is one request. After that the largest
+        "more comments" stubs are expanded one request at a time (like PRAW's
+        replace_more) until the budget is met or more_limit requests are spent.
+        Expansions are flattened directly instead of being spliced back into
+        the comment tree, since only the comment text is needed.
+        """
+        self._acquire()
+        submission = self._client().submission(id=submission_id)
+        record = {"comments": [], "more": []} if self.record_path else None
+
+        usable = []
+        seen = set()
+        order = itertools.count()
+        more_heap = []
+
+        def collect(items, record_node):
+            for item in items:
+                if hasattr(item, 'body'):
+                    if record_node is not None:
+                        record_node["comments"].append({"id": item.id, "body": item.body, "score": item.score})
+                    if item.id in seen:
+                        continue
+                    seen.add(item.id)
+                    if item.body and len(item.body) > MIN_COMMENT_LENGTH and len(usable) < self.comment_budget:
+                        usable.append(item)
+                else:
+                    more_record = {"count": item.count, "comments": [], "more": []} if record_node is not None else None
+                    if more_record is not None:
+                        record_node["more"].append(more_record)
+                    heapq.heappush(more_heap, (-item.count, next(order), item, more_record))
+
+        collect(submission.comments.list(), record)
+
+        expansions = 0
+        while more_heap and expansions < self.more_limit and len(usable) < self.comment_budget:
+            _, _, more, more_record = heapq.heappop(more_heap)
+            self._acquire()
+            collect(_flatten(more.comments(update=False)), more_record)
+            expansions += 1
+
+        if record is not None:
+            with self._recorded_lock:
+                self._recorded[submission_id] = record
+
+        return usable
+
+    def connect(self) -> None:
+        """
+        Create the calling thread's Reddit client
+
+        Raises:
+            ValueError: If the Reddit client can't be initialized (credentials)
+        """
+        self._client()
+
+    def _client(self):
+        """Reddit client for the current thread (the replay client is shared)"""
+        if self.replay:
+            return self.replay
+
+        reddit = getattr(self._local, 'reddit', None)
+        if reddit is None:
+            try:
+                reddit = praw.Reddit(
+                    client_id=self.config.REDDIT_CLIENT_ID,
+                    client_secret=self.config.REDDIT_CLIENT_SECRET,
+                    user_agent=self.config.REDDIT_USER_AGENT
+                )
+                reddit.read_only = True
+            except Exception as e:
+                raise ValueError(f"Failed to initialize Reddit client: {str(e)}\nCheck REDDIT_CLIENT_ID and REDDIT_CLIENT_SECRET in .env")
+            self._local.reddit = reddit
+        return reddit
+
+    def _acquire(self):
+        """Take one request from the shared Reddit budget (no pacing when replaying)"""
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+
+    def _write_recording(self):
+        """Save everything fetched this run as a replay fixture"""
+        os.makedirs(os.path.dirname(self.record_path) or ".", exist_ok=True)
+        with open(self.record_path, 'w', encoding='utf-8') as f:
+            json.dump({"submissions": self._recorded}, f, indent=2)
+
+
+def _flatten(items) -> Iterator:
+    """Yield comments and nested replies depth-first ("continue this thread" results are trees)"""
+    stack = list(reversed(list(items)))
+    while stack:
+        item = stack.pop()
+        yield item
+        replies = getattr(item, 'replies', None)
+        if replies:
+            stack.extend(reversed(list(replies)))
+
+
+class _ReplayComment:
+    """Recorded comment (same attributes PRAW's Comment exposes to the harvester)"""
+
+    def __init__(self, data: Dict[str, Any]):
+        self.id = data['id']
+        self.body = data['body']
+        self.score = data.get('score', 0)
+        self.replies = []
+
+
+class _ReplayMoreComments:
+    """Recorded "more comments" stub; expanding it returns what the live run fetched"""
+
+    def __init__(self, data: Dict[str, Any]):
+        self.count = data.get('count', 0)
+        self._data = data
+
+    def comments(self, update: bool = True) -> List:
+        return _replay_items(self._data)
+
+
+class _ReplayCommentForest:
+    def __init__(self, data: Dict[str, Any]):
+        self._data = data
+
+    def list(self) -> List:
+        return _replay_items(self._data)
+
+
+class _ReplaySubmission:
+    def __init__(self, data: Dict[str, Any]):
+        self.comments = _ReplayCommentForest(data)
+
+
+def _replay_items(node: Dict[str, Any]) -> List:
+    return (
+        [_ReplayComment(comment) for comment in node.get('comments', [])]
+        + [_ReplayMoreComments(more) for more in node.get('more', [])]
+    )
+
+
+class ReplayReddit:
+    """Offline stand-in for praw.Reddit backed by a recorded fixture"""
+
+    def __init__(self, submissions: Dict[str, Dict]):
+        self.submissions = submissions
+
+    @classmethod
+    def load(cls, path: str) -> 'ReplayReddit':
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Reddit replay fixture not found: {path}")
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON in Reddit replay fixture: {e}")
+
+        if not isinstance(data.get('submissions'), dict):
+            raise ValueError(f"Reddit replay fixture missing 'submissions' object: {path}")
+
+        return cls(data['submissions'])
+
+    def submission(self, id: str) -> _ReplaySubmission:
+        if id not in self.submissions:
+            raise KeyError(f"Submission {id} not in replay fixture")
+        return _ReplaySubmission(self.submissions[id])
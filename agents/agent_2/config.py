@@ -6,6 +6,8 @@ Demographics Analyst - Extract customer profiles from reviews/comments
 import os
 from dotenv import load_dotenv
 
+from lib.rate_limiter import REDDIT_BURST as SHARED_REDDIT_BURST, REDDIT_DELAY as SHARED_REDDIT_DELAY
+
 # Load environment variables
 load_dotenv()
 
@@ -25,8 +27,17 @@ class Agent2Config:
     MAX_YOUTUBE_COMMENTS_PER_VIDEO = int(os.getenv('AGENT_2_MAX_YOUTUBE_COMMENTS', '50'))
     MIN_DATA_POINTS_REQUIRED = int(os.getenv('AGENT_2_MIN_DATA_POINTS', '300'))
 
+    # Reddit Comment Harvesting (agents/agent_2/comment_harvester.py)
+    REDDIT_HARVEST_WORKERS = int(os.getenv('AGENT_2_REDDIT_WORKERS', '4'))  # Threads fetched concurrently
+    REDDIT_MORE_COMMENTS_LIMIT = int(os.getenv('AGENT_2_REDDIT_MORE_LIMIT', '0'))  # "More comments" requests per thread (0 = first page only)
+    REDDIT_DELAY = SHARED_REDDIT_DELAY  # Sustained delay between Reddit API calls (shared "reddit" budget)
+    REDDIT_BURST = SHARED_REDDIT_BURST
+    REDDIT_REPLAY_PATH = os.getenv('AGENT_2_REDDIT_REPLAY')  # Harvest from a replay fixture (offline)
+    REDDIT_RECORD_PATH = os.getenv('AGENT_2_REDDIT_RECORD')  # Record a replay fixture from a live run
+
     # Demographic Extraction Settings
-    BATCH_SIZE_FOR_EXTRACTION = int(os.getenv('AGENT_2_BATCH_SIZE', '20'))
+    BATCH_SIZE_FOR_EXTRACTION = int(os.getenv('AGENT_2_BATCH_SIZE', '1000'))  # Reviews per worker shard
+    EXTRACTION_WORKERS = int(os.getenv('AGENT_2_EXTRACTION_WORKERS', '1'))  # 1 = in-process, 0 = all cores
     NUM_DEMOGRAPHIC_CLUSTERS = int(os.getenv('AGENT_2_NUM_CLUSTERS', '4'))
 
     # Confidence Thresholds
@@ -47,6 +58,7 @@ class Agent2Config:
 
     # LED Breadcrumb Ranges (2500-2599)
     LED_INIT = 2500
+    LED_SPAN = 2509  # Stage timing spans (start/end with wall and CPU seconds)
     LED_SCRAPING_START = 2510
     LED_EXTRACTION_START = 2540
     LED_PIPELINE_ANALYSIS = 2545  # Tier 1 analysis
@@ -69,5 +81,16 @@ class Agent2Config:
             print("[!] WARNING: Reddit credentials not found - subreddit overlap analysis will be skipped")
             print("    Set REDDIT_CLIENT_ID and REDDIT_CLIENT_SECRET in .env for full functionality")
 
+        # Extraction sharding must be usable (FAIL LOUDLY on bad env values)
+        if cls.BATCH_SIZE_FOR_EXTRACTION < 1:
+            raise ValueError(f"AGENT_2_BATCH_SIZE must be at least 1 (got {cls.BATCH_SIZE_FOR_EXTRACTION})")
+        if cls.EXTRACTION_WORKERS < 0:
+            raise ValueError(f"AGENT_2_EXTRACTION_WORKERS must be 0 (all cores) or more (got {cls.EXTRACTION_WORKERS})")
+
+        if cls.REDDIT_HARVEST_WORKERS < 1:
+            raise ValueError(f"AGENT_2_REDDIT_WORKERS must be at least 1 (got {cls.REDDIT_HARVEST_WORKERS})")
+        if cls.REDDIT_MORE_COMMENTS_LIMIT < 0:
+            raise ValueError(f"AGENT_2_REDDIT_MORE_LIMIT must be 0 or more (got {cls.REDDIT_MORE_COMMENTS_LIMIT})")
+
         # No hard requirements - Agent 2 can work with cached data from Agent 1
         return True
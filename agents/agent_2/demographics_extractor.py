@@ -9,7 +9,7 @@ LED Range: 2540-2559
 
 import json
 import re
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
 from dataclasses import dataclass, asdict
 
 
@@ -75,6 +75,17 @@ class DemographicsExtractor:
         "passive_income": [r"passive income", r"automat(e|ion)", r"recurring revenue"]
     }
 
+    # Lowercase non-ASCII letters that re.IGNORECASE equates with ASCII pattern
+    # letters (dotless i, long s). Text is lowercased and these are folded, so
+    # the compiled patterns can match case-sensitively with identical results.
+    CASE_FOLDS = str.maketrans({'\u0131': 'i', '\u017f': 's'})
+
+    # Regex metacharacters - patterns without any are plain substrings
+    REGEX_METACHARACTERS = re.compile(r"[.^$*+?{}\[\]\\|()]")
+
+    # Compiled taxonomy (built on first use, see _compile_taxonomy)
+    _taxonomy = None
+
     def __init__(self, trail):
         """
         Initialize demographics extractor
@@ -100,12 +111,7 @@ class DemographicsExtractor:
         if not reviews:
             raise ValueError("Cannot extract demographics from empty review list")
 
-        # Validate reviews have required fields
-        for review in reviews:
-            if 'text' not in review:
-                raise KeyError(f"Review {review.get('id', 'unknown')} missing 'text' field")
-            if 'id' not in review:
-                raise KeyError("Review missing 'id' field")
+        self.validate_reviews(reviews)
 
         self.trail.light(2540, {
             "action": "extracting_demographics",
@@ -128,28 +134,47 @@ class DemographicsExtractor:
 
         return profiles
 
+    @staticmethod
+    def validate_reviews(reviews: List[Dict[str, Any]]) -> None:
+        """
+        Check every review has the fields extraction needs
+
+        Raises:
+            KeyError: If a review is missing 'text' or 'id'
+        """
+        for review in reviews:
+            if 'text' not in review:
+                raise KeyError(f"Review {review.get('id', 'unknown')} missing 'text' field")
+            if 'id' not in review:
+                raise KeyError("Review missing 'id' field")
+
+    def extract_profiles(self, reviews: List[Dict[str, Any]]) -> Iterator[DemographicProfile]:
+        """
+        Yield one profile per review, without batch LEDs
+
+        For worker processes and streaming callers that aggregate profiles as
+        they go instead of collecting a list (see parallel_extraction.py).
+
+        Raises:
+            KeyError: If a review is missing required fields (checked up front)
+        """
+        self.validate_reviews(reviews)
+        for review in reviews:
+            yield self._extract_single_profile(review)
+
     def _extract_single_profile(self, review: Dict[str, Any]) -> DemographicProfile:
         """Extract demographic profile from single review"""
         text = review['text'].lower()
 
-        # Extract age
-        age_range, age_conf = self._extract_age(text)
-
-        # Extract gender (only if explicit)
-        gender, gender_conf = self._extract_gender(text)
-
-        # Extract occupation
-        occupation, occ_conf = self._extract_occupation(text)
+        # Age, gender, occupation, pain points and interests in one taxonomy pass
+        hits = self.scan_taxonomy(text)
+        age_range, age_conf = hits['age']
+        gender, gender_conf = hits['gender']
+        occupation, occ_conf = hits['occupation']
 
         # Extract life stage
         life_stage = self._infer_life_stage(age_range, occupation, text)
 
-        # Extract pain points
-        pain_points = self._extract_pain_points(text)
-
-        # Extract interests
-        interests = self._extract_interests(text)
-
         return DemographicProfile(
             review_id=review['id'],
             age_range=age_range,
@@ -159,11 +184,136 @@ class DemographicsExtractor:
             occupation=occupation,
             occupation_confidence=occ_conf,
             life_stage=life_stage,
-            pain_points=pain_points,
-            interests=interests,
+            pain_points=hits['pain_points'],
+            interests=hits['interests'],
             source_text=review['text'][:200]  # First 200 chars for reference
         )
 
+    @classmethod
+    def _compile_taxonomy(cls) -> Dict[str, list]:
+        """
+        Compile every pattern in the taxonomy once
+
+        Each dimension becomes an ordered list of (label, matchers), where a
+        matcher is (literal, regex, prefilter, explicit_age):
+        - Plain phrases keep literal set and are matched with substring search
+          (in / str.count), the fastest phrase search available without a C
+          extension.
+        - Patterns with regex syntax are precompiled, case-sensitive.
+        - Patterns starting with \\b also get a prefilter without it. A leading
+          word boundary stops sre from using its literal/charset fast search
+          (\\b(18|19|...)\\b is ~15x slower than (18|19|...)\\b), so the
+          anchored pattern only runs on texts the prefilter matched.
+
+        A single combined regex was measured slower than the per-pattern
+        searches it replaces: the taxonomy's 92 patterns overlap ("started my
+        business" is an age, occupation and interest signal), so it needs a
+        lookahead per pattern at every position, and sre then loses its
+        literal-prefix fast search.
+        """
+        if cls._taxonomy is None:
+            def compile_dimension(patterns_by_label: Dict[str, List[str]]) -> list:
+                dimension = []
+                for label, patterns in patterns_by_label.items():
+                    matchers = []
+                    for pattern in patterns:
+                        is_literal = not cls.REGEX_METACHARACTERS.search(pattern)
+                        anchored = not is_literal and pattern.startswith(r"\b")
+                        matchers.append((
+                            pattern if is_literal else None,
+                            None if is_literal else re.compile(pattern),
+                            re.compile(pattern[2:]) if anchored else None,
+                            r"\b\d+" in pattern  # Same explicit-age test as _extract_age
+                        ))
+                    dimension.append((label, matchers))
+                return dimension
+
+            cls._taxonomy = {
+                "age": compile_dimension(cls.AGE_PATTERNS),
+                "gender": compile_dimension(cls.GENDER_PATTERNS),
+                "occupation": compile_dimension(cls.OCCUPATION_PATTERNS),
+                "pain_points": compile_dimension(cls.PAIN_POINT_PATTERNS),
+                "interests": compile_dimension(cls.INTEREST_PATTERNS)
+            }
+
+        return cls._taxonomy
+
+    def scan_taxonomy(self, text: str) -> Dict[str, Any]:
+        """
+        Match every taxonomy dimension against one lowercased text
+
+        Same results as _extract_age, _extract_gender, _extract_occupation,
+        _extract_pain_points and _extract_interests combined, with each pattern
+        compiled once and no re.IGNORECASE (see CASE_FOLDS).
+
+        Returns:
+            Dict with age (range, confidence), gender (gender, confidence),
+            occupation (occupation, confidence), occupation_scores, pain_points,
+            interests
+        """
+        taxonomy = self._compile_taxonomy()
+        if '\u0131' in text or '\u017f' in text:
+            text = text.translate(self.CASE_FOLDS)
+
+        def first_match(matchers):
+            for matcher in matchers:
+                literal, regex, prefilter, _ = matcher
+                if literal is not None:
+                    if literal in text:
+                        return matcher
+                elif (prefilter is None or prefilter.search(text)) and regex.search(text):
+                    return matcher
+            return None
+
+        def labels_found(dimension) -> List[str]:
+            return [label for label, matchers in dimension if first_match(matchers)]
+
+        # Age: first matching pattern in priority order
+        age = ("unknown", 0)
+        for age_range, matchers in taxonomy['age']:
+            match = first_match(matchers)
+            if match:
+                # Higher confidence for explicit age numbers
+                age = (age_range, 9 if match[3] else 6)
+                break
+
+        # Gender: first explicit statement
+        gender = ("unknown", 0)
+        for label, matchers in taxonomy['gender']:
+            if first_match(matchers):
+                gender = (label, 8)
+                break
+
+        # Occupation: non-overlapping match count per pattern, summed per occupation
+        occupation_scores = {}
+        for label, matchers in taxonomy['occupation']:
+            score = 0
+            for literal, regex, prefilter, _ in matchers:
+                if literal is not None:
+                    score += text.count(literal)
+                elif prefilter is None or prefilter.search(text):
+                    score += len(regex.findall(text))
+            if score > 0:
+                occupation_scores[label] = score
+
+        if occupation_scores:
+            best_occupation = max(occupation_scores.items(), key=lambda x: x[1])
+            occupation = (best_occupation[0], min(best_occupation[1] * 3, 10))  # Cap at 10
+        else:
+            occupation = ("unknown", 0)
+
+        return {
+            "age": age,
+            "gender": gender,
+            "occupation": occupation,
+            "occupation_scores": occupation_scores,
+            "pain_points": labels_found(taxonomy['pain_points']),
+            "interests": labels_found(taxonomy['interests'])
+        }
+
+    # Per-dimension extractors - superseded by scan_taxonomy(), kept as the
+    # reference implementation for parity checks and benchmark_extraction.py
+
     def _extract_age(self, text: str) -> tuple[str, int]:
         """Extract age range from text"""
         for age_range, patterns in self.AGE_PATTERNS.items():
@@ -17,21 +17,32 @@ import os
 import json
 from datetime import datetime
 from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator
 
 # Add project root to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 from lib.breadcrumb_system import BreadcrumbTrail
+from lib.metrics import enable_metrics_from_env
 from agents.agent_2.config import Agent2Config as Config
 from agents.agent_2.scraper import DataScraper
-from agents.agent_2.demographics_extractor import DemographicsExtractor
-from agents.agent_2.aggregator import DemographicsAggregator
+from agents.agent_2.aggregator import DemographicsAggregator, IncrementalDemographics
+from agents.agent_2.parallel_extraction import EmptySourceError, ParallelExtractor
 from agents.agent_2.confidence_calculator import ConfidenceCalculator
 from agents.agent_2.checkpoint import CheckpointGate
 from agents.agent_2.source_tiers import SourceTiers
 
 
-def main(input_path: str = None, test_data_path: str = None, auto_approve: bool = False):
+def _count_data_points(reviews: Iterable[Dict[str, Any]], counts: Dict[str, int], source_name: str) -> Iterator[Dict[str, Any]]:
+    """Pass reviews through, counting them into counts[source_name]"""
+    counts[source_name] = 0
+    for review in reviews:
+        counts[source_name] += 1
+        yield review
+
+
+def main(input_path: str = None, test_data_path: str = None, auto_approve: bool = False,
+         workers: int = None):
     """
     Main execution function for Agent 2
 
@@ -39,12 +50,14 @@ def main(input_path: str = None, test_data_path: str = None, auto_approve: bool
         input_path: Path to Agent 1 output JSON
         test_data_path: Path to test data JSON (for development)
         auto_approve: Auto-approve checkpoint gate (for testing)
+        workers: Extraction worker processes (default: Config.EXTRACTION_WORKERS, 0 = all cores)
 
     Returns:
         Path to output JSON file
     """
     # Initialize LED breadcrumb trail
     trail = BreadcrumbTrail("Agent2_DemographicsAnalyst")
+    enable_metrics_from_env()  # METRICS_PORT / METRICS_TEXTFILE
 
     trail.light(Config.LED_INIT, {
         "action": "agent_2_started",
@@ -68,7 +81,11 @@ def main(input_path: str = None, test_data_path: str = None, auto_approve: bool
 
     # Initialize components
     scraper = DataScraper(trail, Config)
-    extractor = DemographicsExtractor(trail)
+    extractor = ParallelExtractor(
+        trail,
+        workers=Config.EXTRACTION_WORKERS if workers is None else workers,
+        shard_size=Config.BATCH_SIZE_FOR_EXTRACTION
+    )
     aggregator = DemographicsAggregator(trail)
     confidence_calc = ConfidenceCalculator(trail, Config)
     checkpoint = CheckpointGate(trail, Config)
@@ -76,24 +93,19 @@ def main(input_path: str = None, test_data_path: str = None, auto_approve: bool
     # Load data
     print(f"[1/6] Loading review/comment data...")
     try:
-        if test_data_path:
-            all_data = scraper.load_from_test_data(test_data_path)
-        elif input_path:
-            all_data = scraper.load_from_agent1(input_path)
-        else:
-            raise ValueError("Must provide either --input or --test-data argument")
+        with trail.span(Config.LED_SPAN, "load_data"):
+            if test_data_path:
+                all_data = scraper.load_from_test_data(test_data_path)
+            elif input_path:
+                all_data = scraper.load_from_agent1(input_path)
+            else:
+                raise ValueError("Must provide either --input or --test-data argument")
 
     except (FileNotFoundError, ValueError) as e:
         trail.fail(Config.LED_SCRAPING_START, e)
         print(f"\n[FAIL] Data loading error: {e}")
         return None
 
-    # Check minimum data requirement
-    if all_data['total_data_points'] < Config.MIN_DATA_POINTS_REQUIRED:
-        print(f"\n[!] WARNING: Only {all_data['total_data_points']} data points available")
-        print(f"    Minimum recommended: {Config.MIN_DATA_POINTS_REQUIRED}")
-        print(f"    This will likely result in low confidence scores\n")
-
     # Prepare source datasets
     source_datasets = scraper.prepare_source_datasets(all_data)
 
@@ -101,34 +113,56 @@ def main(input_path: str = None, test_data_path: str = None, auto_approve: bool
     print(f"\n[2/6] Extracting demographics from each source...")
 
     source_demographics = {}
-    all_profiles = []
-
-    for source_name, reviews in source_datasets.items():
-        if not reviews:
-            print(f"  [SKIP] {source_name}: No data available")
-            continue
-
-        print(f"  [*] Processing {source_name}: {len(reviews)} reviews/comments")
-
-        try:
-            profiles = extractor.extract_from_batch(reviews)
-            all_profiles.extend(profiles)
-
-            # Aggregate for this source
-            profiles_dict = extractor.profiles_to_dict(profiles)
-            source_agg = aggregator.aggregate_profiles(profiles_dict)
-
-            source_demographics[source_name] = {
-                "sample_size": len(reviews),
-                **source_agg
-            }
-
-            print(f"  [OK] {source_name}: {len(profiles)} profiles extracted")
-
-        except (ValueError, KeyError) as e:
-            trail.fail(Config.LED_EXTRACTION_START, e)
-            print(f"  [FAIL] {source_name} extraction failed: {e}")
-            # Continue with other sources
+    # One pass: per-source, overall and cluster counts all come from this state
+    demographics_state = IncrementalDemographics()
+
+    print(f"      Workers: {extractor.workers}, shard size: {extractor.shard_size}")
+
+    # Reviews/comments per source, counted as the extractor reads them
+    data_points: Dict[str, int] = {}
+
+    with extractor:
+        for source_name, reviews in source_datasets.items():
+            if isinstance(reviews, list):
+                if not reviews:
+                    print(f"  [SKIP] {source_name}: No data available")
+                    continue
+                print(f"  [*] Processing {source_name}: {len(reviews)} reviews/comments")
+                data_points[source_name] = len(reviews)
+            else:
+                # Streamed (Reddit): comments go to the extractor as threads finish loading
+                print(f"  [*] Processing {source_name}: streaming comments as threads are harvested")
+                reviews = _count_data_points(reviews, data_points, source_name)
+
+            try:
+                with trail.span(Config.LED_SPAN, "extraction", {"source": source_name}):
+                    extraction = extractor.extract_source(source_name, reviews)
+                demographics_state.merge(extraction)
+
+                # Aggregate for this source
+                source_agg = aggregator.aggregate_tally(demographics_state.sources[source_name])
+
+                source_demographics[source_name] = {
+                    "sample_size": data_points[source_name],
+                    **source_agg
+                }
+
+                print(f"  [OK] {source_name}: {extraction.profile_count} profiles extracted "
+                      f"from {data_points[source_name]} reviews/comments")
+
+            except EmptySourceError:
+                print(f"  [SKIP] {source_name}: No data available")
+            except (ValueError, KeyError) as e:
+                trail.fail(Config.LED_EXTRACTION_START, e)
+                print(f"  [FAIL] {source_name} extraction failed: {e}")
+                # Continue with other sources
+
+    # Check minimum data requirement (streamed sources are only counted once harvested)
+    all_data['total_data_points'] = sum(data_points.values())
+    if all_data['total_data_points'] < Config.MIN_DATA_POINTS_REQUIRED:
+        print(f"\n[!] WARNING: Only {all_data['total_data_points']} data points available")
+        print(f"    Minimum recommended: {Config.MIN_DATA_POINTS_REQUIRED}")
+        print(f"    This will likely result in low confidence scores")
 
     # Intelligent pipeline: Analyze Tier 1 source coverage
     trail.light(2545, {
@@ -156,10 +190,10 @@ def main(input_path: str = None, test_data_path: str = None, auto_approve: bool
     print(f"\n[3/6] Aggregating overall demographics...")
 
     try:
-        all_profiles_dict = extractor.profiles_to_dict(all_profiles)
-        overall_demographics = aggregator.aggregate_profiles(all_profiles_dict)
+        with trail.span(Config.LED_SPAN, "aggregation"):
+            overall_demographics = aggregator.aggregate_tally(demographics_state.overall)
 
-        print(f"  [OK] Overall demographics aggregated from {len(all_profiles)} profiles")
+        print(f"  [OK] Overall demographics aggregated from {demographics_state.profile_count} profiles")
         print(f"       Age: {overall_demographics['age_range']}")
         print(f"       Top Occupation: {overall_demographics['top_occupations'][0]['occupation']}")
 
@@ -172,8 +206,9 @@ def main(input_path: str = None, test_data_path: str = None, auto_approve: bool
     print(f"\n[4/6] Clustering demographics into customer segments...")
 
     try:
-        clusters = aggregator.cluster_profiles(all_profiles_dict, Config.NUM_DEMOGRAPHIC_CLUSTERS)
-        clusters_dict = aggregator.clusters_to_dict(clusters)
+        with trail.span(Config.LED_SPAN, "clustering"):
+            clusters = aggregator.cluster_tallies(demographics_state.clusters, Config.NUM_DEMOGRAPHIC_CLUSTERS)
+            clusters_dict = aggregator.clusters_to_dict(clusters)
 
         print(f"  [OK] Created {len(clusters)} demographic clusters:")
         for cluster in clusters:
@@ -191,12 +226,13 @@ def main(input_path: str = None, test_data_path: str = None, auto_approve: bool
         # TODO: Web search for benchmark data (future enhancement)
         benchmark_data = None
 
-        confidence_result = confidence_calc.calculate_confidence(
-            source_demographics,
-            overall_demographics,
-            all_data['total_data_points'],
-            benchmark_data
-        )
+        with trail.span(Config.LED_SPAN, "confidence"):
+            confidence_result = confidence_calc.calculate_confidence(
+                source_demographics,
+                overall_demographics,
+                all_data['total_data_points'],
+                benchmark_data
+            )
 
         print(f"  [OK] Confidence Score: {confidence_result['confidence_percentage']:.1f}%")
         print(f"       Source Agreement: {confidence_result['breakdown']['source_agreement']:.1%}")
@@ -271,7 +307,7 @@ def main(input_path: str = None, test_data_path: str = None, auto_approve: bool
         },
         "data_sources": source_demographics,
         "metadata": {
-            "total_profiles": len(all_profiles),
+            "total_profiles": demographics_state.profile_count,
             "total_data_points": all_data['total_data_points'],
             "num_sources": len(source_demographics),
             "num_clusters": len(clusters),
@@ -281,7 +317,7 @@ def main(input_path: str = None, test_data_path: str = None, auto_approve: bool
 
     # Save JSON output
     try:
-        with open(output_path, 'w', encoding='utf-8') as f:
+        with trail.span(Config.LED_SPAN, "save_output"), open(output_path, 'w', encoding='utf-8') as f:
             json.dump(output_data, f, indent=2)
 
         trail.light(Config.LED_COMPLETE, {
@@ -305,13 +341,15 @@ def main(input_path: str = None, test_data_path: str = None, auto_approve: bool
     print(f"{'='*60}")
     print(f"Status: {'SUCCESS' if checkpoint_result['checkpoint_passed'] or checkpoint_result['user_approval'] == 'approved' else 'FAILED'}")
     print(f"Confidence: {confidence_result['confidence_percentage']:.1f}%")
-    print(f"Profiles Extracted: {len(all_profiles)}")
+    print(f"Profiles Extracted: {demographics_state.profile_count}")
     print(f"Clusters Created: {len(clusters)}")
     print(f"Data Sources: {len(source_demographics)}")
     print(f"Total LEDs: {summary['total_leds']}")
     print(f"Failures: {summary['failures']}")
     print(f"Quality Score: {trail.get_quality_score()}%")
     print(f"Output: {output_path}")
+    print(f"\n[*] Stage Timing:")
+    BreadcrumbTrail.print_span_breakdown()
     print(f"{'='*60}\n")
 
     return output_path
@@ -336,6 +374,12 @@ if __name__ == "__main__":
         action="store_true",
         help="Auto-approve checkpoint gate (for testing with low confidence)"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Extraction worker processes (default: AGENT_2_EXTRACTION_WORKERS, 0 = all cores)"
+    )
 
     args = parser.parse_args()
 
@@ -347,7 +391,12 @@ if __name__ == "__main__":
         sys.exit(1)
 
     # Run Agent 2
-    output_path = main(input_path=args.input, test_data_path=args.test_data, auto_approve=args.auto_approve)
+    output_path = main(
+        input_path=args.input,
+        test_data_path=args.test_data,
+        auto_approve=args.auto_approve,
+        workers=args.workers
+    )
 
     if output_path:
         print(f"\n[OK] Agent 2 completed successfully!")
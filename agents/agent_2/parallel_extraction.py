@@ -0,0 +1,209 @@
+"""
+Parallel Demographics Extraction - Shard reviews across worker processes
+
+Reviews are split into shards of BATCH_SIZE_FOR_EXTRACTION and extracted in a
+process pool. Each worker returns an IncrementalDemographics state - mergeable
+counts per source, overall and per cluster - instead of DemographicProfile
+objects, so the parent never holds the profiles or their source_text. Shard
+states are merged in input order as they arrive, which keeps every aggregate
+identical to serial extraction (see ProfileTally).
+
+Sources can also be streams (e.g. RedditCommentHarvester.harvest): shards are
+cut and dispatched as reviews arrive, so extraction overlaps with scraping.
+
+LED Range: 2540-2543 (2540/2541 match DemographicsExtractor.extract_from_batch)
+"""
+
+import itertools
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from agents.agent_2.demographics_extractor import DemographicsExtractor
+from agents.agent_2.aggregator import IncrementalDemographics
+
+
+class EmptySourceError(ValueError):
+    """A source (list or stream) had no reviews to extract"""
+
+
+# One extractor per worker process, created on its first shard
+_worker_extractor: Optional[DemographicsExtractor] = None
+
+
+def _extract_shard(source_name: str, reviews: List[Dict[str, Any]]) -> IncrementalDemographics:
+    """Worker entry point: extract one shard and tally it"""
+    global _worker_extractor
+    if _worker_extractor is None:
+        # Workers report progress through the parent's LEDs
+        _worker_extractor = DemographicsExtractor(trail=None)
+
+    return IncrementalDemographics().add_many(_worker_extractor.extract_profiles(reviews), source_name)
+
+
+class ParallelExtractor:
+    """Extract and tally demographics per source on a pool of worker processes"""
+
+    # LED breadcrumb assignments (extraction range 2540-2559)
+    LED_EXTRACTION_START = 2540
+    LED_EXTRACTION_COMPLETE = 2541
+    LED_SHARD_PROGRESS = 2542
+    LED_SHARD_FAILED = 2543
+
+    PROGRESS_EVERY_SHARDS = 100  # Progress LED cadence for large corpora
+
+    def __init__(self, trail, workers: int = 1, shard_size: int = 1000):
+        """
+        Initialize parallel extractor
+
+        Args:
+            trail: BreadcrumbTrail for LED tracking
+            workers: Worker processes (1 = extract in-process, 0 = one per CPU core)
+            shard_size: Reviews per shard sent to a worker
+        """
+        if workers < 0:
+            raise ValueError(f"workers must be 0 (all cores) or more (got {workers})")
+        if shard_size < 1:
+            raise ValueError(f"shard_size must be at least 1 (got {shard_size})")
+
+        self.trail = trail
+        self.workers = workers or os.cpu_count() or 1
+        self.shard_size = shard_size
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> 'ParallelExtractor':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        """Shut down the worker pool (if one was started)"""
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    def extract_source(self, source_name: str, reviews: Iterable[Dict[str, Any]]) -> IncrementalDemographics:
+        """
+        Extract demographics for one source's reviews/comments
+
+        Args:
+            source_name: Source label for LEDs (e.g. "reddit")
+            reviews: List (or stream) of review dicts with 'text' and 'id' fields
+
+        Returns:
+            IncrementalDemographics for this source (sources[source_name],
+            overall and per-cluster tallies)
+
+        Raises:
+            EmptySourceError: If reviews is empty (or the stream yields nothing)
+            ValueError: If no profiles could be extracted
+            KeyError: If a review is missing required fields
+        """
+        if isinstance(reviews, list):
+            if not reviews:
+                raise EmptySourceError("Cannot extract demographics from empty review list")
+
+            shards = [
+                reviews[start:start + self.shard_size]
+                for start in range(0, len(reviews), self.shard_size)
+            ]
+            review_count = len(reviews)
+            total_shards = len(shards)
+        else:
+            # Stream: sizes are unknown until it is exhausted
+            shards = self._stream_shards(reviews)
+            review_count = None
+            total_shards = None
+
+        self.trail.light(self.LED_EXTRACTION_START, {
+            "action": "extracting_demographics",
+            "source": source_name,
+            "batch_size": review_count,
+            "shards": total_shards,
+            "workers": min(self.workers, total_shards) if total_shards else self.workers
+        })
+
+        start_time = time.time()
+        result = IncrementalDemographics()
+        streamed_reviews = 0
+
+        for shards_done, (shard_size, shard_result) in enumerate(self._map_shards(source_name, shards), 1):
+            result.merge(shard_result)
+            streamed_reviews += shard_size
+
+            if shards_done % self.PROGRESS_EVERY_SHARDS == 0:
+                self.trail.light(self.LED_SHARD_PROGRESS, {
+                    "action": "shards_merged",
+                    "source": source_name,
+                    "shards_done": shards_done,
+                    "total_shards": total_shards,
+                    "profiles_so_far": result.profile_count
+                })
+
+        if review_count is None:
+            if streamed_reviews == 0:
+                raise EmptySourceError("Cannot extract demographics from empty review list")
+            review_count = streamed_reviews
+
+        elapsed = time.time() - start_time
+
+        self.trail.light(self.LED_EXTRACTION_COMPLETE, {
+            "action": "extraction_complete",
+            "source": source_name,
+            "profiles_extracted": result.profile_count,
+            "seconds": round(elapsed, 2),
+            "reviews_per_sec": round(review_count / elapsed) if elapsed > 0 else None
+        })
+
+        if result.profile_count == 0:
+            raise ValueError(f"Failed to extract any demographic profiles from {review_count} reviews")
+
+        return result
+
+    def _stream_shards(self, reviews: Iterable[Dict[str, Any]]) -> Iterator[List[Dict[str, Any]]]:
+        """Cut a review stream into shards as reviews arrive"""
+        iterator = iter(reviews)
+        while True:
+            shard = list(itertools.islice(iterator, self.shard_size))
+            if not shard:
+                return
+            yield shard
+
+    def _map_shards(self, source_name: str,
+                    shards: Iterable[List[Dict[str, Any]]]) -> Iterator[Tuple[int, IncrementalDemographics]]:
+        """
+        Yield (shard size, shard result) in input order
+
+        At most two shards per worker are in flight, so results are merged
+        as they stream back instead of piling up in the parent.
+        """
+        if self.workers == 1 or (isinstance(shards, list) and len(shards) == 1):
+            for shard in shards:
+                yield len(shard), _extract_shard(source_name, shard)
+            return
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+
+        pending = deque()
+        try:
+            for shard in shards:
+                pending.append((len(shard), self._executor.submit(_extract_shard, source_name, shard)))
+                if len(pending) >= self.workers * 2:
+                    shard_size, future = pending.popleft()
+                    yield shard_size, future.result()
+
+            while pending:
+                shard_size, future = pending.popleft()
+                yield shard_size, future.result()
+
+        except Exception as e:
+            self.trail.fail(self.LED_SHARD_FAILED, e)
+            raise
+
+        finally:
+            for _, future in pending:
+                future.cancel()
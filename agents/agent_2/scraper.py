@@ -7,10 +7,11 @@ LED Range: 2510-2539
 
 import json
 import os
-import praw
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterable, Iterator, List
 from pathlib import Path
 
+from agents.agent_2.comment_harvester import RedditCommentHarvester
+
 
 class DataScraper:
     """Load and prepare review/comment data for demographic extraction"""
@@ -34,7 +35,9 @@ class DataScraper:
             agent1_output_path: Path to Agent 1's JSON output
 
         Returns:
-            Dict with reviews/comments organized by source
+            Dict with reviews/comments organized by source. 'reddit' is a
+            stream: threads are harvested as the extractor consumes it, so
+            total_data_points counts only the Amazon and YouTube data here
 
         Raises:
             FileNotFoundError: If Agent 1 output doesn't exist
@@ -63,28 +66,26 @@ class DataScraper:
 
         # Extract reviews/comments from Agent 1 data
         amazon_reviews = self._extract_amazon_reviews(agent1_data)
-        reddit_comments = self._extract_reddit_comments(agent1_data)
         youtube_comments = self._extract_youtube_comments(agent1_data)
+        reddit_threads = len(self._reddit_discussions(agent1_data))
+        # Lazy: nothing is fetched until extraction starts reading
+        reddit_comments = self.stream_reddit_comments(agent1_data)
 
-        total_data_points = len(amazon_reviews) + len(reddit_comments) + len(youtube_comments)
+        total_data_points = len(amazon_reviews) + len(youtube_comments)
 
         self.trail.light(2511, {
             "action": "agent1_data_loaded",
             "amazon_reviews": len(amazon_reviews),
-            "reddit_comments": len(reddit_comments),
+            "reddit_threads": reddit_threads,
             "youtube_comments": len(youtube_comments),
             "total_data_points": total_data_points
         })
 
         print(f"[OK] Loaded {total_data_points} data points from Agent 1")
         print(f"     Amazon: {len(amazon_reviews)} reviews")
-        print(f"     Reddit: {len(reddit_comments)} comments")
+        print(f"     Reddit: {reddit_threads} threads (comments harvested during extraction)")
         print(f"     YouTube: {len(youtube_comments)} comments")
 
-        if total_data_points < self.config.MIN_DATA_POINTS_REQUIRED:
-            print(f"[!] WARNING: Only {total_data_points} data points (minimum: {self.config.MIN_DATA_POINTS_REQUIRED})")
-            print(f"    This may result in low confidence scores")
-
         return {
             "amazon": amazon_reviews,
             "reddit": reddit_comments,
@@ -169,69 +170,43 @@ class DataScraper:
 
         return reviews
 
-    def _extract_reddit_comments(self, agent1_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _reddit_discussions(self, agent1_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Reddit discussion threads listed in Agent 1 data"""
+        discussions = agent1_data.get('discussion_urls', [])
+        return [d for d in discussions if d.get('platform') == 'reddit']
+
+    def stream_reddit_comments(self, agent1_data: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
         """
         Scrape actual Reddit comments from URLs provided by Agent 1
 
-        Agent 1 provides discussion URLs and comment counts.
-        Agent 2 scrapes the actual comment text for demographic analysis.
-        """
-        comments = []
+        Agent 1 provides discussion URLs and comment counts; comments are
+        yielded as each discussion thread finishes loading. Threads are fetched
+        concurrently by RedditCommentHarvester, but comments arrive in
+        discussion order, so the result matches a sequential scrape.
 
-        # Get Reddit discussions from Agent 1
-        discussions = agent1_data.get('discussion_urls', [])
-        reddit_discussions = [d for d in discussions if d.get('platform') == 'reddit']
+        The Reddit client is created here, so bad credentials fail now rather
+        than once extraction starts reading the stream.
+
+        Raises:
+            ValueError: If the Reddit client can't be initialized
+        """
+        reddit_discussions = self._reddit_discussions(agent1_data)
 
         if not reddit_discussions:
-            return comments
+            return iter(())
 
-        # Initialize Reddit API client
-        try:
-            reddit = praw.Reddit(
-                client_id=os.getenv('REDDIT_CLIENT_ID'),
-                client_secret=os.getenv('REDDIT_CLIENT_SECRET'),
-                user_agent=os.getenv('REDDIT_USER_AGENT', 'Purchase-Intent-Research/1.0')
-            )
-        except Exception as e:
-            raise ValueError(f"Failed to initialize Reddit client: {str(e)}\nCheck REDDIT_CLIENT_ID and REDDIT_CLIENT_SECRET in .env")
-
-        # Scrape comments from each discussion
-        for discussion in reddit_discussions[:self.config.MAX_REDDIT_DISCUSSIONS]:
-            url = discussion.get('url', '')
-            if not url:
-                continue
-
-            try:
-                # Extract submission ID from URL
-                submission_id = url.split('/comments/')[1].split('/')[0] if '/comments/' in url else None
-                if not submission_id:
-                    continue
-
-                # Fetch submission
-                submission = reddit.submission(id=submission_id)
-                submission.comments.replace_more(limit=0)  # Don't fetch "load more" comments
-
-                # Get top comments
-                for comment in submission.comments.list()[:self.config.MAX_REDDIT_COMMENTS_PER_THREAD]:
-                    if hasattr(comment, 'body') and comment.body and len(comment.body) > 20:
-                        comments.append({
-                            "id": f"reddit_{len(comments)}",
-                            "text": comment.body,
-                            "source": "reddit",
-                            "thread": url,
-                            "score": comment.score if hasattr(comment, 'score') else 0
-                        })
-
-            except Exception as e:
-                # Skip this discussion if scraping fails (don't fail entire pipeline)
-                self.trail.light(self.config.LED_SCRAPE_START, {
-                    "warning": "reddit_scrape_failed",
-                    "url": url,
-                    "error": str(e)
-                })
-                continue
+        harvester = RedditCommentHarvester(
+            self.trail,
+            self.config,
+            replay_path=self.config.REDDIT_REPLAY_PATH,
+            record_path=self.config.REDDIT_RECORD_PATH
+        )
+        harvester.connect()
 
-        return comments
+        return (
+            {"id": f"reddit_{index}", **comment}
+            for index, comment in enumerate(harvester.harvest(reddit_discussions))
+        )
 
     def _extract_youtube_comments(self, agent1_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Extract YouTube comments from Agent 1 data"""
@@ -253,15 +228,15 @@ class DataScraper:
 
         return comments
 
-    def prepare_source_datasets(self, all_data: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+    def prepare_source_datasets(self, all_data: Dict[str, Any]) -> Dict[str, Iterable[Dict[str, Any]]]:
         """
         Prepare separate datasets for each source
 
         Args:
-            all_data: Dict with amazon, reddit, youtube lists
+            all_data: Dict with amazon, reddit, youtube lists (or streams)
 
         Returns:
-            Dict with source name -> list of reviews/comments
+            Dict with source name -> list (or stream) of reviews/comments
         """
         return {
             "amazon": all_data.get('amazon', []),
@@ -0,0 +1,88 @@
+"""
+Agent 2 Reddit Comment Harvester Test
+Harvests the offline replay fixture and checks comment counts and order
+
+Run with: python agents/agent_2/test_comment_harvester.py
+"""
+
+import sys
+import os
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from lib.breadcrumb_system import BreadcrumbTrail
+from agents.agent_2.comment_harvester import RedditCommentHarvester
+from agents.agent_2.config import Agent2Config
+
+FIXTURE = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../tests/fixtures/reddit_replay.json'))
+
+DISCUSSIONS = [
+    {"platform": "reddit", "url": "https://www.reddit.com/r/productivity/comments/1abc23/time_blocking/"},
+    {"platform": "reddit", "url": "https://www.reddit.com/r/productivity/comments/2def45/burnout/"},
+]
+
+
+def harvest(more_limit: int = 0, workers: int = 4) -> list:
+    """Harvest the replay fixture with the given limits"""
+    class Config(Agent2Config):
+        REDDIT_MORE_COMMENTS_LIMIT = more_limit
+        REDDIT_HARVEST_WORKERS = workers
+        MAX_REDDIT_COMMENTS_PER_THREAD = 50
+        MAX_REDDIT_DISCUSSIONS = 10
+
+    harvester = RedditCommentHarvester(BreadcrumbTrail("Agent2_HarvesterTest"), Config, replay_path=FIXTURE)
+    return list(harvester.harvest(DISCUSSIONS))
+
+
+def test_first_page_only():
+    """Default MORE_LIMIT=0 keeps the usable first-page comments"""
+    print("Testing first-page harvest...")
+    comments = harvest()
+    assert len(comments) == 5, f"expected 5 comments, got {len(comments)}"
+    assert [c['thread'] for c in comments] == [DISCUSSIONS[0]['url']] * 3 + [DISCUSSIONS[1]['url']] * 2
+    assert all(len(c['text']) > 20 for c in comments)
+    print("✅ 5 usable comments from the first page of each thread")
+
+
+def test_more_comments_expansion():
+    """MORE_LIMIT=5 expands every stub (nested ones too) without duplicates"""
+    print("\nTesting 'more comments' expansion...")
+    comments = harvest(more_limit=5)
+    assert len(comments) == 11, f"expected 11 comments, got {len(comments)}"
+    texts = [c['text'] for c in comments]
+    assert len(set(texts)) == len(texts), "duplicate comment harvested"
+    print("✅ 11 comments with 'more comments' stubs expanded")
+
+
+def test_worker_count_keeps_order():
+    """Concurrent and sequential harvests yield the same comments in the same order"""
+    print("\nTesting order across worker counts...")
+    assert harvest(more_limit=5, workers=1) == harvest(more_limit=5, workers=4)
+    print("✅ Comments arrive in discussion order regardless of workers")
+
+
+def main():
+    """Run all harvester tests"""
+    print("=" * 80)
+    print("AGENT 2 REDDIT COMMENT HARVESTER TESTS")
+    print("=" * 80)
+
+    results = []
+    for test in (test_first_page_only, test_more_comments_expansion, test_worker_count_keeps_order):
+        try:
+            test()
+            results.append(True)
+        except AssertionError as e:
+            print(f"❌ {test.__name__}: {e}")
+            results.append(False)
+
+    print("\n" + "=" * 80)
+    print("TEST SUMMARY")
+    print("=" * 80)
+    print(f"Tests passed: {sum(results)}/{len(results)}")
+    return 0 if all(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+"""
+Purchase Intent System - Breadcrumb Logging Benchmark
+
+Measures LEDs/sec with the synchronous log sink (open/append/close per LED)
+against the buffered background writer, and fails if the two logs differ.
+Payloads share a list and a dict that are mutated in place between LEDs, so
+the check also catches a log that records payloads as they look at flush
+time instead of when the LED was lit. Console output is discarded so the
+numbers reflect logging cost.
+
+Two rates are reported: "light()" is what the calling code sees (the buffered
+writer does the file I/O off the hot path), "end-to-end" includes the final
+flush, i.e. total logging work. On a single core the GIL keeps the two close;
+the buffered writer mainly saves one open/close per LED.
+
+Usage:
+    python lib/benchmark_breadcrumbs.py
+    python lib/benchmark_breadcrumbs.py --leds 20000 100000
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from lib import breadcrumb_system
+from lib.breadcrumb_system import BreadcrumbTrail
+
+
+def light_leds(trail: BreadcrumbTrail, count: int) -> None:
+    """Payloads shaped like the agents' hot-loop LEDs (recent/totals mutate between LEDs)"""
+    recent = []
+    totals = {"purchase": 0}
+    for i in range(count):
+        recent.append(i)
+        if len(recent) > 5:
+            recent.pop(0)
+        totals["purchase"] += i % 7
+        if i % 100 == 0:
+            totals[f"batch_{i // 100}"] = i
+        trail.light(520 + i % 10, {
+            "action": "post_analyzed",
+            "keyword": f"topic {i % 50}",
+            "posts_analyzed": i,
+            "signals": {"purchase": i % 7, "questions": i % 3},
+            "recent": recent,
+            "totals": totals,
+            "url": f"https://reddit.com/r/books/comments/{i:06x}"
+        })
+
+
+def run_mode(mode: str, count: int, log_path: Path) -> tuple:
+    """(light() LEDs/sec, end-to-end LEDs/sec including the final flush) for one log mode"""
+    breadcrumb_system.LOG_MODE = mode
+    BreadcrumbTrail._log_file = log_path
+    trail = BreadcrumbTrail(f"Benchmark_{mode}")
+
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        light_leds(trail, count)
+        light_seconds = time.perf_counter() - start
+        BreadcrumbTrail.flush_logs()
+        total_seconds = time.perf_counter() - start
+
+    BreadcrumbTrail.clear()
+    return count / light_seconds, count / total_seconds
+
+
+def log_records(path: Path) -> List[Dict]:
+    """Log records without per-run fields (timestamps, component name)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        records = [json.loads(line) for line in f]
+    for record in records:
+        for field in ('timestamp', 'iso_timestamp', 'component'):
+            record.pop(field)
+    return records
+
+
+def run_benchmark(sizes: List[int]) -> Dict:
+    results = {}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            sync_path = Path(tmp) / f"sync_{size}.jsonl"
+            buffered_path = Path(tmp) / f"buffered_{size}.jsonl"
+
+            sync_light, sync_total = run_mode('sync', size, sync_path)
+            buffered_light, buffered_total = run_mode('buffered', size, buffered_path)
+
+            if log_records(sync_path) != log_records(buffered_path):
+                raise ValueError(f"Buffered log differs from synchronous log at {size} LEDs")
+
+            results[size] = {
+                "leds": size,
+                "sync_leds_per_sec": round(sync_total),
+                "buffered_light_leds_per_sec": round(buffered_light),
+                "buffered_leds_per_sec": round(buffered_total),
+                "light_speedup": round(buffered_light / sync_light, 2),
+                "speedup": round(buffered_total / sync_total, 2)
+            }
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark synchronous vs buffered breadcrumb logging")
+    parser.add_argument('--leds', type=int, nargs='+', default=[10000, 50000],
+                        help='LED counts to benchmark (default: 10000 50000)')
+    args = parser.parse_args()
+
+    results = run_benchmark(args.leds)
+
+    print(f"\n{'='*78}")
+    print("BREADCRUMB LOGGING BENCHMARK (LEDs/sec)")
+    print(f"{'='*78}")
+    print(f"{'LEDs':>10} {'Sync':>10} {'Buffered light()':>17} {'Buffered end-to-end':>20} {'light()':>8} {'E2E':>7}")
+    for row in results.values():
+        print(
+            f"{row['leds']:>10,} {row['sync_leds_per_sec']:>10,} "
+            f"{row['buffered_light_leds_per_sec']:>17,} {row['buffered_leds_per_sec']:>20,} "
+            f"{row['light_speedup']:>7}x {row['speedup']:>6}x"
+        )
+    print("\n✅ Buffered log identical to synchronous log")
+
+
+if __name__ == "__main__":
+    main()
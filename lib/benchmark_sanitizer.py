@@ -0,0 +1,172 @@
+"""
+Purchase Intent System - Breadcrumb Sanitizer Benchmark
+
+Compares BreadcrumbTrail's sanitizer (literal-prefix prefilter, combined
+precompiled regex, memoized key checks, one-pass scan of string lists) against
+the original pattern-by-pattern implementation on large LED payloads, and
+fails if they redact differently.
+
+Usage:
+    python lib/benchmark_sanitizer.py
+    python lib/benchmark_sanitizer.py --sizes 1000 100000 --seed 7
+"""
+
+import argparse
+import os
+import random
+import re
+import string
+import sys
+import time
+from typing import Any, Dict, List
+
+# Add project root to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from lib.breadcrumb_system import BreadcrumbTrail, SECRET_VALUE_PATTERNS, SENSITIVE_KEY_PATTERNS
+
+
+class LegacySanitizer:
+    """The original sanitizer, kept as the reference for parity checks"""
+
+    def sanitize_value(self, value: Any) -> Any:
+        if value is None:
+            return value
+        if isinstance(value, dict):
+            return self.sanitize_data(value)
+        if isinstance(value, list):
+            return [self.sanitize_value(item) for item in value]
+        if isinstance(value, str):
+            for pattern in SECRET_VALUE_PATTERNS:
+                if re.search(pattern, value):
+                    return "***REDACTED_SECRET***"
+            if len(value) > 50 and ' ' not in value:
+                return "***REDACTED_LONG_STRING***"
+        return value
+
+    def sanitize_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        if not data:
+            return data
+        sanitized = {}
+        for key, value in data.items():
+            key_normalized = key.lower().replace('_', '').replace('-', '').replace(' ', '')
+            if any(pattern in key_normalized for pattern in SENSITIVE_KEY_PATTERNS):
+                sanitized[key] = "***REDACTED_API_KEY***"
+            else:
+                sanitized[key] = self.sanitize_value(value)
+        return sanitized
+
+    def sanitize_string(self, text: str) -> str:
+        if not text:
+            return text
+        for pattern in SECRET_VALUE_PATTERNS:
+            text = re.sub(pattern, '***REDACTED_SECRET***', text)
+        return text
+
+
+# Secrets and near-misses mixed into generated strings
+SECRET_SAMPLES = [
+    "AIzaSyDemoKey12345678901234567890123",
+    "sk-" + "a1B2" * 12,
+    "Bearer abc.def.ghi",
+    "xoxb-1234-abcd",
+    "ghp_" + "x9" * 18,
+    "AKIA" + "ABCDEFGHIJKLMNOP",
+    "A" * 40,
+    "xox-", "AKIA1234", "sk-short", "Bearer token", "ghp_abc",
+]
+
+WORDS = ["romance", "novels", "productivity", "books", "kindle", "self", "help", "budget", "apps", "2025"]
+
+
+def random_string(rng: random.Random) -> str:
+    roll = rng.random()
+    if roll < 0.05:
+        return rng.choice(SECRET_SAMPLES)
+    if roll < 0.10:
+        # Secret glued into surrounding text
+        return f"{rng.choice(WORDS)} {rng.choice(SECRET_SAMPLES)}{rng.choice(['', '.', ' end'])}"
+    if roll < 0.15:
+        return ''.join(rng.choice(string.ascii_letters + string.digits + '-_.') for _ in range(rng.randint(1, 70)))
+    if roll < 0.20:
+        return f"https://reddit.com/r/{rng.choice(WORDS)}/comments/{rng.getrandbits(40):x}"
+    return random_topic(rng)
+
+
+def random_topic(rng: random.Random) -> str:
+    return ' '.join(rng.choice(WORDS) for _ in range(rng.randint(1, 4)))
+
+
+def generate_payload(size: int, seed: int) -> Dict[str, Any]:
+    """One LED payload with a topic list, nested results and mixed scalars
+
+    (Key names containing "key" - e.g. "keywords" - are redacted wholesale, so
+    the large lists use other names to exercise value scanning.)
+    """
+    rng = random.Random(seed)
+    return {
+        "action": "keywords_collected",
+        "topics": [random_topic(rng) for _ in range(size)],
+        "samples": [random_string(rng) for _ in range(size // 10)],
+        "results": [
+            {"topic": random_string(rng), "score": rng.random() * 100, "rank": i, "cached": i % 2 == 0,
+             "api_key" if i % 97 == 0 else "source": random_string(rng)}
+            for i in range(size // 10)
+        ],
+        "count": size,
+        "error_message": random_string(rng)
+    }
+
+
+def run_benchmark(sizes: List[int], seed: int) -> Dict:
+    trail = BreadcrumbTrail("SanitizerBenchmark")
+    legacy = LegacySanitizer()
+    results = {}
+
+    for size in sizes:
+        payload = generate_payload(size, seed)
+        strings = [random_string(random.Random(seed + i)) for i in range(min(size, 5000))]
+
+        start = time.perf_counter()
+        fast = trail._sanitize_data(payload)
+        fast_strings = [trail._sanitize_string(text) for text in strings]
+        fast_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        slow = legacy.sanitize_data(payload)
+        slow_strings = [legacy.sanitize_string(text) for text in strings]
+        slow_seconds = time.perf_counter() - start
+
+        if fast != slow or fast_strings != slow_strings:
+            raise ValueError(f"Sanitizer output differs from legacy at {size} items (seed {seed})")
+
+        results[size] = {
+            "items": size,
+            "legacy_ms": round(slow_seconds * 1000, 1),
+            "sanitizer_ms": round(fast_seconds * 1000, 1),
+            "speedup": round(slow_seconds / fast_seconds, 1)
+        }
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the breadcrumb secret sanitizer")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000],
+                        help='Topic-list sizes to benchmark (default: 1000 10000 100000)')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed for synthetic payloads')
+    args = parser.parse_args()
+
+    results = run_benchmark(args.sizes, args.seed)
+
+    print(f"\n{'='*60}")
+    print("BREADCRUMB SANITIZER BENCHMARK")
+    print(f"{'='*60}")
+    print(f"{'Items':>10} {'Legacy':>12} {'Sanitizer':>12} {'Speedup':>9}")
+    for row in results.values():
+        print(f"{row['items']:>10,} {row['legacy_ms']:>10}ms {row['sanitizer_ms']:>10}ms {row['speedup']:>8}x")
+    print("\n✅ Sanitizer output identical to legacy")
+
+
+if __name__ == "__main__":
+    main()
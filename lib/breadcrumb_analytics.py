@@ -0,0 +1,489 @@
+"""
+Purchase Intent System - Breadcrumb Log Analytics
+
+Offline queries over logs/breadcrumbs.jsonl (every process's LEDs, not just
+the current one's in-memory trail).
+
+The log is indexed incrementally into a compact SQLite store: each segment's
+byte offset is remembered, so every run only parses lines appended since the
+last one. Each indexed LED keeps its segment and offset, so the full record
+(data, stack) can be read back without scanning. Queries then run against
+the index:
+
+    failures   failure rate by LED range
+    stages     p50/p95 stage durations from span_end LEDs (trail.span)
+    cache      cache hit rate per source (cache_hit vs cache_miss/cache_expired)
+    runs       agent runs per day (agent_N_started LEDs)
+
+Rotation: once the active log passes BREADCRUMB_LOG_ROTATE_MB it is renamed
+to breadcrumbs.<timestamp>.jsonl (the buffered writer reopens the path), and
+rotated segments older than the grace period are gzip-compressed. Both happen
+automatically whenever the index is updated.
+
+Usage:
+    python lib/breadcrumb_analytics.py report
+    python lib/breadcrumb_analytics.py failures --width 10 --since 7d
+    python lib/breadcrumb_analytics.py stages --since 24h
+    python lib/breadcrumb_analytics.py cache
+    python lib/breadcrumb_analytics.py runs
+    python lib/breadcrumb_analytics.py record --failed --limit 5
+    python lib/breadcrumb_analytics.py rotate     # rotate now, compress idle segments
+"""
+
+import argparse
+import gzip
+import json
+import math
+import os
+import re
+import shutil
+import sqlite3
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+DEFAULT_LOG_PATH = Path(__file__).parent.parent / "logs" / "breadcrumbs.jsonl"
+ROTATE_MB = float(os.getenv('BREADCRUMB_LOG_ROTATE_MB', '50'))  # Rotate the active log past this size (0 = never)
+ROTATE_GRACE_SECONDS = float(os.getenv('BREADCRUMB_LOG_ROTATE_GRACE', '300'))  # Compress segments idle this long
+
+READ_CHUNK_BYTES = 8 * 1024 * 1024
+MAX_ERROR_CHARS = 500  # Error text kept in the index (the full record stays in the log)
+
+CACHE_HIT_ACTIONS = ('cache_hit',)
+CACHE_MISS_ACTIONS = ('cache_miss', 'cache_expired')
+RUN_START_ACTION = re.compile(r'^agent_\d+_started$')
+
+
+class BreadcrumbIndex:
+    """Incremental SQLite index over a breadcrumb JSON Lines log and its rotated segments"""
+
+    def __init__(self, log_path: Optional[str] = None, index_path: Optional[str] = None):
+        """
+        Initialize index
+
+        Args:
+            log_path: Active JSON Lines log (default: logs/breadcrumbs.jsonl)
+            index_path: SQLite index file (default: <log dir>/breadcrumbs.index.db)
+        """
+        self.log_path = Path(log_path) if log_path else DEFAULT_LOG_PATH
+        self.index_path = Path(index_path) if index_path else self.log_path.with_name(
+            f"{self.log_path.stem}.index.db"
+        )
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(str(self.index_path), timeout=10)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._init_db()
+
+    def close(self):
+        self._conn.close()
+
+    def __enter__(self) -> 'BreadcrumbIndex':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _init_db(self):
+        with self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS segments (
+                    segment_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name TEXT UNIQUE NOT NULL,
+                    offset INTEGER NOT NULL DEFAULT 0,
+                    compressed INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS leds (
+                    segment_id INTEGER NOT NULL,
+                    offset INTEGER NOT NULL,
+                    led_id INTEGER NOT NULL,
+                    component TEXT,
+                    timestamp REAL NOT NULL,
+                    success INTEGER NOT NULL,
+                    action TEXT,
+                    span TEXT,
+                    wall_seconds REAL,
+                    source TEXT,
+                    error TEXT
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_leds_led_id ON leds(led_id)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_leds_timestamp ON leds(timestamp)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_leds_action ON leds(action)")
+
+    # ------------------------------------------------------------------
+    # Indexing
+    # ------------------------------------------------------------------
+
+    def segment_paths(self) -> List[Path]:
+        """Rotated segments (oldest first), then the active log"""
+        rotated = sorted(self.log_path.parent.glob(f"{self.log_path.stem}.*.jsonl*"))
+        return rotated + ([self.log_path] if self.log_path.exists() else [])
+
+    def update(self, rotate: bool = True, max_mb: float = ROTATE_MB,
+               grace_seconds: float = ROTATE_GRACE_SECONDS) -> int:
+        """
+        Index new lines in every segment, then rotate/compress if due
+
+        Returns:
+            Number of LEDs added to the index
+        """
+        added = sum(self._index_segment(path) for path in self.segment_paths())
+        if rotate:
+            self.rotate(max_mb=max_mb, grace_seconds=grace_seconds)
+        return added
+
+    def _segment(self, name: str) -> Tuple[int, int, int]:
+        """(segment_id, offset, compressed) for a segment, registering it if new"""
+        row = self._conn.execute(
+            "SELECT segment_id, offset, compressed FROM segments WHERE name = ?", (name,)
+        ).fetchone()
+        if row:
+            return row
+        with self._conn:
+            cursor = self._conn.execute("INSERT INTO segments (name) VALUES (?)", (name,))
+        return cursor.lastrowid, 0, 0
+
+    def _index_segment(self, path: Path) -> int:
+        segment_id, offset, compressed = self._segment(path.name)
+        if compressed:
+            return 0  # Fully indexed before it was compressed
+
+        is_gzip = path.suffix == '.gz'
+        if not is_gzip and path.stat().st_size < offset:
+            # Truncated or replaced outside our rotation - start over
+            with self._conn:
+                self._conn.execute("DELETE FROM leds WHERE segment_id = ?", (segment_id,))
+            offset = 0
+
+        rows = []
+        added = 0
+        for line_offset, line in _read_lines(path, offset):
+            record = _parse_line(line)
+            if record is not None:
+                rows.append((segment_id, line_offset, *record))
+            offset = line_offset + len(line)
+
+            if len(rows) >= 10000:
+                added += self._insert(rows, segment_id, offset)
+                rows = []
+
+        added += self._insert(rows, segment_id, offset, compressed=is_gzip)
+        return added
+
+    def _insert(self, rows: List[Tuple], segment_id: int, offset: int, compressed: bool = False) -> int:
+        """Insert rows and advance the segment offset in one transaction"""
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO leds (segment_id, offset, led_id, component, timestamp, success, "
+                "action, span, wall_seconds, source, error) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            self._conn.execute(
+                "UPDATE segments SET offset = ?, compressed = ? WHERE segment_id = ?",
+                (offset, int(compressed), segment_id)
+            )
+        return len(rows)
+
+    # ------------------------------------------------------------------
+    # Rotation
+    # ------------------------------------------------------------------
+
+    def rotate(self, max_mb: float = ROTATE_MB, grace_seconds: float = ROTATE_GRACE_SECONDS,
+               force: bool = False) -> Dict[str, Any]:
+        """
+        Rotate the active log if it is too large, and compress idle segments
+
+        Lines a running agent writes to the renamed file before it notices the
+        rotation are indexed on the next update; segments are only compressed
+        once they have been idle for grace_seconds (and are fully indexed first).
+
+        Returns:
+            Dict with rotated (new segment name or None) and compressed (names)
+        """
+        result = {"rotated": None, "compressed": []}
+
+        if self.log_path.exists() and (force or (max_mb and self.log_path.stat().st_size >= max_mb * 1024 * 1024)):
+            self._index_segment(self.log_path)
+            rotated_name = self._rotated_name()
+            try:
+                os.replace(self.log_path, self.log_path.with_name(rotated_name))
+                with self._conn:
+                    self._conn.execute("UPDATE segments SET name = ? WHERE name = ?", (rotated_name, self.log_path.name))
+                result["rotated"] = rotated_name
+            except OSError:
+                pass  # Log held open (Windows) - try again next update
+
+        now = time.time()
+        for path in self.segment_paths():
+            if path == self.log_path or path.suffix == '.gz' or now - path.stat().st_mtime < grace_seconds:
+                continue
+            self._index_segment(path)
+            gz_path = path.with_name(path.name + '.gz')
+            with open(path, 'rb') as src, gzip.open(gz_path, 'wb') as dst:
+                shutil.copyfileobj(src, dst)
+            with self._conn:
+                self._conn.execute(
+                    "UPDATE segments SET name = ?, compressed = 1 WHERE name = ?", (gz_path.name, path.name)
+                )
+            path.unlink()
+            result["compressed"].append(gz_path.name)
+
+        return result
+
+    def _rotated_name(self) -> str:
+        """
+        Unused segment name for the active log
+
+        Microsecond timestamps keep two rotations in the same second apart
+        (os.replace would overwrite the first) and still sort oldest first.
+        """
+        while True:
+            name = f"{self.log_path.stem}.{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}.jsonl"
+            taken = self._conn.execute(
+                "SELECT 1 FROM segments WHERE name IN (?, ?)", (name, f"{name}.gz")
+            ).fetchone()
+            if not taken and not self.log_path.with_name(name).exists():
+                return name
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def failure_rates(self, width: int = 100, since: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Failure rate per LED range (ranges of `width` LEDs, e.g. 500-599)"""
+        rows = self._conn.execute(
+            "SELECT (led_id / ?) * ? AS range_start, COUNT(*), SUM(success = 0) FROM leds "
+            "WHERE timestamp >= ? GROUP BY range_start ORDER BY range_start",
+            (width, width, since or 0)
+        ).fetchall()
+        return [
+            {
+                "range": f"{start}-{start + width - 1}",
+                "leds": total,
+                "failures": failures,
+                "failure_rate": round(failures / total, 4)
+            }
+            for start, total, failures in rows
+        ]
+
+    def stage_durations(self, since: Optional[float] = None) -> List[Dict[str, Any]]:
+        """p50/p95/max wall seconds per span path (from span_end LEDs)"""
+        durations: Dict[str, List[float]] = {}
+        for span, wall in self._conn.execute(
+            "SELECT span, wall_seconds FROM leds WHERE action = 'span_end' AND timestamp >= ? "
+            "AND wall_seconds IS NOT NULL ORDER BY span, wall_seconds",
+            (since or 0,)
+        ):
+            durations.setdefault(span, []).append(wall)
+
+        return [
+            {
+                "span": span,
+                "count": len(walls),
+                "p50_seconds": _percentile(walls, 0.50),
+                "p95_seconds": _percentile(walls, 0.95),
+                "max_seconds": walls[-1],
+                "total_seconds": round(sum(walls), 4)
+            }
+            for span, walls in durations.items()
+        ]
+
+    def cache_hit_rates(self, since: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Cache hit rate per source (the LED's source/cache_source, else component:LED)"""
+        placeholders = ','.join('?' * (len(CACHE_HIT_ACTIONS) + len(CACHE_MISS_ACTIONS)))
+        rows = self._conn.execute(
+            f"SELECT source, SUM(action IN ({','.join('?' * len(CACHE_HIT_ACTIONS))})), COUNT(*) FROM leds "
+            f"WHERE action IN ({placeholders}) AND timestamp >= ? GROUP BY source ORDER BY source",
+            (*CACHE_HIT_ACTIONS, *CACHE_HIT_ACTIONS, *CACHE_MISS_ACTIONS, since or 0)
+        ).fetchall()
+        return [
+            {"source": source, "hits": hits, "misses": total - hits, "hit_rate": round(hits / total, 4)}
+            for source, hits, total in rows
+        ]
+
+    def runs_per_day(self, since: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Agent runs per local day and component (agent_N_started LEDs)"""
+        rows = self._conn.execute(
+            "SELECT date(timestamp, 'unixepoch', 'localtime') AS day, component, action, COUNT(*) FROM leds "
+            "WHERE action LIKE 'agent%started' AND timestamp >= ? GROUP BY day, component, action ORDER BY day, component",
+            (since or 0,)
+        ).fetchall()
+        return [
+            {"day": day, "component": component, "runs": runs}
+            for day, component, action, runs in rows
+            if RUN_START_ACTION.match(action)
+        ]
+
+    def records(self, led_start: Optional[int] = None, led_end: Optional[int] = None,
+                failed_only: bool = False, since: Optional[float] = None,
+                limit: int = 20) -> List[Dict[str, Any]]:
+        """Most recent full log records matching the filters (read back by offset)"""
+        clauses = ["timestamp >= ?"]
+        params: List[Any] = [since or 0]
+        if led_start is not None:
+            clauses.append("led_id >= ?")
+            params.append(led_start)
+        if led_end is not None:
+            clauses.append("led_id <= ?")
+            params.append(led_end)
+        if failed_only:
+            clauses.append("success = 0")
+
+        rows = self._conn.execute(
+            "SELECT segments.name, leds.offset FROM leds JOIN segments USING (segment_id) "
+            f"WHERE {' AND '.join(clauses)} ORDER BY timestamp DESC LIMIT ?",
+            (*params, limit)
+        ).fetchall()
+        return [self.read_record(name, offset) for name, offset in rows]
+
+    def read_record(self, segment_name: str, offset: int) -> Dict[str, Any]:
+        """
+        Read one full log record by segment and offset
+
+        Raises:
+            FileNotFoundError: If the segment no longer exists
+        """
+        path = self.log_path.with_name(segment_name)
+        opener = gzip.open if path.suffix == '.gz' else open
+        with opener(path, 'rb') as f:
+            f.seek(offset)
+            return json.loads(f.readline())
+
+
+def _read_lines(path: Path, offset: int) -> Iterator[Tuple[int, bytes]]:
+    """Yield (offset, line) for complete lines from offset on (a partial last line is left for later)"""
+    opener = gzip.open if path.suffix == '.gz' else open
+    with opener(path, 'rb') as f:
+        f.seek(offset)
+        buffer = b''
+        position = offset
+        while True:
+            chunk = f.read(READ_CHUNK_BYTES)
+            if not chunk:
+                return
+            buffer += chunk
+            end = buffer.rfind(b'\n') + 1
+            for line in buffer[:end].splitlines(keepends=True):
+                yield position, line
+                position += len(line)
+            buffer = buffer[end:]
+
+
+def _parse_line(line: bytes) -> Optional[Tuple]:
+    """Index columns for one log line (None for blank or corrupt lines)"""
+    try:
+        record = json.loads(line)
+        led_id = int(record['id'])
+        timestamp = float(record['timestamp'])
+    except (ValueError, KeyError, TypeError):
+        return None
+
+    data = record.get('data') if isinstance(record.get('data'), dict) else {}
+    action = data.get('action')
+    wall = data.get('wall_seconds')
+    source = data.get('source') or data.get('cache_source') or f"{record.get('component')}:{led_id}"
+    error = record.get('error')
+
+    return (
+        led_id,
+        record.get('component'),
+        timestamp,
+        1 if record.get('success') else 0,
+        action if isinstance(action, str) else None,
+        data.get('span') if isinstance(data.get('span'), str) else None,
+        float(wall) if isinstance(wall, (int, float)) else None,
+        str(source),
+        error[:MAX_ERROR_CHARS] if isinstance(error, str) else None
+    )
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of an ascending list"""
+    return sorted_values[max(0, math.ceil(q * len(sorted_values)) - 1)]
+
+
+def parse_since(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a --since value: "7d", "24h", "30m" (relative) or "2025-10-01" (date)
+
+    Raises:
+        ValueError: If the value matches neither form
+    """
+    if not value:
+        return None
+    match = re.fullmatch(r'(\d+(?:\.\d+)?)([dhm])', value.strip())
+    if match:
+        seconds = float(match.group(1)) * {'d': 86400, 'h': 3600, 'm': 60}[match.group(2)]
+        return time.time() - seconds
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        raise ValueError(f"Invalid --since '{value}' (expected e.g. 7d, 24h, 30m or 2025-10-01)")
+
+
+def _print_table(title: str, rows: List[Dict[str, Any]]):
+    print(f"\n{'='*78}\n{title}\n{'='*78}")
+    if not rows:
+        print("  (no matching LEDs)")
+        return
+    columns = list(rows[0])
+    widths = [max(len(column), *(len(str(row[column])) for row in rows)) for column in columns]
+    print("  ".join(column.ljust(width) for column, width in zip(columns, widths)))
+    for row in rows:
+        print("  ".join(str(row[column]).ljust(width) for column, width in zip(columns, widths)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query the breadcrumb JSON Lines log through an incremental index")
+    parser.add_argument('command', choices=['report', 'index', 'failures', 'stages', 'cache', 'runs', 'record', 'rotate'])
+    parser.add_argument('--log', help=f'Active log file (default: {DEFAULT_LOG_PATH})')
+    parser.add_argument('--index', help='Index database (default: <log dir>/breadcrumbs.index.db)')
+    parser.add_argument('--since', help='Only LEDs since e.g. 7d, 24h, 30m or 2025-10-01')
+    parser.add_argument('--width', type=int, default=100, help='LED range width for failures (default: 100)')
+    parser.add_argument('--led', help='LED or range for record, e.g. 2541 or 2540-2559')
+    parser.add_argument('--failed', action='store_true', help='record: only failed LEDs')
+    parser.add_argument('--limit', type=int, default=20, help='record: most recent N (default: 20)')
+    parser.add_argument('--max-mb', type=float, default=ROTATE_MB, help='Rotate the active log past this size (0 = never)')
+    parser.add_argument('--grace', type=float, default=ROTATE_GRACE_SECONDS, help='Compress segments idle this many seconds')
+    parser.add_argument('--no-rotate', action='store_true', help='Index without rotating or compressing')
+    args = parser.parse_args()
+
+    if args.width < 1:
+        raise ValueError(f"--width must be at least 1 (got {args.width})")
+    since = parse_since(args.since)
+
+    with BreadcrumbIndex(args.log, args.index) as index:
+        if args.command == 'rotate':
+            index.update(rotate=False)
+            result = index.rotate(grace_seconds=args.grace, force=True)
+            print(f"Rotated: {result['rotated'] or '-'} | Compressed: {', '.join(result['compressed']) or '-'}")
+            return
+
+        added = index.update(rotate=not args.no_rotate, max_mb=args.max_mb, grace_seconds=args.grace)
+        print(f"Indexed {added} new LEDs from {index.log_path}")
+
+        if args.command in ('report', 'failures'):
+            _print_table(f"FAILURE RATE BY LED RANGE (width {args.width})", index.failure_rates(args.width, since))
+        if args.command in ('report', 'stages'):
+            _print_table("STAGE DURATIONS (span_end LEDs, seconds)", index.stage_durations(since))
+        if args.command in ('report', 'cache'):
+            _print_table("CACHE HIT RATE BY SOURCE", index.cache_hit_rates(since))
+        if args.command in ('report', 'runs'):
+            _print_table("RUNS PER DAY", index.runs_per_day(since))
+        if args.command == 'record':
+            start = end = None
+            if args.led:
+                start_text, _, end_text = args.led.partition('-')
+                start, end = int(start_text), int(end_text or start_text)
+            for record in index.records(start, end, failed_only=args.failed, since=since, limit=args.limit):
+                print(json.dumps(record))
+
+
+if __name__ == "__main__":
+    main()
@@ -5,30 +5,66 @@ Python implementation for autonomous debugging and monitoring
 Based on VoiceCoach V2 breadcrumb-system.ts pattern
 Optimized for CLI Python agents with JSON Lines logging
 
+Log lines are written by a background thread in batches (one open file, one
+write per batch) so lighting an LED never waits on disk. Failure records are
+flushed and fsynced before fail() returns, and everything still queued is
+flushed at exit. Set BREADCRUMB_LOG_MODE=sync to write each LED inline.
+
+Console output is filtered by level (BREADCRUMB_CONSOLE=all|failures|quiet,
+also per component), LED ranges and an optional per-LED rate limit; payloads
+are only serialized for the console when a line is actually printed.
+
+trail.span(led_id, name) times a stage (wall and CPU seconds) with start/end
+LEDs; nested spans roll up into a per-stage breakdown (print_span_breakdown).
+
+In-memory trails are bounded ring buffers (BREADCRUMB_MAX_TRAIL most recent
+LEDs, indexed by LED id) so long-running pipelines don't grow without limit.
+
 SECURITY: Auto-sanitizes API keys, tokens, and secrets before logging
 """
 
+import atexit
 import json
+import os
+import threading
 import time
 import traceback
 import re
-from dataclasses import dataclass, asdict
-from typing import Any, Dict, List, Optional, Callable
+from collections import deque
+from contextlib import ContextDecorator
+from contextvars import ContextVar
+from heapq import merge
+from functools import lru_cache
+from dataclasses import dataclass, fields
+from typing import Any, Dict, List, Optional, Callable, Tuple, Union
 from pathlib import Path
 from datetime import datetime
 
 
 @dataclass
 class Breadcrumb:
-    """Individual LED breadcrumb record"""
+    """
+    Individual LED breadcrumb record
+
+    Slots are declared by hand (dataclass(slots=True) needs Python 3.10+);
+    slotted fields can't have class-level defaults, so every field is passed.
+    """
+    __slots__ = ('id', 'name', 'component', 'timestamp', 'success', 'data', 'error', 'stack')
+
     id: int
     name: str
     component: str
     timestamp: float
     success: bool
-    data: Optional[Dict[str, Any]] = None
-    error: Optional[str] = None
-    stack: Optional[str] = None
+    data: Optional[Dict[str, Any]]
+    error: Optional[str]
+    stack: Optional[str]
+
+
+BREADCRUMB_FIELDS = tuple(field.name for field in fields(Breadcrumb))  # Log record order
+
+# LED payload: a dict, or a zero-argument callable building it (only called if the LED is recorded)
+Payload = Union[Dict[str, Any], Callable[[], Dict[str, Any]], None]
 
 
 @dataclass
@@ -39,6 +75,55 @@ class VerificationResult:
     validator: Optional[Callable[[Any], bool]] = None
 
 
+# Log sink settings ("buffered" = background writer thread, "sync" = write inline)
+LOG_MODE = os.getenv('BREADCRUMB_LOG_MODE', 'buffered').lower()
+LOG_BATCH_SIZE = int(os.getenv('BREADCRUMB_LOG_BATCH', '256'))  # Lines per write
+LOG_FLUSH_SECONDS = float(os.getenv('BREADCRUMB_LOG_FLUSH_SECONDS', '0.5'))  # Max delay before queued lines hit disk
+LOG_QUEUE_SIZE = int(os.getenv('BREADCRUMB_LOG_QUEUE', '10000'))  # Lighting thread writes inline past this backlog
+
+# Console verbosity: "all" prints every LED, "failures" only failed LEDs, "quiet" nothing
+CONSOLE_LEVELS = {'quiet': 0, 'failures': 1, 'all': 2}
+
+
+def _console_level(name: str) -> int:
+    """Numeric console level for a level name (FAIL LOUDLY on unknown names)"""
+    level = CONSOLE_LEVELS.get(name.strip().lower())
+    if level is None:
+        raise ValueError(f"Unknown breadcrumb console level '{name}' (expected one of: {', '.join(CONSOLE_LEVELS)})")
+    return level
+
+
+def _parse_led_ranges(spec: str) -> Tuple[Tuple[int, int], ...]:
+    """Parse "500-599,621" into ((500, 599), (621, 621))"""
+    ranges = []
+    for part in filter(None, (part.strip() for part in spec.split(','))):
+        start, _, end = part.partition('-')
+        try:
+            ranges.append((int(start), int(end or start)))
+        except ValueError:
+            raise ValueError(f"Invalid LED range '{part}' (expected e.g. '500-599' or '621')")
+    return tuple(ranges)
+
+
+def _in_ranges(led_id: int, ranges: Tuple[Tuple[int, int], ...]) -> bool:
+    return any(start <= led_id <= end for start, end in ranges)
+
+
+CONSOLE_LEVEL = _console_level(os.getenv('BREADCRUMB_CONSOLE', 'all'))  # Default for every component
+CONSOLE_RANGES = _parse_led_ranges(os.getenv('BREADCRUMB_CONSOLE_RANGES', ''))  # Only print these LEDs (empty = all)
+CONSOLE_MUTE = _parse_led_ranges(os.getenv('BREADCRUMB_CONSOLE_MUTE', ''))  # Never print these LEDs
+
+# Repetitive LEDs: at most RATE_LIMIT lights per LED per component every
+# RATE_WINDOW_SECONDS (0 = no limit). Extra lights are counted but not
+# recorded, then reported as one "suppressed N" breadcrumb. Failures are never limited.
+RATE_LIMIT = int(os.getenv('BREADCRUMB_RATE_LIMIT', '0'))
+RATE_WINDOW_SECONDS = float(os.getenv('BREADCRUMB_RATE_WINDOW', '1.0'))
+
+# In-memory trail bounds (0 = unbounded); quality counters still cover every LED
+TRAIL_MAX_SIZE = int(os.getenv('BREADCRUMB_MAX_TRAIL', '10000'))  # Most recent LEDs kept globally and per component
+FAILURES_MAX_SIZE = int(os.getenv('BREADCRUMB_MAX_FAILURES', '1000'))  # Most recent failures kept
+
+
 # SECURITY: Patterns that indicate sensitive data
 SENSITIVE_KEY_PATTERNS = [
     'api_key', 'apikey', 'api-key', 'key',
@@ -59,6 +144,326 @@ SECRET_VALUE_PATTERNS = [
     r'AKIA[0-9A-Z]{16}',  # AWS access keys
 ]
 
+# One pass instead of one re.search per pattern (any match = a secret)
+SECRET_VALUE_REGEX = re.compile('|'.join(f'(?:{pattern})' for pattern in SECRET_VALUE_PATTERNS))
+SECRET_VALUE_REGEXES = [re.compile(pattern) for pattern in SECRET_VALUE_PATTERNS]
+
+# Cheap prefilter: a secret needs one of the patterns' literal prefixes ("AIza",
+# "sk-", ...) or a run of UNPREFIXED_SECRET_LENGTH alphanumerics (the generic
+# token pattern). Substring checks and one bytes.translate are far cheaper than
+# the regex on long text; only strings that pass it are searched.
+SECRET_PREFIXES = tuple(
+    prefix.group() for prefix in
+    (re.match(r'[A-Za-z0-9_-]+', pattern) for pattern in SECRET_VALUE_PATTERNS) if prefix
+)
+UNPREFIXED_SECRET_LENGTH = 40  # Generic [A-Za-z0-9]{40} tokens
+if [p for p in SECRET_VALUE_PATTERNS if not re.match(r'[A-Za-z0-9_-]+', p)] != [r'[A-Za-z0-9]{40}']:
+    raise ValueError("SECRET_VALUE_PATTERNS changed - update the sanitizer prefilter (_may_contain_secret)")
+
+# Maps ASCII alphanumerics to 'a' and every other byte to ' ' (non-ASCII UTF-8
+# bytes are >= 0x80, so multi-byte characters never count as alphanumerics)
+_ALNUM_TABLE = bytes(ord('a') if chr(i).isascii() and chr(i).isalnum() else ord(' ') for i in range(256))
+_ALNUM_RUN = b'a' * UNPREFIXED_SECRET_LENGTH
+
+# Shortest string any pattern can match ("xoxb-1"); shorter strings skip the regex
+MIN_SECRET_LENGTH = 6
+LONG_STRING_LENGTH = 50  # Longer strings with no spaces are treated as tokens
+
+# Lists of strings are prefiltered in one pass, joined by NUL - no pattern can
+# match across it, so a clean joined string means every item is clean
+LIST_SEPARATOR = '\x00'
+
+# Optional caps for very large payloads (0 = log everything)
+LOG_MAX_STRING = int(os.getenv('BREADCRUMB_LOG_MAX_STRING', '0'))  # Characters kept per string
+LOG_MAX_LIST_ITEMS = int(os.getenv('BREADCRUMB_LOG_MAX_LIST_ITEMS', '0'))  # Items kept per list
+
+
+@lru_cache(maxsize=4096)
+def _is_sensitive_key(key: str) -> bool:
+    """True if a payload key name indicates sensitive data (LED payloads reuse a few key names)"""
+    # Normalize key for comparison (lowercase, no separators)
+    key_normalized = key.lower().replace('_', '').replace('-', '').replace(' ', '')
+    return any(pattern in key_normalized for pattern in SENSITIVE_KEY_PATTERNS)
+
+
+def _may_contain_secret(text: str) -> bool:
+    """False if no SECRET_VALUE_PATTERNS match is possible in text (no false negatives)"""
+    for prefix in SECRET_PREFIXES:
+        if prefix in text:
+            return True
+    if len(text) < UNPREFIXED_SECRET_LENGTH:
+        return False
+    return _ALNUM_RUN in text.encode('utf-8', 'surrogatepass').translate(_ALNUM_TABLE)
+
+
+class _LogWriter:
+    """
+    Background JSON Lines writer for one log file
+
+    Lines arrive already sanitized and serialized - the lighting thread
+    formats them, so each record captures its payload as it was when the LED
+    was lit - and the writer thread only does the file I/O. It wakes when a
+    batch fills or every flush interval. The queue
+    is bounded: once it holds max_queue records the lighting thread writes the
+    backlog itself instead of letting memory grow. If the log is rotated
+    away, the next batch reopens the path.
+    """
+
+    def __init__(self, path: Path, batch_size: int = LOG_BATCH_SIZE,
+                 flush_seconds: float = LOG_FLUSH_SECONDS, max_queue: int = LOG_QUEUE_SIZE):
+        self.path = path
+        self.batch_size = max(1, batch_size)
+        self.flush_seconds = flush_seconds
+        self.max_queue = max(self.batch_size, max_queue)
+
+        self._pending = deque()
+        self._wake = threading.Event()
+        self._write_lock = threading.Lock()
+        self._file = None
+        self._thread = threading.Thread(target=self._run, name=f"breadcrumb-writer-{path.name}", daemon=True)
+        self._thread.start()
+
+    def submit(self, line: str) -> None:
+        self._pending.append(line)
+        backlog = len(self._pending)
+        if backlog >= self.max_queue:
+            self.flush()
+        elif backlog >= self.batch_size:
+            self._wake.set()
+
+    def flush(self, durable: bool = False) -> None:
+        """Write every queued record now (and fsync if durable)"""
+        with self._write_lock:
+            self._write_pending()
+            if durable and self._file is not None:
+                try:
+                    os.fsync(self._file.fileno())
+                except OSError:
+                    pass
+
+    def close(self) -> None:
+        with self._write_lock:
+            self._write_pending()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self.flush_seconds)
+            self._wake.clear()
+            if self._pending:
+                with self._write_lock:
+                    self._write_pending()
+
+    def _write_pending(self) -> None:
+        """Drain the queue into one write (write lock held)"""
+        lines = []
+        while self._pending:
+            lines.append(self._pending.popleft())
+
+        if not lines:
+            return
+
+        try:
+            if self._file is not None and self._rotated():
+                self._file.close()
+                self._file = None
+            if self._file is None:
+                self._file = open(self.path, 'a', encoding='utf-8')
+            self._file.write(''.join(lines))
+            self._file.flush()
+        except Exception as e:
+            # Don't fail the application if logging fails
+            print(f"⚠️  Failed to write breadcrumb log: {e}")
+            self._file = None
+
+    def _rotated(self) -> bool:
+        """True if the log was renamed or removed since it was opened (e.g. by breadcrumb_analytics rotate)"""
+        try:
+            return os.stat(self.path).st_ino != os.fstat(self._file.fileno()).st_ino
+        except OSError:
+            return True
+
+
+_log_writers: Dict[Path, _LogWriter] = {}
+_log_writers_lock = threading.Lock()
+
+
+def _get_log_writer(path: Path) -> _LogWriter:
+    with _log_writers_lock:
+        writer = _log_writers.get(path)
+        if writer is None:
+            writer = _LogWriter(path)
+            _log_writers[path] = writer
+        return writer
+
+
+def _reset_log_writers_in_child() -> None:
+    # A forked child inherits writer objects whose threads did not survive the fork
+    global _log_writers, _log_writers_lock
+    _log_writers = {}
+    _log_writers_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_log_writers_in_child)
+
+
+@atexit.register
+def _close_log_writers() -> None:
+    with _log_writers_lock:
+        writers = list(_log_writers.values())
+        _log_writers.clear()
+    for writer in writers:
+        writer.close()
+
+
+def _bounded(max_size: int) -> deque:
+    """Ring buffer keeping the max_size most recent items (0 = unbounded)"""
+    return deque(maxlen=max_size or None)
+
+
+class _TrailStore:
+    """
+    Bounded global trail with a per-LED-id index
+
+    Breadcrumbs are kept in arrival order (oldest evicted first) and indexed
+    by LED id, so range queries only touch the LEDs they return. LED and
+    failure counts are kept incrementally and are not reduced by eviction.
+    """
+
+    __slots__ = ('trail', 'failures', 'by_led', 'total', 'failed', '_next_seq', '_lock')
+
+    def __init__(self, max_size: int = TRAIL_MAX_SIZE, max_failures: int = FAILURES_MAX_SIZE):
+        self.trail = _bounded(max_size)  # (sequence number, breadcrumb)
+        self.failures = _bounded(max_failures)
+        self.by_led: Dict[int, deque] = {}  # LED id -> (sequence number, breadcrumb), oldest first
+        self.total = 0
+        self.failed = 0
+        self._next_seq = 0
+        self._lock = threading.Lock()
+
+    def add(self, breadcrumb: Breadcrumb) -> None:
+        with self._lock:
+            if len(self.trail) == self.trail.maxlen:
+                # The evicted breadcrumb is the oldest entry for its LED id
+                _, evicted = self.trail[0]
+                entries = self.by_led[evicted.id]
+                entries.popleft()
+                if not entries:
+                    del self.by_led[evicted.id]
+
+            entry = (self._next_seq, breadcrumb)
+            self._next_seq += 1
+            self.trail.append(entry)
+            self.by_led.setdefault(breadcrumb.id, deque()).append(entry)
+
+            self.total += 1
+            if not breadcrumb.success:
+                self.failed += 1
+                self.failures.append(breadcrumb)
+
+    def count_suppressed(self, count: int) -> None:
+        """Count rate-limited lights (successes that were not stored)"""
+        with self._lock:
+            self.total += count
+
+    def all(self) -> List[Breadcrumb]:
+        with self._lock:
+            return [breadcrumb for _, breadcrumb in self.trail]
+
+    def all_failures(self) -> List[Breadcrumb]:
+        with self._lock:
+            return list(self.failures)
+
+    def range(self, start: int, end: int) -> List[Breadcrumb]:
+        """Retained breadcrumbs with start <= id <= end, in arrival order"""
+        with self._lock:
+            if end - start < len(self.by_led):
+                led_ids = [led_id for led_id in range(start, end + 1) if led_id in self.by_led]
+            else:
+                led_ids = [led_id for led_id in self.by_led if start <= led_id <= end]
+            runs = [list(self.by_led[led_id]) for led_id in led_ids]
+
+        # Sequence numbers are unique, so entries never compare breadcrumbs
+        return [breadcrumb for _, breadcrumb in merge(*runs)]
+
+    def clear(self) -> None:
+        with self._lock:
+            self.trail.clear()
+            self.failures.clear()
+            self.by_led.clear()
+            self.total = 0
+            self.failed = 0
+
+
+_current_span: ContextVar[Optional[str]] = ContextVar('breadcrumb_span', default=None)  # Innermost open span path
+
+
+class Span(ContextDecorator):
+    """
+    Timed stage: lights a start LED on entry and an end LED with elapsed
+    wall and CPU seconds on exit
+
+    Spans opened inside another span are recorded under its path
+    ("research/reddit"). Nesting follows contextvars, so work handed to a
+    thread pool via contextvars.copy_context().run stays under the span that
+    submitted it. Works as a context manager or a decorator
+    (each call is timed separately). CPU time is process-wide, so it includes
+    other threads running during the span. Exceptions are re-raised after
+    the end LED records status "error".
+    """
+
+    def __init__(self, trail: 'BreadcrumbTrail', led_id: int, name: str,
+                 data: Optional[Dict[str, Any]] = None, end_led: Optional[int] = None):
+        self.trail = trail
+        self.led_id = led_id
+        self.end_led = led_id if end_led is None else end_led
+        self.name = name
+        self.data = data
+        self.path = name
+        self.wall_seconds: Optional[float] = None
+        self.cpu_seconds: Optional[float] = None
+
+    def _recreate_cm(self) -> 'Span':
+        # Fresh span per decorated call (safe for recursion and threads)
+        return Span(self.trail, self.led_id, self.name, self.data, self.end_led)
+
+    def __enter__(self) -> 'Span':
+        parent = _current_span.get()
+        self.path = f"{parent}/{self.name}" if parent else self.name
+        self._token = _current_span.set(self.path)
+
+        self.trail.light(self.led_id, {
+            "action": "span_start",
+            "span": self.path,
+            "depth": self.path.count('/'),
+            **(self.data or {})
+        })
+        self._cpu_start = time.process_time()
+        self._wall_start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.wall_seconds = time.perf_counter() - self._wall_start
+        self.cpu_seconds = time.process_time() - self._cpu_start
+        _current_span.reset(self._token)
+
+        BreadcrumbTrail._record_span(self.path, self.wall_seconds, self.cpu_seconds, exc_type is not None)
+
+        end_data = {
+            "action": "span_end",
+            "span": self.path,
+            "wall_seconds": round(self.wall_seconds, 4),
+            "cpu_seconds": round(self.cpu_seconds, 4),
+            "status": "error" if exc_type else "ok"
+        }
+        if exc_type:
+            end_data["error"] = f"{exc_type.__name__}: {exc}"
+        self.trail.light(self.end_led, end_data)
+        return False
+
 
 class BreadcrumbTrail:
     """
@@ -67,9 +472,11 @@ class BreadcrumbTrail:
     Features:
     - JSON Lines logging for easy grep/parsing
     - Console output with emojis for human readability
-    - Global trail aggregation across all agents
+    - Console verbosity levels, LED range filters and rate limiting
+    - Global trail aggregation across all agents (bounded, indexed by LED id)
     - Failure tracking for autonomous debugging
     - Verification and checkpoint support
+    - Span timing (wall/CPU seconds per stage)
 
     Usage:
         trail = BreadcrumbTrail("Agent0_TopicResearch")
@@ -80,22 +487,30 @@ class BreadcrumbTrail:
     """
 
     # Class-level storage for global trail
-    _global_trail: List[Breadcrumb] = []
-    _global_failures: List[Breadcrumb] = []
+    _store = _TrailStore()
     _component_trails: Dict[str, 'BreadcrumbTrail'] = {}
+    _span_totals: Dict[str, List] = {}  # Span path -> [count, wall seconds, CPU seconds, errors]
+    _listeners: Tuple[Callable[[Breadcrumb], None], ...] = ()  # Called with every recorded breadcrumb
+    _span_lock = threading.Lock()
     _log_file: Optional[Path] = None
 
-    def __init__(self, component_name: str, log_file: Optional[str] = None):
+    def __init__(self, component_name: str, log_file: Optional[str] = None,
+                 console_level: Optional[str] = None):
         """
         Initialize breadcrumb trail for a component
 
         Args:
             component_name: Name of component/agent (e.g., "Agent0_TopicResearch")
             log_file: Optional path to JSON Lines log file (default: logs/breadcrumbs.jsonl)
+            console_level: "all", "failures" or "quiet" for this component (default: BREADCRUMB_CONSOLE)
         """
         self.component_name = component_name
-        self.sequence: List[Breadcrumb] = []
-        self.assertions: List[Dict[str, Any]] = []
+        self.console_level = CONSOLE_LEVEL if console_level is None else _console_level(console_level)
+        self._rate_windows: Dict[int, List] = {}  # LED id -> [window start, lights, suppressed]
+        self.sequence: deque = _bounded(TRAIL_MAX_SIZE)
+        self.assertions: deque = _bounded(TRAIL_MAX_SIZE)
+        self.led_count = 0
+        self.failure_count = 0
 
         # Register this trail globally
         BreadcrumbTrail._component_trails[component_name] = self
@@ -109,37 +524,128 @@ class BreadcrumbTrail:
             log_dir.mkdir(exist_ok=True)
             BreadcrumbTrail._log_file = log_dir / "breadcrumbs.jsonl"
 
-    def light(self, led_id: int, data: Optional[Dict[str, Any]] = None) -> None:
+    def light(self, led_id: int, data: Payload = None) -> None:
         """
         Light an LED breadcrumb (success)
 
         Args:
             led_id: LED number (500-4599 for Purchase Intent agents)
-            data: Optional data dictionary to attach
+            data: Optional data dictionary to attach, or a callable returning
+                it (skipped entirely if the LED is rate limited)
         """
+        if RATE_LIMIT and self._rate_limited(led_id):
+            return
+
+        if callable(data):
+            data = data()
+
+        self._record(led_id, data)
+
+    def _record(self, led_id: int, data: Optional[Dict[str, Any]]) -> None:
+        """Store, print and log a successful LED"""
         breadcrumb = Breadcrumb(
             id=led_id,
             name=self._get_led_name(led_id),
             component=self.component_name,
             timestamp=time.time(),
             success=True,
-            data=data
+            data=data,
+            error=None,
+            stack=None
         )
 
         self.sequence.append(breadcrumb)
-        BreadcrumbTrail._global_trail.append(breadcrumb)
-
-        # Console output with emoji (safe encoding)
-        data_str = json.dumps(data or {})
-        try:
-            print(f"🎵 LED {led_id}: {breadcrumb.name} - {data_str} {self.component_name}_{led_id}")
-        except UnicodeEncodeError:
-            # Fallback for Windows console without emoji support
-            print(f"[OK] LED {led_id}: {breadcrumb.name} - {data_str} {self.component_name}_{led_id}")
+        self.led_count += 1
+        BreadcrumbTrail._store.add(breadcrumb)
+        if BreadcrumbTrail._listeners:
+            self._notify(breadcrumb)
+
+        # Console output with emoji (safe encoding) - only serialized if printed
+        if self._prints(led_id):
+            data_str = json.dumps(data or {})
+            try:
+                print(f"🎵 LED {led_id}: {breadcrumb.name} - {data_str} {self.component_name}_{led_id}")
+            except UnicodeEncodeError:
+                # Fallback for Windows console without emoji support
+                print(f"[OK] LED {led_id}: {breadcrumb.name} - {data_str} {self.component_name}_{led_id}")
 
         # Write to JSON Lines log
         self._write_log(breadcrumb)
 
+    @staticmethod
+    def _notify(breadcrumb: Breadcrumb) -> None:
+        """Hand a recorded breadcrumb to every listener (listener errors never fail the caller)"""
+        for listener in BreadcrumbTrail._listeners:
+            try:
+                listener(breadcrumb)
+            except Exception as e:
+                print(f"⚠️  Breadcrumb listener failed: {e}")
+
+    @classmethod
+    def add_listener(cls, listener: Callable[[Breadcrumb], None]) -> None:
+        """Call listener(breadcrumb) for every LED recorded from now on, in the lighting thread (e.g. lib/metrics.py)"""
+        if listener not in cls._listeners:
+            cls._listeners = cls._listeners + (listener,)
+
+    @classmethod
+    def remove_listener(cls, listener: Callable[[Breadcrumb], None]) -> None:
+        cls._listeners = tuple(registered for registered in cls._listeners if registered != listener)
+
+    def _prints(self, led_id: int) -> bool:
+        """True if a successful LED is shown on the console"""
+        if self.console_level < CONSOLE_LEVELS['all']:
+            return False
+        if CONSOLE_RANGES and not _in_ranges(led_id, CONSOLE_RANGES):
+            return False
+        return not (CONSOLE_MUTE and _in_ranges(led_id, CONSOLE_MUTE))
+
+    def _rate_limited(self, led_id: int) -> bool:
+        """
+        Count one light against the LED's rate window
+
+        Returns True if the light should be suppressed. When a new window
+        starts, the previous window's suppressed count is reported first.
+        """
+        now = time.monotonic()
+        window = self._rate_windows.get(led_id)
+        if window is None:
+            self._rate_windows[led_id] = [now, 1, 0]
+            return False
+
+        if now - window[0] >= RATE_WINDOW_SECONDS:
+            self._report_suppressed(led_id, window)
+            window[0], window[1], window[2] = now, 1, 0
+            return False
+
+        if window[1] < RATE_LIMIT:
+            window[1] += 1
+            return False
+
+        window[2] += 1
+        self.led_count += 1
+        BreadcrumbTrail._store.count_suppressed(1)
+        return True
+
+    def _report_suppressed(self, led_id: int, window: List) -> None:
+        """Record one summary breadcrumb for a window's suppressed lights"""
+        suppressed = window[2]
+        if not suppressed:
+            return
+        window[2] = 0
+        # The summary stands in for lights already counted
+        self.led_count -= 1
+        BreadcrumbTrail._store.count_suppressed(-1)
+        self._record(led_id, {
+            "action": "suppressed_repeats",
+            "suppressed": suppressed,
+            "window_seconds": RATE_WINDOW_SECONDS
+        })
+
+    def flush_suppressed(self) -> None:
+        """Report every pending suppressed count now (e.g. at the end of a run)"""
+        for led_id, window in list(self._rate_windows.items()):
+            self._report_suppressed(led_id, window)
+
     def light_with_verification(
         self,
         led_id: int,
@@ -185,6 +691,26 @@ class BreadcrumbTrail:
 
         return True
 
+    def span(self, led_id: int, name: str, data: Optional[Dict[str, Any]] = None,
+             end_led: Optional[int] = None) -> Span:
+        """
+        Time a stage as a context manager or decorator
+
+        Usage:
+            with trail.span(509, "reddit_search", {"topic": topic}):
+                reddit_client.search_topic(topic)
+
+        Args:
+            led_id: LED lit when the span starts (and ends, unless end_led is given)
+            name: Stage name (nested spans are reported as "outer/inner")
+            data: Optional data for the start LED
+            end_led: Optional separate LED for the end record
+
+        Returns:
+            Span (wall_seconds and cpu_seconds are set once it exits)
+        """
+        return Span(self, led_id, name, data, end_led)
+
     def checkpoint(
         self,
         led_id: int,
@@ -233,41 +759,51 @@ class BreadcrumbTrail:
             component=self.component_name,
             timestamp=time.time(),
             success=False,
+            data=None,
             error=str(error),
             stack=traceback.format_exc()
         )
 
         self.sequence.append(breadcrumb)
-        BreadcrumbTrail._global_trail.append(breadcrumb)
-        BreadcrumbTrail._global_failures.append(breadcrumb)
-
-        # Console error output (safe encoding)
-        try:
-            print(f"❌ LED {led_id} FAILED [{self.component_name}]: {breadcrumb.name} {error}")
-        except UnicodeEncodeError:
-            # Fallback for Windows console without emoji support
-            print(f"[FAIL] LED {led_id} FAILED [{self.component_name}]: {breadcrumb.name} {error}")
+        self.led_count += 1
+        self.failure_count += 1
+        BreadcrumbTrail._store.add(breadcrumb)
+        if BreadcrumbTrail._listeners:
+            self._notify(breadcrumb)
+
+        # Console error output (safe encoding) - shown unless the component is quiet
+        if self.console_level >= CONSOLE_LEVELS['failures']:
+            try:
+                print(f"❌ LED {led_id} FAILED [{self.component_name}]: {breadcrumb.name} {error}")
+            except UnicodeEncodeError:
+                # Fallback for Windows console without emoji support
+                print(f"[FAIL] LED {led_id} FAILED [{self.component_name}]: {breadcrumb.name} {error}")
 
-        # Write to JSON Lines log
-        self._write_log(breadcrumb)
+        # Write to JSON Lines log (durably - failures must survive a crash)
+        self._write_log(breadcrumb, durable=True)
 
     def get_verification_summary(self) -> Dict[str, Any]:
         """
         Get summary of all verifications and failures
 
+        Counts cover every LED this trail has lit; critical_failures and
+        assertions come from the retained (most recent) records.
+
         Returns:
             Dictionary with verification statistics
         """
-        failures = [b for b in self.sequence if not b.success]
+        critical_failures = [
+            b for b in self.sequence if not b.success and 8000 <= b.id < 9000
+        ] if self.failure_count else []
 
         return {
-            "total_leds": len(self.sequence),
-            "failures": len(failures),
+            "total_leds": self.led_count,
+            "failures": self.failure_count,
             "assertions_passed": sum(1 for a in self.assertions if a["passed"]),
             "assertions_failed": sum(1 for a in self.assertions if not a["passed"]),
-            "failure_rate": len(failures) / max(len(self.sequence), 1),
-            "critical_failures": [f for f in failures if 8000 <= f.id < 9000],
-            "verification_passed": len(failures) == 0 and all(a["passed"] for a in self.assertions)
+            "failure_rate": self.failure_count / max(self.led_count, 1),
+            "critical_failures": critical_failures,
+            "verification_passed": self.failure_count == 0 and all(a["passed"] for a in self.assertions)
         }
 
     def _get_led_name(self, led_id: int) -> str:
@@ -311,26 +847,67 @@ class BreadcrumbTrail:
 
         SECURITY: Redacts API keys, tokens, passwords, secrets
         """
-        if value is None:
+        if isinstance(value, str):
+            # Too short to be a secret or a long token
+            if len(value) < MIN_SECRET_LENGTH:
+                return value
+
+            # Check if value looks like a secret (matches known patterns)
+            if _may_contain_secret(value) and SECRET_VALUE_REGEX.search(value):
+                return "***REDACTED_SECRET***"
+
+            # Redact very long strings that might be tokens (>50 chars with no spaces)
+            if len(value) > LONG_STRING_LENGTH and ' ' not in value:
+                return "***REDACTED_LONG_STRING***"
+
+            if LOG_MAX_STRING and len(value) > LOG_MAX_STRING:
+                return f"{value[:LOG_MAX_STRING]}...(+{len(value) - LOG_MAX_STRING} chars)"
+
             return value
 
         if isinstance(value, dict):
             return self._sanitize_data(value)
 
         if isinstance(value, list):
-            return [self._sanitize_value(item) for item in value]
+            if LOG_MAX_LIST_ITEMS and len(value) > LOG_MAX_LIST_ITEMS:
+                return (
+                    self._sanitize_list(value[:LOG_MAX_LIST_ITEMS])
+                    + [f"...(+{len(value) - LOG_MAX_LIST_ITEMS} items)"]
+                )
+            return self._sanitize_list(value)
 
-        if isinstance(value, str):
-            # Check if value looks like a secret (matches known patterns)
-            for pattern in SECRET_VALUE_PATTERNS:
-                if re.search(pattern, value):
-                    return "***REDACTED_SECRET***"
+        # None, numbers, bools pass through
+        return value
 
-            # Redact very long strings that might be tokens (>50 chars with no spaces)
-            if len(value) > 50 and ' ' not in value:
-                return "***REDACTED_LONG_STRING***"
+    def _sanitize_list(self, items: List[Any]) -> List[Any]:
+        """
+        Sanitize a list, scanning all-string lists (keyword lists) in one pass
 
-        return value
+        Items are only sanitized one by one if the joined prefilter finds a
+        possible secret, an item looks like a long token (or exceeds
+        LOG_MAX_STRING), or the list holds non-strings.
+        """
+        if len(items) > 1:
+            try:
+                joined = LIST_SEPARATOR.join(items)
+            except TypeError:
+                joined = None  # Not all strings
+
+            if (
+                joined is not None
+                and joined.count(LIST_SEPARATOR) == len(items) - 1
+                and not _may_contain_secret(joined)
+            ):
+                # Long items only need individual handling if they have no spaces or get truncated
+                cap = min(LONG_STRING_LENGTH, LOG_MAX_STRING or LONG_STRING_LENGTH)
+                long_items = [item for item in items if len(item) > cap]
+                if not any(
+                    ' ' not in item or (LOG_MAX_STRING and len(item) > LOG_MAX_STRING)
+                    for item in long_items
+                ):
+                    return list(items)
+
+        return [self._sanitize_value(item) for item in items]
 
     def _sanitize_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -346,13 +923,8 @@ class BreadcrumbTrail:
 
         sanitized = {}
         for key, value in data.items():
-            # Normalize key for comparison (lowercase, no separators)
-            key_normalized = key.lower().replace('_', '').replace('-', '').replace(' ', '')
-
             # Check if key name indicates sensitive data
-            is_sensitive_key = any(pattern in key_normalized for pattern in SENSITIVE_KEY_PATTERNS)
-
-            if is_sensitive_key:
+            if _is_sensitive_key(key):
                 sanitized[key] = "***REDACTED_API_KEY***"
             else:
                 sanitized[key] = self._sanitize_value(value)
@@ -368,72 +940,172 @@ class BreadcrumbTrail:
         if not text:
             return text
 
+        # Most messages hold no secret - the prefilter or one combined scan proves it
+        if not _may_contain_secret(text) or not SECRET_VALUE_REGEX.search(text):
+            return text
+
+        # Pattern by pattern, so overlapping secrets are redacted exactly as before
         sanitized = text
-        for pattern in SECRET_VALUE_PATTERNS:
-            sanitized = re.sub(pattern, '***REDACTED_SECRET***', sanitized)
+        for regex in SECRET_VALUE_REGEXES:
+            sanitized = regex.sub('***REDACTED_SECRET***', sanitized)
 
         return sanitized
 
-    def _write_log(self, breadcrumb: Breadcrumb) -> None:
+    def _format_log_line(self, breadcrumb: Breadcrumb) -> str:
         """
-        Write breadcrumb to JSON Lines log file
+        Serialize a breadcrumb as one JSON Lines record
 
         SECURITY: Automatically sanitizes sensitive data before writing
         """
-        if BreadcrumbTrail._log_file:
-            try:
-                with open(BreadcrumbTrail._log_file, 'a', encoding='utf-8') as f:
-                    log_entry = asdict(breadcrumb)
+        # Shallow copy is enough: sanitizing rebuilds nested dicts/lists, and
+        # payloads are plain JSON (light() already json.dumps them for the console)
+        log_entry = {field: getattr(breadcrumb, field) for field in BREADCRUMB_FIELDS}
 
-                    # SECURITY: Sanitize data field
-                    if log_entry.get('data'):
-                        log_entry['data'] = self._sanitize_data(log_entry['data'])
+        # SECURITY: Sanitize data field
+        if log_entry.get('data'):
+            log_entry['data'] = self._sanitize_data(log_entry['data'])
 
-                    # SECURITY: Sanitize error messages (might contain URLs with tokens)
-                    if log_entry.get('error'):
-                        log_entry['error'] = self._sanitize_string(log_entry['error'])
+        # SECURITY: Sanitize error messages (might contain URLs with tokens)
+        if log_entry.get('error'):
+            log_entry['error'] = self._sanitize_string(log_entry['error'])
 
-                    # SECURITY: Sanitize stack traces
-                    if log_entry.get('stack'):
-                        log_entry['stack'] = self._sanitize_string(log_entry['stack'])
+        # SECURITY: Sanitize stack traces
+        if log_entry.get('stack'):
+            log_entry['stack'] = self._sanitize_string(log_entry['stack'])
 
-                    log_entry['iso_timestamp'] = datetime.fromtimestamp(
-                        breadcrumb.timestamp
-                    ).isoformat()
-                    f.write(json.dumps(log_entry) + '\n')
-            except Exception as e:
-                # Don't fail the application if logging fails
-                print(f"⚠️  Failed to write breadcrumb log: {e}")
+        log_entry['iso_timestamp'] = datetime.fromtimestamp(
+            breadcrumb.timestamp
+        ).isoformat()
+        return json.dumps(log_entry) + '\n'
+
+    def _write_log(self, breadcrumb: Breadcrumb, durable: bool = False) -> None:
+        """
+        Write breadcrumb to JSON Lines log file
+
+        The line is formatted here, on the lighting thread, in both modes.
+        Buffered mode hands it to the background writer; durable writes wait
+        until it (and everything before it) is on disk.
+        """
+        if not BreadcrumbTrail._log_file:
+            return
+
+        try:
+            line = self._format_log_line(breadcrumb)
+            if LOG_MODE != 'sync':
+                writer = _get_log_writer(BreadcrumbTrail._log_file)
+                writer.submit(line)
+                if durable:
+                    writer.flush(durable=True)
+                return
+
+            with open(BreadcrumbTrail._log_file, 'a', encoding='utf-8') as f:
+                f.write(line)
+        except Exception as e:
+            # Don't fail the application if logging fails
+            print(f"⚠️  Failed to write breadcrumb log: {e}")
+
+    @classmethod
+    def flush_logs(cls) -> None:
+        """Report pending rate-limit summaries, then block until every buffered LED is written"""
+        for trail in list(cls._component_trails.values()):
+            trail.flush_suppressed()
+        with _log_writers_lock:
+            writers = list(_log_writers.values())
+        for writer in writers:
+            writer.flush()
 
     @classmethod
     def get_all(cls) -> List[Breadcrumb]:
-        """Get all breadcrumbs across all components"""
-        return cls._global_trail
+        """Get all retained breadcrumbs across all components (oldest first)"""
+        return cls._store.all()
 
     @classmethod
     def get_range(cls, start: int, end: int) -> List[Breadcrumb]:
-        """Get breadcrumbs within a specific LED range"""
-        return [b for b in cls._global_trail if start <= b.id <= end]
+        """Get retained breadcrumbs within a specific LED range (index lookup, oldest first)"""
+        return cls._store.range(start, end)
 
     @classmethod
     def get_failures(cls) -> List[Breadcrumb]:
-        """Get all failed breadcrumbs"""
-        return cls._global_failures
+        """Get retained failed breadcrumbs (the FAILURES_MAX_SIZE most recent)"""
+        return cls._store.all_failures()
 
     @classmethod
     def get_component(cls, name: str) -> Optional[List[Breadcrumb]]:
-        """Get breadcrumbs for a specific component"""
+        """Get retained breadcrumbs for a specific component"""
         trail = cls._component_trails.get(name)
-        return trail.sequence if trail else None
+        return list(trail.sequence) if trail else None
+
+    @classmethod
+    def _record_span(cls, path: str, wall_seconds: float, cpu_seconds: float, failed: bool) -> None:
+        with cls._span_lock:
+            totals = cls._span_totals.setdefault(path, [0, 0.0, 0.0, 0])
+            totals[0] += 1
+            totals[1] += wall_seconds
+            totals[2] += cpu_seconds
+            totals[3] += failed
+
+    @classmethod
+    def get_span_breakdown(cls) -> List[Dict[str, Any]]:
+        """
+        Per-stage totals for every span path, in the order stages first started
+
+        Returns:
+            List of dicts with span, depth, count, wall_seconds, cpu_seconds, errors
+        """
+        with cls._span_lock:
+            totals = [(path, list(values)) for path, values in cls._span_totals.items()]
+
+        # Parents finish after their children, so order by first start instead
+        # of first finish: a child path sorts right after its parent
+        order = {}
+        for path, _ in totals:
+            parts = path.split('/')
+            for depth in range(1, len(parts) + 1):
+                order.setdefault('/'.join(parts[:depth]), len(order))
+        totals.sort(key=lambda item: [order['/'.join(item[0].split('/')[:depth])]
+                                      for depth in range(1, item[0].count('/') + 2)])
+
+        return [
+            {
+                "span": path,
+                "depth": path.count('/'),
+                "count": count,
+                "wall_seconds": round(wall, 4),
+                "cpu_seconds": round(cpu, 4),
+                "errors": errors
+            }
+            for path, (count, wall, cpu, errors) in totals
+        ]
+
+    @classmethod
+    def print_span_breakdown(cls) -> None:
+        """Print the per-stage latency breakdown (share of total top-level wall time)"""
+        breakdown = cls.get_span_breakdown()
+        if not breakdown:
+            return
+
+        total_wall = sum(row["wall_seconds"] for row in breakdown if row["depth"] == 0) or 1.0
+        print(f"{'Stage':<40} {'Calls':>6} {'Wall':>10} {'CPU':>10} {'Share':>7}")
+        for row in breakdown:
+            label = ("  " * row["depth"] + row["span"].rsplit('/', 1)[-1])[:40]
+            print(
+                f"{label:<40} {row['count']:>6} {row['wall_seconds']:>9.2f}s "
+                f"{row['cpu_seconds']:>9.2f}s {row['wall_seconds'] / total_wall:>7.1%}"
+                + (f"  ({row['errors']} failed)" if row["errors"] else "")
+            )
 
     @classmethod
     def clear(cls) -> None:
         """Clear all breadcrumb trails (useful for testing)"""
-        cls._global_trail.clear()
-        cls._global_failures.clear()
+        cls._store.clear()
+        with cls._span_lock:
+            cls._span_totals.clear()
         for trail in cls._component_trails.values():
             trail.sequence.clear()
             trail.assertions.clear()
+            trail.led_count = 0
+            trail.failure_count = 0
+            trail._rate_windows.clear()
 
     @classmethod
     def check_range(cls, start: int, end: int) -> Dict[str, Any]:
@@ -445,9 +1117,8 @@ class BreadcrumbTrail:
         """
         leds = cls.get_range(start, end)
         failed = [b.id for b in leds if not b.success]
-        existing = [b.id for b in leds]
-        expected = list(range(start, end + 1))
-        missing = [led_id for led_id in expected if led_id not in existing]
+        existing = {b.id for b in leds}
+        missing = [led_id for led_id in range(start, end + 1) if led_id not in existing]
 
         return {
             "passed": len(failed) == 0 and len(missing) == 0,
@@ -460,18 +1131,28 @@ class BreadcrumbTrail:
         """
         Calculate quality score (0-100) based on failure rate
 
+        Counts every LED since the last clear(), including evicted ones.
+
         Returns:
             Percentage of successful breadcrumbs
         """
-        total = len(cls._global_trail)
-        failures = len(cls._global_failures)
+        total = cls._store.total
+        failures = cls._store.failed
         if total == 0:
             return 0.0
         return round(((total - failures) / total) * 100, 2)
 
 
+@atexit.register
+def _report_suppressed_at_exit() -> None:
+    # Registered after _close_log_writers, so it runs first (atexit is LIFO)
+    if RATE_LIMIT:
+        for trail in list(BreadcrumbTrail._component_trails.values()):
+            trail.flush_suppressed()
+
+
 # Convenience function for quick LED lighting without creating a trail object
-def light_led(led_id: int, component: str, data: Optional[Dict[str, Any]] = None) -> None:
+def light_led(led_id: int, component: str, data: Payload = None) -> None:
     """
     Quick LED lighting without managing a BreadcrumbTrail object
 
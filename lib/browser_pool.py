@@ -0,0 +1,499 @@
+"""
+Purchase Intent System - Shared Browser Pool
+Long-lived Playwright browsers and reusable contexts for every scraper
+
+Launching Chromium costs 1-3s and hundreds of MB, so scrapers borrow a page
+from a pool instead of launching a browser per query:
+- Browsers are launched once and kept for the life of the process
+- Each browser holds reusable contexts, one set per "profile" (e.g. amazon,
+  goodreads), so cookies are isolated between sites but persist between
+  queries to the same site
+- Pages are reused and recycled after BROWSER_POOL_PAGE_USES checkouts,
+  contexts after BROWSER_POOL_CONTEXT_USES (fresh cookies and identity)
+- Every checkout health-checks the browser and page; a crashed browser is
+  relaunched, and work interrupted by a crash is retried once
+
+Sync API (Agent 1): Playwright's sync objects are bound to the thread that
+created them, so BrowserPool runs page work on its own long-lived worker
+threads (one browser each, started on demand). Any thread can call run().
+
+    from lib.browser_pool import get_browser_pool
+
+    titles = get_browser_pool().run(lambda page: page.goto(url) and page.title(), profile="amazon")
+
+Async API (Agent 0): AsyncBrowserPool lends pages on the running event loop.
+
+    pool = AsyncBrowserPool(context_options=lambda: {"accept_downloads": True})
+    async with pool.page("google_trends") as page:
+        await page.goto(url)
+    await pool.close()
+"""
+
+import asyncio
+import atexit
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import asynccontextmanager
+from typing import Any, Callable, Dict, List, Optional, Union
+
+
+BROWSERS = int(os.getenv('BROWSER_POOL_BROWSERS', '2'))  # Sync pool: browser worker threads (started on demand)
+CONTEXTS = int(os.getenv('BROWSER_POOL_CONTEXTS', '2'))  # Async pool: contexts open at once
+PAGE_USES = int(os.getenv('BROWSER_POOL_PAGE_USES', '20'))  # Checkouts before a page is replaced
+CONTEXT_USES = int(os.getenv('BROWSER_POOL_CONTEXT_USES', '100'))  # Checkouts before a context is replaced
+
+DEFAULT_LAUNCH_OPTIONS = {
+    "headless": True,
+    "args": ['--disable-blink-features=AutomationControlled', '--disable-dev-shm-usage', '--no-sandbox']
+}
+
+ContextOptions = Union[None, Dict[str, Any], Callable[[], Dict[str, Any]]]
+
+
+def _resolve_options(options: ContextOptions) -> Dict[str, Any]:
+    """Context options may be a dict or a factory (e.g. a random user agent per context)"""
+    if options is None:
+        return {}
+    return dict(options() if callable(options) else options)
+
+
+def _validate_limits(page_uses: int, context_uses: int) -> None:
+    if page_uses < 1 or context_uses < 1:
+        raise ValueError(f"Browser pool page/context uses must be at least 1 (got {page_uses}/{context_uses})")
+
+
+class _Slot:
+    """One pooled context and its reusable page"""
+
+    __slots__ = ('profile', 'context', 'page', 'uses', 'page_uses', 'busy', 'retire')
+
+    def __init__(self, profile: str, context):
+        self.profile = profile
+        self.context = context
+        self.page = None
+        self.uses = 0
+        self.page_uses = 0
+        self.busy = False
+        self.retire = False  # Close the context when it is released
+
+
+class _PoolStats:
+    """Counters shared by both pool flavours"""
+
+    def __init__(self):
+        self.launches = 0
+        self.recoveries = 0
+        self.contexts_created = 0
+        self.pages_created = 0
+        self.checkouts = 0
+        self.crash_retries = 0
+        self._lock = threading.Lock()
+
+    def add(self, field: str) -> None:
+        with self._lock:
+            setattr(self, field, getattr(self, field) + 1)
+
+    def as_dict(self) -> Dict[str, int]:
+        return {
+            "launches": self.launches,
+            "recoveries": self.recoveries,
+            "contexts_created": self.contexts_created,
+            "pages_created": self.pages_created,
+            "checkouts": self.checkouts,
+            "crash_retries": self.crash_retries
+        }
+
+
+def _quietly(func, *args) -> None:
+    """Cleanup call whose failure (e.g. on a crashed browser) doesn't matter"""
+    try:
+        func(*args)
+    except Exception:
+        pass
+
+
+class _BrowserWorker(threading.Thread):
+    """Owns one sync Playwright browser and its contexts; runs BrowserPool tasks"""
+
+    def __init__(self, pool: 'BrowserPool', index: int):
+        super().__init__(name=f"browser-pool-{index}", daemon=True)
+        self.pool = pool
+        self.playwright = None
+        self.browser = None
+        self.slots: List[_Slot] = []
+        self.busy = False
+
+    def run(self) -> None:
+        while True:
+            task = self.pool._tasks.get()
+            if task is None:
+                break
+            fn, profile, options, future = task
+            if not future.set_running_or_notify_cancel():
+                continue
+            self.busy = True
+            try:
+                future.set_result(self._run_task(fn, profile, options))
+            except BaseException as e:
+                future.set_exception(e)
+            finally:
+                self.busy = False
+        self._shutdown()
+
+    def _run_task(self, fn, profile: str, options: ContextOptions) -> Any:
+        for attempt in range(2):
+            slot = self._checkout(profile, options)
+            try:
+                result = fn(slot.page)
+            except Exception:
+                crashed = not self._healthy()
+                self._release(slot, failed=True)
+                if crashed and attempt == 0:
+                    # Browser died under the task - relaunch and retry once
+                    self.pool.stats.add('crash_retries')
+                    continue
+                raise
+            self._release(slot)
+            return result
+        raise RuntimeError("Browser pool retry logic failed unexpectedly")
+
+    def _healthy(self) -> bool:
+        try:
+            return self.browser is not None and self.browser.is_connected()
+        except Exception:
+            return False
+
+    def _launch(self) -> None:
+        """Start (or restart after a crash) this worker's browser"""
+        if self.playwright is not None:
+            self.pool.stats.add('recoveries')
+            self._shutdown()
+        self.playwright = self.pool._start_playwright()
+        self.browser = self.playwright.chromium.launch(**self.pool.launch_options)
+        self.pool.stats.add('launches')
+
+    def _checkout(self, profile: str, options: ContextOptions) -> _Slot:
+        if not self._healthy():
+            self._launch()
+
+        slot = next((s for s in self.slots if s.profile == profile and not s.busy), None)
+        if slot is None:
+            if len(self.slots) >= self.pool.max_contexts:
+                # Make room: drop an idle context of another profile
+                idle = next((s for s in self.slots if not s.busy), None)
+                if idle is not None:
+                    self._close_slot(idle)
+            context = self.browser.new_context(**_resolve_options(
+                options if options is not None else self.pool.context_options))
+            slot = _Slot(profile, context)
+            self.slots.append(slot)
+            self.pool.stats.add('contexts_created')
+
+        if slot.page is None or slot.page.is_closed():
+            slot.page = slot.context.new_page()
+            slot.page_uses = 0
+            self.pool.stats.add('pages_created')
+
+        slot.busy = True
+        slot.uses += 1
+        slot.page_uses += 1
+        self.pool.stats.add('checkouts')
+        return slot
+
+    def _release(self, slot: _Slot, failed: bool = False) -> None:
+        slot.busy = False
+        if not self._healthy():
+            self.slots.clear()  # Everything went down with the browser
+            return
+        if slot.retire or slot.uses >= self.pool.max_context_uses:
+            self._close_slot(slot)
+        elif failed or slot.page_uses >= self.pool.max_page_uses:
+            # Unknown page state after an error, or recycled after N uses
+            _quietly(slot.page.close)
+            slot.page = None
+
+    def _close_slot(self, slot: _Slot) -> None:
+        _quietly(slot.context.close)
+        if slot in self.slots:
+            self.slots.remove(slot)
+
+    def _shutdown(self) -> None:
+        for slot in list(self.slots):
+            self._close_slot(slot)
+        if self.browser is not None:
+            _quietly(self.browser.close)
+        if self.playwright is not None:
+            _quietly(self.playwright.stop)
+        self.browser = None
+        self.playwright = None
+
+
+class BrowserPool:
+    """Sync browser pool: page work runs on long-lived browser worker threads"""
+
+    def __init__(self, browsers: int = BROWSERS, max_contexts: int = CONTEXTS,
+                 launch_options: Optional[Dict[str, Any]] = None, context_options: ContextOptions = None,
+                 max_page_uses: int = PAGE_USES, max_context_uses: int = CONTEXT_USES):
+        """
+        Initialize pool (no browser is launched until the first run())
+
+        Args:
+            browsers: Most browser worker threads (each runs one task at a time)
+            max_contexts: Most contexts kept open per browser (across profiles)
+            launch_options: chromium.launch() kwargs (default: headless, anti-detection args)
+            context_options: new_context() kwargs, or a factory returning them
+            max_page_uses: Checkouts before a page is closed and replaced
+            max_context_uses: Checkouts before a context (cookies, identity) is replaced
+        """
+        if browsers < 1 or max_contexts < 1:
+            raise ValueError(f"Browser pool needs at least 1 browser and context (got {browsers}/{max_contexts})")
+        _validate_limits(max_page_uses, max_context_uses)
+
+        self.browsers = browsers
+        self.max_contexts = max_contexts
+        self.launch_options = dict(launch_options or DEFAULT_LAUNCH_OPTIONS)
+        self.context_options = context_options
+        self.max_page_uses = max_page_uses
+        self.max_context_uses = max_context_uses
+        self.stats = _PoolStats()
+
+        self._tasks: queue.Queue = queue.Queue()
+        self._workers: List[_BrowserWorker] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    @staticmethod
+    def _start_playwright():
+        from playwright.sync_api import sync_playwright
+        return sync_playwright().start()
+
+    def run(self, fn: Callable[[Any], Any], profile: str = "default", context_options: ContextOptions = None) -> Any:
+        """
+        Call fn(page) on a pooled page and return its result (exceptions propagate)
+
+        Args:
+            fn: Work to do with the page - runs on a browser worker thread
+            profile: Context set to borrow from (cookies are shared within a profile only)
+            context_options: Options for a context created for this call (default: the pool's)
+        """
+        if threading.current_thread() in self._workers:
+            raise ValueError("BrowserPool.run() called from inside a pooled task - use the page you were given")
+
+        future = Future()
+        with self._lock:
+            if self._closed:
+                raise ValueError("BrowserPool is closed")
+            # Start another browser only when the queued work outnumbers the idle ones
+            if len(self._workers) < self.browsers and \
+                    self._tasks.qsize() >= sum(not worker.busy for worker in self._workers):
+                worker = _BrowserWorker(self, len(self._workers))
+                self._workers.append(worker)
+                worker.start()
+            self._tasks.put((fn, profile, context_options, future))
+        return future.result()
+
+    def get_stats(self) -> Dict[str, int]:
+        return {"browsers": len(self._workers), **self.stats.as_dict()}
+
+    def close(self, timeout: float = 10.0) -> None:
+        """Close every context and browser (idempotent, never raises)"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            for _ in self._workers:
+                self._tasks.put(None)
+        deadline = time.time() + timeout
+        for worker in self._workers:
+            worker.join(max(0.0, deadline - time.time()))
+
+
+class AsyncBrowserPool:
+    """Async browser pool: one browser per event loop, up to max_contexts pages lent at once"""
+
+    def __init__(self, max_contexts: int = CONTEXTS, launch_options: Optional[Dict[str, Any]] = None,
+                 context_options: ContextOptions = None,
+                 max_page_uses: int = PAGE_USES, max_context_uses: int = CONTEXT_USES):
+        if max_contexts < 1:
+            raise ValueError(f"Browser pool needs at least 1 context (got {max_contexts})")
+        _validate_limits(max_page_uses, max_context_uses)
+
+        self.max_contexts = max_contexts
+        self.launch_options = dict(launch_options or DEFAULT_LAUNCH_OPTIONS)
+        self.context_options = context_options
+        self.max_page_uses = max_page_uses
+        self.max_context_uses = max_context_uses
+        self.stats = _PoolStats()
+
+        self._loop = None
+        self._playwright = None
+        self._browser = None
+        self._slots: List[_Slot] = []
+        self._available = None  # asyncio.Condition, bound to self._loop
+        self._lock = None  # asyncio.Lock guarding launches
+
+    @staticmethod
+    async def _start_playwright():
+        from playwright.async_api import async_playwright
+        return await async_playwright().start()
+
+    def _bind_loop(self) -> None:
+        """Playwright objects belong to one loop - start over if called from a new one"""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # The previous loop is gone (its browser dies with its driver); drop the references
+            self._loop = loop
+            self._playwright = None
+            self._browser = None
+            self._slots = []
+            self._available = asyncio.Condition()
+            self._lock = asyncio.Lock()
+
+    def _healthy(self) -> bool:
+        try:
+            return self._browser is not None and self._browser.is_connected()
+        except Exception:
+            return False
+
+    async def _ensure_browser(self) -> None:
+        async with self._lock:
+            if self._healthy():
+                return
+            if self._playwright is not None:
+                # Crash recovery
+                self.stats.add('recoveries')
+                await self._shutdown()
+            self._playwright = await self._start_playwright()
+            self._browser = await self._playwright.chromium.launch(**self.launch_options)
+            self.stats.add('launches')
+
+    async def _checkout(self, profile: str, options: ContextOptions) -> _Slot:
+        async with self._available:
+            while True:
+                await self._ensure_browser()
+                slot = next((s for s in self._slots if s.profile == profile and not s.busy), None)
+                if slot is not None or len(self._slots) < self.max_contexts:
+                    break
+                idle = next((s for s in self._slots if not s.busy), None)
+                if idle is not None:
+                    self._slots.remove(idle)
+                    await self._close_context(idle)
+                    break
+                await self._available.wait()
+
+            if slot is None:
+                slot = _Slot(profile, None)
+                slot.busy = True
+                self._slots.append(slot)  # Reserve before awaiting the context
+                try:
+                    slot.context = await self._browser.new_context(**_resolve_options(
+                        options if options is not None else self.context_options))
+                except Exception:
+                    self._slots.remove(slot)
+                    raise
+                self.stats.add('contexts_created')
+            slot.busy = True
+
+        try:
+            if slot.page is None or slot.page.is_closed():
+                slot.page = await slot.context.new_page()
+                slot.page_uses = 0
+                self.stats.add('pages_created')
+        except Exception:
+            await self._release(slot, failed=True)
+            raise
+
+        slot.uses += 1
+        slot.page_uses += 1
+        self.stats.add('checkouts')
+        return slot
+
+    async def _release(self, slot: _Slot, failed: bool = False) -> None:
+        async with self._available:
+            slot.busy = False
+            if not self._healthy():
+                if slot in self._slots:
+                    self._slots.remove(slot)
+            elif slot.retire or slot.uses >= self.max_context_uses:
+                self._slots.remove(slot)
+                await self._close_context(slot)
+            elif (failed or slot.page_uses >= self.max_page_uses) and slot.page is not None:
+                page, slot.page = slot.page, None
+                try:
+                    await page.close()
+                except Exception:
+                    pass
+            self._available.notify()
+
+    @asynccontextmanager
+    async def page(self, profile: str = "default", context_options: ContextOptions = None):
+        """
+        Borrow a page (waits while max_contexts pages are out)
+
+        Args:
+            profile: Context set to borrow from (cookies are shared within a profile only)
+            context_options: Options for a context created for this checkout (default: the pool's)
+        """
+        self._bind_loop()
+        slot = await self._checkout(profile, context_options)
+        try:
+            yield slot.page
+        except BaseException:
+            await self._release(slot, failed=True)
+            raise
+        await self._release(slot)
+
+    def retire(self, page) -> None:
+        """Replace this page's context when it is returned (fresh cookies, e.g. after a block)"""
+        for slot in self._slots:
+            if slot.page is page:
+                slot.retire = True
+
+    def get_stats(self) -> Dict[str, int]:
+        return {"contexts": len(self._slots), **self.stats.as_dict()}
+
+    async def _close_context(self, slot: _Slot) -> None:
+        if slot.context is None:
+            return
+        try:
+            await slot.context.close()
+        except Exception:
+            pass
+
+    async def _shutdown(self) -> None:
+        for slot in self._slots:
+            await self._close_context(slot)
+        self._slots = []
+        for closer in (self._browser.close if self._browser else None,
+                       self._playwright.stop if self._playwright else None):
+            if closer is None:
+                continue
+            try:
+                await closer()
+            except Exception:
+                pass
+        self._browser = None
+        self._playwright = None
+
+    async def close(self) -> None:
+        """Close every context and the browser (call before the loop closes; never raises)"""
+        if self._loop is not asyncio.get_running_loop():
+            return
+        await self._shutdown()
+
+
+_pool: Optional[BrowserPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_browser_pool() -> BrowserPool:
+    """Process-wide sync browser pool (closed at exit)"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = BrowserPool()
+            atexit.register(_pool.close)
+        return _pool
@@ -0,0 +1,354 @@
+"""
+Purchase Intent System - Pipeline Metrics
+Prometheus/OpenMetrics counters and histograms fed by the LED breadcrumb stream
+
+PipelineMetrics listens to every BreadcrumbTrail LED (cache hits/misses, rate
+limit retries, span timings, researched topics) and to QueueManager call
+records (API calls per source), and exposes them in the Prometheus text format:
+- a local HTTP endpoint (GET /metrics) for scraping while an agent runs
+- a textfile-collector dump (node_exporter --collector.textfile.directory),
+  rewritten atomically on request and at exit, for scheduled runs
+
+Usage:
+    from lib.metrics import enable_metrics
+
+    enable_metrics(port=9464)                               # http://127.0.0.1:9464/metrics
+    enable_metrics(textfile="metrics/purchase_intent.prom")  # written at exit
+
+Agents call enable_metrics_from_env(), which reads METRICS_PORT and
+METRICS_TEXTFILE (both unset = metrics disabled, zero overhead).
+"""
+
+import atexit
+import bisect
+import math
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from lib.breadcrumb_analytics import CACHE_HIT_ACTIONS, CACHE_MISS_ACTIONS
+from lib.breadcrumb_system import Breadcrumb, BreadcrumbTrail
+
+
+METRIC_PREFIX = "purchase_intent"
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Histogram buckets (seconds): stages run from milliseconds to tens of minutes,
+# backoff sleeps are 2^attempt + jitter
+STAGE_BUCKETS = (0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0)
+SLEEP_BUCKETS = (1.0, 2.0, 4.0, 8.0, 16.0, 32.0, 64.0)
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the text exposition format"""
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    """Labelled metric family (values keyed by label-value tuples)"""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, help_text: str, labels: Iterable[str] = ()):
+        self.name = f"{METRIC_PREFIX}_{name}"
+        self.help_text = help_text
+        self.labels = tuple(labels)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labels):
+            raise ValueError(f"{self.name} expects labels {self.labels}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labels)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self._samples())
+        return lines
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonic counter"""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labels: Iterable[str] = ()):
+        super().__init__(name, help_text, labels)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        if amount < 0:
+            raise ValueError(f"{self.name} can only increase (got {amount})")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labels, key)} {_format_value(value)}" for key, value in items]
+
+
+class Gauge(_Metric):
+    """Point-in-time value, optionally computed when rendered"""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, help_text: str, labels: Iterable[str] = (), compute=None):
+        super().__init__(name, help_text, labels)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._compute = compute  # () -> {label tuple: value}, evaluated at render time
+
+    def set(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            values = dict(self._values)
+        if self._compute:
+            values.update(self._compute())
+        return [f"{self.name}{_format_labels(self.labels, key)} {_format_value(value)}"
+                for key, value in sorted(values.items())]
+
+
+class Histogram(_Metric):
+    """Cumulative-bucket histogram (_bucket, _sum, _count series)"""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, labels: Iterable[str] = (), buckets: Tuple[float, ...] = STAGE_BUCKETS):
+        super().__init__(name, help_text, labels)
+        if list(buckets) != sorted(set(buckets)):
+            raise ValueError(f"{self.name} buckets must be strictly increasing: {buckets}")
+        self.buckets = tuple(buckets) + (math.inf,)
+        self._values: Dict[Tuple[str, ...], List] = {}  # label tuple -> [bucket counts, sum, count]
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            entry[0][index] += 1
+            entry[1] += value
+            entry[2] += 1
+
+    def count(self, **labels) -> int:
+        entry = self._values.get(self._key(labels))
+        return entry[2] if entry else 0
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted((key, ([*entry[0]], entry[1], entry[2])) for key, entry in self._values.items())
+        lines = []
+        for key, (bucket_counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, bucket_counts):
+                cumulative += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labels, key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labels, key)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.labels, key)} {count}")
+        return lines
+
+
+class PipelineMetrics:
+    """Metric registry for one agent process, updated from LEDs and QueueManager"""
+
+    def __init__(self):
+        self.started = time.time()
+        self.server: Optional[ThreadingHTTPServer] = None  # Set by enable_metrics(port=...)
+        self.textfiles: List[str] = []  # Written at exit
+
+        self.api_calls = Counter(
+            "api_calls_total", "API queries logged by QueueManager (cached=true means served from cache)",
+            ("source", "cached"))
+        self.cache_requests = Counter(
+            "cache_requests_total", "Cache lookups from cache_hit / cache_miss / cache_expired LEDs",
+            ("source", "result"))
+        self.retries = Counter(
+            "rate_limit_retries_total", "Rate limit retries (rate_limit_retry LEDs)", ("component",))
+        self.retry_sleep = Histogram(
+            "retry_sleep_seconds", "Backoff sleep before each rate limit retry", ("component",), SLEEP_BUCKETS)
+        self.stage_duration = Histogram(
+            "stage_duration_seconds", "Wall time of each timed stage (span_end LEDs)", ("span", "status"))
+        self.topics = Counter(
+            "topics_researched_total", "Topics started (researching_topic LEDs)", ("component",))
+        self.topics_per_second = Gauge(
+            "topics_per_second", "Topics researched per second since metrics were enabled", ("component",),
+            compute=self._topic_rates)
+        self.leds = Counter(
+            "leds_total", "LEDs recorded, by component and outcome", ("component", "status"))
+        self.uptime = Gauge(
+            "uptime_seconds", "Seconds since metrics were enabled",
+            compute=lambda: {(): round(time.time() - self.started, 3)})
+
+        self._metrics = [
+            self.api_calls, self.cache_requests, self.retries, self.retry_sleep,
+            self.stage_duration, self.topics, self.topics_per_second, self.leds, self.uptime
+        ]
+
+    def _topic_rates(self) -> Dict[Tuple[str, ...], float]:
+        elapsed = max(time.time() - self.started, 1e-9)
+        with self.topics._lock:
+            totals = dict(self.topics._values)
+        return {key: round(total / elapsed, 6) for key, total in totals.items()}
+
+    def observe(self, breadcrumb: Breadcrumb) -> None:
+        """BreadcrumbTrail listener: update metrics from one recorded LED"""
+        self.leds.inc(component=breadcrumb.component, status="success" if breadcrumb.success else "failure")
+
+        data = breadcrumb.data if isinstance(breadcrumb.data, dict) else {}
+        action = data.get("action")
+        if not isinstance(action, str):
+            return
+
+        if action in CACHE_HIT_ACTIONS or action in CACHE_MISS_ACTIONS:
+            # Same source rule as lib/breadcrumb_analytics.py
+            source = data.get("source") or data.get("cache_source") or f"{breadcrumb.component}:{breadcrumb.id}"
+            self.cache_requests.inc(source=source, result="hit" if action in CACHE_HIT_ACTIONS else "miss")
+        elif action == "rate_limit_retry":
+            self.retries.inc(component=breadcrumb.component)
+            if isinstance(data.get("sleep_time"), (int, float)):
+                self.retry_sleep.observe(float(data["sleep_time"]), component=breadcrumb.component)
+        elif action == "span_end":
+            if isinstance(data.get("wall_seconds"), (int, float)):
+                self.stage_duration.observe(
+                    float(data["wall_seconds"]), span=data.get("span", ""), status=data.get("status", "ok"))
+        elif action == "researching_topic":
+            self.topics.inc(component=breadcrumb.component)
+
+    def record_api_call(self, source: str, cached: bool) -> None:
+        """QueueManager hook: one logged API call"""
+        self.api_calls.inc(source=source, cached="true" if cached else "false")
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format"""
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path: str) -> None:
+        """Atomically (re)write a textfile-collector .prom file"""
+        directory = os.path.dirname(path) or "."
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(self.render())
+        os.replace(tmp_path, path)
+
+    def start_http_server(self, port: int, addr: str = "127.0.0.1") -> ThreadingHTTPServer:
+        """Serve GET /metrics on a daemon thread (port 0 picks a free port: server.server_address)"""
+        metrics = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] not in ('/metrics', '/'):
+                    self.send_error(404)
+                    return
+                body = metrics.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # Scrapes are not worth a console line
+
+        server = ThreadingHTTPServer((addr, port), MetricsHandler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+        return server
+
+
+_metrics: Optional[PipelineMetrics] = None
+_metrics_lock = threading.Lock()
+
+
+def get_metrics() -> Optional[PipelineMetrics]:
+    """The process-wide metrics registry, or None if metrics are not enabled"""
+    return _metrics
+
+
+def enable_metrics(port: Optional[int] = None, textfile: Optional[str] = None,
+                   addr: str = "127.0.0.1") -> PipelineMetrics:
+    """
+    Start collecting pipeline metrics for this process (idempotent)
+
+    Args:
+        port: Serve /metrics on this port (None = no HTTP endpoint, 0 = any free port)
+        textfile: Write a .prom file here at exit (None = no textfile dump)
+        addr: Address for the HTTP endpoint (local only by default)
+
+    Returns:
+        The PipelineMetrics registry (its .server is the HTTP server, if started)
+    """
+    global _metrics
+    with _metrics_lock:
+        if _metrics is None:
+            _metrics = PipelineMetrics()
+            BreadcrumbTrail.add_listener(_metrics.observe)
+        metrics = _metrics
+
+        if port is not None and metrics.server is None:
+            metrics.server = metrics.start_http_server(port, addr)
+        if textfile and textfile not in metrics.textfiles:
+            metrics.textfiles.append(textfile)
+            atexit.register(_write_textfile_at_exit, metrics, textfile)
+    return metrics
+
+
+def enable_metrics_from_env() -> Optional[PipelineMetrics]:
+    """enable_metrics() from METRICS_PORT / METRICS_TEXTFILE (None if neither is set)"""
+    port = os.getenv('METRICS_PORT', '').strip()
+    textfile = os.getenv('METRICS_TEXTFILE', '').strip()
+    if not port and not textfile:
+        return None
+    if port and not port.isdigit():
+        raise ValueError(f"METRICS_PORT must be a port number, got '{port}'")
+    return enable_metrics(port=int(port) if port else None, textfile=textfile or None)
+
+
+def disable_metrics() -> None:
+    """Stop collecting (tests): detach the listener and shut down the HTTP endpoint"""
+    global _metrics
+    with _metrics_lock:
+        if _metrics is None:
+            return
+        BreadcrumbTrail.remove_listener(_metrics.observe)
+        if _metrics.server is not None:
+            _metrics.server.shutdown()
+            _metrics.server.server_close()
+        _metrics = None
+
+
+def _write_textfile_at_exit(metrics: PipelineMetrics, path: str) -> None:
+    try:
+        metrics.write_textfile(path)
+    except Exception as e:
+        print(f"⚠️  Could not write metrics textfile {path}: {e}")
@@ -0,0 +1,280 @@
+"""
+Purchase Intent System - Shared Rate Limiter
+Token-bucket pacing shared by every API client
+
+Each source (reddit, google_trends, youtube, amazon_paapi, ...) gets one bucket
+per process, looked up by name, so concurrent workers draw from the same
+budget instead of each sleeping on its own schedule. A bucket refills at `rate`
+tokens per second and holds at most `capacity` tokens (the burst size).
+
+Buckets can persist their state to a small JSON file guarded by a lock file,
+which lets several agent processes share one budget for the same API.
+
+A source has one rate and burst size: APIs used by several agents (Reddit)
+take theirs from the shared settings below, and registering an existing
+source with different settings raises.
+
+Usage:
+    from lib.rate_limiter import get_limiter
+
+    limiter = get_limiter("reddit", rate=1 / REDDIT_DELAY, capacity=REDDIT_BURST)
+    limiter.acquire()            # blocks only when the budget is exhausted
+    results = api.search(...)
+
+    # Async callers reserve a slot and sleep on the event loop instead
+    await asyncio.sleep(limiter.reserve())
+"""
+
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+
+# Cross-process persistence (set RATE_LIMIT_PERSIST=0 to keep buckets in-process only)
+PERSIST_BY_DEFAULT = os.getenv('RATE_LIMIT_PERSIST', '1').lower() not in ('0', 'false', 'no')
+STATE_DIR = os.getenv('RATE_LIMIT_STATE_DIR', os.path.join("cache", "rate_limits"))
+
+LOCK_TIMEOUT_SECONDS = 10.0
+STALE_LOCK_SECONDS = 30.0
+
+# Shared Reddit budget (agents 0, 1 and 2 all draw from the "reddit" bucket)
+REDDIT_DELAY = float(os.getenv('REDDIT_RATE_LIMIT_DELAY', '2.0'))  # Sustained seconds between Reddit API calls
+REDDIT_BURST = int(os.getenv('REDDIT_RATE_LIMIT_BURST', '5'))  # Calls allowed back-to-back
+
+
+class TokenBucket:
+    """
+    Token bucket for one API source
+
+    Implemented as virtual scheduling: instead of storing a token count, the
+    bucket stores the time at which it will next be full ("theoretical arrival
+    time"). Each acquire pushes that time forward by 1/rate per token, and the
+    caller waits only for the part that exceeds the burst allowance. Reserving a
+    slot is instant, so callers are served in arrival order without holding a
+    lock while they sleep.
+    """
+
+    def __init__(self, name: str, rate: float, capacity: float = 1.0,
+                 persist: bool = PERSIST_BY_DEFAULT, state_dir: str = STATE_DIR):
+        if rate <= 0:
+            raise ValueError(f"Rate limiter '{name}': rate must be positive (got {rate})")
+        if capacity < 1:
+            raise ValueError(f"Rate limiter '{name}': capacity must be at least 1 (got {capacity})")
+
+        self.name = name
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self.state_path = os.path.join(state_dir, f"{name}.json") if persist else None
+
+        self._lock = threading.Lock()
+        self._tat = 0.0  # Theoretical arrival time of the next token (wall clock)
+
+        # Stats (this process only)
+        self.total_acquired = 0
+        self.total_wait_seconds = 0.0
+
+    @property
+    def interval(self) -> float:
+        """Seconds between tokens at the sustained rate"""
+        return 1.0 / self.rate
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        Reserve tokens and return how long the caller must wait before using them
+
+        The reservation is recorded immediately, so the caller must honor the
+        returned delay (time.sleep / asyncio.sleep) before making the request.
+        """
+        if tokens > self.capacity:
+            raise ValueError(
+                f"Rate limiter '{self.name}': cannot acquire {tokens} tokens "
+                f"(capacity is {self.capacity})"
+            )
+
+        with self._lock:
+            with self._shared_state():
+                now = time.time()
+                burst_allowance = (self.capacity - tokens) * self.interval
+                tat = max(self._tat, now)
+                wait = max(0.0, tat - burst_allowance - now)
+                self._tat = tat + tokens * self.interval
+
+            self.total_acquired += tokens
+            self.total_wait_seconds += wait
+
+        return wait
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Block until tokens are available
+
+        Returns:
+            Seconds spent waiting (0.0 when the bucket had budget left)
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Take tokens only if no wait is needed; returns False without reserving otherwise"""
+        with self._lock:
+            with self._shared_state():
+                now = time.time()
+                burst_allowance = (self.capacity - tokens) * self.interval
+                tat = max(self._tat, now)
+                if tat - burst_allowance > now:
+                    return False
+                self._tat = tat + tokens * self.interval
+
+            self.total_acquired += tokens
+
+        return True
+
+    def available_tokens(self) -> float:
+        """Tokens that could be taken right now without waiting"""
+        with self._lock:
+            with self._shared_state(write=False):
+                backlog = max(0.0, self._tat - time.time())
+        return max(0.0, self.capacity - backlog / self.interval)
+
+    def get_stats(self) -> Dict:
+        """Usage stats for dashboards and LED payloads"""
+        return {
+            "source": self.name,
+            "rate_per_second": round(self.rate, 4),
+            "capacity": self.capacity,
+            "available_tokens": round(self.available_tokens(), 2),
+            "total_acquired": self.total_acquired,
+            "total_wait_seconds": round(self.total_wait_seconds, 2),
+            "persistent": self.state_path is not None
+        }
+
+    @contextmanager
+    def _shared_state(self, write: bool = True):
+        """
+        Load the bucket state from disk, let the caller update it, write it back
+
+        Persistence failures are silent: the bucket keeps pacing in-process.
+        """
+        if not self.state_path:
+            yield
+            return
+
+        try:
+            lock = _file_lock(self.state_path)
+            lock.__enter__()
+        except (OSError, TimeoutError):
+            yield
+            return
+
+        try:
+            try:
+                with open(self.state_path, 'r') as f:
+                    self._tat = max(self._tat, float(json.load(f).get('tat', 0.0)))
+            except (OSError, ValueError, TypeError):
+                pass
+
+            yield
+
+            if write:
+                try:
+                    tmp_path = f"{self.state_path}.{os.getpid()}.tmp"
+                    with open(tmp_path, 'w') as f:
+                        json.dump({"tat": self._tat, "rate": self.rate, "capacity": self.capacity}, f)
+                    os.replace(tmp_path, self.state_path)
+                except OSError:
+                    pass
+        finally:
+            lock.__exit__(None, None, None)
+
+
+@contextmanager
+def _file_lock(path: str):
+    """
+    Cross-process lock using an exclusively created lock file (portable to Windows)
+
+    Lock files older than STALE_LOCK_SECONDS are treated as left behind by a
+    crashed process and removed.
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    lock_path = f"{path}.lock"
+    deadline = time.time() + LOCK_TIMEOUT_SECONDS
+
+    while True:
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                if time.time() - os.path.getmtime(lock_path) > STALE_LOCK_SECONDS:
+                    os.remove(lock_path)
+                    continue
+            except OSError:
+                continue
+            if time.time() > deadline:
+                raise TimeoutError(f"Timed out waiting for rate limiter lock: {lock_path}")
+            time.sleep(0.005)
+
+    try:
+        yield
+    finally:
+        os.close(fd)
+        try:
+            os.remove(lock_path)
+        except OSError:
+            pass
+
+
+_registry: Dict[str, TokenBucket] = {}
+_registry_lock = threading.Lock()
+
+
+def get_limiter(source: str, rate: float, capacity: float = 1.0,
+                persist: Optional[bool] = None) -> TokenBucket:
+    """
+    Get the shared bucket for a source, creating it on first use
+
+    Every client for the same API should use the same source name so they share
+    one budget. Later callers get the existing bucket, and must ask for the same
+    rate and capacity (FAIL LOUDLY otherwise - a bucket's persisted state is
+    only meaningful at the rate it was paced with).
+
+    Args:
+        source: API name (e.g. "reddit", "google_trends")
+        rate: Sustained requests per second (e.g. 1 / delay_seconds)
+        capacity: Burst size - requests allowed back-to-back before pacing kicks in
+        persist: Share the budget across processes (default: RATE_LIMIT_PERSIST env)
+
+    Raises:
+        ValueError: If the source already has a bucket with a different rate or capacity
+    """
+    with _registry_lock:
+        limiter = _registry.get(source)
+        if limiter is not None:
+            if not (math.isclose(limiter.rate, rate) and math.isclose(limiter.capacity, capacity)):
+                raise ValueError(
+                    f"Rate limiter '{source}' is already registered at {limiter.rate:g}/s "
+                    f"(capacity {limiter.capacity:g}); got {rate:g}/s (capacity {capacity:g}). "
+                    f"Clients sharing a source must use one rate"
+                )
+        else:
+            limiter = TokenBucket(
+                source,
+                rate,
+                capacity,
+                persist=PERSIST_BY_DEFAULT if persist is None else persist
+            )
+            _registry[source] = limiter
+        return limiter
+
+
+def get_all_stats() -> Dict[str, Dict]:
+    """Stats for every bucket created in this process"""
+    with _registry_lock:
+        limiters = list(_registry.values())
+    return {limiter.name: limiter.get_stats() for limiter in limiters}
@@ -0,0 +1,300 @@
+"""
+Purchase Intent System - Unified Response Cache
+Content-addressed cache for API responses shared by all agents
+
+Entries are keyed by a SHA-256 hash of (source, normalized query, params), so
+"Romance  Novels" and "romance novels" share an entry while different
+timeframes or result limits do not. Everything lives in one SQLite database
+(cache/response_cache.db) instead of thousands of small JSON files:
+- Per-entry expiry (each source passes its own TTL when writing)
+- Size-bounded LRU eviction (least recently read entries go first)
+- Atomic writes (SQLite transactions, WAL mode for concurrent processes)
+- Hit / miss / byte metrics per source
+
+Usage:
+    from lib.response_cache import get_cache
+
+    cache = get_cache()
+    data = cache.get("google_trends", keyword, params={"timeframe": "today 12-m"})
+    if data is None:
+        data = fetch(keyword)
+        cache.set("google_trends", keyword, data, params={...}, ttl_seconds=24 * 3600)
+
+Like the file caches it replaces, the cache never raises: read errors are
+treated as misses and write errors are ignored.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+
+DEFAULT_DB_PATH = os.getenv('RESPONSE_CACHE_DB', os.path.join("cache", "response_cache.db"))
+DEFAULT_MAX_BYTES = int(float(os.getenv('RESPONSE_CACHE_MAX_MB', '256')) * 1024 * 1024)
+
+EVICT_TO_FRACTION = 0.9  # Evict down to 90% of max_bytes so we don't evict on every write
+
+
+def normalize_query(query: str) -> str:
+    """Lowercase and collapse whitespace so equivalent queries share an entry"""
+    return " ".join(str(query).lower().split())
+
+
+def make_key(source: str, query: str, params: Optional[Dict] = None) -> str:
+    """Content address for (source, normalized query, params)"""
+    payload = json.dumps(
+        [source, normalize_query(query), params or {}],
+        sort_keys=True,
+        separators=(',', ':'),
+        default=str
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class ResponseCache:
+    """SQLite-backed response cache with per-entry TTL and LRU size bound"""
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        self._conn = None
+        self._total_bytes = 0
+        self._metrics: Dict[str, Dict[str, int]] = {}
+
+        try:
+            os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    conn.execute("""
+                        CREATE TABLE IF NOT EXISTS entries (
+                            key TEXT PRIMARY KEY,
+                            source TEXT NOT NULL,
+                            query TEXT NOT NULL,
+                            params TEXT,
+                            value TEXT NOT NULL,
+                            size INTEGER NOT NULL,
+                            created_at REAL NOT NULL,
+                            expires_at REAL,
+                            accessed_at REAL NOT NULL
+                        )
+                    """)
+                    conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries(accessed_at)")
+                    conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_source ON entries(source)")
+                self._total_bytes = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        except Exception:
+            # Cache unavailable - every lookup becomes a miss
+            self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, timeout=10, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        return self._conn
+
+    def _count(self, source: str, metric: str, amount: int = 1):
+        source_metrics = self._metrics.setdefault(source, {
+            "hits": 0, "misses": 0, "expired": 0, "writes": 0,
+            "bytes_read": 0, "bytes_written": 0, "evictions": 0
+        })
+        source_metrics[metric] += amount
+
+    def get_entry(self, source: str, query: str, params: Optional[Dict] = None,
+                  include_expired: bool = False) -> Optional[Dict]:
+        """
+        Look up an entry with its metadata
+
+        Returns:
+            Dict with value, created_at, age_seconds, expired - or None on a miss.
+            Expired entries are returned (expired=True) only if include_expired is
+            set; they are never served by get().
+        """
+        key = make_key(source, query, params)
+        now = time.time()
+
+        try:
+            with self._lock:
+                conn = self._connect()
+                row = conn.execute(
+                    "SELECT value, size, created_at, expires_at FROM entries WHERE key = ?",
+                    (key,)
+                ).fetchone()
+
+                if row is None:
+                    self._count(source, "misses")
+                    return None
+
+                value, size, created_at, expires_at = row
+                expired = expires_at is not None and expires_at <= now
+
+                if expired:
+                    self._count(source, "expired")
+                    if not include_expired:
+                        return None
+                else:
+                    self._count(source, "hits")
+                    self._count(source, "bytes_read", size)
+                    with conn:
+                        conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+
+            return {
+                "value": json.loads(value),
+                "created_at": created_at,
+                "age_seconds": now - created_at,
+                "expired": expired
+            }
+
+        except Exception:
+            self._count(source, "misses")
+            return None
+
+    def get(self, source: str, query: str, params: Optional[Dict] = None) -> Optional[Any]:
+        """Cached value, or None on a miss or expired entry"""
+        entry = self.get_entry(source, query, params)
+        return entry["value"] if entry else None
+
+    def contains(self, source: str, query: str, params: Optional[Dict] = None) -> bool:
+        """True if a fresh entry exists (does not count as a hit or refresh LRU order)"""
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT expires_at FROM entries WHERE key = ?",
+                    (make_key(source, query, params),)
+                ).fetchone()
+            return row is not None and (row[0] is None or row[0] > time.time())
+        except Exception:
+            return False
+
+    def set(self, source: str, query: str, value: Any, params: Optional[Dict] = None,
+            ttl_seconds: Optional[float] = None, created_at: Optional[float] = None) -> bool:
+        """
+        Store a JSON-serializable value
+
+        Args:
+            source: Cache namespace (e.g. "google_trends", "amazon")
+            query: Query string (normalized for the key)
+            value: JSON-serializable response data
+            params: Request parameters that change the response
+            ttl_seconds: Time to live (None = never expires, only evicted by LRU)
+            created_at: Override creation time (e.g. source file mtime)
+
+        Returns:
+            True if stored
+        """
+        try:
+            payload = json.dumps(value, separators=(',', ':'))
+        except (TypeError, ValueError):
+            return False
+
+        now = time.time()
+        created_at = created_at if created_at is not None else now
+        expires_at = created_at + ttl_seconds if ttl_seconds is not None else None
+        size = len(payload.encode('utf-8'))
+        key = make_key(source, query, params)
+
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    old = conn.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+                    conn.execute(
+                        "INSERT OR REPLACE INTO entries "
+                        "(key, source, query, params, value, size, created_at, expires_at, accessed_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (
+                            key, source, normalize_query(query),
+                            json.dumps(params or {}, sort_keys=True, default=str),
+                            payload, size, created_at, expires_at, now
+                        )
+                    )
+                self._total_bytes += size - (old[0] if old else 0)
+                self._count(source, "writes")
+                self._count(source, "bytes_written", size)
+
+                if self._total_bytes > self.max_bytes:
+                    self._evict(conn)
+
+            return True
+
+        except Exception:
+            return False
+
+    def delete(self, source: str, query: str, params: Optional[Dict] = None):
+        """Remove one entry"""
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    conn.execute("DELETE FROM entries WHERE key = ?", (make_key(source, query, params),))
+                self._total_bytes = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        except Exception:
+            pass
+
+    def _evict(self, conn: sqlite3.Connection):
+        """Drop expired entries, then least recently accessed ones until under budget (lock held)"""
+        with conn:
+            conn.execute("DELETE FROM entries WHERE expires_at IS NOT NULL AND expires_at <= ?", (time.time(),))
+
+        # Other processes write too - recompute before evicting live entries
+        self._total_bytes = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        target = self.max_bytes * EVICT_TO_FRACTION
+
+        if self._total_bytes <= self.max_bytes:
+            return
+
+        victims = []
+        freed = 0
+        for key, source, size in conn.execute("SELECT key, source, size FROM entries ORDER BY accessed_at"):
+            if self._total_bytes - freed <= target:
+                break
+            victims.append((key,))
+            freed += size
+            self._count(source, "evictions")
+
+        with conn:
+            conn.executemany("DELETE FROM entries WHERE key = ?", victims)
+        self._total_bytes -= freed
+
+    def get_metrics(self) -> Dict[str, Dict]:
+        """Per-source hit/miss/byte counters (this process) plus stored entries and bytes"""
+        metrics = {source: dict(counts) for source, counts in self._metrics.items()}
+
+        try:
+            with self._lock:
+                rows = self._connect().execute(
+                    "SELECT source, COUNT(*), SUM(size) FROM entries GROUP BY source"
+                ).fetchall()
+        except Exception:
+            rows = []
+
+        for source, entries, size in rows:
+            stored = metrics.setdefault(source, {})
+            stored["entries"] = entries
+            stored["stored_bytes"] = size or 0
+
+        for counts in metrics.values():
+            lookups = counts.get("hits", 0) + counts.get("misses", 0) + counts.get("expired", 0)
+            counts["hit_rate"] = round(counts.get("hits", 0) / lookups * 100, 1) if lookups else 0.0
+
+        return metrics
+
+
+_caches: Dict[str, ResponseCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_cache(db_path: str = DEFAULT_DB_PATH) -> ResponseCache:
+    """Shared ResponseCache instance for a database path"""
+    with _caches_lock:
+        cache = _caches.get(db_path)
+        if cache is None:
+            cache = ResponseCache(db_path)
+            _caches[db_path] = cache
+        return cache
@@ -0,0 +1,114 @@
+"""
+Test Breadcrumb Log Analytics
+
+Writes LEDs to a throwaway log, indexes it and checks the cache hit rate
+counts cold misses and that back-to-back rotations keep every segment.
+
+Run with: python test_breadcrumb_analytics.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from lib.breadcrumb_analytics import BreadcrumbIndex
+from lib.breadcrumb_system import BreadcrumbTrail
+from lib.response_cache import ResponseCache
+from agents.agent_0.api_clients import GoogleTrendsClient
+
+
+def use_log(path: Path):
+    """Send every trail's LEDs to path, returning the previous log file"""
+    previous = BreadcrumbTrail._log_file
+    BreadcrumbTrail._log_file = path
+    return previous
+
+
+def test_cache_hit_rate_counts_cold_misses():
+    """A hit, an expired entry and a cold miss give a 1/3 hit rate"""
+    print("Testing cache hit rate...")
+    with tempfile.TemporaryDirectory() as tmp:
+        log_path = Path(tmp) / "breadcrumbs.jsonl"
+        previous = use_log(log_path)
+        try:
+            client = GoogleTrendsClient.__new__(GoogleTrendsClient)  # No TrendReq (network) - only the cache is used
+            client.trail = BreadcrumbTrail("Agent0_AnalyticsTest")
+            client.cache = ResponseCache(str(Path(tmp) / "response_cache.db"))
+            params = GoogleTrendsClient.cache_params()
+            client.cache.set(GoogleTrendsClient.CACHE_SOURCE, "romance novels", {"average_interest": 60},
+                             params=params, ttl_seconds=3600)
+            client.cache.set(GoogleTrendsClient.CACHE_SOURCE, "budget apps", {"average_interest": 40},
+                             params=params, ttl_seconds=3600, created_at=time.time() - 7200)
+
+            for keyword in ("romance novels", "budget apps", "sourdough"):
+                client._load_from_cache(keyword)
+            client.cache._conn.close()
+            BreadcrumbTrail.flush_logs()
+        finally:
+            BreadcrumbTrail._log_file = previous
+
+        with BreadcrumbIndex(str(log_path)) as index:
+            index.update(rotate=False)
+            rates = index.cache_hit_rates()
+
+    assert rates == [{"source": "google_trends", "hits": 1, "misses": 2, "hit_rate": 0.3333}], rates
+    print("✅ Cold misses counted alongside expired entries")
+
+
+def test_rotations_in_one_second():
+    """Two forced rotations within a second keep both segments indexed"""
+    print("\nTesting back-to-back rotations...")
+    with tempfile.TemporaryDirectory() as tmp:
+        log_path = Path(tmp) / "breadcrumbs.jsonl"
+        previous = use_log(log_path)
+        try:
+            trail = BreadcrumbTrail("Agent0_AnalyticsTest")
+            with BreadcrumbIndex(str(log_path)) as index:
+                rotated = []
+                for i in range(3):
+                    trail.light(500, {"action": "rotation_test", "index": i})
+                    BreadcrumbTrail.flush_logs()
+                    if i < 2:
+                        rotated.append(index.rotate(grace_seconds=3600, force=True)["rotated"])
+
+                index.update(rotate=False)
+                names = [path.name for path in index.segment_paths()]
+                count = index._conn.execute("SELECT COUNT(*) FROM leds WHERE action = 'rotation_test'").fetchone()[0]
+        finally:
+            BreadcrumbTrail._log_file = previous
+
+    assert None not in rotated and rotated[0] != rotated[1], rotated
+    assert names == rotated + ["breadcrumbs.jsonl"], names
+    assert count == 3, f"expected 3 indexed LEDs, got {count}"
+    print("✅ Distinct segment names, oldest first, nothing overwritten")
+
+
+def main():
+    """Run all breadcrumb analytics tests"""
+    print("=" * 80)
+    print("BREADCRUMB LOG ANALYTICS TESTS")
+    print("=" * 80)
+
+    results = []
+    for test in (test_cache_hit_rate_counts_cold_misses, test_rotations_in_one_second):
+        try:
+            test()
+            results.append(True)
+        except AssertionError as e:
+            print(f"❌ {test.__name__}: {e}")
+            results.append(False)
+
+    print("\n" + "=" * 80)
+    print("TEST SUMMARY")
+    print("=" * 80)
+    print(f"Tests passed: {sum(results)}/{len(results)}")
+    return 0 if all(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+"""
+Test Pipeline Metrics Exporter
+
+Lights the LEDs the agents emit (cache hits/misses, rate limit retries, spans,
+researched topics), logs QueueManager calls, then scrapes the local /metrics
+endpoint and checks the textfile-collector dump.
+
+Run with: python test_metrics_exporter.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+import urllib.request
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from lib.breadcrumb_system import BreadcrumbTrail
+from lib.metrics import CONTENT_TYPE, disable_metrics, enable_metrics, get_metrics
+from lib.response_cache import ResponseCache
+from agents.agent_0.api_clients import GoogleTrendsClient
+from agents.agent_0.queue_manager import QueueManager
+
+
+def scrape(metrics) -> dict:
+    """GET /metrics and parse the samples into {series: value}"""
+    host, port = metrics.server.server_address[:2]
+    with urllib.request.urlopen(f"http://{host}:{port}/metrics", timeout=5) as response:
+        assert response.status == 200
+        assert response.headers["Content-Type"] == CONTENT_TYPE
+        body = response.read().decode('utf-8')
+
+    samples = {}
+    for line in body.splitlines():
+        if line and not line.startswith('#'):
+            series, value = line.rsplit(' ', 1)
+            samples[series] = float(value)
+    return samples
+
+
+def trends_cache_lookups(trail: BreadcrumbTrail, tmp: str) -> None:
+    """Real GoogleTrendsClient cache lookups: one hit, one expired entry, one cold miss"""
+    client = GoogleTrendsClient.__new__(GoogleTrendsClient)  # No TrendReq (network) - only the cache is used
+    client.trail = trail
+    client.cache = ResponseCache(str(Path(tmp) / "response_cache.db"))
+
+    params = GoogleTrendsClient.cache_params()
+    source = GoogleTrendsClient.CACHE_SOURCE
+    client.cache.set(source, "romance novels", {"average_interest": 60}, params=params, ttl_seconds=3600)
+    client.cache.set(source, "budget apps", {"average_interest": 40}, params=params,
+                     ttl_seconds=3600, created_at=time.time() - 7200)
+
+    assert client._load_from_cache("romance novels") == {"average_interest": 60}
+    assert client._load_from_cache("budget apps") is None
+    assert client._load_from_cache("sourdough") is None
+
+    # The LEDs see every lookup the cache itself counted
+    counts = client.cache.get_metrics()[source]
+    assert (counts["hits"], counts["expired"], counts["misses"]) == (1, 1, 1)
+    client.cache._conn.close()
+
+
+def light_pipeline(trail: BreadcrumbTrail, tmp: str) -> None:
+    """The LEDs Agent 0 lights during a research run"""
+    trail.light(503, {"action": "researching_topic", "topic": "romance novels", "index": 1})
+    trail.light(503, {"action": "researching_topic", "topic": "budget apps", "index": 2})
+    trends_cache_lookups(trail, tmp)
+    # Agent results loader miss (no source key - counted under component:LED)
+    trail.light(627, {"action": "cache_miss", "keyword": "sourdough"})
+    trail.light(511, {"action": "rate_limit_retry", "attempt": 1, "sleep_time": 1.42, "error": "429"})
+    trail.light(511, {"action": "rate_limit_retry", "attempt": 2, "sleep_time": 2.87, "error": "429"})
+    with trail.span(509, "google_trends"):
+        pass
+    trail.fail(512, Exception("Max retries exceeded"))
+
+
+def test_http_scrape():
+    """LED stream and QueueManager calls show up in a local scrape"""
+    print("Testing /metrics scrape...")
+    disable_metrics()
+    metrics = enable_metrics(port=0)
+    try:
+        trail = BreadcrumbTrail("Agent0_MetricsTest")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            light_pipeline(trail, tmp)
+            queue = QueueManager(trail, db_path=str(Path(tmp) / "api_call_history.db"))
+            queue.log_api_call("romance novels", cached=True)
+            queue.log_api_call("budget apps", cached=False)
+            queue.log_api_call("budget apps", cached=False, source="playwright")
+            queue._conn.close()
+
+        samples = scrape(metrics)
+        expected = {
+            'purchase_intent_api_calls_total{source="google_trends",cached="true"}': 1,
+            'purchase_intent_api_calls_total{source="google_trends",cached="false"}': 1,
+            'purchase_intent_api_calls_total{source="playwright",cached="false"}': 1,
+            'purchase_intent_cache_requests_total{source="google_trends",result="hit"}': 1,
+            'purchase_intent_cache_requests_total{source="google_trends",result="miss"}': 2,
+            'purchase_intent_cache_requests_total{source="Agent0_MetricsTest:627",result="miss"}': 1,
+            'purchase_intent_rate_limit_retries_total{component="Agent0_MetricsTest"}': 2,
+            'purchase_intent_retry_sleep_seconds_bucket{component="Agent0_MetricsTest",le="2"}': 1,
+            'purchase_intent_retry_sleep_seconds_bucket{component="Agent0_MetricsTest",le="4"}': 2,
+            'purchase_intent_retry_sleep_seconds_count{component="Agent0_MetricsTest"}': 2,
+            'purchase_intent_stage_duration_seconds_count{span="google_trends",status="ok"}': 1,
+            'purchase_intent_topics_researched_total{component="Agent0_MetricsTest"}': 2,
+            'purchase_intent_leds_total{component="Agent0_MetricsTest",status="failure"}': 1,
+        }
+        for series, value in expected.items():
+            assert samples.get(series) == value, f"{series}: expected {value}, got {samples.get(series)}"
+        assert abs(samples['purchase_intent_retry_sleep_seconds_sum{component="Agent0_MetricsTest"}'] - 4.29) < 1e-9
+        assert samples['purchase_intent_topics_per_second{component="Agent0_MetricsTest"}'] > 0
+    finally:
+        disable_metrics()
+
+    assert get_metrics() is None
+    print("✅ Scrape reports API calls, cache results, retries, stage latency and topics")
+
+
+def test_textfile_dump():
+    """Textfile-collector dump matches the rendered exposition"""
+    print("\nTesting textfile dump...")
+    disable_metrics()
+    metrics = enable_metrics()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            light_pipeline(BreadcrumbTrail("Agent0_MetricsTest"), tmp)
+            path = Path(tmp) / "collector" / "purchase_intent.prom"
+            metrics.write_textfile(str(path))
+            text = path.read_text(encoding='utf-8')
+            assert list(path.parent.iterdir()) == [path], "temporary file left behind"
+    finally:
+        disable_metrics()
+
+    assert '# TYPE purchase_intent_stage_duration_seconds histogram' in text
+    assert 'purchase_intent_stage_duration_seconds_bucket{span="google_trends",status="ok",le="+Inf"} 1' in text
+    assert text.endswith('\n')
+    print("✅ Textfile dump written atomically")
+
+
+def main():
+    """Run all metrics exporter tests"""
+    print("=" * 80)
+    print("PIPELINE METRICS EXPORTER TESTS")
+    print("=" * 80)
+
+    results = []
+    for test in (test_http_scrape, test_textfile_dump):
+        try:
+            test()
+            results.append(True)
+        except AssertionError as e:
+            print(f"❌ {test.__name__}: {e}")
+            results.append(False)
+
+    print("\n" + "=" * 80)
+    print("TEST SUMMARY")
+    print("=" * 80)
+    print(f"Tests passed: {sum(results)}/{len(results)}")
+    return 0 if all(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
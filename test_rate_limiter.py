@@ -0,0 +1,170 @@
+"""
+Test Shared Rate Limiter
+Checks token-bucket pacing, one rate per source, and the lock-file guarded
+state that lets several processes share one budget
+
+Run with: python test_rate_limiter.py
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from lib import rate_limiter
+from lib.rate_limiter import TokenBucket, get_limiter
+
+
+def test_burst_then_pacing():
+    """capacity calls go straight through, then one call per interval"""
+    print("Testing burst and sustained pacing...")
+    bucket = TokenBucket("pacing_test", rate=10, capacity=3, persist=False)
+
+    waits = [bucket.reserve() for _ in range(5)]
+    assert waits[:3] == [0.0, 0.0, 0.0], waits
+    assert 0.08 < waits[3] <= 0.1 and 0.18 < waits[4] <= 0.2, waits
+
+    assert not bucket.try_acquire(), "exhausted bucket should refuse"
+    assert bucket.total_acquired == 5, "refused try_acquire must not reserve"
+
+    for bad in ({"rate": 0}, {"rate": 1, "capacity": 0.5}):
+        try:
+            TokenBucket("bad_test", persist=False, **{"capacity": 1, **bad})
+            assert False, f"{bad} should raise"
+        except ValueError:
+            pass
+    try:
+        bucket.reserve(4)
+        assert False, "more tokens than capacity should raise"
+    except ValueError:
+        pass
+    print("✅ Burst of 3, then 0.1s apart; invalid settings raise")
+
+
+def test_one_rate_per_source():
+    """A source registered again must ask for the same rate and capacity"""
+    print("\nTesting one rate per source...")
+    limiter = get_limiter("rate_mismatch_test", rate=1 / 2.0, capacity=5, persist=False)
+    assert get_limiter("rate_mismatch_test", rate=1 / 2.0, capacity=5) is limiter
+
+    for rate, capacity in ((1 / 2.5, 5), (1 / 2.0, 3)):
+        try:
+            get_limiter("rate_mismatch_test", rate=rate, capacity=capacity)
+            assert False, f"rate {rate} capacity {capacity} should raise"
+        except ValueError as e:
+            assert "rate_mismatch_test" in str(e)
+    print("✅ Same settings share the bucket, a different rate or burst raises")
+
+
+def test_agents_share_reddit_rate():
+    """Every agent's Reddit settings come from the shared budget"""
+    print("\nTesting the shared Reddit rate...")
+    from agents.agent_0.config import Agent0Config
+    from agents.agent_1.config import Agent1Config
+    from agents.agent_2.config import Agent2Config
+
+    for config in (Agent0Config, Agent1Config, Agent2Config):
+        assert (config.REDDIT_DELAY, config.REDDIT_BURST) == (rate_limiter.REDDIT_DELAY, rate_limiter.REDDIT_BURST), \
+            f"{config.__name__} has its own Reddit rate"
+    print(f"✅ Agents 0-2 pace Reddit at one call per {rate_limiter.REDDIT_DELAY:g}s")
+
+
+def test_persisted_state_shared():
+    """Two buckets on one state file draw from a single budget"""
+    print("\nTesting persisted state...")
+    with tempfile.TemporaryDirectory() as state_dir:
+        first = TokenBucket("persist_test", rate=10, capacity=2, persist=True, state_dir=state_dir)
+        second = TokenBucket("persist_test", rate=10, capacity=2, persist=True, state_dir=state_dir)
+
+        assert first.reserve() == 0.0 and first.reserve() == 0.0
+        wait = second.reserve()
+        assert 0.08 < wait <= 0.1, f"second bucket should see the spent burst (waited {wait})"
+
+        with open(first.state_path) as f:
+            state = json.load(f)
+        assert state["rate"] == 10 and state["capacity"] == 2
+        assert state["tat"] == second._tat
+        assert os.listdir(state_dir) == ["persist_test.json"], "lock or temp file left behind"
+    print("✅ Budget shared through the state file, lock released")
+
+
+def test_budget_shared_across_processes():
+    """A child process spends the burst; this process then has to wait"""
+    print("\nTesting a budget shared across processes...")
+    root = os.path.dirname(os.path.abspath(__file__))
+    with tempfile.TemporaryDirectory() as state_dir:
+        child = (
+            "import sys; sys.path.insert(0, sys.argv[1]);"
+            "from lib.rate_limiter import TokenBucket;"
+            "bucket = TokenBucket('process_test', rate=2, capacity=3, persist=True, state_dir=sys.argv[2]);"
+            "[bucket.reserve() for _ in range(3)]"
+        )
+        subprocess.run([sys.executable, "-c", child, root, state_dir], check=True, timeout=60)
+
+        bucket = TokenBucket("process_test", rate=2, capacity=3, persist=True, state_dir=state_dir)
+        assert bucket.available_tokens() < 1
+        wait = bucket.reserve()
+        assert 0 < wait <= 0.5, f"expected to wait for the child's spent burst (waited {wait})"
+    print("✅ Burst spent in another process is honored")
+
+
+def test_lock_file_handling():
+    """Stale lock files are cleared; a held lock falls back to in-process pacing"""
+    print("\nTesting lock files...")
+    timeout = rate_limiter.LOCK_TIMEOUT_SECONDS
+    with tempfile.TemporaryDirectory() as state_dir:
+        bucket = TokenBucket("lock_test", rate=10, capacity=1, persist=True, state_dir=state_dir)
+        lock_path = f"{bucket.state_path}.lock"
+
+        # Left behind by a crashed process
+        open(lock_path, 'w').close()
+        old = time.time() - rate_limiter.STALE_LOCK_SECONDS - 1
+        os.utime(lock_path, (old, old))
+        assert bucket.reserve() == 0.0
+        assert not os.path.exists(lock_path), "stale lock should be removed"
+        assert os.path.exists(bucket.state_path)
+
+        # Held by a live process: give up on the file, keep pacing in-process
+        open(lock_path, 'w').close()
+        next_slot = bucket._tat
+        rate_limiter.LOCK_TIMEOUT_SECONDS = 0.05
+        try:
+            wait = bucket.reserve()
+        finally:
+            rate_limiter.LOCK_TIMEOUT_SECONDS = timeout
+        assert abs(bucket._tat - (next_slot + 0.1)) < 1e-6, "in-process pacing should still apply"
+        assert 0 < wait <= 0.1, f"time spent on the lock counts towards the wait (waited {wait})"
+        assert os.path.exists(lock_path), "someone else's lock must not be removed"
+    print("✅ Stale lock cleared, held lock times out without losing pacing")
+
+
+def main():
+    """Run all rate limiter tests"""
+    print("=" * 80)
+    print("SHARED RATE LIMITER TESTS")
+    print("=" * 80)
+
+    results = []
+    for test in (test_burst_then_pacing, test_one_rate_per_source, test_agents_share_reddit_rate,
+                 test_persisted_state_shared, test_budget_shared_across_processes, test_lock_file_handling):
+        try:
+            test()
+            results.append(True)
+        except AssertionError as e:
+            print(f"❌ {test.__name__}: {e}")
+            results.append(False)
+
+    print("\n" + "=" * 80)
+    print("TEST SUMMARY")
+    print("=" * 80)
+    print(f"Tests passed: {sum(results)}/{len(results)}")
+    return 0 if all(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())